@@ -226,12 +226,15 @@ async def extract_text_ocr(
         image_bytes = base64.b64decode(image_data)
         ocr_provider = OCRProvider(provider.lower())
 
+        # One cached recognition pass serves both response shapes
+        result = await ocr_engine.full_analysis(
+            image_bytes,
+            language,
+            ocr_provider
+        )
+
         if return_boxes:
-            boxes = await ocr_engine.extract_boxes(
-                image_bytes,
-                language,
-                ocr_provider
-            )
+            boxes = result.boxes
 
             return {
                 "success": True,
@@ -249,15 +252,9 @@ async def extract_text_ocr(
                 "total_boxes": len(boxes)
             }
         else:
-            text = await ocr_engine.extract_text(
-                image_bytes,
-                language,
-                ocr_provider
-            )
-
             return {
                 "success": True,
-                "text": text,
+                "text": result.text,
                 "provider": provider,
                 "timestamp": datetime.utcnow().isoformat() + "Z"
             }
@@ -295,7 +292,7 @@ async def detect_ui_elements(
         ocr_data = None
         if extract_text:
             try:
-                boxes = await ocr_engine.extract_boxes(image_bytes)
+                boxes = (await ocr_engine.full_analysis(image_bytes)).boxes
                 ocr_data = {
                     "boxes": [
                         {
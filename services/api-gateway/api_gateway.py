@@ -6,6 +6,7 @@ Integrates vision, streaming, and voice services.
 Implements request routing, middleware, and service orchestration.
 """
 
+import asyncio
 import logging
 import os
 from typing import Optional
@@ -19,6 +20,7 @@ import uvicorn
 
 # Import API routers
 from api.vision_endpoints import router as vision_router
+from ocr import shutdown_tile_pool
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +162,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("API Gateway shutting down...")
+    await asyncio.to_thread(shutdown_tile_pool)
 
 
 # Create FastAPI app
@@ -5,7 +5,7 @@ HTTP client for Memory Engine service (7020) with retry and timeout handling.
 
 import httpx
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime
 import uuid
 
@@ -172,6 +172,54 @@ class MemoryClient:
         
         return response.json()
     
+    async def store_batch(
+        self,
+        items: List[Dict[str, Any]],
+        correlation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Store many memories in one Memory Engine transaction.
+        
+        Args:
+            items: Dicts with "content", "memory_type" and optional "metadata"
+            correlation_id: Optional correlation ID for tracing
+        
+        Returns:
+            {"status": "stored", "ids": [...], "count": int} (ids in input order)
+        
+        Raises:
+            MemoryClientError: On failure (the batch is all-or-nothing)
+        """
+        correlation_id = correlation_id or str(uuid.uuid4())
+        
+        url = f"{self.base_url}/v1/store/batch"
+        payload = {
+            "items": [
+                {
+                    "content": it.get("content", ""),
+                    "type": it.get("memory_type", ""),
+                    "metadata": it.get("metadata") or {},
+                }
+                for it in items
+            ]
+        }
+        
+        response = await self._retry_request(
+            "POST",
+            url,
+            correlation_id,
+            json=payload
+        )
+        
+        if response.status_code != 200:
+            raise MemoryClientError(
+                "STORE_FAILED",
+                f"Failed to store memory batch: {response.status_code}",
+                {"status_code": response.status_code, "response": response.text[:200]}
+            )
+        
+        return response.json()
+    
     async def recall(
         self,
         memory_id: str,
@@ -5,12 +5,14 @@ HTTP client for OpenClaw service (7040) with retry and timeout handling.
 
 import httpx
 import asyncio
-from typing import Optional, Dict, Any
+import json
+from typing import Optional, Dict, Any, AsyncIterator
 import uuid
 
 DEFAULT_TIMEOUT = 10.0
 DEFAULT_RETRIES = 3
 BACKOFF_FACTOR = 1.5
+STREAM_TIMEOUT_MARGIN = 5.0  # seconds past the tool timeout before giving up on a stream
 
 
 class OpenclawClientError(Exception):
@@ -156,6 +158,121 @@ class OpenclawClient:
             )
         
         return response.json()
+
+    async def execute_stream(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        timeout_ms: int = 5000,
+        correlation_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a tool in OpenClaw, yielding progress as it happens.
+
+        Events, in order:
+            {"type": "started", "execution_id": ..., ...}
+            {"type": "output", "stream": "stdout"|"stderr", "text": ...}  (zero or more)
+            {"type": "final", "response": <execute() result>}
+
+        Not retried: the tool may already have run. Closing the generator
+        early closes the connection, which makes OpenClaw kill the tool.
+        Falls back to execute() against an OpenClaw without /execute/stream.
+
+        Raises:
+            OpenclawClientError: On failure
+        """
+        correlation_id = correlation_id or str(uuid.uuid4())
+
+        url = f"{self.base_url}/execute/stream"
+        payload = {
+            "tool_name": tool_name,
+            "args": args,
+            "timeout_ms": timeout_ms,
+            "correlation_id": correlation_id
+        }
+        # Quiet commands may not print for a while; only give up once the
+        # tool's own deadline (enforced by OpenClaw) has clearly passed
+        timeout = httpx.Timeout(self.timeout.connect, read=timeout_ms / 1000 + STREAM_TIMEOUT_MARGIN)
+
+        try:
+            async with self.client.stream(
+                "POST",
+                url,
+                json=payload,
+                headers={"X-Correlation-ID": correlation_id},
+                timeout=timeout
+            ) as response:
+                if response.status_code in (404, 405):
+                    fallback = True
+                elif response.status_code != 200:
+                    raise OpenclawClientError(
+                        "EXECUTE_FAILED",
+                        f"Failed to execute tool: {response.status_code}",
+                        {"status_code": response.status_code}
+                    )
+                else:
+                    fallback = False
+                    async for line in response.aiter_lines():
+                        if not line:
+                            continue
+                        event = json.loads(line)
+                        yield event
+                        if event.get("type") == "final":
+                            return
+                    raise OpenclawClientError(
+                        "STREAM_INCOMPLETE",
+                        "OpenClaw stream ended without a result",
+                        {"tool_name": tool_name}
+                    )
+        except httpx.TimeoutException:
+            raise OpenclawClientError(
+                "TIMEOUT",
+                "OpenClaw stream timed out",
+                {"timeout_seconds": timeout.read}
+            )
+        except httpx.RequestError as e:
+            raise OpenclawClientError(
+                "UNAVAILABLE",
+                f"OpenClaw unavailable: {str(e)}",
+                {"error": str(e)}
+            )
+
+        if fallback:
+            result = await self.execute(tool_name, args, timeout_ms, correlation_id)
+            yield {"type": "final", "response": result}
+
+    async def cancel(
+        self,
+        execution_id: str,
+        correlation_id: Optional[str] = None
+    ) -> bool:
+        """
+        Cancel a streamed execution.
+
+        Returns:
+            True if it was cancelled, False if it had already finished
+        """
+        correlation_id = correlation_id or str(uuid.uuid4())
+
+        url = f"{self.base_url}/execute/{execution_id}/cancel"
+
+        response = await self._retry_request(
+            "POST",
+            url,
+            correlation_id
+        )
+
+        if response.status_code == 404:
+            return False
+
+        if response.status_code != 200:
+            raise OpenclawClientError(
+                "CANCEL_FAILED",
+                f"Failed to cancel execution: {response.status_code}",
+                {"status_code": response.status_code}
+            )
+
+        return True
     
     async def list_tools(
         self,
@@ -179,7 +179,8 @@ class RouterClient:
         messages: List[Dict[str, str]],
         model: Optional[str] = None,
         task_type: str = "text",
-        correlation_id: Optional[str] = None
+        correlation_id: Optional[str] = None,
+        session_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get chat response from Model Router.
@@ -189,6 +190,7 @@ class RouterClient:
             model: Optional specific model to use
             task_type: Task type for routing (text, vision, etc.)
             correlation_id: Optional correlation ID for tracing
+            session_id: Optional session ID for fair queueing in the router
 
         Returns:
             Chat response
@@ -205,6 +207,8 @@ class RouterClient:
         }
         if model:
             payload["model"] = model
+        if session_id:
+            payload["session_id"] = session_id
         
         response = await self._retry_request(
             "POST",
@@ -16,15 +16,42 @@ import asyncio
 import json
 import logging
 import os
+import queue
 import sqlite3
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("api-gateway.durable_state")
 
 DEFAULT_DB_PATH = os.path.join("S:\\", "data", "gateway_state.db")
 
+# Max outbox IDs per set-based UPDATE (stays under SQLite's bound-parameter limit)
+_OUTBOX_ID_CHUNK = 500
+
+# Group-commit tuning: a commit is issued after N queued ops or T ms,
+# whichever comes first.
+DEFAULT_COMMIT_BATCH_SIZE = 64
+DEFAULT_COMMIT_INTERVAL_MS = 5.0
+# Lazy session touches are written at most once per interval.
+DEFAULT_TOUCH_INTERVAL_S = 5.0
+DEFAULT_READ_WORKERS = 2
+
+_IDLE = object()
+
+
+def _resolve_future(fut: "asyncio.Future", result: Any, error: Optional[BaseException]) -> None:
+    if fut.done():
+        return
+    if error is not None:
+        fut.set_exception(error)
+    else:
+        fut.set_result(result)
+
 _SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS sessions (
     session_id     TEXT PRIMARY KEY,
@@ -90,20 +117,82 @@ CREATE TABLE IF NOT EXISTS idempotency_keys (
 """
 
 
+@dataclass
+class _WriteOp:
+    """A queued mutation plus the future that resolves once it is committed."""
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    future: "asyncio.Future"
+    loop: asyncio.AbstractEventLoop
+
+
+def _noop_sync(conn) -> None:
+    return None
+
+
 class DurableStateStore:
     """
     SQLite-backed durable state for sessions, confirmations, dead letters,
     and an outbox for at-least-once memory write-back.
 
-    All public methods are async-safe via run_in_executor wrapping sync sqlite3.
+    Writes go through one dedicated writer thread that owns the write
+    connection and batches queued mutations into group commits (flushed
+    after ``commit_batch_size`` ops or ``commit_interval_ms``). Each
+    mutation runs inside its own savepoint, so one failing op does not
+    roll back its neighbours; the awaiting caller resumes only after the
+    group containing its op has committed.
+
+    Reads run on a small dedicated pool, each thread holding its own
+    read-only connection (WAL lets them proceed alongside the writer).
+
+    Session activity touches are lazy: touch_session() only records the
+    latest values, and the writer folds them into a commit at most once
+    per ``touch_interval_s``.
+
     Persistence failures log warnings but never raise to callers.
     """
 
-    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+    def __init__(
+        self,
+        db_path: str = DEFAULT_DB_PATH,
+        commit_batch_size: int = DEFAULT_COMMIT_BATCH_SIZE,
+        commit_interval_ms: float = DEFAULT_COMMIT_INTERVAL_MS,
+        touch_interval_s: float = DEFAULT_TOUCH_INTERVAL_S,
+        read_workers: int = DEFAULT_READ_WORKERS,
+    ):
         self._db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._commit_batch_size = max(1, commit_batch_size)
+        self._commit_interval_s = max(0.0, commit_interval_ms) / 1000.0
+        self._touch_interval_s = max(0.0, touch_interval_s)
+
+        self._write_q: "queue.Queue[Optional[_WriteOp]]" = queue.Queue()
+        self._closed = False
+
+        self._touch_lock = threading.Lock()
+        self._pending_touches: Dict[str, Tuple[str, int]] = {}
+        self._force_touch_flush = False
+        self._last_touch_flush = time.monotonic()
+
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._read_pool = ThreadPoolExecutor(
+            max_workers=max(1, read_workers),
+            thread_name_prefix="durable-state-read",
+        )
+
+        self._commits = 0
+        self._ops_committed = 0
+        self._ops_failed = 0
+        self._touches_written = 0
+        self._max_group_size = 0
+
         self._init_db()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="durable-state-writer", daemon=True,
+        )
+        self._writer.start()
 
     # ------------------------------------------------------------------
     # Internal: database lifecycle
@@ -112,23 +201,189 @@ class DurableStateStore:
     def _init_db(self):
         """Create / open database and run migrations."""
         os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
-        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        self._conn = sqlite3.connect(
+            self._db_path, check_same_thread=False, isolation_level=None,
+        )
         self._conn.row_factory = sqlite3.Row
         # WAL mode for concurrent readers
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA synchronous=NORMAL")
         self._conn.execute("PRAGMA busy_timeout=5000")
         self._conn.executescript(_SCHEMA_SQL)
-        self._conn.commit()
         logger.info("Durable state store opened: %s", self._db_path)
 
-    async def _run(self, fn, *args):
-        """Run a sync function in the default executor (thread pool)."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, fn, *args)
+    def _reader(self) -> sqlite3.Connection:
+        """Per-thread read-only connection (created lazily on the read pool)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA query_only=1")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    async def _read(self, fn, *args):
+        """Run a sync read function on the read pool with a reader connection."""
+        if self._closed:
+            raise RuntimeError("durable state store is closed")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._read_pool, lambda: fn(self._reader(), *args),
+        )
+
+    async def _write(self, fn, *args):
+        """Queue a mutation for the writer thread; resolves once committed."""
+        if self._closed:
+            raise RuntimeError("durable state store is closed")
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._write_q.put(_WriteOp(fn, args, fut, loop))
+        return await fut
+
+    def _writer_loop(self):
+        """Drain the write queue into group commits until the stop sentinel."""
+        stop = False
+        while not stop:
+            batch: List[_WriteOp] = []
+            try:
+                item = self._write_q.get(timeout=max(self._touch_interval_s, 0.01))
+            except queue.Empty:
+                item = _IDLE
+            if item is None:
+                stop = True
+            elif item is not _IDLE:
+                batch.append(item)
+                deadline = time.monotonic() + self._commit_interval_s
+                while len(batch) < self._commit_batch_size:
+                    try:
+                        nxt = self._write_q.get_nowait()
+                    except queue.Empty:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            nxt = self._write_q.get(timeout=remaining)
+                        except queue.Empty:
+                            break
+                    if nxt is None:
+                        stop = True
+                        break
+                    batch.append(nxt)
+
+            touches = self._take_touches(force=stop)
+            if batch or touches:
+                self._commit_group(batch, touches)
+
+    def _take_touches(self, force: bool = False) -> Dict[str, Tuple[str, int]]:
+        """Hand pending touches to the writer if the rate window has elapsed."""
+        with self._touch_lock:
+            if not self._pending_touches:
+                return {}
+            now = time.monotonic()
+            force = force or self._force_touch_flush
+            if not force and now - self._last_touch_flush < self._touch_interval_s:
+                return {}
+            touches, self._pending_touches = self._pending_touches, {}
+            self._force_touch_flush = False
+            self._last_touch_flush = now
+            return touches
+
+    def _commit_group(self, batch: List[_WriteOp], touches: Dict[str, Tuple[str, int]]):
+        """Apply *batch* (one savepoint per op) and *touches* in one transaction."""
+        conn = self._conn
+        outcomes: List[Tuple[_WriteOp, Any, Optional[BaseException]]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op in batch:
+                conn.execute("SAVEPOINT op")
+                try:
+                    res = op.fn(conn, *op.args)
+                    conn.execute("RELEASE SAVEPOINT op")
+                    outcomes.append((op, res, None))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO SAVEPOINT op")
+                    conn.execute("RELEASE SAVEPOINT op")
+                    outcomes.append((op, None, e))
+            if touches:
+                try:
+                    self._apply_touches_sync(conn, touches)
+                except Exception as e:
+                    logger.warning("session touch flush failed (%d sessions): %s", len(touches), e)
+                    touches = {}
+            conn.execute("COMMIT")
+        except Exception as e:
+            logger.warning("durable state group commit failed (%d ops): %s", len(batch), e)
+            try:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+            except Exception:
+                pass
+            outcomes = [(op, None, e) for op in batch]
+            touches = {}
+
+        self._commits += 1
+        self._max_group_size = max(self._max_group_size, len(batch))
+        self._touches_written += len(touches)
+        for op, res, err in outcomes:
+            if err is None:
+                self._ops_committed += 1
+            else:
+                self._ops_failed += 1
+            try:
+                op.loop.call_soon_threadsafe(_resolve_future, op.future, res, err)
+            except RuntimeError:
+                # Caller's loop already closed; nobody is waiting any more
+                pass
+
+    def _apply_touches_sync(self, conn, touches: Dict[str, Tuple[str, int]]):
+        now = datetime.now(timezone.utc).isoformat()
+        conn.executemany(
+            "UPDATE sessions SET last_activity = ?, turn_count = ?, updated_at = ? WHERE session_id = ?",
+            [(last_activity, turn_count, now, sid) for sid, (last_activity, turn_count) in touches.items()],
+        )
+
+    async def flush(self):
+        """Wait until every queued write and pending touch is committed."""
+        with self._touch_lock:
+            self._force_touch_flush = True
+        try:
+            await self._write(_noop_sync)
+        except Exception as e:
+            logger.warning("durable state flush failed: %s", e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Writer/commit counters for diagnostics."""
+        ops = self._ops_committed + self._ops_failed
+        return {
+            "commits": self._commits,
+            "ops_committed": self._ops_committed,
+            "ops_failed": self._ops_failed,
+            "avg_group_size": round(ops / self._commits, 2) if self._commits else 0.0,
+            "max_group_size": self._max_group_size,
+            "write_queue_depth": self._write_q.qsize(),
+            "pending_touches": len(self._pending_touches),
+            "touches_written": self._touches_written,
+            "reader_connections": len(self._readers),
+        }
 
     def close(self):
-        """Close the database connection."""
+        """Commit outstanding writes, stop the writer and close all connections."""
+        if self._closed:
+            return
+        self._closed = True
+        self._write_q.put(None)
+        self._writer.join(timeout=10.0)
+        self._read_pool.shutdown(wait=True)
+        with self._readers_lock:
+            for conn in self._readers:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._readers.clear()
         if self._conn:
             try:
                 self._conn.close()
@@ -140,10 +395,10 @@ class DurableStateStore:
     # Sessions
     # ------------------------------------------------------------------
 
-    def _persist_session_sync(self, sess: Dict[str, Any]):
+    def _persist_session_sync(self, conn, sess: Dict[str, Any]):
         now = datetime.now(timezone.utc).isoformat()
         metadata_json = json.dumps(sess.get("metadata") or {})
-        self._conn.execute(
+        conn.execute(
             """INSERT OR REPLACE INTO sessions
                (session_id, user_id, conversation_id, profile, status,
                 created_at, expires_at, last_activity, turn_count, metadata, updated_at)
@@ -162,21 +417,19 @@ class DurableStateStore:
                 now,
             ),
         )
-        self._conn.commit()
 
     async def persist_session(self, sess: Dict[str, Any]):
         """Write a full session record (INSERT OR REPLACE)."""
         try:
-            await self._run(self._persist_session_sync, sess)
+            await self._write(self._persist_session_sync, sess)
         except Exception as e:
             logger.warning("persist_session failed for %s: %s", sess.get("session_id"), e)
 
-    def _update_session_sync(self, session_id: str, updates_json: str):
-        updates = json.loads(updates_json)
+    def _update_session_sync(self, conn, session_id: str, updates: Dict[str, Any]):
         if not updates:
             return
         now = datetime.now(timezone.utc).isoformat()
-        updates["updated_at"] = now
+        updates = dict(updates, updated_at=now)
         set_parts = []
         values = []
         for k, v in updates.items():
@@ -186,18 +439,30 @@ class DurableStateStore:
             values.append(v)
         values.append(session_id)
         sql = f"UPDATE sessions SET {', '.join(set_parts)} WHERE session_id = ?"
-        self._conn.execute(sql, values)
-        self._conn.commit()
+        conn.execute(sql, values)
 
     async def update_session(self, session_id: str, updates: Dict[str, Any]):
         """Update specific fields on a session record."""
         try:
-            await self._run(self._update_session_sync, session_id, json.dumps(updates))
+            await self._write(self._update_session_sync, session_id, dict(updates))
         except Exception as e:
             logger.warning("update_session failed for %s: %s", session_id, e)
 
-    def _load_active_sessions_sync(self) -> str:
-        cur = self._conn.execute(
+    def touch_session(self, session_id: str, last_activity: str, turn_count: int):
+        """
+        Record session activity without waiting on disk.
+
+        Touches are coalesced per session (latest wins) and written by the
+        writer thread at most once per touch interval, alongside whatever
+        group commit is next.
+        """
+        if self._closed:
+            return
+        with self._touch_lock:
+            self._pending_touches[session_id] = (last_activity, turn_count)
+
+    def _load_active_sessions_sync(self, conn) -> List[Dict[str, Any]]:
+        cur = conn.execute(
             "SELECT * FROM sessions WHERE status = 'active'"
         )
         rows = cur.fetchall()
@@ -210,13 +475,12 @@ class DurableStateStore:
             except (json.JSONDecodeError, TypeError):
                 d["metadata"] = {}
             result.append(d)
-        return json.dumps(result)
+        return result
 
     async def load_active_sessions(self) -> List[Dict[str, Any]]:
         """Load all sessions with status='active'."""
         try:
-            raw = await self._run(self._load_active_sessions_sync)
-            return json.loads(raw)
+            return await self._read(self._load_active_sessions_sync)
         except Exception as e:
             logger.warning("load_active_sessions failed: %s", e)
             return []
@@ -225,9 +489,9 @@ class DurableStateStore:
     # Confirmations
     # ------------------------------------------------------------------
 
-    def _persist_confirmation_sync(self, token: Dict[str, Any]):
+    def _persist_confirmation_sync(self, conn, token: Dict[str, Any]):
         args_json = json.dumps(token.get("args") or {})
-        self._conn.execute(
+        conn.execute(
             """INSERT OR REPLACE INTO confirmations
                (confirmation_id, session_id, turn_id, tool_name, args,
                 summary, status, created_at, ttl_seconds, decided_at)
@@ -245,31 +509,29 @@ class DurableStateStore:
                 token.get("decided_at"),
             ),
         )
-        self._conn.commit()
 
     async def persist_confirmation(self, token: Dict[str, Any]):
         """Write a confirmation token to durable storage."""
         try:
-            await self._run(self._persist_confirmation_sync, token)
+            await self._write(self._persist_confirmation_sync, token)
         except Exception as e:
             logger.warning("persist_confirmation failed for %s: %s", token.get("confirmation_id"), e)
 
-    def _update_confirmation_sync(self, confirmation_id: str, status: str, decided_at: Optional[str]):
-        self._conn.execute(
+    def _update_confirmation_sync(self, conn, confirmation_id: str, status: str, decided_at: Optional[str]):
+        conn.execute(
             "UPDATE confirmations SET status = ?, decided_at = ? WHERE confirmation_id = ?",
             (status, decided_at, confirmation_id),
         )
-        self._conn.commit()
 
     async def update_confirmation(self, confirmation_id: str, status: str, decided_at: Optional[str] = None):
         """Update confirmation status and decided_at timestamp."""
         try:
-            await self._run(self._update_confirmation_sync, confirmation_id, status, decided_at)
+            await self._write(self._update_confirmation_sync, confirmation_id, status, decided_at)
         except Exception as e:
             logger.warning("update_confirmation failed for %s: %s", confirmation_id, e)
 
-    def _load_pending_confirmations_sync(self) -> str:
-        cur = self._conn.execute(
+    def _load_pending_confirmations_sync(self, conn) -> List[Dict[str, Any]]:
+        cur = conn.execute(
             "SELECT * FROM confirmations WHERE status = 'pending'"
         )
         rows = cur.fetchall()
@@ -281,13 +543,12 @@ class DurableStateStore:
             except (json.JSONDecodeError, TypeError):
                 d["args"] = {}
             result.append(d)
-        return json.dumps(result)
+        return result
 
     async def load_pending_confirmations(self) -> List[Dict[str, Any]]:
         """Load all confirmations with status='pending'."""
         try:
-            raw = await self._run(self._load_pending_confirmations_sync)
-            return json.loads(raw)
+            return await self._read(self._load_pending_confirmations_sync)
         except Exception as e:
             logger.warning("load_pending_confirmations failed: %s", e)
             return []
@@ -296,13 +557,13 @@ class DurableStateStore:
     # Dead Letters
     # ------------------------------------------------------------------
 
-    def _persist_dead_letter_sync(self, dl: Dict[str, Any]):
+    def _persist_dead_letter_sync(self, conn, dl: Dict[str, Any]):
         params_json = json.dumps(dl.get("params") or {})
         created_at = dl.get("created_at", "")
         # Handle both datetime objects and ISO strings
         if hasattr(created_at, "isoformat"):
             created_at = created_at.isoformat() + "Z"
-        self._conn.execute(
+        conn.execute(
             """INSERT OR REPLACE INTO dead_letters
                (letter_id, action_id, intent, params, error_code, error_message,
                 failure_class, correlation_id, session_id, created_at,
@@ -325,17 +586,15 @@ class DurableStateStore:
                 dl.get("replay_action_id"),
             ),
         )
-        self._conn.commit()
 
     async def persist_dead_letter(self, dl: Dict[str, Any]):
         """Write a dead letter to durable storage."""
         try:
-            await self._run(self._persist_dead_letter_sync, dl)
+            await self._write(self._persist_dead_letter_sync, dl)
         except Exception as e:
             logger.warning("persist_dead_letter failed for %s: %s", dl.get("letter_id"), e)
 
-    def _update_dead_letter_sync(self, letter_id: str, updates_json: str):
-        updates = json.loads(updates_json)
+    def _update_dead_letter_sync(self, conn, letter_id: str, updates: Dict[str, Any]):
         if not updates:
             return
         set_parts = []
@@ -351,25 +610,17 @@ class DurableStateStore:
             values.append(v)
         values.append(letter_id)
         sql = f"UPDATE dead_letters SET {', '.join(set_parts)} WHERE letter_id = ?"
-        self._conn.execute(sql, values)
-        self._conn.commit()
+        conn.execute(sql, values)
 
     async def update_dead_letter(self, letter_id: str, updates: Dict[str, Any]):
         """Update fields on a dead letter record."""
         try:
-            # Convert datetime values to strings for JSON serialization
-            serializable = {}
-            for k, v in updates.items():
-                if hasattr(v, "isoformat"):
-                    serializable[k] = v.isoformat() + "Z"
-                else:
-                    serializable[k] = v
-            await self._run(self._update_dead_letter_sync, letter_id, json.dumps(serializable))
+            await self._write(self._update_dead_letter_sync, letter_id, dict(updates))
         except Exception as e:
             logger.warning("update_dead_letter failed for %s: %s", letter_id, e)
 
-    def _load_dead_letters_sync(self) -> str:
-        cur = self._conn.execute(
+    def _load_dead_letters_sync(self, conn) -> List[Dict[str, Any]]:
+        cur = conn.execute(
             "SELECT * FROM dead_letters WHERE replayed = 0"
         )
         rows = cur.fetchall()
@@ -382,13 +633,12 @@ class DurableStateStore:
                 d["params"] = {}
             d["replayed"] = bool(d.get("replayed", 0))
             result.append(d)
-        return json.dumps(result)
+        return result
 
     async def load_dead_letters(self) -> List[Dict[str, Any]]:
         """Load all non-replayed dead letters."""
         try:
-            raw = await self._run(self._load_dead_letters_sync)
-            return json.loads(raw)
+            return await self._read(self._load_dead_letters_sync)
         except Exception as e:
             logger.warning("load_dead_letters failed: %s", e)
             return []
@@ -397,13 +647,12 @@ class DurableStateStore:
     # Outbox (memory write-back queue)
     # ------------------------------------------------------------------
 
-    def _enqueue_outbox_sync(self, outbox_id: str, entry_type: str, payload_json: str, created_at: str):
-        self._conn.execute(
+    def _enqueue_outbox_sync(self, conn, outbox_id: str, entry_type: str, payload_json: str, created_at: str):
+        conn.execute(
             """INSERT INTO outbox (outbox_id, entry_type, payload, created_at, delivered, attempts)
                VALUES (?, ?, ?, ?, 0, 0)""",
             (outbox_id, entry_type, payload_json, created_at),
         )
-        self._conn.commit()
 
     async def enqueue_outbox(self, entry_type: str, payload: Dict[str, Any]) -> str:
         """Add an entry to the outbox queue. Returns outbox_id."""
@@ -411,13 +660,13 @@ class DurableStateStore:
         now = datetime.now(timezone.utc).isoformat()
         payload_json = json.dumps(payload, default=str)
         try:
-            await self._run(self._enqueue_outbox_sync, outbox_id, entry_type, payload_json, now)
+            await self._write(self._enqueue_outbox_sync, outbox_id, entry_type, payload_json, now)
         except Exception as e:
             logger.warning("enqueue_outbox failed: %s", e)
         return outbox_id
 
-    def _get_pending_outbox_sync(self, limit: int) -> str:
-        cur = self._conn.execute(
+    def _get_pending_outbox_sync(self, conn, limit: int) -> List[Dict[str, Any]]:
+        cur = conn.execute(
             "SELECT * FROM outbox WHERE delivered = 0 ORDER BY created_at ASC LIMIT ?",
             (limit,),
         )
@@ -431,43 +680,78 @@ class DurableStateStore:
                 d["payload"] = {}
             d["delivered"] = bool(d.get("delivered", 0))
             result.append(d)
-        return json.dumps(result, default=str)
+        return result
 
     async def get_pending_outbox(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get undelivered outbox entries, oldest first."""
         try:
-            raw = await self._run(self._get_pending_outbox_sync, limit)
-            return json.loads(raw)
+            return await self._read(self._get_pending_outbox_sync, limit)
         except Exception as e:
             logger.warning("get_pending_outbox failed: %s", e)
             return []
 
-    def _mark_delivered_sync(self, outbox_id: str):
+    def _mark_delivered_sync(self, conn, outbox_id: str):
         now = datetime.now(timezone.utc).isoformat()
-        self._conn.execute(
+        conn.execute(
             "UPDATE outbox SET delivered = 1, delivered_at = ?, attempts = attempts + 1 WHERE outbox_id = ?",
             (now, outbox_id),
         )
-        self._conn.commit()
 
     async def mark_delivered(self, outbox_id: str):
         """Mark an outbox entry as successfully delivered."""
         try:
-            await self._run(self._mark_delivered_sync, outbox_id)
+            await self._write(self._mark_delivered_sync, outbox_id)
         except Exception as e:
             logger.warning("mark_delivered failed for %s: %s", outbox_id, e)
 
-    def _increment_attempt_sync(self, outbox_id: str):
-        self._conn.execute(
+    def _mark_delivered_many_sync(self, conn, outbox_ids: List[str]):
+        now = datetime.now(timezone.utc).isoformat()
+        for i in range(0, len(outbox_ids), _OUTBOX_ID_CHUNK):
+            chunk = outbox_ids[i:i + _OUTBOX_ID_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            conn.execute(
+                "UPDATE outbox SET delivered = 1, delivered_at = ?, attempts = attempts + 1 "
+                f"WHERE outbox_id IN ({marks})",
+                (now, *chunk),
+            )
+
+    async def mark_delivered_many(self, outbox_ids: List[str]):
+        """Mark many outbox entries delivered in one set-based update + commit."""
+        if not outbox_ids:
+            return
+        try:
+            await self._write(self._mark_delivered_many_sync, list(outbox_ids))
+        except Exception as e:
+            logger.warning("mark_delivered_many failed for %d entries: %s", len(outbox_ids), e)
+
+    def _increment_attempt_many_sync(self, conn, outbox_ids: List[str]):
+        for i in range(0, len(outbox_ids), _OUTBOX_ID_CHUNK):
+            chunk = outbox_ids[i:i + _OUTBOX_ID_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            conn.execute(
+                f"UPDATE outbox SET attempts = attempts + 1 WHERE outbox_id IN ({marks})",
+                tuple(chunk),
+            )
+
+    async def increment_attempt_many(self, outbox_ids: List[str]):
+        """Increment the attempt counter for many failed deliveries at once."""
+        if not outbox_ids:
+            return
+        try:
+            await self._write(self._increment_attempt_many_sync, list(outbox_ids))
+        except Exception as e:
+            logger.warning("increment_attempt_many failed for %d entries: %s", len(outbox_ids), e)
+
+    def _increment_attempt_sync(self, conn, outbox_id: str):
+        conn.execute(
             "UPDATE outbox SET attempts = attempts + 1 WHERE outbox_id = ?",
             (outbox_id,),
         )
-        self._conn.commit()
 
     async def increment_attempt(self, outbox_id: str):
         """Increment the attempt counter for a failed delivery."""
         try:
-            await self._run(self._increment_attempt_sync, outbox_id)
+            await self._write(self._increment_attempt_sync, outbox_id)
         except Exception as e:
             logger.warning("increment_attempt failed for %s: %s", outbox_id, e)
 
@@ -477,14 +761,13 @@ class DurableStateStore:
     # IdempotencyStore is integrated into DurableStateStore (not a separate class)
     # Table: idempotency_keys — SQLite-backed, TTL-expiring, write-through
 
-    def _persist_idempotency_key_sync(self, key: str, action_id: str, result_json: str, created_at: str, expires_at: str):
-        self._conn.execute(
+    def _persist_idempotency_key_sync(self, conn, key: str, action_id: str, result_json: str, created_at: str, expires_at: str):
+        conn.execute(
             """INSERT OR REPLACE INTO idempotency_keys
                (idempotency_key, action_id, result_json, created_at, expires_at)
                VALUES (?, ?, ?, ?, ?)""",
             (key, action_id, result_json, created_at, expires_at),
         )
-        self._conn.commit()
 
     async def persist_idempotency_key(self, key: str, action_id: str, result: Dict[str, Any], ttl_seconds: float = 300.0):
         """Write an idempotency key mapping to durable storage with TTL."""
@@ -494,48 +777,46 @@ class DurableStateStore:
         expires_at = (now + timedelta(seconds=ttl_seconds)).isoformat()
         result_json = json.dumps(result, default=str)
         try:
-            await self._run(self._persist_idempotency_key_sync, key, action_id, result_json, created_at, expires_at)
+            await self._write(self._persist_idempotency_key_sync, key, action_id, result_json, created_at, expires_at)
         except Exception as e:
             logger.warning("persist_idempotency_key failed for %s: %s", key, e)
 
-    def _get_idempotency_key_sync(self, key: str) -> str:
+    def _get_idempotency_key_sync(self, conn, key: str) -> Optional[Dict[str, Any]]:
         now = datetime.now(timezone.utc).isoformat()
-        cur = self._conn.execute(
+        cur = conn.execute(
             "SELECT * FROM idempotency_keys WHERE idempotency_key = ? AND expires_at > ?",
             (key, now),
         )
         row = cur.fetchone()
         if row is None:
-            return json.dumps(None)
+            return None
         d = dict(row)
         try:
             d["result_json"] = json.loads(d.get("result_json") or "{}")
         except (json.JSONDecodeError, TypeError):
             d["result_json"] = {}
-        return json.dumps(d)
+        return d
 
     async def get_idempotency_key(self, key: str) -> Optional[Dict[str, Any]]:
         """Look up a non-expired idempotency key. Returns None if not found or expired."""
         try:
-            raw = await self._run(self._get_idempotency_key_sync, key)
-            return json.loads(raw)
+            return await self._read(self._get_idempotency_key_sync, key)
         except Exception as e:
             logger.warning("get_idempotency_key failed for %s: %s", key, e)
             return None
 
-    def _prune_expired_idempotency_keys_sync(self) -> int:
+    def _prune_expired_idempotency_keys_sync(self, conn) -> int:
         now = datetime.now(timezone.utc).isoformat()
-        cur = self._conn.execute(
+        cur = conn.execute(
             "DELETE FROM idempotency_keys WHERE expires_at <= ?",
             (now,),
         )
-        self._conn.commit()
         return cur.rowcount
 
     async def prune_expired_idempotency_keys(self) -> int:
         """Remove expired idempotency keys. Returns count deleted."""
         try:
-            return await self._run(self._prune_expired_idempotency_keys_sync)
+            return await self._write(self._prune_expired_idempotency_keys_sync)
         except Exception as e:
             logger.warning("prune_expired_idempotency_keys failed: %s", e)
             return 0
@@ -2,7 +2,7 @@
 Latency Budget (v4.3 Epic C, v4.7 Epic C)
 
 Per-stage p95/p99 tracking for promotion gate compliance.
-Stages: asr, memory_read, model, tool, memory_write, tts, total
+Stages: asr, memory_read, model, model_queue, tool, memory_write, tts, total
 
 Stores last 10000 samples per stage in a circular buffer.
 SLO checking returns a list of violations for promotion gates.
@@ -30,7 +30,7 @@ from routes.chat import handle_chat
 from routes.action import handle_action
 from routes.turn import handle_turn
 from routes.sessions import handle_create_session, handle_get_session, handle_delete_session
-from routes.stream import handle_stream
+from routes.stream import handle_stream, run_approved_tool
 from routes.ui_stream import handle_ui_stream, ui_stream_manager, inject_clients as inject_ui_clients
 from schemas.turn import TurnRequest
 from schemas.session import SessionCreateRequest, ConfirmationDecisionRequest
@@ -817,10 +817,17 @@ async def _do_approve_confirmation(request: Request, confirmation_id: str):
     if result.get("ok"):
         token = result.get("token")
         if token:
+            # A longer run needs the timeout_ms that was approved with it
+            timeout_ms = token.args.get("timeout_ms")
+            if not isinstance(timeout_ms, int) or timeout_ms <= 0:
+                timeout_ms = 5000
             try:
-                exec_resp = await openclaw_client.execute(
-                    tool_name=token.tool_name, args=token.args,
-                    timeout_ms=5000, correlation_id=correlation_id,
+                # Streamed so the session's stream clients see progress live
+                exec_resp = await run_approved_tool(
+                    openclaw_client,
+                    session_id=token.session_id, turn_id=token.turn_id,
+                    tool_name=token.tool_name, tool_args=token.args,
+                    correlation_id=correlation_id, timeout_ms=timeout_ms,
                 )
                 return {
                     "ok": True, "confirmation_id": confirmation_id,
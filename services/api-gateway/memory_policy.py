@@ -10,9 +10,10 @@ Memory writes are first enqueued to a durable outbox, then delivered
 to memory-engine. Failed deliveries can be retried via flush_outbox().
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from clients.memory_client import MemoryClient, MemoryClientError
 from jsonl_logger import error_log, turn_log
@@ -48,6 +49,55 @@ def _build_summary(input_text: str, assistant_text: str, max_len: int = 200) ->
     return f"User: {user_part} | Assistant: {asst_part}"
 
 
+def _collect_turn_items(
+    pol: MemoryWritePolicy,
+    turn_id: str,
+    user_id: str,
+    conversation_id: str,
+    input_text: str,
+    assistant_text: str,
+    vision_summary: Optional[str],
+    tool_events: Optional[List[Dict[str, Any]]],
+    confirmation_events: Optional[List[Dict[str, Any]]],
+) -> List[Tuple[str, str]]:
+    """Return the (content, memory_type) items a turn writes, in policy order."""
+    items: List[Tuple[str, str]] = []
+
+    # Raw turn transcript
+    if pol.write_raw:
+        items.append((json.dumps({
+            "turn_id": turn_id,
+            "user_id": user_id,
+            "conversation_id": conversation_id,
+            "input": input_text,
+            "output": assistant_text,
+        }), "turn_raw"))
+
+    # Compact summary
+    if pol.write_summary:
+        items.append((_build_summary(input_text, assistant_text), "turn_summary"))
+
+    # Vision observation
+    if pol.include_vision_observation and vision_summary:
+        items.append((vision_summary, "vision_observation"))
+
+    # Tool events
+    if pol.include_tool_events and tool_events:
+        for te in tool_events:
+            items.append((json.dumps(te, default=str), "tool_event"))
+
+    # Confirmation events
+    if pol.include_confirmation_events and confirmation_events:
+        for ce in confirmation_events:
+            items.append((json.dumps(ce, default=str), "confirmation_event"))
+
+    return items
+
+
+# Strong references to deferred write-back tasks so they are not GC'd mid-flight.
+_deferred_tasks: Set["asyncio.Task[Any]"] = set()
+
+
 async def write_turn_memories(
     memory_client: MemoryClient,
     turn_id: str,
@@ -61,26 +111,39 @@ async def write_turn_memories(
     confirmation_events: Optional[List[Dict[str, Any]]] = None,
     policy: Optional[MemoryWritePolicy] = None,
     correlation_id: str = "",
+    defer: bool = False,
 ) -> Dict[str, Any]:
     """
     Write turn data to memory-engine according to policy.
 
-    Returns {"written": bool, "items_written": int, "errors": [...]}.
+    All items are enqueued to the outbox first, then delivered to
+    memory-engine in a single store_batch request. Clients or engines
+    without the batch endpoint (404/405) fall back to concurrent
+    per-item store() calls.
+
+    With ``defer=True`` and an outbox configured, delivery moves off the
+    response path: the call returns once every item is durably queued and
+    a background task delivers them (``flush_outbox`` retries failures).
+
+    Returns {"written": bool, "items_written": int, "errors": [...]}
+    (plus "deferred"/"items_queued" when deferred).
     Never raises — failures are captured and returned.
     """
     pol = policy or DEFAULT_WRITE_POLICY
-    result = {"written": False, "items_written": 0, "errors": []}
+    result: Dict[str, Any] = {"written": False, "items_written": 0, "errors": []}
     base_meta = {
         "user_id": user_id,
         "conversation_id": conversation_id,
         "turn_id": turn_id,
         "session_id": session_id,
     }
+    items = _collect_turn_items(
+        pol, turn_id, user_id, conversation_id, input_text, assistant_text,
+        vision_summary, tool_events, confirmation_events,
+    )
 
-    async def _store(content: str, mem_type: str, extra_meta: Optional[dict] = None):
+    async def _enqueue(content: str, mem_type: str) -> Tuple[Dict[str, Any], Optional[str]]:
         meta = {**base_meta, "type": mem_type}
-        if extra_meta:
-            meta.update(extra_meta)
 
         # v4.3: enqueue to outbox before attempting delivery
         outbox_id = None
@@ -97,7 +160,18 @@ async def write_turn_memories(
                 )
             except Exception as e:
                 logger.warning("outbox enqueue failed for %s (non-fatal): %s", mem_type, e)
+        return meta, outbox_id
+
+    def _record_error(mem_type: str, exc: MemoryClientError) -> None:
+        err_info = {"type": mem_type, "code": exc.code, "message": exc.message}
+        result["errors"].append(err_info)
+        error_log.log({
+            "session_id": session_id, "turn_id": turn_id,
+            "code": "MEMORY_WRITE_FAILED", "detail": err_info,
+        })
+        logger.warning("memory write failed (%s): %s", mem_type, exc)
 
+    async def _deliver(content: str, mem_type: str, meta: Dict[str, Any], outbox_id: Optional[str]) -> bool:
         try:
             resp = await memory_client.store(
                 content=content,
@@ -115,44 +189,56 @@ async def write_turn_memories(
                         logger.warning("outbox mark_delivered failed for %s: %s", outbox_id, e)
                 return True
         except MemoryClientError as exc:
-            err_info = {"type": mem_type, "code": exc.code, "message": exc.message}
-            result["errors"].append(err_info)
-            error_log.log({
-                "session_id": session_id, "turn_id": turn_id,
-                "code": "MEMORY_WRITE_FAILED", "detail": err_info,
-            })
-            logger.warning("memory write failed (%s): %s", mem_type, exc)
+            _record_error(mem_type, exc)
         return False
 
-    # Raw turn transcript
-    if pol.write_raw:
-        raw_content = json.dumps({
-            "turn_id": turn_id,
-            "user_id": user_id,
-            "conversation_id": conversation_id,
-            "input": input_text,
-            "output": assistant_text,
-        })
-        await _store(raw_content, "turn_raw")
-
-    # Compact summary
-    if pol.write_summary:
-        summary = _build_summary(input_text, assistant_text)
-        await _store(summary, "turn_summary")
-
-    # Vision observation
-    if pol.include_vision_observation and vision_summary:
-        await _store(vision_summary, "vision_observation")
+    async def _deliver_batch(queued: List[Tuple[str, str, Dict[str, Any], Optional[str]]]) -> bool:
+        """One store_batch request for the whole turn; False if unsupported."""
+        try:
+            resp = await memory_client.store_batch(
+                items=[
+                    {"content": c, "memory_type": t, "metadata": m}
+                    for c, t, m, _ in queued
+                ],
+                correlation_id=correlation_id,
+            )
+        except MemoryClientError as exc:
+            if exc.details.get("status_code") in (404, 405):
+                return False
+            for _, mem_type, _, _ in queued:
+                _record_error(mem_type, exc)
+            return True
+        if resp.get("status") == "stored" and len(resp.get("ids", [])) == len(queued):
+            result["items_written"] += len(queued)
+            outbox_ids = [oid for _, _, _, oid in queued if oid]
+            if _outbox_state_store and outbox_ids:
+                await _outbox_state_store.mark_delivered_many(outbox_ids)
+        return True
+
+    async def _deliver_all(queued: List[Tuple[str, str, Dict[str, Any], Optional[str]]]) -> None:
+        if hasattr(memory_client, "store_batch") and await _deliver_batch(queued):
+            return
+        await asyncio.gather(*(_deliver(c, t, m, oid) for c, t, m, oid in queued))
+
+    # Outbox enqueues share one SQLite connection, so they stay sequential.
+    queued = []
+    for content, mem_type in items:
+        meta, outbox_id = await _enqueue(content, mem_type)
+        queued.append((content, mem_type, meta, outbox_id))
+
+    if not queued:
+        return result
 
-    # Tool events
-    if pol.include_tool_events and tool_events:
-        for te in tool_events:
-            await _store(json.dumps(te, default=str), "tool_event")
+    if defer and all(oid for _, _, _, oid in queued):
+        task = asyncio.create_task(_deliver_all(queued))
+        _deferred_tasks.add(task)
+        task.add_done_callback(_deferred_tasks.discard)
+        result["written"] = True
+        result["deferred"] = True
+        result["items_queued"] = len(queued)
+        return result
 
-    # Confirmation events
-    if pol.include_confirmation_events and confirmation_events:
-        for ce in confirmation_events:
-            await _store(json.dumps(ce, default=str), "confirmation_event")
+    await _deliver_all(queued)
 
     result["written"] = result["items_written"] > 0
     return result
@@ -304,6 +390,85 @@ async def retrieve_context(
 MAX_OUTBOX_RETRY_ATTEMPTS = 5
 
 
+# Max turn_memory entries sent per /v1/store/batch call during a flush
+OUTBOX_STORE_BATCH_SIZE = 200
+
+
+async def _store_turn_memory_single(
+    memory_client: MemoryClient,
+    payload: Dict[str, Any],
+) -> bool:
+    """Deliver one turn_memory payload via the single-item store endpoint."""
+    resp = await memory_client.store(
+        content=payload.get("content", ""),
+        memory_type=payload.get("memory_type", ""),
+        metadata=payload.get("metadata", {}),
+        correlation_id=payload.get("correlation_id", ""),
+    )
+    return resp.get("status") == "stored"
+
+
+async def _deliver_turn_memories(
+    memory_client: MemoryClient,
+    entries: List[Dict[str, Any]],
+) -> Tuple[List[str], List[str]]:
+    """
+    Deliver turn_memory outbox entries, batched via store_batch.
+
+    Each batch is all-or-nothing on the memory-engine side, so a batch
+    either delivers every entry or fails every entry. Falls back to
+    per-entry store() when the client or memory-engine has no batch
+    endpoint (404/405).
+
+    Returns (delivered_ids, failed_ids).
+    """
+    delivered: List[str] = []
+    failed: List[str] = []
+    use_batch = hasattr(memory_client, "store_batch")
+
+    for start in range(0, len(entries), OUTBOX_STORE_BATCH_SIZE):
+        chunk = entries[start:start + OUTBOX_STORE_BATCH_SIZE]
+        ids = [e.get("outbox_id", "") for e in chunk]
+
+        if use_batch:
+            try:
+                resp = await memory_client.store_batch(
+                    items=[e.get("payload", {}) for e in chunk],
+                )
+                if resp.get("status") == "stored" and len(resp.get("ids", [])) == len(chunk):
+                    delivered.extend(ids)
+                else:
+                    failed.extend(ids)
+                continue
+            except MemoryClientError as exc:
+                if exc.details.get("status_code") not in (404, 405):
+                    logger.warning(
+                        "flush_outbox: batch delivery of %d entries failed: %s", len(chunk), exc,
+                    )
+                    failed.extend(ids)
+                    continue
+                logger.info("flush_outbox: store_batch unsupported, falling back to per-entry store")
+                use_batch = False
+            except Exception as exc:
+                logger.warning(
+                    "flush_outbox: unexpected batch error for %d entries: %s", len(chunk), exc,
+                )
+                failed.extend(ids)
+                continue
+
+        for entry, outbox_id in zip(chunk, ids):
+            try:
+                if await _store_turn_memory_single(memory_client, entry.get("payload", {})):
+                    delivered.append(outbox_id)
+                else:
+                    failed.append(outbox_id)
+            except Exception as exc:
+                logger.warning("flush_outbox: delivery failed for %s: %s", outbox_id, exc)
+                failed.append(outbox_id)
+
+    return delivered, failed
+
+
 async def flush_outbox(
     memory_client: MemoryClient,
     limit: int = 50,
@@ -313,6 +478,9 @@ async def flush_outbox(
     Reads pending entries from DurableStateStore, attempts memory write,
     marks delivered on success. Skips entries that exceed max retry attempts.
 
+    turn_memory entries are delivered in batches through /v1/store/batch;
+    delivered/failed bookkeeping is applied with one set-based update each.
+
     Returns {"flushed": int, "failed": int, "skipped": int}.
     """
     if not _outbox_state_store:
@@ -326,6 +494,10 @@ async def flush_outbox(
         logger.warning("flush_outbox: failed to load pending entries: %s", e)
         return result
 
+    delivered: List[str] = []
+    failed: List[str] = []
+    turn_entries: List[Dict[str, Any]] = []
+
     for entry in pending:
         outbox_id = entry.get("outbox_id", "")
         attempts = entry.get("attempts", 0)
@@ -336,56 +508,54 @@ async def flush_outbox(
             result["skipped"] += 1
             continue
 
+        if entry_type.startswith("turn_memory:"):
+            turn_entries.append(entry)
+            continue
+
+        if not entry_type.startswith("typed_memory:"):
+            # Unknown entry type, skip
+            logger.warning("flush_outbox: unknown entry type '%s', skipping %s", entry_type, outbox_id)
+            result["skipped"] += 1
+            continue
+
         try:
-            if entry_type.startswith("turn_memory:"):
-                # Re-attempt turn memory store
-                resp = await memory_client.store(
-                    content=payload.get("content", ""),
-                    memory_type=payload.get("memory_type", ""),
-                    metadata=payload.get("metadata", {}),
-                    correlation_id=payload.get("correlation_id", ""),
-                )
-                if resp.get("status") == "stored":
-                    await _outbox_state_store.mark_delivered(outbox_id)
-                    result["flushed"] += 1
-                else:
-                    await _outbox_state_store.increment_attempt(outbox_id)
-                    result["failed"] += 1
-            elif entry_type.startswith("typed_memory:"):
-                # Re-attempt typed memory store
-                resp = await memory_client.store_typed(
-                    memory_type=payload.get("memory_type", ""),
-                    subtype=payload.get("subtype", ""),
-                    content=payload.get("content", ""),
-                    metadata=payload.get("metadata"),
-                    valid_from=payload.get("valid_from"),
-                    valid_until=payload.get("valid_until"),
-                    correlation_id=payload.get("correlation_id", ""),
-                )
-                if resp.get("status") == "stored":
-                    await _outbox_state_store.mark_delivered(outbox_id)
-                    result["flushed"] += 1
-                else:
-                    await _outbox_state_store.increment_attempt(outbox_id)
-                    result["failed"] += 1
+            # Re-attempt typed memory store
+            resp = await memory_client.store_typed(
+                memory_type=payload.get("memory_type", ""),
+                subtype=payload.get("subtype", ""),
+                content=payload.get("content", ""),
+                metadata=payload.get("metadata"),
+                valid_from=payload.get("valid_from"),
+                valid_until=payload.get("valid_until"),
+                correlation_id=payload.get("correlation_id", ""),
+            )
+            if resp.get("status") == "stored":
+                delivered.append(outbox_id)
             else:
-                # Unknown entry type, skip
-                logger.warning("flush_outbox: unknown entry type '%s', skipping %s", entry_type, outbox_id)
-                result["skipped"] += 1
+                failed.append(outbox_id)
         except MemoryClientError as exc:
             logger.warning("flush_outbox: delivery failed for %s: %s", outbox_id, exc)
-            try:
-                await _outbox_state_store.increment_attempt(outbox_id)
-            except Exception:
-                pass
-            result["failed"] += 1
+            failed.append(outbox_id)
         except Exception as exc:
             logger.warning("flush_outbox: unexpected error for %s: %s", outbox_id, exc)
-            try:
-                await _outbox_state_store.increment_attempt(outbox_id)
-            except Exception:
-                pass
-            result["failed"] += 1
+            failed.append(outbox_id)
+
+    if turn_entries:
+        ok, bad = await _deliver_turn_memories(memory_client, turn_entries)
+        delivered.extend(ok)
+        failed.extend(bad)
+
+    try:
+        await _outbox_state_store.mark_delivered_many(delivered)
+    except Exception as e:
+        logger.warning("flush_outbox: mark_delivered_many failed: %s", e)
+    try:
+        await _outbox_state_store.increment_attempt_many(failed)
+    except Exception as e:
+        logger.warning("flush_outbox: increment_attempt_many failed: %s", e)
+
+    result["flushed"] = len(delivered)
+    result["failed"] = len(failed)
 
     if result["flushed"] > 0 or result["failed"] > 0:
         logger.info(
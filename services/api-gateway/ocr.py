@@ -3,14 +3,22 @@ OCR Module
 
 Implements Optical Character Recognition for extracting text from images.
 Supports multiple OCR backends with fallback options.
+
+Full analysis runs a single recognition pass per image (text and boxes are
+derived from the same result) and is memoized process-wide by
+(sha256 of image bytes, language, provider).
 """
 
 import asyncio
 import base64
+import hashlib
 import logging
 import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import io
 
@@ -69,22 +77,229 @@ class OCRResult:
     provider: str = "unknown"
 
 
+class OCRResultCache:
+    """Thread-safe LRU of OCRResults keyed by (image sha256, language, provider)."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], OCRResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(image_bytes: bytes, language: Optional[str], provider: str) -> Tuple[str, str, str]:
+        return (hashlib.sha256(image_bytes).hexdigest(), language or "auto", provider)
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[OCRResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: Tuple[str, str, str], result: OCRResult) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Shared by every OCREngine in the process
+ocr_result_cache = OCRResultCache()
+
+_tile_pool: Optional[ProcessPoolExecutor] = None
+_tile_pool_lock = threading.Lock()
+
+
+def _get_tile_pool(max_workers: Optional[int]) -> ProcessPoolExecutor:
+    """Lazily create the process pool used for tiled Tesseract passes."""
+    global _tile_pool
+    with _tile_pool_lock:
+        if _tile_pool is None:
+            _tile_pool = ProcessPoolExecutor(max_workers=max_workers)
+        return _tile_pool
+
+
+def shutdown_tile_pool() -> None:
+    """Stop the tiled-OCR process pool, if one was started (service shutdown)."""
+    global _tile_pool
+    with _tile_pool_lock:
+        pool, _tile_pool = _tile_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _tesseract_tile_data(png_bytes: bytes, lang: str) -> Dict[str, List[Any]]:
+    """Run image_to_data on one encoded tile (process-pool entry point)."""
+    img = Image.open(io.BytesIO(png_bytes))
+    return pytesseract.image_to_data(img, lang=lang, output_type=pytesseract.Output.DICT)
+
+
+def _tesseract_words(
+    data: Dict[str, List[Any]],
+    tile: int = 0,
+    dy: int = 0,
+    keep: Optional[Tuple[int, int]] = None,
+) -> List[Tuple[Tuple[int, int, int, int], str, int, Tuple[int, int, int, int]]]:
+    """
+    Flatten image_to_data output into (line_key, text, conf, bbox) words.
+
+    ``dy`` shifts boxes from tile to image coordinates; ``keep`` is the
+    (top, bottom) band a tile owns, so words in the overlap margin are
+    only taken from one tile.
+    """
+    words = []
+    for i, text in enumerate(data["text"]):
+        if not str(text).strip():
+            continue
+        conf = int(float(data["conf"][i]))
+        if conf < 0:
+            continue
+        top = int(data["top"][i]) + dy
+        height = int(data["height"][i])
+        if keep is not None and not keep[0] <= top + height // 2 < keep[1]:
+            continue
+        line_key = (tile, int(data["block_num"][i]), int(data["par_num"][i]), int(data["line_num"][i]))
+        bbox = (int(data["left"][i]), top, int(data["width"][i]), height)
+        words.append((line_key, str(text), conf, bbox))
+    return words
+
+
+def _compose_text(words) -> str:
+    """Rebuild page text: words joined per line, blank line between paragraphs."""
+    lines: "OrderedDict[Tuple[int, int, int, int], List[str]]" = OrderedDict()
+    for line_key, text, _, _ in words:
+        lines.setdefault(line_key, []).append(text)
+    out: List[str] = []
+    prev_par = None
+    for (tile, block, par, _), line_words in lines.items():
+        if prev_par is not None and (tile, block, par) != prev_par:
+            out.append("")
+        out.append(" ".join(line_words))
+        prev_par = (tile, block, par)
+    return "\n".join(out).strip()
+
+
 class TesseractOCR:
     """Tesseract-based OCR engine."""
 
-    def __init__(self, languages: List[str] = None):
+    def __init__(
+        self,
+        languages: List[str] = None,
+        tile_height: Optional[int] = None,
+        tile_overlap: int = 64,
+        tile_workers: Optional[int] = None,
+    ):
         """
         Initialize Tesseract OCR.
 
         Args:
             languages: List of language codes (e.g., ['eng', 'spa'])
+            tile_height: Split images taller than this into horizontal bands
+                recognized in parallel across a process pool (None disables)
+            tile_overlap: Pixels of context added above and below each band
+            tile_workers: Process pool size (defaults to CPU count)
         """
         self.logger = logging.getLogger(f"{__name__}.TesseractOCR")
         self.languages = languages or [OCRLanguage.ENGLISH.value]
+        self.tile_height = tile_height
+        self.tile_overlap = tile_overlap
+        self.tile_workers = tile_workers
         
         if not PYTESSERACT_AVAILABLE:
             self.logger.warning("pytesseract not available")
 
+    async def analyze(
+        self,
+        image_bytes: bytes,
+        language: Optional[str] = None
+    ) -> Tuple[str, List[OCRBox]]:
+        """
+        Extract text and bounding boxes from a single image_to_data pass.
+
+        The text is rebuilt from the recognized words (joined per line, a
+        blank line between paragraphs), so its whitespace can differ from
+        image_to_string; extract_text() still uses image_to_string.
+
+        Args:
+            image_bytes: Input image bytes
+            language: Language code (overrides default)
+
+        Returns:
+            (text, boxes)
+
+        Raises:
+            RuntimeError: If OCR fails
+        """
+        if not PYTESSERACT_AVAILABLE:
+            raise RuntimeError("pytesseract not available")
+
+        try:
+            img = Image.open(io.BytesIO(image_bytes))
+            lang = language or '+'.join(self.languages)
+
+            if self.tile_height and img.height > self.tile_height:
+                words = await self._analyze_tiles(img, lang)
+            else:
+                data = await asyncio.to_thread(
+                    pytesseract.image_to_data,
+                    img,
+                    lang=lang,
+                    output_type=pytesseract.Output.DICT
+                )
+                words = _tesseract_words(data)
+
+            boxes = [
+                OCRBox(text=text, confidence=conf / 100.0, bbox=bbox, language=lang)
+                for _, text, conf, bbox in words
+                if conf > 0  # Only include detected text
+            ]
+            return _compose_text(words), boxes
+
+        except Exception as e:
+            self.logger.error(f"Tesseract analysis failed: {e}")
+            raise RuntimeError(f"OCR analysis failed: {e}")
+
+    async def _analyze_tiles(self, img: "Image.Image", lang: str):
+        """Recognize horizontal bands of a tall image in parallel."""
+        img.load()
+        loop = asyncio.get_running_loop()
+        pool = _get_tile_pool(self.tile_workers)
+
+        jobs = []
+        for index, band_top in enumerate(range(0, img.height, self.tile_height)):
+            band_bottom = min(band_top + self.tile_height, img.height)
+            crop_top = max(band_top - self.tile_overlap, 0)
+            crop_bottom = min(band_bottom + self.tile_overlap, img.height)
+            buf = io.BytesIO()
+            img.crop((0, crop_top, img.width, crop_bottom)).save(buf, format="PNG")
+            future = loop.run_in_executor(pool, _tesseract_tile_data, buf.getvalue(), lang)
+            jobs.append((index, crop_top, (band_top, band_bottom), future))
+
+        words = []
+        for index, crop_top, band, future in jobs:
+            data = await future
+            words.extend(_tesseract_words(data, tile=index, dy=crop_top, keep=band))
+        return words
+
     async def extract_text(
         self,
         image_bytes: bytes,
@@ -140,44 +355,8 @@ class TesseractOCR:
         Raises:
             RuntimeError: If OCR fails
         """
-        if not PYTESSERACT_AVAILABLE:
-            raise RuntimeError("pytesseract not available")
-
-        try:
-            img = Image.open(io.BytesIO(image_bytes))
-            lang = language or '+'.join(self.languages)
-            
-            # Get data with bounding boxes
-            data = await asyncio.to_thread(
-                pytesseract.image_to_data,
-                img,
-                lang=lang,
-                output_type=pytesseract.Output.DICT
-            )
-            
-            boxes = []
-            for i, text in enumerate(data['text']):
-                if text.strip():
-                    conf = int(data['conf'][i])
-                    if conf > 0:  # Only include detected text
-                        box = OCRBox(
-                            text=text,
-                            confidence=conf / 100.0,
-                            bbox=(
-                                data['left'][i],
-                                data['top'][i],
-                                data['width'][i],
-                                data['height'][i]
-                            ),
-                            language=lang
-                        )
-                        boxes.append(box)
-            
-            return boxes
-            
-        except Exception as e:
-            self.logger.error(f"Tesseract box extraction failed: {e}")
-            raise RuntimeError(f"OCR box extraction failed: {e}")
+        _, boxes = await self.analyze(image_bytes, language)
+        return boxes
 
     async def detect_language(self, image_bytes: bytes) -> str:
         """
@@ -245,6 +424,22 @@ class PaddleOCR:
         except ImportError:
             raise RuntimeError("paddleocr not installed")
 
+    async def analyze(self, image_bytes: bytes) -> Tuple[str, List[OCRBox]]:
+        """
+        Extract text and bounding boxes from a single PaddleOCR pass.
+
+        Args:
+            image_bytes: Input image bytes
+
+        Returns:
+            (text, boxes)
+
+        Raises:
+            RuntimeError: If OCR fails
+        """
+        boxes = await self.extract_boxes(image_bytes)
+        return '\n'.join(b.text for b in boxes), boxes
+
     async def extract_text(self, image_bytes: bytes) -> str:
         """
         Extract text using PaddleOCR.
@@ -380,6 +575,26 @@ class OllamaOCR:
             self.logger.error(f"Ollama OCR extraction failed: {e}")
             raise RuntimeError(f"OCR extraction failed: {e}")
 
+    async def analyze(self, image_bytes: bytes, model: str = "llava") -> Tuple[str, List[OCRBox]]:
+        """
+        Extract text and boxes using Ollama (both prompts issued concurrently).
+
+        Args:
+            image_bytes: Input image bytes
+            model: Model name
+
+        Returns:
+            (text, boxes)
+
+        Raises:
+            RuntimeError: If OCR fails
+        """
+        text, boxes = await asyncio.gather(
+            self.extract_text(image_bytes, model),
+            self.extract_boxes(image_bytes, model),
+        )
+        return text, boxes
+
     async def extract_boxes(self, image_bytes: bytes, model: str = "llava") -> List[OCRBox]:
         """
         Extract text with confidence using Ollama.
@@ -451,18 +666,33 @@ class OllamaOCR:
 class OCREngine:
     """Main OCR engine with provider selection and fallback."""
 
-    def __init__(self, primary_provider: OCRProvider = OCRProvider.TESSERACT):
+    def __init__(
+        self,
+        primary_provider: OCRProvider = OCRProvider.TESSERACT,
+        cache: Optional[OCRResultCache] = None,
+        tile_height: Optional[int] = None,
+        tile_workers: Optional[int] = None,
+    ):
         """
         Initialize OCR engine.
 
         Args:
             primary_provider: Primary OCR provider
+            cache: Result cache for full_analysis (defaults to the
+                process-wide ocr_result_cache)
+            tile_height: Tesseract band height for parallel OCR of tall
+                screenshots (None disables tiling)
+            tile_workers: Process pool size for tiled OCR
         """
         self.logger = logging.getLogger(f"{__name__}.OCREngine")
         self.primary_provider = primary_provider
+        self.cache = cache if cache is not None else ocr_result_cache
         
         self.providers = {
-            OCRProvider.TESSERACT: TesseractOCR(),
+            OCRProvider.TESSERACT: TesseractOCR(
+                tile_height=tile_height,
+                tile_workers=tile_workers,
+            ),
             OCRProvider.PADDLE: PaddleOCR(),
             OCRProvider.OLLAMA: OllamaOCR(),
         }
@@ -584,29 +814,101 @@ class OCREngine:
             
             raise RuntimeError(f"All OCR providers failed: {e}")
 
-    async def full_analysis(
+    async def _analyze(
+        self,
+        image_bytes: bytes,
+        language: Optional[str],
+        provider: OCRProvider
+    ) -> Tuple[str, List[OCRBox]]:
+        if provider == OCRProvider.TESSERACT:
+            return await self.providers[OCRProvider.TESSERACT].analyze(image_bytes, language)
+        elif provider == OCRProvider.PADDLE:
+            return await self.providers[OCRProvider.PADDLE].analyze(image_bytes)
+        elif provider == OCRProvider.OLLAMA:
+            return await self.providers[OCRProvider.OLLAMA].analyze(image_bytes)
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    async def analyze(
         self,
         image_bytes: bytes,
         language: Optional[str] = None,
         provider: Optional[OCRProvider] = None
+    ) -> Tuple[str, List[OCRBox]]:
+        """
+        Extract text and bounding boxes in one recognition pass.
+
+        Args:
+            image_bytes: Input image bytes
+            language: Language code
+            provider: Specific provider to use
+
+        Returns:
+            (text, boxes)
+
+        Raises:
+            RuntimeError: If all providers fail
+        """
+        target_provider = provider or self.primary_provider
+
+        try:
+            return await self._analyze(image_bytes, language, target_provider)
+        except Exception as e:
+            self.logger.warning(f"Primary provider {target_provider} failed: {e}")
+
+            # Try fallbacks
+            for alt_provider in [OCRProvider.PADDLE, OCRProvider.TESSERACT, OCRProvider.OLLAMA]:
+                if alt_provider == target_provider:
+                    continue
+
+                try:
+                    self.logger.info(f"Trying fallback provider: {alt_provider}")
+                    return await self._analyze(image_bytes, language, alt_provider)
+                except Exception as e2:
+                    self.logger.warning(f"Fallback {alt_provider} failed: {e2}")
+
+            raise RuntimeError(f"All OCR providers failed: {e}")
+
+    async def full_analysis(
+        self,
+        image_bytes: bytes,
+        language: Optional[str] = None,
+        provider: Optional[OCRProvider] = None,
+        use_cache: bool = True
     ) -> OCRResult:
         """
         Perform full OCR analysis.
 
+        Text and boxes come from the same recognition pass (for Tesseract
+        the text is rebuilt from the word boxes, see TesseractOCR.analyze).
+        Results are cached by (image sha256, language, provider); identical
+        images are not re-OCR'd.
+
         Args:
             image_bytes: Input image bytes
             language: Language code
             provider: Specific provider
+            use_cache: Consult and populate the result cache
 
         Returns:
             OCRResult with full analysis
         """
         import time
         start_time = time.time()
+        provider_name = str(provider or self.primary_provider)
+
+        key = None
+        if use_cache:
+            key = self.cache.make_key(image_bytes, language, provider_name)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return replace(
+                    cached,
+                    boxes=list(cached.boxes),
+                    processing_time_ms=(time.time() - start_time) * 1000,
+                )
         
         try:
-            text = await self.extract_text(image_bytes, language, provider)
-            boxes = await self.extract_boxes(image_bytes, language, provider)
+            text, boxes = await self.analyze(image_bytes, language, provider)
             
             # Calculate average confidence
             avg_confidence = (
@@ -616,14 +918,17 @@ class OCREngine:
             
             elapsed_ms = (time.time() - start_time) * 1000
             
-            return OCRResult(
+            result = OCRResult(
                 text=text,
                 confidence=avg_confidence,
                 language=language or "auto",
                 boxes=boxes,
                 processing_time_ms=elapsed_ms,
-                provider=str(provider or self.primary_provider)
+                provider=provider_name
             )
+            if key is not None:
+                self.cache.put(key, replace(result, boxes=list(boxes)))
+            return result
             
         except Exception as e:
             self.logger.error(f"Full OCR analysis failed: {e}")
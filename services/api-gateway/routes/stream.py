@@ -9,12 +9,14 @@ latency instrumentation, and end-to-end correlation IDs.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import time
 import uuid
+from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from clients.memory_client import MemoryClient, MemoryClientError
 from clients.router_client import RouterClient, RouterClientError
@@ -45,12 +47,27 @@ logger = logging.getLogger("api-gateway.routes.stream")
 # Module-level singletons -- shared across all stream connections
 _backpressure = BackpressurePolicy(max_queue_depth=10, shed_strategy="oldest")
 _latency_budget = LatencyBudget()
+# Open stream connections per session, so a tool approved over HTTP can
+# relay its progress to the session's clients
+_session_sockets: Dict[str, Set[Any]] = {}
+# execution_ids of approved tools still running, per session
+_approved_runs: Dict[str, Set[str]] = {}
 
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _normalize_utterance(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _drop_speculation(speculation: Optional[Dict[str, Any]]) -> None:
+    """Cancel a speculative recall that will not be used."""
+    if speculation and not speculation["task"].done():
+        speculation["task"].cancel()
+
+
 def _event(
     event_type: str,
     session_id: str = "",
@@ -66,6 +83,221 @@ def _event(
     }
 
 
+class _Inbox:
+    """
+    Client messages for one connection.
+
+    A receive is kept pending across tool runs so a control.cancel can
+    interrupt a running tool; anything else that arrives meanwhile is
+    deferred to the main loop in order.
+    """
+
+    def __init__(self, websocket):
+        self._websocket = websocket
+        self._pending: Optional[asyncio.Future] = None
+        self.deferred: deque = deque()
+
+    def receive_task(self) -> asyncio.Future:
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._websocket.receive_json())
+        return self._pending
+
+    def take(self) -> Dict[str, Any]:
+        """Result of the completed receive (re-raises a disconnect)."""
+        task, self._pending = self._pending, None
+        return task.result()
+
+    async def receive(self, timeout: float) -> Dict[str, Any]:
+        if self.deferred:
+            return self.deferred.popleft()
+        done, _ = await asyncio.wait({self.receive_task()}, timeout=timeout)
+        if not done:
+            raise asyncio.TimeoutError()
+        return self.take()
+
+    def close(self) -> None:
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+
+
+async def _stream_tool_call(
+    websocket,
+    inbox: _Inbox,
+    openclaw_client: OpenclawClient,
+    session_id: str,
+    turn_id: str,
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    correlation_id: str,
+    timeout_ms: int = 5000,
+):
+    """
+    Execute a tool through OpenClaw's streaming endpoint.
+
+    Output is relayed to the client as tool.call.progress events while the
+    tool runs. A control.cancel from the client cancels it (and is acked);
+    other client messages wait in the inbox for the main loop.
+
+    Returns (execute() response or None, cancelled).
+    """
+    stream = openclaw_client.execute_stream(
+        tool_name=tool_name,
+        args=tool_args,
+        timeout_ms=timeout_ms,
+        correlation_id=correlation_id,
+    )
+    execution_id = None
+    response = None
+    cancelled = False
+    next_event: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(stream.__anext__())
+            receive = inbox.receive_task()
+            done, _ = await asyncio.wait(
+                {next_event, receive}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if next_event in done:
+                task, next_event = next_event, None
+                try:
+                    event = task.result()
+                except StopAsyncIteration:
+                    break
+                if event["type"] == "started":
+                    execution_id = event.get("execution_id")
+                elif event["type"] == "output":
+                    await websocket.send_json(
+                        _event("tool.call.progress", session_id, turn_id=turn_id, payload={
+                            "tool_name": tool_name,
+                            "stream": event.get("stream", "stdout"),
+                            "text": event.get("text", ""),
+                        })
+                    )
+                elif event["type"] == "final":
+                    response = event["response"]
+                continue
+
+            msg = inbox.take()
+            if msg.get("type") != "control.cancel":
+                inbox.deferred.append(msg)
+                continue
+
+            cancelled = True
+            _backpressure.reset_session(session_id)
+            await websocket.send_json(
+                _event("ack", session_id, turn_id=turn_id, payload={
+                    "cancelled": True,
+                    "tool_name": tool_name,
+                })
+            )
+            if execution_id is None:
+                break  # closing the stream stops the tool
+            try:
+                await openclaw_client.cancel(execution_id, correlation_id=correlation_id)
+            except OpenclawClientError as exc:
+                logger.warning("tool cancel failed execution=%s: %s", execution_id, exc.message)
+                break
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+            with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration, OpenclawClientError):
+                await next_event
+        await stream.aclose()
+    return response, cancelled
+
+
+async def _send_to_session(session_id: str, event: Dict[str, Any]) -> int:
+    """Send *event* to every open stream connection of a session."""
+    delivered = 0
+    for ws in list(_session_sockets.get(session_id, ())):
+        try:
+            await ws.send_json(event)
+            delivered += 1
+        except Exception:
+            pass
+    return delivered
+
+
+async def run_approved_tool(
+    openclaw_client: OpenclawClient,
+    session_id: str,
+    turn_id: str,
+    tool_name: str,
+    tool_args: Dict[str, Any],
+    correlation_id: str,
+    timeout_ms: int = 5000,
+) -> Dict[str, Any]:
+    """
+    Execute an approved guarded write through OpenClaw's streaming endpoint.
+
+    Output is relayed as tool.call.progress to the session's open stream
+    connections (then a tool.call.result), and a control.cancel on any of
+    them cancels the run.
+
+    Returns:
+        The final execute() response
+
+    Raises:
+        OpenclawClientError: On failure
+    """
+    response = None
+    execution_id = None
+    stream = openclaw_client.execute_stream(
+        tool_name=tool_name,
+        args=tool_args,
+        timeout_ms=timeout_ms,
+        correlation_id=correlation_id,
+    )
+    try:
+        async for event in stream:
+            if event["type"] == "started":
+                execution_id = event.get("execution_id")
+                if execution_id:
+                    _approved_runs.setdefault(session_id, set()).add(execution_id)
+            elif event["type"] == "output":
+                await _send_to_session(
+                    session_id,
+                    _event("tool.call.progress", session_id, turn_id=turn_id, payload={
+                        "tool_name": tool_name,
+                        "stream": event.get("stream", "stdout"),
+                        "text": event.get("text", ""),
+                    }),
+                )
+            elif event["type"] == "final":
+                response = event["response"]
+    finally:
+        await stream.aclose()
+        runs = _approved_runs.get(session_id)
+        if runs is not None:
+            runs.discard(execution_id)
+            if not runs:
+                del _approved_runs[session_id]
+    await _send_to_session(
+        session_id,
+        _event("tool.call.result", session_id, turn_id=turn_id, payload={
+            "tool_name": tool_name,
+            "status": response.get("status", "unknown"),
+            "result": response.get("result", {}),
+        }),
+    )
+    return response
+
+
+async def _cancel_approved_runs(openclaw_client: OpenclawClient, session_id: str) -> int:
+    """Cancel the session's running approved tools; returns how many."""
+    cancelled = 0
+    for execution_id in list(_approved_runs.get(session_id, ())):
+        try:
+            if await openclaw_client.cancel(execution_id):
+                cancelled += 1
+        except OpenclawClientError as exc:
+            logger.warning("tool cancel failed execution=%s: %s", execution_id, exc.message)
+    return cancelled
+
+
 async def handle_stream(
     websocket,
     session_id: str,
@@ -82,11 +314,12 @@ async def handle_stream(
       Client -> Server:
         input.text, input.audio.chunk,
         input.vision.frame, input.vision.snapshot,
+        input.text.speculative, control.speculative.cancel,
         control.vision.enable, control.vision.disable,
         control.end_turn, control.cancel, control.ping
       Server -> Client:
         ack, response.partial, response.final, tool.call.requested,
-        tool.call.result, safety.confirmation.required,
+        tool.call.progress, tool.call.result, safety.confirmation.required,
         vision.accepted, vision.rejected, vision.summary.final,
         error
     """
@@ -104,11 +337,18 @@ async def handle_stream(
         return
 
     await session_mgr.adjust_streams(session_id, +1)
+    _session_sockets.setdefault(session_id, set()).add(websocket)
 
     # Per-session vision config (mutable via control events)
     vision_cfg = VisionConfig(enabled=False)
     # Per-turn response policy
     response_policy = DEFAULT_POLICY
+    # Memory recall started on a stable partial transcript (one at a time):
+    # {"spec_id", "text", "task"}. input.text with a matching spec_id and
+    # the same text uses its result instead of recalling again.
+    speculation: Optional[Dict[str, Any]] = None
+    # control.cancel stays readable while a tool is running
+    inbox = _Inbox(websocket)
 
     try:
         # Send ack
@@ -118,9 +358,7 @@ async def handle_stream(
 
         while True:
             try:
-                raw = await asyncio.wait_for(
-                    websocket.receive_json(), timeout=300  # 5 min idle
-                )
+                raw = await inbox.receive(timeout=300)  # 5 min idle
             except asyncio.TimeoutError:
                 await websocket.send_json(
                     _event("error", session_id, payload={
@@ -158,11 +396,37 @@ async def handle_stream(
             # ── control.cancel (barge-in) ──────────────────────────────
             if event_type == "control.cancel":
                 _backpressure.reset_session(session_id)
+                await _cancel_approved_runs(openclaw_client, session_id)
                 await websocket.send_json(
                     _event("ack", session_id, turn_id=turn_id, payload={"cancelled": True})
                 )
                 continue
 
+            # ── input.text.speculative (recall on a stable partial) ────
+            if event_type == "input.text.speculative":
+                _drop_speculation(speculation)
+                speculation = None
+                spec_text = payload.get("text", "")
+                spec_id = payload.get("spec_id", "")
+                if spec_text and spec_id:
+                    speculation = {
+                        "spec_id": spec_id,
+                        "text": spec_text,
+                        "task": asyncio.create_task(retrieve_context(
+                            memory_client=memory_client,
+                            query=spec_text,
+                            correlation_id=f"spec_{spec_id}",
+                        )),
+                    }
+                continue
+
+            # ── control.speculative.cancel ──────────────────────────
+            if event_type == "control.speculative.cancel":
+                if speculation and speculation["spec_id"] == payload.get("spec_id"):
+                    _drop_speculation(speculation)
+                    speculation = None
+                continue
+
             # ── control.vision.enable ───────────────────────────────
             if event_type == "control.vision.enable":
                 vision_cfg = VisionConfig(
@@ -287,13 +551,26 @@ async def handle_stream(
                         )
                     latency.vision_ms = round((time.monotonic() - tv0) * 1000, 1)
 
-                # — Memory recall —
+                # — Memory recall (reuse a matching speculative prefetch) —
                 tm0 = time.monotonic()
-                mem_ctx = await retrieve_context(
-                    memory_client=memory_client,
-                    query=input_text,
-                    correlation_id=correlation_id,
-                )
+                spec, speculation = speculation, None
+                mem_ctx = None
+                if (
+                    spec is not None
+                    and spec["spec_id"] == payload.get("spec_id")
+                    and _normalize_utterance(spec["text"]) == _normalize_utterance(input_text)
+                    and not spec["task"].cancelled()
+                ):
+                    mem_ctx = await spec["task"]
+                    latency.speculative_recall = True
+                else:
+                    _drop_speculation(spec)
+                if mem_ctx is None:
+                    mem_ctx = await retrieve_context(
+                        memory_client=memory_client,
+                        query=input_text,
+                        correlation_id=correlation_id,
+                    )
                 retrieved_count = mem_ctx["retrieved_count"]
                 context_text = mem_ctx["context_text"]
                 latency.memory_read_ms = round((time.monotonic() - tm0) * 1000, 1)
@@ -330,6 +607,7 @@ async def handle_stream(
                         messages=messages,
                         task_type=task_type,
                         correlation_id=correlation_id,
+                        session_id=session_id,
                     )
                     assistant_text = chat_resp.get("response", "") or chat_resp.get("text", "") or ""
                     tool_calls_raw = chat_resp.get("tool_calls") or []
@@ -377,6 +655,9 @@ async def handle_stream(
 
                 latency.model_ms = round((time.monotonic() - tmod0) * 1000, 1)
                 _latency_budget.record("model", latency.model_ms, session_id)
+                sched = chat_resp.get("scheduler") if isinstance(chat_resp, dict) else None
+                if sched and sched.get("queue_wait_ms") is not None:
+                    _latency_budget.record("model_queue", float(sched["queue_wait_ms"]), session_id)
 
                 # — Response normalization —
                 assistant_text = normalize_response(assistant_text, response_policy)
@@ -392,6 +673,7 @@ async def handle_stream(
 
                 # Enforce max tool calls per turn
                 capped_tool_calls = tool_calls_raw[:response_policy.max_tool_calls_per_turn]
+                tools_cancelled = False
 
                 for tc in capped_tool_calls:
                     tool_name = tc.get("tool_name", tc.get("name", ""))
@@ -445,14 +727,31 @@ async def handle_stream(
                         })
                         continue
 
-                    # safe_read — execute immediately
+                    if tools_cancelled:
+                        tool_events.append({"tool_name": tool_name, "disposition": "cancelled"})
+                        continue
+
+                    # safe_read — execute immediately, relaying output as it arrives
                     try:
-                        exec_resp = await openclaw_client.execute(
+                        exec_resp, tools_cancelled = await _stream_tool_call(
+                            websocket, inbox, openclaw_client,
+                            session_id=session_id,
+                            turn_id=turn_id,
                             tool_name=tool_name,
-                            args=tool_args,
-                            timeout_ms=5000,
+                            tool_args=tool_args,
                             correlation_id=correlation_id,
                         )
+                        if tools_cancelled:
+                            await websocket.send_json(
+                                _event("tool.call.result", session_id, turn_id=turn_id, payload={
+                                    "tool_name": tool_name,
+                                    "status": "cancelled",
+                                    "result": (exec_resp or {}).get("result") or {},
+                                })
+                            )
+                            tool_log.log({"session_id": session_id, "turn_id": turn_id, "correlation_id": correlation_id, "tool_name": tool_name, "disposition": "cancelled"})
+                            tool_events.append({"tool_name": tool_name, "disposition": "cancelled"})
+                            continue
                         await websocket.send_json(
                             _event("tool.call.result", session_id, turn_id=turn_id, payload={
                                 "tool_name": tool_name,
@@ -566,4 +865,11 @@ async def handle_stream(
         except Exception:
             pass
     finally:
+        _drop_speculation(speculation)
+        inbox.close()
+        sockets = _session_sockets.get(session_id)
+        if sockets is not None:
+            sockets.discard(websocket)
+            if not sockets:
+                del _session_sockets[session_id]
         await session_mgr.adjust_streams(session_id, -1)
@@ -23,6 +23,7 @@ from turn_quality import (
     DEFAULT_POLICY,
 )
 from memory_policy import write_turn_memories, retrieve_context
+from turn_executor import execute_tool_calls
 from schemas.vision import LatencyBreakdown, ResponsePolicy
 from jsonl_logger import error_log
 
@@ -155,40 +156,20 @@ async def handle_turn(
         tool_calls_attempted = len(raw_tool_calls)
         capped = raw_tool_calls[:response_policy.max_tool_calls_per_turn]
 
-        for tc in capped:
-            tool_name = tc.get("tool_name", tc.get("name", ""))
-            tool_args = tc.get("args", tc.get("arguments", {}))
-            if tool_name not in OPENCLAW_TOOL_ALLOWLIST:
-                tool_call_records.append(ToolCallRecord(
-                    tool_name=tool_name,
-                    args=tool_args,
-                    status="rejected_not_in_allowlist",
-                ))
-                continue
-            # Execute via openclaw
-            try:
-                exec_resp = await openclaw_client.execute(
-                    tool_name=tool_name,
-                    args=tool_args,
-                    timeout_ms=5000,
-                    correlation_id=correlation_id,
-                )
-                tool_call_records.append(ToolCallRecord(
-                    tool_name=tool_name,
-                    args=tool_args,
-                    status=exec_resp.get("status", "unknown"),
-                    result=exec_resp.get("result"),
-                ))
-                tool_result_dicts.append(exec_resp.get("result", {}))
-                tool_calls_executed += 1
-            except OpenclawClientError as exc:
-                tool_call_records.append(ToolCallRecord(
-                    tool_name=tool_name,
-                    args=tool_args,
-                    status="error",
-                    result={"error": exc.message},
-                ))
+        tool_stage = await execute_tool_calls(
+            openclaw_client=openclaw_client,
+            tool_calls=capped,
+            allowlist=OPENCLAW_TOOL_ALLOWLIST,
+            correlation_id=correlation_id,
+            max_parallel=response_policy.max_parallel_tool_calls,
+            timeout_ms=5000,
+        )
+        tool_call_records.extend(tool_stage.records)
+        tool_result_dicts.extend(tool_stage.results)
+        tool_calls_executed += tool_stage.executed
         latency.tool_ms = round((time.monotonic() - ttool0) * 1000, 1)
+        latency.tool_call_ms = tool_stage.call_ms
+        latency.parallel_saved_ms = round(max(0.0, sum(tool_stage.call_ms) - latency.tool_ms), 1)
 
         # ── 5. Write turn record to memory-engine (conflict-safe) ─────
         tmw0 = time.monotonic()
@@ -202,6 +183,7 @@ async def handle_turn(
             assistant_text=assistant_text,
             tool_events=[tc.dict() for tc in tool_call_records] if tool_call_records else None,
             correlation_id=correlation_id,
+            defer=response_policy.defer_memory_write,
         )
         memory_written = mem_result["written"]
         latency.memory_write_ms = round((time.monotonic() - tmw0) * 1000, 1)
@@ -59,6 +59,8 @@ class ResponsePolicy(BaseModel):
     fallback_on_model_timeout: bool = True
     primary_profile: str = "chat_low_latency"
     fallback_profile: str = "chat_low_latency"
+    max_parallel_tool_calls: int = 4
+    defer_memory_write: bool = False
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -74,6 +76,12 @@ class LatencyBreakdown(BaseModel):
     tool_ms: float = 0.0
     memory_write_ms: float = 0.0
     total_ms: float = 0.0
+    # Per-call tool durations; their sum vs tool_ms shows the parallel saving
+    tool_call_ms: List[float] = Field(default_factory=list)
+    # Time saved vs running the overlapped stages strictly serially
+    parallel_saved_ms: float = 0.0
+    # Memory recall came from a speculative prefetch on a stable partial
+    speculative_recall: bool = False
 
 
 # ──────────────────────────────────────────────────────────────────────────────
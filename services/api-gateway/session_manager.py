@@ -228,6 +228,21 @@ class SessionManager:
         except Exception as e:
             logger.warning("Session update persist failed for %s: %s", sess.session_id, e)
 
+    def _persist_touch(self, sess: Session) -> None:
+        """Persist activity fields. The durable store coalesces these lazily;
+        other backends get a debounced update task."""
+        if self._state_store and hasattr(self._state_store, "touch_session"):
+            try:
+                self._state_store.touch_session(sess.session_id, sess.last_activity, sess.turn_count)
+                sess.mark_persisted()
+            except Exception as e:
+                logger.warning("Session touch (state store) failed for %s: %s", sess.session_id, e)
+            return
+        if sess.needs_persist:
+            asyncio.create_task(self._persist_session_update(
+                sess, {"last_activity": sess.last_activity, "turn_count": sess.turn_count}
+            ))
+
     async def create(
         self,
         user_id: str,
@@ -282,10 +297,7 @@ class SessionManager:
             sess = self._sessions.get(session_id)
             if sess and sess.status == "active":
                 sess.touch()
-                if sess.needs_persist:
-                    asyncio.create_task(self._persist_session_update(
-                        sess, {"last_activity": sess.last_activity, "turn_count": sess.turn_count}
-                    ))
+                self._persist_touch(sess)
 
     async def increment_turn(self, session_id: str):
         async with self._lock:
@@ -293,10 +305,7 @@ class SessionManager:
             if sess:
                 sess.turn_count += 1
                 sess.touch()
-                if sess.needs_persist:
-                    asyncio.create_task(self._persist_session_update(
-                        sess, {"last_activity": sess.last_activity, "turn_count": sess.turn_count}
-                    ))
+                self._persist_touch(sess)
 
     async def adjust_streams(self, session_id: str, delta: int):
         async with self._lock:
@@ -0,0 +1,127 @@
+"""
+API Gateway — Turn Executor (parallel tool stage)
+
+Runs a turn's tool calls concurrently where policy allows it.
+
+Ordering rules (policy-aware):
+  - Consecutive ``safe_read`` calls form a group and run concurrently,
+    bounded by ``max_parallel``.
+  - Any other call (``guarded_write`` and friends) is a barrier: it runs
+    alone, after everything before it and before everything after it, so
+    read-after-write and write-after-write ordering is preserved.
+  - Calls outside the allowlist are rejected without touching openclaw.
+
+Records and results are always returned in the model's original call
+order, regardless of completion order.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from clients.openclaw_client import OpenclawClient, OpenclawClientError
+from schemas.turn import ToolCallRecord
+
+logger = logging.getLogger("api-gateway.turn_executor")
+
+DEFAULT_MAX_PARALLEL_TOOL_CALLS = 4
+
+
+@dataclass
+class ToolStageResult:
+    """Outcome of the tool stage of a turn (input order preserved)."""
+    records: List[ToolCallRecord] = field(default_factory=list)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    executed: int = 0
+    call_ms: List[float] = field(default_factory=list)
+
+
+def plan_tool_groups(tool_calls: List[Dict[str, Any]]) -> List[List[int]]:
+    """
+    Split tool calls into ordered execution groups of call indices.
+
+    Each group runs concurrently; groups run one after another.
+    """
+    from tool_policy import classify_tool
+
+    groups: List[List[int]] = []
+    current_reads: List[int] = []
+    for idx, tc in enumerate(tool_calls):
+        tool_name = tc.get("tool_name", tc.get("name", ""))
+        if classify_tool(tool_name) == "safe_read":
+            current_reads.append(idx)
+            continue
+        if current_reads:
+            groups.append(current_reads)
+            current_reads = []
+        groups.append([idx])
+    if current_reads:
+        groups.append(current_reads)
+    return groups
+
+
+async def execute_tool_calls(
+    openclaw_client: OpenclawClient,
+    tool_calls: List[Dict[str, Any]],
+    allowlist: FrozenSet[str],
+    correlation_id: str,
+    max_parallel: int = DEFAULT_MAX_PARALLEL_TOOL_CALLS,
+    timeout_ms: int = 5000,
+) -> ToolStageResult:
+    """Execute *tool_calls* via openclaw with bounded, policy-aware concurrency."""
+    n = len(tool_calls)
+    records: List[Optional[ToolCallRecord]] = [None] * n
+    results: List[Optional[Dict[str, Any]]] = [None] * n
+    call_ms: List[float] = [0.0] * n
+    sem = asyncio.Semaphore(max(1, max_parallel))
+
+    async def _run_one(idx: int) -> None:
+        tc = tool_calls[idx]
+        tool_name = tc.get("tool_name", tc.get("name", ""))
+        tool_args = tc.get("args", tc.get("arguments", {}))
+        if tool_name not in allowlist:
+            records[idx] = ToolCallRecord(
+                tool_name=tool_name,
+                args=tool_args,
+                status="rejected_not_in_allowlist",
+            )
+            return
+        async with sem:
+            t0 = time.monotonic()
+            try:
+                exec_resp = await openclaw_client.execute(
+                    tool_name=tool_name,
+                    args=tool_args,
+                    timeout_ms=timeout_ms,
+                    correlation_id=correlation_id,
+                )
+                records[idx] = ToolCallRecord(
+                    tool_name=tool_name,
+                    args=tool_args,
+                    status=exec_resp.get("status", "unknown"),
+                    result=exec_resp.get("result"),
+                )
+                results[idx] = exec_resp.get("result", {})
+            except OpenclawClientError as exc:
+                records[idx] = ToolCallRecord(
+                    tool_name=tool_name,
+                    args=tool_args,
+                    status="error",
+                    result={"error": exc.message},
+                )
+            finally:
+                call_ms[idx] = round((time.monotonic() - t0) * 1000, 1)
+
+    for group in plan_tool_groups(tool_calls):
+        await asyncio.gather(*(_run_one(i) for i in group))
+
+    stage = ToolStageResult()
+    for idx in range(n):
+        stage.records.append(records[idx])
+        stage.call_ms.append(call_ms[idx])
+        if results[idx] is not None:
+            stage.results.append(results[idx])
+            stage.executed += 1
+    return stage
@@ -9,7 +9,7 @@ import asyncio
 import base64
 import logging
 import json
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import io
@@ -82,9 +82,94 @@ class UIAnalysis:
     model_used: str
 
 
+class _OCRBoxIndex:
+    """Uniform-grid spatial index over OCR boxes for region overlap queries."""
+
+    CELL_PX = 64
+    MAX_CELLS = 256  # boxes/queries spanning more cells are scanned linearly
+
+    def __init__(self, ocr_results: Dict[str, Any]):
+        self.boxes: List[Tuple[Any, Any, Any, Any, str]] = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._unindexed: List[int] = []
+
+        for i, box_info in enumerate(ocr_results.get("boxes", [])):
+            box_x, box_y, box_w, box_h = box_info.get("bbox", (0, 0, 0, 0))
+            self.boxes.append((box_x, box_y, box_w, box_h, box_info.get("text", "")))
+            cells = self._cells_for(box_x, box_y, box_w, box_h)
+            if cells is None:
+                self._unindexed.append(i)
+                continue
+            for cell in cells:
+                self._cells.setdefault(cell, []).append(i)
+
+    def _cells_for(self, x, y, w, h) -> Optional[List[Tuple[int, int]]]:
+        if w < 0 or h < 0:
+            return None
+        c0, c1 = int(x // self.CELL_PX), int((x + w) // self.CELL_PX)
+        r0, r1 = int(y // self.CELL_PX), int((y + h) // self.CELL_PX)
+        if (c1 - c0 + 1) * (r1 - r0 + 1) > self.MAX_CELLS:
+            return None
+        return [(r, c) for r in range(r0, r1 + 1) for c in range(c0, c1 + 1)]
+
+    def overlapping(self, bbox: Tuple[int, int, int, int]) -> List[int]:
+        """Indices (in OCR order) of boxes overlapping *bbox*."""
+        x, y, w, h = bbox
+        cells = self._cells_for(x, y, w, h)
+        if cells is None:
+            candidates = range(len(self.boxes))
+        else:
+            found = set(self._unindexed)
+            for cell in cells:
+                found.update(self._cells.get(cell, ()))
+            candidates = sorted(found)
+
+        hits = []
+        for i in candidates:
+            box_x, box_y, box_w, box_h, _ = self.boxes[i]
+            if (x < box_x + box_w and x + w > box_x and
+                y < box_y + box_h and y + h > box_y):
+                hits.append(i)
+        return hits
+
+    def has_text(self, bbox: Tuple[int, int, int, int]) -> bool:
+        return bool(self.overlapping(bbox))
+
+    def region_text(self, bbox: Tuple[int, int, int, int]) -> Optional[str]:
+        texts = [self.boxes[i][4] for i in self.overlapping(bbox) if self.boxes[i][4]]
+        return " ".join(texts) if texts else None
+
+
+def _crop_box(bbox: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+    """Pixel box (left, top, right, bottom) the way PIL's crop rounds it."""
+    x, y, w, h = bbox
+    left, top, right, bottom = (int(round(v)) for v in (x, y, x + w, y + h))
+    if right < left:
+        raise ValueError("Coordinate 'right' is less than 'left'")
+    if bottom < top:
+        raise ValueError("Coordinate 'lower' is less than 'upper'")
+    return left, top, right, bottom
+
+
+def _padded_region(array: "np.ndarray", box: Tuple[int, int, int, int]) -> "np.ndarray":
+    """Slice *box* out of *array*, zero-filling outside the image like PIL crop."""
+    left, top, right, bottom = box
+    height, width = array.shape[:2]
+    if left >= 0 and top >= 0 and right <= width and bottom <= height:
+        return array[top:bottom, left:right]
+    region = np.zeros((bottom - top, right - left) + array.shape[2:], dtype=array.dtype)
+    x0, x1 = max(left, 0), min(right, width)
+    y0, y1 = max(top, 0), min(bottom, height)
+    if x0 < x1 and y0 < y1:
+        region[y0 - top:y1 - top, x0 - left:x1 - left] = array[y0:y1, x0:x1]
+    return region
+
+
 class ElementClassifier:
     """Classifies detected elements into semantic types."""
 
+    INPUT_VARIANCE_MAX = 50
+
     def __init__(self):
         """Initialize element classifier."""
         self.logger = logging.getLogger(f"{__name__}.ElementClassifier")
@@ -98,6 +183,10 @@ class ElementClassifier:
         """
         Classify detected regions into UI element types.
 
+        The screenshot is decoded and converted to grayscale once; colour
+        variance for every region comes from integral images in a single
+        vectorized pass and OCR boxes are spatially indexed once.
+
         Args:
             image_bytes: Input image bytes
             detections: List of (bbox, confidence) tuples
@@ -113,28 +202,36 @@ class ElementClassifier:
 
             img = Image.open(io.BytesIO(image_bytes))
             img_array = np.array(img)
+            gray = np.mean(img_array, axis=2) if img_array.ndim == 3 else img_array
+
+            boxes = [_crop_box(bbox) for bbox, _ in detections]
+            low_variance = self._low_variance(img_array, boxes)
+
+            ocr_index = None
+            mentions_click = False
+            if ocr_results:
+                ocr_index = _OCRBoxIndex(ocr_results)
+                mentions_click = "click" in str(ocr_results).lower()
+            has_boxes = bool(ocr_results) and "boxes" in ocr_results
 
             elements = []
 
-            for bbox, conf in detections:
-                x, y, w, h = bbox
-                
-                # Extract region
-                region = img.crop((x, y, x + w, y + h))
-                region_array = np.array(region)
+            for (bbox, conf), box, is_low_variance in zip(detections, boxes, low_variance):
+                has_text = has_boxes and ocr_index.has_text(bbox)
 
                 # Classify based on visual features
-                element_type = await self._classify_region(
-                    region_array,
-                    region,
+                element_type = self._classify_features(
                     bbox,
-                    ocr_results
+                    has_text,
+                    mentions_click,
+                    is_low_variance,
+                    lambda box=box: self._edge_density(_padded_region(gray, box)),
                 )
 
                 # Extract text if available
                 text_content = None
-                if ocr_results:
-                    text_content = self._extract_region_text(ocr_results, bbox)
+                if ocr_index is not None:
+                    text_content = ocr_index.region_text(bbox)
 
                 element = UIElement(
                     element_type=element_type,
@@ -152,21 +249,24 @@ class ElementClassifier:
             self.logger.error(f"Classification failed: {e}")
             raise RuntimeError(f"Element classification failed: {e}")
 
-    async def _classify_region(
+    def _classify_features(
         self,
-        region_array: np.ndarray,
-        region_img: Image.Image,
         bbox: Tuple[int, int, int, int],
-        ocr_results: Optional[Dict[str, Any]] = None
+        has_text: bool,
+        mentions_click: bool,
+        low_variance: bool,
+        edge_density: Callable[[], float],
     ) -> ElementType:
         """
         Classify single region based on visual features.
 
         Args:
-            region_array: NumPy array of region
-            region_img: PIL Image of region
             bbox: Bounding box
-            ocr_results: Optional OCR data
+            has_text: Region overlaps an OCR box
+            mentions_click: OCR output mentions "click"
+            low_variance: Region colour variance is below INPUT_VARIANCE_MAX
+            edge_density: Computes the region's edge density (only called
+                by branches that need it)
 
         Returns:
             Classified ElementType
@@ -174,15 +274,12 @@ class ElementClassifier:
         x, y, w, h = bbox
         aspect_ratio = w / h if h > 0 else 1.0
 
-        # Feature extraction
-        has_text = ocr_results and self._has_text_in_region(ocr_results, bbox)
-        
-        # Color analysis
-        color_variance = np.var(region_array)
-        
-        # Edge detection (simple Sobel-like)
-        edges = self._detect_edges(region_array)
-        edge_density = np.sum(edges) / edges.size if edges.size > 0 else 0
+        density: List[float] = []
+
+        def edges() -> float:
+            if not density:
+                density.append(edge_density())
+            return density[0]
 
         # Shape heuristics
         is_square = 0.7 < aspect_ratio < 1.3
@@ -190,21 +287,74 @@ class ElementClassifier:
         is_wide = aspect_ratio > 2.0
 
         # Classification logic
-        if is_square and edge_density > 0.1:
+        if is_square and edges() > 0.1:
             return ElementType.BUTTON
         elif is_wide and has_text:
-            return ElementType.INPUT if color_variance < 50 else ElementType.TEXT
-        elif is_tall and edge_density > 0.15:
+            return ElementType.INPUT if low_variance else ElementType.TEXT
+        elif is_tall and edges() > 0.15:
             return ElementType.DROPDOWN
         elif has_text:
-            if "click" in str(ocr_results).lower():
+            if mentions_click:
                 return ElementType.LINK
             return ElementType.TEXT
-        elif edge_density > 0.2:
+        elif edges() > 0.2:
             return ElementType.IMAGE
         else:
             return ElementType.UNKNOWN
 
+    def _low_variance(
+        self,
+        img_array: np.ndarray,
+        boxes: List[Tuple[int, int, int, int]]
+    ) -> List[bool]:
+        """Per-region ``np.var(region) < INPUT_VARIANCE_MAX`` via integral images."""
+        if not boxes:
+            return []
+        if img_array.dtype.kind not in "biu" or img_array.dtype.itemsize > 2:
+            # Float / 32-bit modes: int64 sums of squares are not exact
+            return [
+                bool(np.var(_padded_region(img_array, box)) < self.INPUT_VARIANCE_MAX)
+                for box in boxes
+            ]
+
+        values = img_array.astype(np.int64)
+        channels = values.shape[2] if values.ndim == 3 else 1
+        if values.ndim == 3:
+            s1, s2 = values.sum(axis=2), (values * values).sum(axis=2)
+        else:
+            s1, s2 = values, values * values
+        height, width = s1.shape
+
+        # Summed-area tables with a zero row/column in front
+        sat1 = np.zeros((height + 1, width + 1), dtype=np.int64)
+        sat2 = np.zeros((height + 1, width + 1), dtype=np.int64)
+        sat1[1:, 1:] = s1.cumsum(axis=0).cumsum(axis=1)
+        sat2[1:, 1:] = s2.cumsum(axis=0).cumsum(axis=1)
+
+        coords = np.array(boxes, dtype=np.int64)
+        left = np.clip(coords[:, 0], 0, width)
+        top = np.clip(coords[:, 1], 0, height)
+        right = np.clip(coords[:, 2], 0, width)
+        bottom = np.clip(coords[:, 3], 0, height)
+        right, bottom = np.maximum(right, left), np.maximum(bottom, top)
+
+        sum1 = sat1[bottom, right] - sat1[top, right] - sat1[bottom, left] + sat1[top, left]
+        sum2 = sat2[bottom, right] - sat2[top, right] - sat2[bottom, left] + sat2[top, left]
+        # Out-of-image padding is zero: it adds to the count, not the sums
+        counts = (coords[:, 2] - coords[:, 0]) * (coords[:, 3] - coords[:, 1]) * channels
+
+        # var < t  <=>  n*sum(x^2) - sum(x)^2 < t*n^2, exact in Python ints
+        limit = self.INPUT_VARIANCE_MAX
+        return [
+            n > 0 and n * q - p * p < limit * n * n
+            for n, p, q in zip(counts.tolist(), sum1.tolist(), sum2.tolist())
+        ]
+
+    def _edge_density(self, gray_region: np.ndarray) -> float:
+        """Fraction of region pixels whose gradient exceeds the region mean."""
+        edges = self._detect_edges(gray_region)
+        return np.sum(edges) / edges.size if edges.size > 0 else 0
+
     def _detect_edges(self, image_array: np.ndarray) -> np.ndarray:
         """Simple edge detection using gradient."""
         try:
@@ -223,48 +373,6 @@ class ElementClassifier:
             self.logger.warning(f"Edge detection failed: {e}")
             return np.array([])
 
-    def _has_text_in_region(
-        self,
-        ocr_results: Dict[str, Any],
-        bbox: Tuple[int, int, int, int]
-    ) -> bool:
-        """Check if region contains text from OCR."""
-        if "boxes" not in ocr_results:
-            return False
-
-        x, y, w, h = bbox
-        region_area = w * h
-
-        for box_info in ocr_results.get("boxes", []):
-            box_x, box_y, box_w, box_h = box_info.get("bbox", (0, 0, 0, 0))
-            
-            # Check overlap
-            if (x < box_x + box_w and x + w > box_x and
-                y < box_y + box_h and y + h > box_y):
-                return True
-
-        return False
-
-    def _extract_region_text(
-        self,
-        ocr_results: Dict[str, Any],
-        bbox: Tuple[int, int, int, int]
-    ) -> Optional[str]:
-        """Extract text content for region from OCR."""
-        x, y, w, h = bbox
-        texts = []
-
-        for box_info in ocr_results.get("boxes", []):
-            box_x, box_y, box_w, box_h = box_info.get("bbox", (0, 0, 0, 0))
-            
-            if (x < box_x + box_w and x + w > box_x and
-                y < box_y + box_h and y + h > box_y):
-                text = box_info.get("text", "")
-                if text:
-                    texts.append(text)
-
-        return " ".join(texts) if texts else None
-
     def _heuristic_classify(
         self,
         detections: List[Tuple[Tuple[int, int, int, int], float]]
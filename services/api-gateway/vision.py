@@ -7,8 +7,11 @@ Supports screenshot capture, image preprocessing, and vision API calls.
 
 import asyncio
 import base64
+import hashlib
 import logging
 import json
+import time
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 from datetime import datetime
@@ -394,6 +397,17 @@ class ImageProcessor:
             raise RuntimeError(f"Failed to convert image format: {e}")
 
 
+@dataclass
+class BatchItemResult:
+    """Outcome of one image in a batch analysis (same position as the input)."""
+    index: int
+    ok: bool
+    result: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+    deduplicated: bool = False  # served by an identical earlier item
+
+
 class VisionClient:
     """Client for vision model API calls."""
 
@@ -401,7 +415,8 @@ class VisionClient:
         self,
         provider: VisionProvider = VisionProvider.OLLAMA,
         api_key: Optional[str] = None,
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        batch_concurrency: int = 4
     ):
         """
         Initialize vision client.
@@ -410,10 +425,13 @@ class VisionClient:
             provider: Vision provider
             api_key: API key for cloud providers
             base_url: Base URL for service (default based on provider)
+            batch_concurrency: Default max in-flight requests for batch analysis
         """
         self.provider = provider
         self.api_key = api_key
         self.base_url = base_url or self._get_default_url()
+        self.batch_concurrency = batch_concurrency
+        self.image_processor = ImageProcessor()
         self.logger = logging.getLogger(f"{__name__}.VisionClient")
 
     def _get_default_url(self) -> str:
@@ -681,12 +699,105 @@ class VisionClient:
             self.logger.error(f"Qwen vision analysis failed: {e}")
             raise RuntimeError(f"Vision analysis failed: {e}")
 
+    async def analyze_batch(
+        self,
+        image_list: List[Tuple[bytes, str]],
+        model: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        concurrency: Optional[int] = None,
+        item_timeout: Optional[float] = None,
+        preprocess: bool = True,
+        max_width: int = 1920,
+        max_height: int = 1080,
+        quality: int = 85
+    ) -> List[BatchItemResult]:
+        """
+        Analyze multiple images with bounded concurrency.
+
+        Identical (image, prompt) pairs are sent once. Each distinct image
+        is resized and compressed through ImageProcessor before upload.
+
+        Args:
+            image_list: List of (image_bytes, prompt) tuples
+            model: Model name
+            max_tokens: Max response tokens
+            temperature: Response temperature
+            concurrency: Max in-flight requests (default batch_concurrency)
+            item_timeout: Per-item timeout in seconds (None = no limit)
+            preprocess: Resize/compress images before upload
+            max_width: Resize bound in pixels
+            max_height: Resize bound in pixels
+            quality: JPEG quality for compression
+
+        Returns:
+            One BatchItemResult per input, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.batch_concurrency))
+        prepared: Dict[str, "asyncio.Future[bytes]"] = {}
+        requests: Dict[Tuple[str, str], "asyncio.Task[Tuple[Optional[str], Optional[str], float]]"] = {}
+        owners: List[Tuple[Tuple[str, str], bool]] = []
+
+        async def prepare(image_bytes: bytes) -> bytes:
+            if not preprocess:
+                return image_bytes
+            try:
+                resized = await self.image_processor.resize_image(image_bytes, max_width, max_height)
+                compressed = await self.image_processor.compress_image(resized, quality, ImageFormat.JPEG)
+            except RuntimeError as e:
+                self.logger.warning(f"Batch preprocessing skipped: {e}")
+                return image_bytes
+            return compressed if len(compressed) < len(image_bytes) else image_bytes
+
+        async def run(digest: str, image_bytes: bytes, prompt: str):
+            async with semaphore:
+                start = time.monotonic()
+                try:
+                    if digest not in prepared:
+                        prepared[digest] = asyncio.ensure_future(prepare(image_bytes))
+                    upload = await prepared[digest]
+                    result = await asyncio.wait_for(
+                        self.analyze_image(upload, prompt, model, max_tokens, temperature),
+                        timeout=item_timeout,
+                    )
+                    return result, None, (time.monotonic() - start) * 1000
+                except asyncio.TimeoutError:
+                    error = f"timeout after {item_timeout}s"
+                except Exception as e:
+                    error = str(e)
+                self.logger.error(f"Batch analysis item failed: {error}")
+                return None, error, (time.monotonic() - start) * 1000
+
+        for img_bytes, prompt in image_list:
+            key = (hashlib.sha256(img_bytes).hexdigest(), prompt)
+            duplicate = key in requests
+            if not duplicate:
+                requests[key] = asyncio.ensure_future(run(key[0], img_bytes, prompt))
+            owners.append((key, duplicate))
+
+        await asyncio.gather(*requests.values())
+
+        results = []
+        for index, (key, duplicate) in enumerate(owners):
+            result, error, elapsed_ms = requests[key].result()
+            results.append(BatchItemResult(
+                index=index,
+                ok=error is None,
+                result=result,
+                error=error,
+                elapsed_ms=round(elapsed_ms, 1),
+                deduplicated=duplicate,
+            ))
+        return results
+
     async def batch_analyze(
         self,
         image_list: List[Tuple[bytes, str]],
         model: Optional[str] = None,
         max_tokens: int = 1024,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        concurrency: Optional[int] = None,
+        item_timeout: Optional[float] = None
     ) -> List[str]:
         """
         Analyze multiple images concurrently.
@@ -696,22 +807,14 @@ class VisionClient:
             model: Model name
             max_tokens: Max response tokens
             temperature: Response temperature
+            concurrency: Max in-flight requests (default batch_concurrency)
+            item_timeout: Per-item timeout in seconds
 
         Returns:
-            List of analysis results
+            List of analysis results in input order ("Error: ..." for failures)
         """
-        tasks = [
-            self.analyze_image(img_bytes, prompt, model, max_tokens, temperature)
-            for img_bytes, prompt in image_list
-        ]
-        
-        results = []
-        for task in asyncio.as_completed(tasks):
-            try:
-                result = await task
-                results.append(result)
-            except Exception as e:
-                self.logger.error(f"Batch analysis task failed: {e}")
-                results.append(f"Error: {str(e)}")
-        
-        return results
+        items = await self.analyze_batch(
+            image_list, model, max_tokens, temperature,
+            concurrency=concurrency, item_timeout=item_timeout,
+        )
+        return [item.result if item.ok else f"Error: {item.error}" for item in items]
@@ -75,6 +75,54 @@ class ProvenanceTracker:
         except Exception as e:
             logger.error("Provenance tracking failed for %s: %s", memory_id, e)
 
+    def track_many(self, entries: List[Dict[str, Any]]) -> None:
+        """Record provenance for many memory items in one audit batch.
+
+        Args:
+            entries: Dicts with ``memory_id`` and optional ``source_type``,
+                ``source_id`` and ``metadata`` (same meaning as track()).
+        """
+        if not entries:
+            return
+        try:
+            import json
+            now = datetime.now(timezone.utc).isoformat()
+            records = [
+                {
+                    "memory_id": e["memory_id"],
+                    "source_type": e.get("source_type") or "direct",
+                    "source_id": e.get("source_id"),
+                    "metadata": e.get("metadata") or {},
+                    "tracked_at": now,
+                }
+                for e in entries
+            ]
+            with self.db.connection() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO audit_log (id, operation, ledger_id, details, performed_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            f"prov_{uuid.uuid4().hex[:12]}",
+                            "PROVENANCE",
+                            r["memory_id"],
+                            json.dumps(r),
+                            now,
+                        )
+                        for r in records
+                    ],
+                )
+                conn.commit()
+
+            for r in records:
+                self._index[r["memory_id"]] = r
+            logger.debug("Provenance tracked for batch of %d", len(records))
+
+        except Exception as e:
+            logger.error("Batch provenance tracking failed (%d items): %s", len(entries), e)
+
     def get_provenance(self, memory_id: str) -> Dict[str, Any]:
         """Get provenance for a memory item.
 
@@ -157,7 +157,62 @@ class MemoryDatabase:
         except Exception as e:
             logger.error(f"Failed to store memory: {e}")
             raise
-    
+
+    def store_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store many memories in a single transaction.
+
+        Each item is a dict with ``type``, ``content`` and optional
+        ``metadata``. Ledger rows and their CREATE audit rows are written
+        with one ``executemany`` each and committed together, so the batch
+        is all-or-nothing. Returns memory IDs in input order.
+        """
+        if not items:
+            return []
+
+        now = datetime.now(timezone.utc).isoformat()
+        memory_ids = [f"mem_{uuid.uuid4().hex[:12]}" for _ in items]
+        ledger_rows = [
+            (
+                memory_id,
+                item["type"],
+                item["content"],
+                json.dumps(item["metadata"]) if item.get("metadata") else None,
+                now,
+                now,
+            )
+            for memory_id, item in zip(memory_ids, items)
+        ]
+        audit_rows = [
+            (f"audit_{uuid.uuid4().hex[:12]}", "CREATE", memory_id, now)
+            for memory_id in memory_ids
+        ]
+
+        try:
+            with self.connection() as conn:
+                conn.executemany(
+                    """
+                    INSERT INTO ledger (id, type, content, metadata, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    ledger_rows,
+                )
+                conn.executemany(
+                    """
+                    INSERT INTO audit_log (id, operation, ledger_id, performed_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    audit_rows,
+                )
+                conn.commit()
+
+            logger.info(f"Stored memory batch: {len(memory_ids)} items")
+            return memory_ids
+
+        except Exception as e:
+            logger.error(f"Failed to store memory batch: {e}")
+            raise
+
     def get(self, memory_id: str) -> Optional[Dict]:
         """Retrieve a memory by ID."""
         try:
@@ -236,6 +236,42 @@ class HybridSearchLayer:
         except Exception as e:
             logger.warning("Vector index for %s failed (non-fatal): %s", memory_id, e)
 
+    def on_store_many(self, items: List[tuple]):
+        """Index a batch of (memory_id, content) pairs in BM25."""
+        if not self._initialized or not self._bm25:
+            return
+        for memory_id, content in items:
+            try:
+                self._bm25.index_document(str(memory_id), content)
+                self._indexed_count += 1
+            except Exception as e:
+                logger.error("BM25 index error for %s: %s", memory_id, e)
+
+    async def on_store_many_async(self, items: List[tuple]):
+        """Embed a batch of (memory_id, content) pairs and add them to HNSW
+        with a single add_vectors call.
+
+        Same contract as on_store_async(): errors are logged, never raised.
+        """
+        if not items:
+            return
+        if not self._vector_initialized or not self._embeddings or not self._hnsw:
+            return
+        try:
+            texts = [content for _, content in items]
+            if hasattr(self._embeddings, "embed_batch"):
+                embeddings = await self._embeddings.embed_batch(texts)
+            else:
+                embeddings = [await self._embeddings.embed(t) for t in texts]
+            await self._hnsw.add_vectors(
+                vectors=embeddings,
+                ids=[str(memory_id) for memory_id, _ in items],
+                metadata=[{"content": content[:200]} for _, content in items],
+            )
+            logger.debug("Vector indexed batch of %d", len(items))
+        except Exception as e:
+            logger.warning("Vector index for batch of %d failed (non-fatal): %s", len(items), e)
+
     def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Sync hybrid search: BM25 ranking with LIKE fallback.
@@ -9,6 +9,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
+import asyncio
 import logging
 import sys
 import json
@@ -64,6 +65,9 @@ class StoreRequest(BaseModel):
     content: str
     metadata: Optional[Dict] = None
 
+class StoreBatchRequest(BaseModel):
+    items: List[StoreRequest]
+
 class RecallRequest(BaseModel):
     query: str
     limit: int = 10
@@ -282,6 +286,69 @@ async def store(request: StoreRequest):
         logger.error(f"Store error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+# Upper bound on items per /v1/store/batch call (keeps one transaction short).
+MAX_STORE_BATCH = 500
+
+# Strong refs to in-flight batch vector-index tasks (awaited on shutdown).
+_index_tasks: set = set()
+
+
+@app.post("/v1/store/batch")
+async def store_batch(request: StoreBatchRequest):
+    """
+    Store many memories in one ledger transaction.
+
+    All items commit together with one CREATE audit batch and one
+    provenance batch; BM25 indexing runs inline and vector indexing is
+    enqueued as a single background task. IDs are returned in input order.
+    """
+    if not request.items:
+        raise HTTPException(status_code=400, detail="items must not be empty")
+    if len(request.items) > MAX_STORE_BATCH:
+        raise HTTPException(
+            status_code=413,
+            detail=f"batch of {len(request.items)} exceeds limit of {MAX_STORE_BATCH}",
+        )
+
+    try:
+        memory_ids = db.store_many([
+            {"type": it.type, "content": it.content, "metadata": it.metadata}
+            for it in request.items
+        ])
+    except Exception as e:
+        logger.error(f"Store batch error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+    pairs = [(mid, it.content) for mid, it in zip(memory_ids, request.items)]
+
+    try:
+        _hybrid.on_store_many(pairs)
+    except Exception as e:
+        logger.warning(f"Hybrid index failed for batch of {len(pairs)}: {e}")
+
+    task = asyncio.create_task(_hybrid.on_store_many_async(pairs))
+    _index_tasks.add(task)
+    task.add_done_callback(_index_tasks.discard)
+
+    try:
+        _provenance.track_many([
+            {
+                "memory_id": mid,
+                "source_type": (it.metadata or {}).get("source_type", "direct"),
+                "source_id": (it.metadata or {}).get("source_id"),
+            }
+            for mid, it in zip(memory_ids, request.items)
+        ])
+    except Exception as e:
+        logger.warning(f"Provenance tracking failed for batch of {len(pairs)}: {e}")
+
+    return {
+        "status": "stored",
+        "ids": memory_ids,
+        "count": len(memory_ids),
+        "service": "memory-engine"
+    }
+
 @app.get("/recall/{memory_id}")
 def recall(memory_id: str):
     """Recall a specific memory by ID."""
@@ -1564,6 +1631,10 @@ async def _lifespan(a):
 
     yield  # ── app is running ──
 
+    # Let enqueued batch vector indexing land before the index is saved
+    if _index_tasks:
+        await asyncio.gather(*list(_index_tasks), return_exceptions=True)
+
     # Persist HNSW index on shutdown
     try:
         await _hybrid.save_index()
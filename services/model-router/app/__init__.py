@@ -33,3 +33,8 @@ from app.route_audit import (
     AuditRecord,
     RouteAuditLogger,
 )
+
+from app.request_scheduler import (
+    RequestScheduler,
+    SchedulerRejected,
+)
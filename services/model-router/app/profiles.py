@@ -46,6 +46,8 @@ class ReasonCode(str, Enum):
     NO_BACKEND_AVAILABLE    = "NO_BACKEND_AVAILABLE"
     DOWNGRADED              = "DOWNGRADED"
     DEFAULT_PROFILE         = "DEFAULT_PROFILE"
+    QUEUE_FULL              = "QUEUE_FULL"
+    QUEUE_DEADLINE_EXCEEDED = "QUEUE_DEADLINE_EXCEEDED"
 
 
 # ---------------------------------------------------------------------------
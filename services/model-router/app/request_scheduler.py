@@ -0,0 +1,391 @@
+"""
+Model Router - Request Scheduler
+
+Per-backend admission control for local model backends (Ollama, vLLM,
+LM Studio).  Each backend gets a bounded number of in-flight requests;
+everything beyond that waits in a priority queue keyed by routing profile
+(voice/chat turns ahead of tool and vision work, ahead of background
+memory summarisation).
+
+Within a priority level, sessions are served round-robin so one chatty
+session cannot starve the others.  Every queued request carries a
+queue-time deadline derived from its profile: requests that would clearly
+miss it are rejected at admission (using the observed service time), and
+requests that time out while queued are rejected with a reason code so the
+caller can downgrade to the next backend in the profile's chain.
+
+Queue wait time and depth are exported in the same violation format as
+the gateway's ``LatencyBudget.check_slo`` so they can be fed straight into
+``SLOGuardrails.record_window``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+from app.profiles import ProfileName, ReasonCode
+
+logger = logging.getLogger("model-router.request-scheduler")
+
+
+# Providers whose capacity is a local GPU box and therefore needs admission
+# control.  Cloud providers are passed through unscheduled.
+LOCAL_PROVIDERS = frozenset({"ollama", "vllm", "lmstudio"})
+
+# Lower value == served first.
+PROFILE_PRIORITY: Dict[ProfileName, int] = {
+    ProfileName.CHAT_LOW_LATENCY: 0,
+    ProfileName.TOOL_EXECUTION: 1,
+    ProfileName.VISION_ANALYSIS: 2,
+    ProfileName.SAFE_FALLBACK: 2,
+    ProfileName.REASONING_DEEP: 3,
+    ProfileName.MEMORY_OPS: 4,
+}
+
+# Maximum time a request may wait for a slot before it is rejected.
+DEFAULT_QUEUE_DEADLINE_MS: Dict[ProfileName, float] = {
+    ProfileName.CHAT_LOW_LATENCY: 1_500.0,
+    ProfileName.TOOL_EXECUTION: 3_000.0,
+    ProfileName.VISION_ANALYSIS: 5_000.0,
+    ProfileName.SAFE_FALLBACK: 2_500.0,
+    ProfileName.REASONING_DEEP: 10_000.0,
+    ProfileName.MEMORY_OPS: 30_000.0,
+}
+
+_WAIT_SAMPLES = 1000
+
+
+def is_local_backend(backend: str) -> bool:
+    """True if *backend* (``provider/model``) runs on a local provider."""
+    provider = backend.split("/", 1)[0] if "/" in backend else "ollama"
+    return provider in LOCAL_PROVIDERS
+
+
+# ---------------------------------------------------------------------------
+# Errors
+# ---------------------------------------------------------------------------
+
+class SchedulerRejected(Exception):
+    """Raised when a request cannot be admitted to a backend."""
+
+    def __init__(self, backend: str, reason_code: ReasonCode, waited_ms: float = 0.0):
+        self.backend = backend
+        self.reason_code = reason_code
+        self.waited_ms = waited_ms
+        super().__init__(f"{reason_code.value}: {backend} (waited {waited_ms:.0f}ms)")
+
+
+# ---------------------------------------------------------------------------
+# Per-backend queue
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Ticket:
+    session_id: str
+    priority: int
+    enqueued_at: float
+    future: "asyncio.Future[None]"
+
+
+@dataclass
+class _BackendQueue:
+    """Queue state for one backend.  Only touched from the event loop."""
+    backend: str
+    max_inflight: int
+    max_queue: int
+    inflight: int = 0
+    depth: int = 0
+    # priority -> session_id -> FIFO of tickets (OrderedDict gives round-robin)
+    levels: Dict[int, "OrderedDict[str, Deque[_Ticket]]"] = field(default_factory=dict)
+    waits_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=_WAIT_SAMPLES))
+    service_ewma_ms: Optional[float] = None
+    max_depth_seen: int = 0
+    admitted: int = 0
+    rejected_full: int = 0
+    rejected_deadline: int = 0
+    rejected_early: int = 0
+
+    def push(self, ticket: _Ticket) -> None:
+        sessions = self.levels.setdefault(ticket.priority, OrderedDict())
+        sessions.setdefault(ticket.session_id, deque()).append(ticket)
+        self.depth += 1
+        self.max_depth_seen = max(self.max_depth_seen, self.depth)
+
+    def remove(self, ticket: _Ticket) -> None:
+        sessions = self.levels.get(ticket.priority)
+        if not sessions:
+            return
+        q = sessions.get(ticket.session_id)
+        if q is None:
+            return
+        try:
+            q.remove(ticket)
+        except ValueError:
+            return
+        self.depth -= 1
+        if not q:
+            del sessions[ticket.session_id]
+
+    def pop_next(self) -> Optional[_Ticket]:
+        """Highest priority first; round-robin across sessions within a level."""
+        for priority in sorted(self.levels):
+            sessions = self.levels[priority]
+            while sessions:
+                session_id, q = next(iter(sessions.items()))
+                ticket = q.popleft()
+                self.depth -= 1
+                if q:
+                    sessions.move_to_end(session_id)
+                else:
+                    del sessions[session_id]
+                if not ticket.future.done():
+                    return ticket
+        return None
+
+    def ahead_of(self, priority: int) -> int:
+        """Number of queued tickets that would be served before *priority*."""
+        return sum(
+            sum(len(q) for q in sessions.values())
+            for p, sessions in self.levels.items() if p <= priority
+        )
+
+    def wait_percentile(self, p: float) -> float:
+        if not self.waits_ms:
+            return 0.0
+        data = sorted(self.waits_ms)
+        idx = min(len(data) - 1, int(round(p * (len(data) - 1))))
+        return round(data[idx], 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "max_inflight": self.max_inflight,
+            "max_queue": self.max_queue,
+            "inflight": self.inflight,
+            "queue_depth": self.depth,
+            "max_depth_seen": self.max_depth_seen,
+            "queue_wait_p50_ms": self.wait_percentile(0.50),
+            "queue_wait_p95_ms": self.wait_percentile(0.95),
+            "service_ewma_ms": round(self.service_ewma_ms, 2) if self.service_ewma_ms else None,
+            "admitted": self.admitted,
+            "rejected_full": self.rejected_full,
+            "rejected_deadline": self.rejected_deadline,
+            "rejected_early": self.rejected_early,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Scheduler
+# ---------------------------------------------------------------------------
+
+class RequestScheduler:
+    """
+    Priority, deadline and fairness-aware admission control per backend.
+
+    Usage::
+
+        async with scheduler.slot("ollama/qwen2.5:7b",
+                                  ProfileName.CHAT_LOW_LATENCY,
+                                  session_id="s1") as wait_ms:
+            result = await asyncio.to_thread(provider.chat, ...)
+
+    Raises ``SchedulerRejected`` (QUEUE_FULL / QUEUE_DEADLINE_EXCEEDED)
+    instead of letting the request wait past its deadline.
+    """
+
+    def __init__(
+        self,
+        default_max_inflight: int = 2,
+        default_max_queue: int = 64,
+        queue_deadlines_ms: Optional[Dict[ProfileName, float]] = None,
+    ):
+        self._default_max_inflight = max(1, default_max_inflight)
+        self._default_max_queue = max(0, default_max_queue)
+        self._deadlines = dict(DEFAULT_QUEUE_DEADLINE_MS)
+        if queue_deadlines_ms:
+            self._deadlines.update(queue_deadlines_ms)
+        self._backends: Dict[str, _BackendQueue] = {}
+        self._seq = itertools.count()
+
+    # ---- configuration ----------------------------------------------------
+
+    def configure_backend(self, backend: str, max_inflight: int = 2,
+                          max_queue: int = 64) -> None:
+        """Register or update limits for a backend."""
+        bq = self._backends.get(backend)
+        if bq is None:
+            self._backends[backend] = _BackendQueue(
+                backend=backend,
+                max_inflight=max(1, max_inflight),
+                max_queue=max(0, max_queue),
+            )
+        else:
+            bq.max_inflight = max(1, max_inflight)
+            bq.max_queue = max(0, max_queue)
+
+    def _queue_for(self, backend: str) -> _BackendQueue:
+        bq = self._backends.get(backend)
+        if bq is None:
+            bq = _BackendQueue(
+                backend=backend,
+                max_inflight=self._default_max_inflight,
+                max_queue=self._default_max_queue,
+            )
+            self._backends[backend] = bq
+        return bq
+
+    def deadline_ms(self, profile: ProfileName) -> float:
+        return self._deadlines.get(profile, DEFAULT_QUEUE_DEADLINE_MS[ProfileName.SAFE_FALLBACK])
+
+    # ---- admission --------------------------------------------------------
+
+    async def acquire(
+        self,
+        backend: str,
+        profile: ProfileName = ProfileName.CHAT_LOW_LATENCY,
+        session_id: str = "",
+        deadline_ms: Optional[float] = None,
+    ) -> float:
+        """Wait for an in-flight slot on *backend*.  Returns queue wait in ms."""
+        bq = self._queue_for(backend)
+        priority = PROFILE_PRIORITY.get(profile, PROFILE_PRIORITY[ProfileName.SAFE_FALLBACK])
+        deadline = self.deadline_ms(profile) if deadline_ms is None else deadline_ms
+
+        if bq.inflight < bq.max_inflight and bq.depth == 0:
+            bq.inflight += 1
+            bq.admitted += 1
+            bq.waits_ms.append(0.0)
+            return 0.0
+
+        if bq.depth >= bq.max_queue:
+            bq.rejected_full += 1
+            raise SchedulerRejected(backend, ReasonCode.QUEUE_FULL)
+
+        # Early rejection: if the work already ahead of us cannot drain
+        # before our deadline, fail now rather than after waiting for it.
+        if bq.service_ewma_ms is not None:
+            predicted = (bq.ahead_of(priority) + 1) / bq.max_inflight * bq.service_ewma_ms
+            if predicted > deadline:
+                bq.rejected_early += 1
+                raise SchedulerRejected(backend, ReasonCode.QUEUE_DEADLINE_EXCEEDED)
+
+        loop = asyncio.get_running_loop()
+        ticket = _Ticket(
+            session_id=session_id or f"anon-{next(self._seq)}",
+            priority=priority,
+            enqueued_at=time.monotonic(),
+            future=loop.create_future(),
+        )
+        bq.push(ticket)
+        try:
+            await asyncio.wait_for(asyncio.shield(ticket.future), timeout=deadline / 1000.0)
+        except asyncio.TimeoutError:
+            waited = (time.monotonic() - ticket.enqueued_at) * 1000.0
+            if ticket.future.done() and not ticket.future.cancelled():
+                # Slot handed over at the same instant the deadline fired.
+                self._release_slot(bq)
+            else:
+                ticket.future.cancel()
+                bq.remove(ticket)
+            bq.rejected_deadline += 1
+            bq.waits_ms.append(waited)
+            raise SchedulerRejected(backend, ReasonCode.QUEUE_DEADLINE_EXCEEDED, waited)
+        except asyncio.CancelledError:
+            if ticket.future.done() and not ticket.future.cancelled():
+                self._release_slot(bq)
+            else:
+                ticket.future.cancel()
+                bq.remove(ticket)
+            raise
+
+        waited = (time.monotonic() - ticket.enqueued_at) * 1000.0
+        bq.admitted += 1
+        bq.waits_ms.append(waited)
+        return waited
+
+    def release(self, backend: str, service_ms: Optional[float] = None) -> None:
+        """Return a slot and hand it to the next queued request, if any."""
+        bq = self._queue_for(backend)
+        if service_ms is not None and service_ms >= 0:
+            alpha = 0.3
+            bq.service_ewma_ms = (
+                service_ms if bq.service_ewma_ms is None
+                else alpha * service_ms + (1 - alpha) * bq.service_ewma_ms
+            )
+        self._release_slot(bq)
+
+    def _release_slot(self, bq: _BackendQueue) -> None:
+        ticket = bq.pop_next()
+        if ticket is None:
+            bq.inflight = max(0, bq.inflight - 1)
+            return
+        # Slot transfers directly to the waiter; inflight is unchanged.
+        ticket.future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        backend: str,
+        profile: ProfileName = ProfileName.CHAT_LOW_LATENCY,
+        session_id: str = "",
+        deadline_ms: Optional[float] = None,
+    ) -> AsyncIterator[float]:
+        """Async context manager around ``acquire``/``release``."""
+        waited = await self.acquire(backend, profile, session_id, deadline_ms)
+        start = time.monotonic()
+        try:
+            yield waited
+        finally:
+            self.release(backend, (time.monotonic() - start) * 1000.0)
+
+    # ---- export -----------------------------------------------------------
+
+    def queue_depth(self, backend: str) -> int:
+        bq = self._backends.get(backend)
+        return bq.depth if bq else 0
+
+    def check_slo(
+        self,
+        max_wait_p95_ms: float = 1_000.0,
+        max_depth: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return violations in ``LatencyBudget.check_slo`` format so the
+        gateway can pass them to ``SLOGuardrails.record_window``.
+        """
+        violations: List[Dict[str, Any]] = []
+        for backend in sorted(self._backends):
+            bq = self._backends[backend]
+            p95 = bq.wait_percentile(0.95)
+            if p95 > max_wait_p95_ms:
+                violations.append({
+                    "stage": "model_queue",
+                    "metric": "p95",
+                    "threshold": max_wait_p95_ms,
+                    "actual": p95,
+                    "backend": backend,
+                })
+            if max_depth is not None and bq.depth > max_depth:
+                violations.append({
+                    "stage": "model_queue",
+                    "metric": "depth",
+                    "threshold": max_depth,
+                    "actual": bq.depth,
+                    "backend": backend,
+                })
+        return violations
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "default_max_inflight": self._default_max_inflight,
+            "default_max_queue": self._default_max_queue,
+            "queue_deadlines_ms": {p.value: d for p, d in self._deadlines.items()},
+            "backends": {b: q.to_dict() for b, q in sorted(self._backends.items())},
+        }
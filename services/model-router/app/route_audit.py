@@ -12,11 +12,13 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 
 from app.routing_engine import RouteDecision
 
@@ -66,17 +68,52 @@ class AuditRecord:
 
 class RouteAuditLogger:
     """
-    Thread-safe JSONL audit logger.
+    Thread-safe, batched JSONL audit logger.
 
-    Writes one JSON object per line to the audit file.  Buffers writes
-    in memory and flushes after each record for durability.
+    Records are serialised on the caller's thread and handed to a bounded
+    queue; a background writer thread drains the queue in batches and
+    appends them to the audit file with a single write per flush.  When
+    the queue is full the record is dropped and counted rather than
+    blocking the routing path.
+
+    The most recent records are mirrored in an in-memory ring so
+    ``read_recent`` is O(n) in the number requested.  When the ring does
+    not cover the request (e.g. after a restart), the file tail is read
+    by seeking backwards from EOF instead of loading the whole file.
+
+    The file is rotated once it exceeds ``max_bytes`` (``routes.jsonl``
+    -> ``routes.jsonl.1`` -> ...), keeping ``backup_count`` old files.
     """
 
-    def __init__(self, path: Optional[str] = None):
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        queue_size: int = 4096,
+        batch_size: int = 256,
+        flush_interval_s: float = 0.5,
+        max_bytes: int = 50 * 1024 * 1024,
+        backup_count: int = 5,
+        ring_size: int = 1000,
+    ):
         self._path = Path(path or DEFAULT_AUDIT_PATH)
         self._lock = threading.Lock()
         self._record_count = 0
+        self._dropped_count = 0
+        self._write_errors = 0
+        self._batches_flushed = 0
+        self._rotations = 0
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_s = flush_interval_s
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=queue_size)
+        self._ring: Deque[str] = deque(maxlen=ring_size)
+        self._closed = False
         self._ensure_dir()
+        self._writer = threading.Thread(
+            target=self._run_writer, name="route-audit-writer", daemon=True,
+        )
+        self._writer.start()
 
     def _ensure_dir(self) -> None:
         """Create parent directory if needed."""
@@ -115,28 +152,139 @@ class RouteAuditLogger:
         """Write an AuditRecord directly."""
         self._write(record)
 
+    # ---- lifecycle --------------------------------------------------------
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every queued record has been written (or timeout)."""
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending records and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("audit: queue full on close, writer not signalled")
+            return
+        self._writer.join(timeout=timeout)
+
     # ---- internal ---------------------------------------------------------
 
     def _write(self, record: AuditRecord) -> None:
-        """Serialise and append one record to the audit file."""
+        """Serialise one record and enqueue it for the background writer."""
         line = json.dumps(record.to_dict(), separators=(",", ":"))
         with self._lock:
+            if self._closed:
+                self._dropped_count += 1
+                return
             try:
-                with open(self._path, "a", encoding="utf-8") as f:
-                    f.write(line + "\n")
-                self._record_count += 1
-            except OSError as e:
-                logger.error("audit: write failed: %s", e)
+                self._queue.put_nowait(line)
+            except queue.Full:
+                self._dropped_count += 1
+                return
+            self._ring.append(line)
+
+    def _run_writer(self) -> None:
+        """Writer loop: collect up to batch_size records or flush_interval_s, then append."""
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            taken = 1
+            batch: List[str] = []
+            if first is None:
+                stop = True
+            else:
+                batch.append(first)
+            deadline = time.monotonic() + self._flush_interval_s
+            while not stop and len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._flush_batch(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+
+    def _flush_batch(self, batch: List[str]) -> None:
+        """Append a batch of serialised lines, rotating first if needed."""
+        payload = "\n".join(batch) + "\n"
+        try:
+            self._maybe_rotate(len(payload.encode("utf-8")))
+            with open(self._path, "a", encoding="utf-8") as f:
+                f.write(payload)
+            with self._lock:
+                self._record_count += len(batch)
+                self._batches_flushed += 1
+        except OSError as e:
+            with self._lock:
+                self._write_errors += 1
+            logger.error("audit: write failed: %s", e)
+
+    def _maybe_rotate(self, incoming: int) -> None:
+        """Rotate the audit file when the next write would exceed max_bytes."""
+        if self._max_bytes <= 0:
+            return
+        try:
+            size = self._path.stat().st_size
+        except OSError:
+            return
+        if size == 0 or size + incoming <= self._max_bytes:
+            return
+        if self._backup_count <= 0:
+            self._path.unlink()
+        else:
+            for i in range(self._backup_count - 1, 0, -1):
+                src = self._path.with_name(f"{self._path.name}.{i}")
+                if src.exists():
+                    os.replace(src, self._path.with_name(f"{self._path.name}.{i + 1}"))
+            os.replace(self._path, self._path.with_name(f"{self._path.name}.1"))
+        with self._lock:
+            self._rotations += 1
+
+    def _read_tail_lines(self, n: int, chunk_size: int = 8192) -> List[str]:
+        """Return the last *n* non-empty lines of the audit file via reverse seek."""
+        with open(self._path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            buf = b""
+            while pos > 0 and buf.count(b"\n") <= n:
+                step = min(chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                buf = f.read(step) + buf
+        lines = [ln for ln in buf.decode("utf-8", errors="replace").splitlines() if ln.strip()]
+        return lines[-n:]
 
     # ---- queries ----------------------------------------------------------
 
     def read_recent(self, n: int = 20) -> List[Dict[str, Any]]:
-        """Read the last *n* records from the audit file."""
+        """Read the last *n* records (ring mirror first, file tail otherwise)."""
+        if n <= 0:
+            return []
+        with self._lock:
+            lines = list(self._ring)[-n:] if len(self._ring) >= n else None
         try:
-            with open(self._path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-            tail = lines[-n:] if len(lines) > n else lines
-            return [json.loads(line) for line in tail if line.strip()]
+            if lines is None:
+                self.flush(timeout=1.0)
+                lines = self._read_tail_lines(n)
+            return [json.loads(line) for line in lines]
         except (OSError, json.JSONDecodeError):
             return []
 
@@ -144,6 +292,10 @@ class RouteAuditLogger:
     def record_count(self) -> int:
         return self._record_count
 
+    @property
+    def dropped_count(self) -> int:
+        return self._dropped_count
+
     @property
     def path(self) -> str:
         return str(self._path)
@@ -152,4 +304,9 @@ class RouteAuditLogger:
         return {
             "path": self.path,
             "records_written": self._record_count,
+            "records_dropped": self._dropped_count,
+            "queue_depth": self._queue.qsize(),
+            "batches_flushed": self._batches_flushed,
+            "write_errors": self._write_errors,
+            "rotations": self._rotations,
         }
@@ -50,6 +50,7 @@ _routing_engine = None
 _health_registry = None
 _budget_guard = None
 _audit_logger = None
+_scheduler = None
 _legacy_chat_fallback = os.getenv("SONIA_MODEL_ROUTER_LEGACY_CHAT_FALLBACK", "1").lower() not in ("0", "false", "no")
 _inflight_tasks: Dict[str, asyncio.Task] = {}
 
@@ -74,6 +75,7 @@ class ChatRequest(BaseModel):
     max_tokens: Optional[int] = 2048
     policy: Optional[str] = "cloud_allowed"  # local_only, cloud_allowed, provider_pinned
     provider: Optional[str] = None  # For provider_pinned policy
+    session_id: Optional[str] = None  # For fair queueing across sessions
 
 class ProfileRouteRequest(BaseModel):
     task_type: str = ""
@@ -155,6 +157,33 @@ def _dispatch_selected_backend(backend_key: str, messages: List[Dict], kwargs: D
     result["selected_backend"] = backend_key
     return result
 
+
+async def _scheduled_call(backend_key: str, profile_name: str, session_id: str, fn, *args) -> Dict:
+    """
+    Run a blocking provider call off the event loop, under the request
+    scheduler's admission control when *backend_key* is a local backend.
+
+    Raises SchedulerRejected when the backend queue is full or the queue
+    deadline for the profile would be exceeded.
+    """
+    from app.request_scheduler import is_local_backend
+    from app.profiles import ProfileName
+
+    if _scheduler is None or not is_local_backend(backend_key):
+        return await asyncio.to_thread(fn, *args)
+    try:
+        profile = ProfileName(profile_name)
+    except ValueError:
+        profile = ProfileName.SAFE_FALLBACK
+    async with _scheduler.slot(backend_key, profile, session_id) as waited_ms:
+        result = await asyncio.to_thread(fn, *args)
+    result["scheduler"] = {
+        "backend": backend_key,
+        "queue_wait_ms": round(waited_ms, 1),
+        "queue_depth": _scheduler.queue_depth(backend_key),
+    }
+    return result
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Health & Status Endpoints
 # ─────────────────────────────────────────────────────────────────────────────
@@ -180,6 +209,8 @@ def healthz():
         result["quarantined"] = _health_registry.quarantined_backends()
     if _audit_logger is not None:
         result["audit"] = _audit_logger.to_dict()
+    if _scheduler is not None:
+        result["scheduler"] = _scheduler.to_dict()["backends"]
     return result
 
 @app.get("/version")
@@ -306,6 +337,8 @@ async def select(request: SelectRequest):
 @app.post("/chat")
 async def chat(request: ChatRequest, cancel_token: Optional[str] = None):
     """Send chat request to routed provider with policy support."""
+    from app.profiles import ReasonCode, classify_request
+    from app.request_scheduler import SchedulerRejected
 
     async def _chat_inner() -> Dict:
         # Validate task type
@@ -318,6 +351,7 @@ async def chat(request: ChatRequest, cancel_token: Optional[str] = None):
             )
 
         policy = request.policy or "cloud_allowed"
+        session_id = request.session_id or ""
         extra_kwargs = {}
         if request.temperature is not None:
             extra_kwargs["temperature"] = request.temperature
@@ -344,7 +378,12 @@ async def chat(request: ChatRequest, cancel_token: Optional[str] = None):
                     status_code=503,
                     detail=f"No model for task {request.task_type} on {request.provider}"
                 )
-            result = provider.chat(model_info.name, request.messages, **extra_kwargs)
+            result = await _scheduled_call(
+                f"{request.provider}/{model_info.name}",
+                classify_request(request.task_type, _infer_hint(request.task_type, request.messages)).value,
+                session_id,
+                lambda: provider.chat(model_info.name, request.messages, **extra_kwargs),
+            )
 
         elif policy == "local_only":
             # Only use local providers (ollama)
@@ -360,12 +399,18 @@ async def chat(request: ChatRequest, cancel_token: Optional[str] = None):
                     status_code=503,
                     detail=f"No local model for task: {request.task_type}"
                 )
-            result = provider.chat(model_info.name, request.messages, **extra_kwargs)
+            result = await _scheduled_call(
+                f"ollama/{model_info.name}",
+                classify_request(request.task_type, _infer_hint(request.task_type, request.messages)).value,
+                session_id,
+                lambda: provider.chat(model_info.name, request.messages, **extra_kwargs),
+            )
 
         else:
             # cloud_allowed (default): route through deterministic profile engine.
             route_decision = None
             result = None
+            admission_rejected = None
             if _routing_engine is not None:
                 trace_id = f"chat-{int(datetime.utcnow().timestamp() * 1000)}"
                 route_decision = _routing_engine.route_request(
@@ -378,15 +423,46 @@ async def chat(request: ChatRequest, cancel_token: Optional[str] = None):
                     _audit_logger.log_decision(route_decision)
 
                 if route_decision.selected_backend:
-                    result = _dispatch_selected_backend(
-                        route_decision.selected_backend,
-                        request.messages,
-                        extra_kwargs,
-                    )
+                    # Try the selected backend, downgrading along the chain
+                    # when its queue is full or the queue deadline would pass.
+                    chain = route_decision.fallback_chain
+                    start = chain.index(route_decision.selected_backend) if route_decision.selected_backend in chain else 0
+                    candidates = [route_decision.selected_backend] + [
+                        b for b in chain[start + 1:]
+                        if _health_registry is None or _health_registry.is_healthy(b)
+                    ]
+                    for backend_key in candidates:
+                        try:
+                            result = await _scheduled_call(
+                                backend_key,
+                                route_decision.profile_name,
+                                session_id,
+                                _dispatch_selected_backend,
+                                backend_key,
+                                request.messages,
+                                extra_kwargs,
+                            )
+                        except SchedulerRejected as rej:
+                            route_decision.skipped.append({
+                                "backend": backend_key,
+                                "reason": rej.reason_code.value,
+                            })
+                            admission_rejected = rej
+                            continue
+                        if backend_key != route_decision.selected_backend:
+                            route_decision.reason_code = ReasonCode.DOWNGRADED.value
+                            route_decision.selected_backend = backend_key
+                        admission_rejected = None
+                        break
+                    if admission_rejected is not None and result is None:
+                        raise HTTPException(
+                            status_code=503,
+                            detail=f"Admission rejected: {admission_rejected}",
+                        )
 
             # Feature-flagged fallback to legacy provider router.
             if (result is None or result.get("status") != "success") and _legacy_chat_fallback:
-                legacy_result = router.chat(task, request.messages, **extra_kwargs)
+                legacy_result = await asyncio.to_thread(router.chat, task, request.messages, **extra_kwargs)
                 legacy_result["routing_mode"] = "legacy_provider_router"
                 if route_decision is not None:
                     legacy_result["route_decision"] = route_decision.to_dict()
@@ -420,6 +496,8 @@ async def chat(request: ChatRequest, cancel_token: Optional[str] = None):
 
     except HTTPException:
         raise
+    except SchedulerRejected as rej:
+        raise HTTPException(status_code=503, detail=f"Admission rejected: {rej}")
     except Exception as e:
         logger.error(f"Chat error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -561,6 +639,18 @@ def get_route_audit(n: int = 20):
     return {
         "records": _audit_logger.read_recent(n),
         "total_written": _audit_logger.record_count,
+        "total_dropped": _audit_logger.dropped_count,
+        "service": "model-router",
+    }
+
+@app.get("/scheduler")
+def get_scheduler(max_wait_p95_ms: float = 1000.0):
+    """Per-backend queue depth, wait percentiles and SLO violations."""
+    if _scheduler is None:
+        return {"scheduler": None, "violations": [], "service": "model-router"}
+    return {
+        "scheduler": _scheduler.to_dict(),
+        "violations": _scheduler.check_slo(max_wait_p95_ms=max_wait_p95_ms),
         "service": "model-router",
     }
 
@@ -592,7 +682,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 @asynccontextmanager
 async def _lifespan(a):
     """Startup and shutdown lifecycle for Model Router."""
-    global _routing_engine, _health_registry, _budget_guard, _audit_logger
+    global _routing_engine, _health_registry, _budget_guard, _audit_logger, _scheduler
 
     logger.info("Model Router starting up...")
 
@@ -616,6 +706,7 @@ async def _lifespan(a):
         from app.health_registry import HealthRegistry
         from app.budget_guard import BudgetGuard
         from app.route_audit import RouteAuditLogger
+        from app.request_scheduler import RequestScheduler
 
         # Load config
         cfg_path = Path(r"S:\config\sonia-config.json")
@@ -669,10 +760,38 @@ async def _lifespan(a):
             check_budget=_budget_guard.check,
         )
 
+        # Request scheduler (admission control for local backends)
+        sched_cfg = mr_cfg.get("scheduler", {})
+        deadlines = {}
+        for profile_key, deadline in sched_cfg.get("queue_deadlines_ms", {}).items():
+            try:
+                deadlines[ProfileName(profile_key)] = float(deadline)
+            except ValueError:
+                logger.warning("Unknown profile key in scheduler deadlines: %s", profile_key)
+        _scheduler = RequestScheduler(
+            default_max_inflight=sched_cfg.get("default_max_inflight", 2),
+            default_max_queue=sched_cfg.get("default_max_queue", 64),
+            queue_deadlines_ms=deadlines,
+        )
+        for backend_entry in sched_cfg.get("backends", []):
+            _scheduler.configure_backend(
+                backend=backend_entry.get("backend", ""),
+                max_inflight=backend_entry.get("max_inflight", 2),
+                max_queue=backend_entry.get("max_queue", 64),
+            )
+
         # Audit logger
         audit_path = mr_cfg.get("audit_log_path",
                                 r"S:\logs\services\model-router\routes.jsonl")
-        _audit_logger = RouteAuditLogger(path=audit_path)
+        audit_cfg = mr_cfg.get("audit", {})
+        _audit_logger = RouteAuditLogger(
+            path=audit_path,
+            queue_size=audit_cfg.get("queue_size", 4096),
+            batch_size=audit_cfg.get("batch_size", 256),
+            flush_interval_s=audit_cfg.get("flush_interval_s", 0.5),
+            max_bytes=audit_cfg.get("max_bytes", 50 * 1024 * 1024),
+            backup_count=audit_cfg.get("backup_count", 5),
+        )
 
         logger.info("Profile infrastructure initialised: %d profiles, audit -> %s",
                      len(_profile_registry.names), audit_path)
@@ -684,6 +803,8 @@ async def _lifespan(a):
     yield  # ── app is running ──
 
     logger.info("Model Router shutting down...")
+    if _audit_logger is not None:
+        await asyncio.to_thread(_audit_logger.close)
 
 app.router.lifespan_context = _lifespan
 
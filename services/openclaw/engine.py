@@ -0,0 +1,131 @@
+"""
+OpenClaw Execution Engine
+Runs tool executors without blocking the service event loop.
+
+Executors that provide a native coroutine (execute_async: shell.run,
+web.search, web.fetch) are awaited directly. All others run on a bounded
+thread pool. Every call first takes a per-tool concurrency slot, so a
+burst of one slow tool cannot starve the rest.
+"""
+
+import asyncio
+import contextlib
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Optional
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TOOL_LIMIT = 4
+
+# Concurrency slots per limit key. Desktop input tools share one key:
+# two calls driving the same keyboard/mouse at once would interleave.
+TOOL_LIMITS: Dict[str, int] = {
+    "shell.run": 4,
+    "file.read": 8,
+    "file.write": 2,
+    "web.search": 8,
+    "web.fetch": 8,
+    "desktop.input": 1,
+    "clipboard": 1,
+    "app.launch": 2,
+    "app.close": 2,
+}
+
+_LIMIT_KEYS: Dict[str, str] = {
+    "window.focus": "desktop.input",
+    "keyboard.type": "desktop.input",
+    "keyboard.hotkey": "desktop.input",
+    "mouse.click": "desktop.input",
+    "clipboard.read": "clipboard",
+    "clipboard.write": "clipboard",
+}
+
+
+class ExecutionEngine:
+    """
+    Async dispatcher for registry executors.
+    Owns the thread pool and the per-tool semaphores.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        tool_limits: Optional[Dict[str, int]] = None,
+        default_limit: int = DEFAULT_TOOL_LIMIT,
+    ):
+        self.max_workers = max_workers
+        self.tool_limits = {**TOOL_LIMITS, **(tool_limits or {})}
+        self.default_limit = default_limit
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._running: Dict[str, int] = {}
+        self._waiting: Dict[str, int] = {}
+        self.completed = 0
+        self.offloaded = 0
+
+    def limit_key(self, tool_name: str) -> str:
+        return _LIMIT_KEYS.get(tool_name, tool_name)
+
+    def _semaphore(self, key: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(key)
+        if sem is None:
+            sem = asyncio.Semaphore(self.tool_limits.get(key, self.default_limit))
+            self._semaphores[key] = sem
+        return sem
+
+    def _thread_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="openclaw-tool"
+            )
+        return self._pool
+
+    @contextlib.asynccontextmanager
+    async def slot(self, tool_name: str) -> AsyncIterator[None]:
+        """Hold one of the tool's concurrency slots (e.g. for a streamed run)."""
+        key = self.limit_key(tool_name)
+        self._waiting[key] = self._waiting.get(key, 0) + 1
+        try:
+            await self._semaphore(key).acquire()
+        finally:
+            self._waiting[key] -= 1
+        self._running[key] = self._running.get(key, 0) + 1
+        try:
+            yield
+        finally:
+            self._running[key] -= 1
+            self.completed += 1
+            self._semaphores[key].release()
+
+    async def run(self, tool_name: str, executor: Any, args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Run one executor call under its tool's concurrency limit."""
+        async with self.slot(tool_name):
+            native = getattr(executor, "execute_async", None)
+            if native is not None:
+                return await native(tool_name, args, **kwargs)
+            self.offloaded += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._thread_pool(),
+                functools.partial(executor.execute, tool_name, args, **kwargs),
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current load per limit key."""
+        return {
+            "max_workers": self.max_workers,
+            "completed": self.completed,
+            "offloaded": self.offloaded,
+            "running": {k: n for k, n in self._running.items() if n},
+            "waiting": {k: n for k, n in self._waiting.items() if n},
+            "limits": dict(self.tool_limits),
+            "default_limit": self.default_limit,
+        }
+
+    async def close(self) -> None:
+        """Stop the thread pool and the shared web client."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        from openclaw.executors.web_exec import close_clients
+        await close_clients()
@@ -3,9 +3,15 @@ OpenClaw Shell Executor
 Executes shell commands with strict allowlist enforcement and timeout handling.
 """
 
+import asyncio
+import codecs
+import locale
+import os
+import signal
 import subprocess
 import time
-from typing import Any, Dict, Optional, Tuple
+from collections import deque
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -21,6 +27,17 @@ class ShellExecutor:
     
     DEFAULT_TIMEOUT_MS = 5000
     MAX_TIMEOUT_MS = 15000
+    MAX_OUTPUT_CHARS = 10000
+    # Streamed runs may take minutes: they report output as it arrives,
+    # are killed on cancel or client disconnect, and keep output in
+    # constant memory. The default stays DEFAULT_TIMEOUT_MS, so a longer
+    # limit has to be requested per call.
+    MAX_STREAM_TIMEOUT_MS = 300000
+    STREAM_READ_BYTES = 4096
+    STREAM_MAX_LINE_CHARS = 4096  # longer lines are forwarded in pieces
+    STREAM_QUEUE_LINES = 256  # unread lines before the process is paused
+    STREAM_BATCH_CHARS = 8192  # lines already read are sent together
+    SHELL = ("powershell", "-Command")
     
     def __init__(self):
         self.policy = get_policy()
@@ -62,7 +79,7 @@ class ShellExecutor:
             
             # Execute command
             result = subprocess.run(
-                ["powershell", "-Command", command],
+                [*self.SHELL, command],
                 capture_output=True,
                 text=True,
                 timeout=timeout_sec,
@@ -86,8 +103,8 @@ class ShellExecutor:
             result_dict = {
                 "command": command,
                 "return_code": result.returncode,
-                "stdout": result.stdout[:10000],  # Limit output to 10KB
-                "stderr": result.stderr[:10000],
+                "stdout": result.stdout[:self.MAX_OUTPUT_CHARS],  # Limit output to 10KB
+                "stderr": result.stderr[:self.MAX_OUTPUT_CHARS],
                 "elapsed_ms": elapsed_ms,
                 "success": result.returncode == 0
             }
@@ -118,6 +135,233 @@ class ShellExecutor:
             )
             return False, {}, error_msg
     
+    async def execute_async(
+        self,
+        command: str,
+        timeout_ms: Optional[int] = None,
+        correlation_id: Optional[str] = None
+    ) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+        """
+        Execute a shell command without blocking the event loop.
+
+        Same checks and result shape as execute(). On timeout (or when the
+        calling task is cancelled) the whole process tree is killed.
+        """
+        start_time = time.time()
+
+        timeout_ms = timeout_ms or self.DEFAULT_TIMEOUT_MS
+        allowed, timeout_err = self.policy.check_timeout(timeout_ms, self.MAX_TIMEOUT_MS)
+        if not allowed:
+            return False, {}, timeout_err
+
+        allowed, cmd_err = self.policy.check_shell_command(command)
+        if not allowed:
+            return False, {}, cmd_err
+
+        proc = None
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.SHELL, command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **_new_process_group(),
+            )
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout_ms / 1000.0)
+            elapsed_ms = (time.time() - start_time) * 1000
+
+            encoding = locale.getpreferredencoding(False)
+            stdout_text = stdout.decode(encoding, errors="replace")
+            stderr_text = stderr.decode(encoding, errors="replace")
+            self._log_execution(
+                command=command,
+                success=True,
+                stdout_len=len(stdout_text),
+                stderr_len=len(stderr_text),
+                return_code=proc.returncode,
+                elapsed_ms=elapsed_ms,
+                correlation_id=correlation_id
+            )
+            return True, {
+                "command": command,
+                "return_code": proc.returncode,
+                "stdout": stdout_text[:self.MAX_OUTPUT_CHARS],
+                "stderr": stderr_text[:self.MAX_OUTPUT_CHARS],
+                "elapsed_ms": elapsed_ms,
+                "success": proc.returncode == 0
+            }, None
+
+        except asyncio.TimeoutError:
+            await _kill_tree(proc)
+            elapsed_ms = (time.time() - start_time) * 1000
+            self._log_execution(
+                command=command,
+                success=False,
+                error="timeout",
+                elapsed_ms=elapsed_ms,
+                correlation_id=correlation_id
+            )
+            return False, {}, f"Command timed out after {timeout_ms}ms"
+
+        except asyncio.CancelledError:
+            await _kill_tree(proc)
+            raise
+
+        except Exception as e:
+            await _kill_tree(proc)
+            elapsed_ms = (time.time() - start_time) * 1000
+            self._log_execution(
+                command=command,
+                success=False,
+                error=str(e),
+                elapsed_ms=elapsed_ms,
+                correlation_id=correlation_id
+            )
+            return False, {}, f"Execution failed: {str(e)}"
+
+    async def execute_stream(
+        self,
+        command: str,
+        timeout_ms: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+        cancel: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a shell command, yielding its output as it is produced.
+
+        Yields {"type": "output", "stream": "stdout"|"stderr", "text": ...}
+        events (lines, batched when several are already waiting), then one
+        {"type": "result", "success", "result", "error"} event in the
+        execute() shape. stdout/stderr in the result are the last
+        MAX_OUTPUT_CHARS of each stream, kept in constant memory.
+
+        Setting *cancel*, a timeout, or closing the generator kills the
+        process tree.
+        """
+        start_time = time.time()
+
+        timeout_ms = timeout_ms or self.DEFAULT_TIMEOUT_MS
+        allowed, timeout_err = self.policy.check_timeout(timeout_ms, self.MAX_STREAM_TIMEOUT_MS)
+        if not allowed:
+            yield {"type": "result", "success": False, "result": {}, "error": timeout_err}
+            return
+
+        allowed, cmd_err = self.policy.check_shell_command(command)
+        if not allowed:
+            yield {"type": "result", "success": False, "result": {}, "error": cmd_err}
+            return
+
+        outputs = {
+            "stdout": OutputRing(self.MAX_OUTPUT_CHARS),
+            "stderr": OutputRing(self.MAX_OUTPUT_CHARS),
+        }
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.STREAM_QUEUE_LINES)
+        proc = None
+        tasks = []
+        error = None
+        cancelled = False
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.SHELL, command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **_new_process_group(),
+            )
+            tasks = [
+                asyncio.create_task(self._pump(proc.stdout, "stdout", queue)),
+                asyncio.create_task(self._pump(proc.stderr, "stderr", queue)),
+            ]
+            if cancel is not None:
+                tasks.append(asyncio.create_task(_kill_on(cancel, proc)))
+
+            deadline = time.monotonic() + timeout_ms / 1000.0
+            open_streams = 2
+            item = None
+            while open_streams:
+                if item is None:
+                    try:
+                        item = await asyncio.wait_for(queue.get(), deadline - time.monotonic())
+                    except asyncio.TimeoutError:
+                        error = f"Command timed out after {timeout_ms}ms"
+                        break
+                name, text = item
+                item = None
+                if text is None:
+                    open_streams -= 1
+                    continue
+                # Coalesce lines of the same stream that are already queued
+                while not queue.empty() and len(text) < self.STREAM_BATCH_CHARS:
+                    item = queue.get_nowait()
+                    if item[0] != name or item[1] is None:
+                        break
+                    text += item[1]
+                    item = None
+                outputs[name].append(text)
+                yield {"type": "output", "stream": name, "text": text}
+
+            if error:
+                await _kill_tree(proc)
+            else:
+                await proc.wait()
+            cancelled = cancel is not None and cancel.is_set()
+        except Exception as e:
+            error = f"Execution failed: {str(e)}"
+        finally:
+            for task in tasks:
+                task.cancel()
+            await _kill_tree(proc)
+
+        elapsed_ms = (time.time() - start_time) * 1000
+        if cancelled:
+            error = "Command cancelled"
+        self._log_execution(
+            command=command,
+            success=error is None,
+            stdout_len=outputs["stdout"].total_chars,
+            stderr_len=outputs["stderr"].total_chars,
+            return_code=proc.returncode if proc is not None and error is None else None,
+            error="timeout" if error and "timed out" in error else error,
+            elapsed_ms=elapsed_ms,
+            correlation_id=correlation_id
+        )
+        if error:
+            yield {"type": "result", "success": False, "result": {}, "error": error}
+            return
+
+        result = {
+            "command": command,
+            "return_code": proc.returncode,
+            "elapsed_ms": elapsed_ms,
+            "success": proc.returncode == 0
+        }
+        for name, ring in outputs.items():
+            result[name] = ring.getvalue()
+            result[f"{name}_chars"] = ring.total_chars
+            result[f"{name}_truncated"] = ring.truncated
+        yield {"type": "result", "success": True, "result": result, "error": None}
+
+    async def _pump(self, reader: asyncio.StreamReader, name: str, queue: asyncio.Queue) -> None:
+        """Split *reader* into lines (bounded length) and queue them."""
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace")
+        partial = ""
+        while True:
+            chunk = await reader.read(self.STREAM_READ_BYTES)
+            text = partial + decoder.decode(chunk, final=not chunk)
+            parts = text.split("\n")
+            partial = parts.pop()
+            lines = [p + "\n" for p in parts]
+            while len(partial) > self.STREAM_MAX_LINE_CHARS:
+                lines.append(partial[:self.STREAM_MAX_LINE_CHARS])
+                partial = partial[self.STREAM_MAX_LINE_CHARS:]
+            if not chunk and partial:
+                lines.append(partial)
+            for line in lines:
+                await queue.put((name, line))
+            if not chunk:
+                await queue.put((name, None))
+                return
+
     def _log_execution(
         self,
         command: str,
@@ -156,3 +400,75 @@ class ShellExecutor:
     def clear_execution_log(self):
         """Clear execution log."""
         self.execution_log.clear()
+
+
+class OutputRing:
+    """Last max_chars characters of a stream, in constant memory."""
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self.total_chars = 0
+        self._chunks: deque = deque()
+        self._size = 0
+
+    def append(self, text: str) -> None:
+        self.total_chars += len(text)
+        if len(text) >= self.max_chars:
+            self._chunks.clear()
+            self._chunks.append(text[-self.max_chars:])
+            self._size = self.max_chars
+            return
+        self._chunks.append(text)
+        self._size += len(text)
+        while self._size > self.max_chars:
+            excess = self._size - self.max_chars
+            head = self._chunks[0]
+            if len(head) <= excess:
+                self._chunks.popleft()
+                self._size -= len(head)
+            else:
+                self._chunks[0] = head[excess:]
+                self._size -= excess
+
+    @property
+    def truncated(self) -> bool:
+        return self.total_chars > self._size
+
+    def getvalue(self) -> str:
+        return "".join(self._chunks)
+
+
+async def _kill_on(cancel: asyncio.Event, proc: asyncio.subprocess.Process) -> None:
+    await cancel.wait()
+    await _kill_tree(proc)
+
+
+def _new_process_group() -> Dict[str, Any]:
+    """Spawn options that let _kill_tree reach the command's children."""
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+async def _kill_tree(proc: Optional[asyncio.subprocess.Process]) -> None:
+    """Kill *proc* and everything it started, then reap it."""
+    if proc is None or proc.returncode is not None:
+        return
+    try:
+        if os.name == "nt":
+            killer = await asyncio.create_subprocess_exec(
+                "taskkill", "/F", "/T", "/PID", str(proc.pid),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            await killer.wait()
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, OSError):
+        pass
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+    await proc.wait()
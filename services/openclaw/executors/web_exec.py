@@ -22,6 +22,33 @@ except ImportError:
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
 _MULTI_SPACE_RE = re.compile(r"\s+")
 
+_FETCH_HEADERS = {
+    "User-Agent": "SONIA/1.0 (OpenClaw web.fetch)",
+    "Accept": "text/html, text/plain, application/json",
+}
+
+# One keep-alive client shared by the async paths (closed by close_clients)
+_async_client = None
+
+
+def _get_async_client():
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            follow_redirects=True,
+            max_redirects=5,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8, keepalive_expiry=30.0),
+        )
+    return _async_client
+
+
+async def close_clients() -> None:
+    """Shutdown the shared async client (call on app shutdown)."""
+    global _async_client
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+    _async_client = None
+
 
 class WebExecutor:
     """Executes web operations (search, fetch)."""
@@ -75,8 +102,7 @@ class WebExecutor:
             return False, {}, "query is required"
 
         try:
-            # DuckDuckGo instant answer API (no API key)
-            url = f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&no_html=1&skip_disambig=1"
+            url = self._search_url(query)
 
             with httpx.Client(timeout=timeout_s) as client:
                 resp = client.get(url, follow_redirects=True)
@@ -89,58 +115,12 @@ class WebExecutor:
                           correlation_id=correlation_id)
                 return False, {}, f"Search API returned HTTP {resp.status_code}"
 
-            data = resp.json()
-            results = []
-
-            # Abstract (main answer)
-            abstract = data.get("AbstractText", "")
-            abstract_url = data.get("AbstractURL", "")
-            abstract_source = data.get("AbstractSource", "")
-            if abstract:
-                results.append({
-                    "title": abstract_source or "Answer",
-                    "snippet": abstract[:500],
-                    "url": abstract_url,
-                })
-
-            # Related topics
-            for topic in data.get("RelatedTopics", [])[:max_results]:
-                if isinstance(topic, dict):
-                    text = topic.get("Text", "")
-                    first_url = topic.get("FirstURL", "")
-                    if text:
-                        results.append({
-                            "title": text[:80],
-                            "snippet": text[:300],
-                            "url": first_url,
-                        })
-
-            # Infobox
-            infobox = data.get("Infobox", {})
-            if isinstance(infobox, dict):
-                for item in infobox.get("content", [])[:3]:
-                    if isinstance(item, dict):
-                        label = item.get("label", "")
-                        value = item.get("value", "")
-                        if label and value:
-                            results.append({
-                                "title": label,
-                                "snippet": str(value)[:300],
-                                "url": "",
-                            })
-
-            results = results[:max_results]
+            results = self._search_results(resp.json(), max_results)
 
             self._log("search", query=query, success=True,
                       elapsed_ms=elapsed, correlation_id=correlation_id)
 
-            return True, {
-                "query": query,
-                "results": results,
-                "result_count": len(results),
-                "elapsed_ms": round(elapsed, 1),
-                "source": "duckduckgo",
-            }, None
+            return True, self._search_payload(query, results, elapsed), None
 
         except Exception as e:
             elapsed = (time.time() - start) * 1000
@@ -193,10 +173,7 @@ class WebExecutor:
                 follow_redirects=True,
                 max_redirects=5,
             ) as client:
-                resp = client.get(url, headers={
-                    "User-Agent": "SONIA/1.0 (OpenClaw web.fetch)",
-                    "Accept": "text/html, text/plain, application/json",
-                })
+                resp = client.get(url, headers=_FETCH_HEADERS)
 
             elapsed = (time.time() - start) * 1000
 
@@ -206,38 +183,91 @@ class WebExecutor:
                           correlation_id=correlation_id)
                 return False, {}, f"Fetch returned HTTP {resp.status_code}"
 
-            content_type = resp.headers.get("content-type", "")
-            content_length = len(resp.content)
+            return self._fetch_result(resp, url, max_chars, elapsed, correlation_id)
+
+        except Exception as e:
+            elapsed = (time.time() - start) * 1000
+            self._log("fetch", url=url, success=False,
+                      error=str(e), elapsed_ms=elapsed,
+                      correlation_id=correlation_id)
+            return False, {}, f"Fetch failed: {e}"
+
+    # ------------------------------------------------------------------
+    # Async variants (pooled client, do not block the event loop)
+    # ------------------------------------------------------------------
+
+    async def search_async(
+        self,
+        query: str,
+        max_results: int = 5,
+        timeout_ms: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+    ) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+        """search() on the shared async client."""
+        if httpx is None:
+            return False, {}, "httpx not installed"
+
+        start = time.time()
+        timeout_ms = min(timeout_ms or self.DEFAULT_TIMEOUT_MS, self.MAX_TIMEOUT_MS)
 
-            if content_length > self.MAX_FETCH_BYTES:
-                return False, {}, f"Response too large ({content_length} bytes, max {self.MAX_FETCH_BYTES})"
+        if not query or not query.strip():
+            return False, {}, "query is required"
 
-            # Extract text based on content type
-            text = resp.text
-            if "html" in content_type:
-                text = self._strip_html(text)
-            elif "json" in content_type:
-                try:
-                    parsed = resp.json()
-                    text = json.dumps(parsed, indent=2, default=str)
-                except Exception:
-                    pass  # keep raw text
+        try:
+            resp = await _get_async_client().get(self._search_url(query), timeout=timeout_ms / 1000.0)
+            elapsed = (time.time() - start) * 1000
 
-            # Truncate
-            text = text[:max_chars]
+            if resp.status_code != 200:
+                self._log("search", query=query, success=False,
+                          error=f"HTTP {resp.status_code}", elapsed_ms=elapsed,
+                          correlation_id=correlation_id)
+                return False, {}, f"Search API returned HTTP {resp.status_code}"
 
-            self._log("fetch", url=url, success=True,
+            results = self._search_results(resp.json(), max_results)
+            self._log("search", query=query, success=True,
                       elapsed_ms=elapsed, correlation_id=correlation_id)
+            return True, self._search_payload(query, results, elapsed), None
 
-            return True, {
-                "url": url,
-                "content_type": content_type,
-                "text": text,
-                "text_length": len(text),
-                "original_length": content_length,
-                "truncated": content_length > max_chars,
-                "elapsed_ms": round(elapsed, 1),
-            }, None
+        except Exception as e:
+            elapsed = (time.time() - start) * 1000
+            self._log("search", query=query, success=False,
+                      error=str(e), elapsed_ms=elapsed,
+                      correlation_id=correlation_id)
+            return False, {}, f"Search failed: {e}"
+
+    async def fetch_async(
+        self,
+        url: str,
+        max_chars: int = 5000,
+        timeout_ms: Optional[int] = None,
+        correlation_id: Optional[str] = None,
+    ) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+        """fetch() on the shared async client."""
+        if httpx is None:
+            return False, {}, "httpx not installed"
+
+        start = time.time()
+        timeout_ms = min(timeout_ms or self.DEFAULT_TIMEOUT_MS, self.MAX_TIMEOUT_MS)
+
+        if not url or not url.strip():
+            return False, {}, "url is required"
+
+        ok, err = self._validate_url(url)
+        if not ok:
+            return False, {}, err
+
+        try:
+            resp = await _get_async_client().get(
+                url, headers=_FETCH_HEADERS, timeout=timeout_ms / 1000.0)
+            elapsed = (time.time() - start) * 1000
+
+            if resp.status_code != 200:
+                self._log("fetch", url=url, success=False,
+                          error=f"HTTP {resp.status_code}", elapsed_ms=elapsed,
+                          correlation_id=correlation_id)
+                return False, {}, f"Fetch returned HTTP {resp.status_code}"
+
+            return self._fetch_result(resp, url, max_chars, elapsed, correlation_id)
 
         except Exception as e:
             elapsed = (time.time() - start) * 1000
@@ -250,6 +280,101 @@ class WebExecutor:
     # Helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _search_url(query: str) -> str:
+        # DuckDuckGo instant answer API (no API key)
+        return f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&no_html=1&skip_disambig=1"
+
+    @staticmethod
+    def _search_results(data: Dict[str, Any], max_results: int) -> List[Dict[str, Any]]:
+        """Flatten a DuckDuckGo instant answer into result entries."""
+        results = []
+
+        # Abstract (main answer)
+        abstract = data.get("AbstractText", "")
+        abstract_url = data.get("AbstractURL", "")
+        abstract_source = data.get("AbstractSource", "")
+        if abstract:
+            results.append({
+                "title": abstract_source or "Answer",
+                "snippet": abstract[:500],
+                "url": abstract_url,
+            })
+
+        # Related topics
+        for topic in data.get("RelatedTopics", [])[:max_results]:
+            if isinstance(topic, dict):
+                text = topic.get("Text", "")
+                first_url = topic.get("FirstURL", "")
+                if text:
+                    results.append({
+                        "title": text[:80],
+                        "snippet": text[:300],
+                        "url": first_url,
+                    })
+
+        # Infobox
+        infobox = data.get("Infobox", {})
+        if isinstance(infobox, dict):
+            for item in infobox.get("content", [])[:3]:
+                if isinstance(item, dict):
+                    label = item.get("label", "")
+                    value = item.get("value", "")
+                    if label and value:
+                        results.append({
+                            "title": label,
+                            "snippet": str(value)[:300],
+                            "url": "",
+                        })
+
+        return results[:max_results]
+
+    @staticmethod
+    def _search_payload(query: str, results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+        return {
+            "query": query,
+            "results": results,
+            "result_count": len(results),
+            "elapsed_ms": round(elapsed, 1),
+            "source": "duckduckgo",
+        }
+
+    def _fetch_result(self, resp, url: str, max_chars: int, elapsed: float,
+                      correlation_id: Optional[str]) -> Tuple[bool, Dict[str, Any], Optional[str]]:
+        """Size check, text extraction and truncation for a 200 response."""
+        content_type = resp.headers.get("content-type", "")
+        content_length = len(resp.content)
+
+        if content_length > self.MAX_FETCH_BYTES:
+            return False, {}, f"Response too large ({content_length} bytes, max {self.MAX_FETCH_BYTES})"
+
+        # Extract text based on content type
+        text = resp.text
+        if "html" in content_type:
+            text = self._strip_html(text)
+        elif "json" in content_type:
+            try:
+                parsed = resp.json()
+                text = json.dumps(parsed, indent=2, default=str)
+            except Exception:
+                pass  # keep raw text
+
+        # Truncate
+        text = text[:max_chars]
+
+        self._log("fetch", url=url, success=True,
+                  elapsed_ms=elapsed, correlation_id=correlation_id)
+
+        return True, {
+            "url": url,
+            "content_type": content_type,
+            "text": text,
+            "text_length": len(text),
+            "original_length": content_length,
+            "truncated": content_length > max_chars,
+            "elapsed_ms": round(elapsed, 1),
+        }, None
+
     def _validate_url(self, url: str) -> Tuple[bool, Optional[str]]:
         """Validate URL for safety."""
         try:
@@ -5,11 +5,15 @@ FastAPI application with executor registry and strict safety enforcement.
 
 from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Dict
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from datetime import datetime
+import asyncio
 import json
 import sys
+import uuid
 
 OPENCLAW_DIR = Path(__file__).resolve().parent
 SERVICES_DIR = OPENCLAW_DIR.parent
@@ -37,6 +41,9 @@ from openclaw.registry import get_registry
 # Initialize registry on startup
 registry = None
 
+# Streamed executions in flight: execution_id -> cancel event
+active_streams: Dict[str, asyncio.Event] = {}
+
 
 @asynccontextmanager
 async def _lifespan(a):
@@ -56,6 +63,8 @@ async def _lifespan(a):
 
     yield  # ── app is running ──
 
+    await registry.engine.close()
+
     log_entry = {
         "timestamp": datetime.utcnow().isoformat() + "Z",
         "level": "INFO",
@@ -179,8 +188,9 @@ async def execute(request: ExecuteRequest) -> ExecuteResponse:
     }
     ```
     """
-    # Execute through registry (deterministic dispatch)
-    response = registry.execute(request)
+    # Execute through registry (deterministic dispatch); the engine keeps
+    # slow tools off the event loop so other requests are not stalled
+    response = await registry.execute_async(request)
     
     # Log execution
     log_entry = {
@@ -198,6 +208,80 @@ async def execute(request: ExecuteRequest) -> ExecuteResponse:
     return response
 
 
+@app.post("/execute/stream")
+async def execute_stream(request: ExecuteRequest):
+    """
+    Execute a tool, streaming progress as NDJSON (one JSON object per line).
+
+    ```
+    {"type": "started", "execution_id": "exec_...", "tool_name": "shell.run", "correlation_id": "req_001"}
+    {"type": "output", "stream": "stdout", "text": "line 1\\n"}
+    {"type": "output", "stream": "stderr", "text": "warning\\n"}
+    {"type": "final", "response": {"status": "executed", ...}}
+    ```
+
+    Only streaming tools (shell.run) emit "output" events; the final
+    response has the same shape as POST /execute. Cancel with
+    POST /execute/{execution_id}/cancel or by closing the connection.
+    """
+    execution_id = f"exec_{uuid.uuid4().hex[:12]}"
+    cancel = asyncio.Event()
+    active_streams[execution_id] = cancel
+
+    async def events():
+        stream = registry.execute_stream(request, cancel=cancel)
+        status = "error"
+        response = None
+        try:
+            yield _ndjson({
+                "type": "started",
+                "execution_id": execution_id,
+                "tool_name": request.tool_name,
+                "correlation_id": request.correlation_id,
+            })
+            async for event in stream:
+                if event["type"] == "final":
+                    response = event["response"]
+                    status = response.status
+                yield _ndjson(event)
+        finally:
+            # Closing the stream kills the process if the client went away
+            await stream.aclose()
+            active_streams.pop(execution_id, None)
+            print(json.dumps({
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "level": "INFO",
+                "service": "openclaw",
+                "event": "tool_execution_stream",
+                "tool_name": request.tool_name,
+                "execution_id": execution_id,
+                "status": status if response is not None else "disconnected",
+                "cancelled": cancel.is_set(),
+                "correlation_id": response.correlation_id if response else request.correlation_id,
+                "duration_ms": response.duration_ms if response else None
+            }))
+
+    return StreamingResponse(
+        events(),
+        media_type="application/x-ndjson",
+        headers={"X-Execution-Id": execution_id},
+    )
+
+
+@app.post("/execute/{execution_id}/cancel")
+async def cancel_execution(execution_id: str):
+    """Cancel a streamed execution; its final event reports the cancellation."""
+    cancel = active_streams.get(execution_id)
+    if cancel is None:
+        raise HTTPException(status_code=404, detail=f"Unknown execution '{execution_id}'")
+    cancel.set()
+    return {"execution_id": execution_id, "cancelled": True}
+
+
+def _ndjson(event: Dict) -> bytes:
+    return (json.dumps(jsonable_encoder(event)) + "\n").encode()
+
+
 @app.get("/tools")
 async def list_tools():
     """
@@ -298,6 +382,27 @@ async def registry_stats():
     }
 
 
+@app.get("/engine/stats")
+async def engine_stats():
+    """
+    Execution engine load.
+    
+    Response:
+    ```json
+    {
+        "max_workers": 8,
+        "completed": 120,
+        "offloaded": 35,
+        "running": {"shell.run": 2},
+        "waiting": {},
+        "limits": {"shell.run": 4, "desktop.input": 1},
+        "default_limit": 4
+    }
+    ```
+    """
+    return registry.engine.get_stats()
+
+
 @app.get("/breakers")
 async def breaker_status():
     """Circuit breaker status for all tools."""
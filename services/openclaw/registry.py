@@ -3,9 +3,11 @@ OpenClaw Tool Registry
 Deterministic executor registry and dispatcher.
 """
 
-from typing import Any, Dict, Optional, Callable
+from typing import Any, AsyncIterator, Dict, Optional, Callable
 from datetime import datetime
 from pathlib import Path
+import asyncio
+import contextlib
 import os
 import uuid
 import sys
@@ -40,6 +42,7 @@ def _validate_path(path: str) -> Optional[str]:
 
 from openclaw.schemas import ExecuteResponse, ExecuteRequest, ToolMetadata, RegistryStats
 from openclaw.policy import get_policy, SecurityTier
+from openclaw.engine import ExecutionEngine
 from openclaw.executors.shell_exec import ShellExecutor
 from openclaw.executors.file_exec import FileExecutor
 from openclaw.executors.browser_exec import BrowserExecutor
@@ -54,6 +57,16 @@ from openclaw.executors.notification_exec import NotificationExecutor
 
 class ToolExecutor:
     """Base class for tool executors."""
+
+    # Executors with a non-blocking implementation define
+    # `async def execute_async(...)`; the others run on the engine's
+    # thread pool.
+    execute_async = None
+
+    # Executors that can report output while running define
+    # `async def execute_stream(...)`: an async generator yielding
+    # progress events and finally {"type": "result", ...}.
+    execute_stream = None
     
     def execute(self, tool_name: str, args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """Execute tool and return result."""
@@ -91,6 +104,36 @@ class ShellRunExecutor(ToolExecutor):
             "error": error
         }
 
+    async def execute_async(self, tool_name: str, args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Execute shell command as an asyncio subprocess."""
+        command = args.get("command", "")
+        if not command:
+            return {"error": "command argument required"}
+
+        success, result, error = await self.shell.execute_async(
+            command,
+            timeout_ms=kwargs.get("timeout_ms"),
+            correlation_id=kwargs.get("correlation_id")
+        )
+        return {"success": success, "result": result, "error": error}
+
+    async def execute_stream(self, tool_name: str, args: Dict[str, Any], **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Execute shell command, yielding output lines as they arrive."""
+        command = args.get("command", "")
+        if not command:
+            yield {"type": "result", "error": "command argument required"}
+            return
+
+        stream = self.shell.execute_stream(
+            command,
+            timeout_ms=kwargs.get("timeout_ms"),
+            correlation_id=kwargs.get("correlation_id"),
+            cancel=kwargs.get("cancel")
+        )
+        async with contextlib.aclosing(stream):
+            async for event in stream:
+                yield event
+
 
 class FileReadExecutor(ToolExecutor):
     """Executor for file.read tool."""
@@ -315,6 +358,14 @@ class WebSearchExecutor(ToolExecutor):
         success, result, error = self.web.search(
             query, max_results=max_results, **kwargs)
         return {"success": success, "result": result, "error": error}
+    async def execute_async(self, tool_name: str, args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        query = args.get("query", "")
+        max_results = args.get("max_results", 5)
+        if not query:
+            return {"error": "query argument required"}
+        success, result, error = await self.web.search_async(
+            query, max_results=max_results, **kwargs)
+        return {"success": success, "result": result, "error": error}
 
 
 class WebFetchExecutor(ToolExecutor):
@@ -329,6 +380,14 @@ class WebFetchExecutor(ToolExecutor):
         success, result, error = self.web.fetch(
             url, max_chars=max_chars, **kwargs)
         return {"success": success, "result": result, "error": error}
+    async def execute_async(self, tool_name: str, args: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        url = args.get("url", "")
+        max_chars = args.get("max_chars", 5000)
+        if not url:
+            return {"error": "url argument required"}
+        success, result, error = await self.web.fetch_async(
+            url, max_chars=max_chars, **kwargs)
+        return {"success": success, "result": result, "error": error}
 
 
 class NotificationSendExecutor(ToolExecutor):
@@ -354,11 +413,12 @@ class ToolRegistry:
     Deterministic tool registry and dispatcher.
     """
     
-    def __init__(self):
+    def __init__(self, engine: Optional[ExecutionEngine] = None):
         self.tools: Dict[str, ToolMetadata] = {}
         self.executors: Dict[str, ToolExecutor] = {}
         self.execution_log: list[Dict[str, Any]] = []
         self.policy = get_policy()
+        self.engine = engine or ExecutionEngine()
         
         # Register tools in deterministic order
         self._register_tools()
@@ -575,6 +635,89 @@ class ToolRegistry:
         Deterministic dispatch to executor.
         """
         start_time = datetime.utcnow()
+        tool_name, args, correlation_id, response = self._resolve(request)
+        if response is not None:
+            return response
+
+        try:
+            result = self.executors[tool_name].execute(
+                tool_name,
+                args,
+                timeout_ms=request.timeout_ms,
+                correlation_id=correlation_id
+            )
+        except Exception as e:
+            return self._failed(tool_name, correlation_id, start_time, e)
+        return self._complete(request.tool_name, tool_name, correlation_id, start_time, result)
+
+    async def execute_async(self, request: ExecuteRequest) -> ExecuteResponse:
+        """
+        Execute a tool request through the execution engine.
+        Same dispatch and response envelope as execute(), without
+        blocking the event loop.
+        """
+        start_time = datetime.utcnow()
+        tool_name, args, correlation_id, response = self._resolve(request)
+        if response is not None:
+            return response
+
+        try:
+            result = await self.engine.run(
+                tool_name,
+                self.executors[tool_name],
+                args,
+                timeout_ms=request.timeout_ms,
+                correlation_id=correlation_id
+            )
+        except Exception as e:
+            return self._failed(tool_name, correlation_id, start_time, e)
+        return self._complete(request.tool_name, tool_name, correlation_id, start_time, result)
+
+    async def execute_stream(
+        self,
+        request: ExecuteRequest,
+        cancel: Optional[asyncio.Event] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a tool request, yielding progress events as they happen.
+        The last event is {"type": "final", "response": ExecuteResponse}.
+        Tools without a streaming executor yield only the final event.
+        """
+        start_time = datetime.utcnow()
+        tool_name, args, correlation_id, response = self._resolve(request)
+        if response is not None:
+            yield {"type": "final", "response": response}
+            return
+
+        executor = self.executors[tool_name]
+        kwargs = {"timeout_ms": request.timeout_ms, "correlation_id": correlation_id}
+        try:
+            if executor.execute_stream is None:
+                result = await self.engine.run(tool_name, executor, args, **kwargs)
+            else:
+                result = None
+                async with self.engine.slot(tool_name):
+                    stream = executor.execute_stream(tool_name, args, cancel=cancel, **kwargs)
+                    async with contextlib.aclosing(stream):
+                        async for event in stream:
+                            if event["type"] == "result":
+                                result = event
+                                break
+                            yield event
+                if result is None:
+                    raise RuntimeError("executor stream ended without a result")
+                result.pop("type")
+        except Exception as e:
+            yield {"type": "final", "response": self._failed(tool_name, correlation_id, start_time, e)}
+            return
+        response = self._complete(request.tool_name, tool_name, correlation_id, start_time, result)
+        yield {"type": "final", "response": response}
+
+    def _resolve(self, request: ExecuteRequest):
+        """
+        Resolve aliases and normalize arguments.
+        Returns (tool_name, args, correlation_id, early_response).
+        """
         correlation_id = request.correlation_id or f"req_{uuid.uuid4().hex[:12]}"
         requested_tool = request.tool_name
         tool_name = _TOOL_ALIASES.get(requested_tool, requested_tool)
@@ -593,62 +736,69 @@ class ToolRegistry:
                 correlation_id=correlation_id
             )
             self._log_execution(tool_name, "not_implemented", correlation_id)
-            return response
-        
-        # Get executor
-        executor = self.executors[tool_name]
-        
-        # Execute tool
-        try:
-            result = executor.execute(
-                tool_name,
-                args,
-                timeout_ms=request.timeout_ms,
-                correlation_id=correlation_id
-            )
-            if requested_tool != tool_name:
-                result["_alias"] = {
-                    "requested_tool": requested_tool,
-                    "canonical_tool": tool_name,
-                }
-            
-            # Check for errors
-            if result.get("error"):
-                response = ExecuteResponse(
-                    status="error",
-                    tool_name=tool_name,
-                    error=result["error"],
-                    message=f"Execution failed: {result['error']}",
-                    correlation_id=correlation_id
-                )
-                self._log_execution(tool_name, "error", correlation_id, result["error"])
-                return response
-            
-            # Success
-            elapsed = (datetime.utcnow() - start_time).total_seconds() * 1000
-            response = ExecuteResponse(
-                status="executed",
-                tool_name=tool_name,
-                result=result.get("result", {}),
-                side_effects=result.get("side_effects", []),
-                correlation_id=correlation_id,
-                duration_ms=elapsed
-            )
-            self._log_execution(tool_name, "executed", correlation_id)
-            return response
+            return tool_name, args, correlation_id, response
+
+        return tool_name, args, correlation_id, None
+
+    def _complete(
+        self,
+        requested_tool: str,
+        tool_name: str,
+        correlation_id: str,
+        start_time: datetime,
+        result: Dict[str, Any]
+    ) -> ExecuteResponse:
+        """Build the response envelope for an executor result."""
+        if requested_tool != tool_name:
+            result["_alias"] = {
+                "requested_tool": requested_tool,
+                "canonical_tool": tool_name,
+            }
         
-        except Exception as e:
-            elapsed = (datetime.utcnow() - start_time).total_seconds() * 1000
+        # Check for errors
+        if result.get("error"):
             response = ExecuteResponse(
                 status="error",
                 tool_name=tool_name,
-                error=str(e),
-                message=f"Execution failed: {str(e)}",
-                correlation_id=correlation_id,
-                duration_ms=elapsed
+                error=result["error"],
+                message=f"Execution failed: {result['error']}",
+                correlation_id=correlation_id
             )
-            self._log_execution(tool_name, "error", correlation_id, str(e))
+            self._log_execution(tool_name, "error", correlation_id, result["error"])
             return response
+        
+        # Success
+        elapsed = (datetime.utcnow() - start_time).total_seconds() * 1000
+        response = ExecuteResponse(
+            status="executed",
+            tool_name=tool_name,
+            result=result.get("result", {}),
+            side_effects=result.get("side_effects", []),
+            correlation_id=correlation_id,
+            duration_ms=elapsed
+        )
+        self._log_execution(tool_name, "executed", correlation_id)
+        return response
+
+    def _failed(
+        self,
+        tool_name: str,
+        correlation_id: str,
+        start_time: datetime,
+        e: Exception
+    ) -> ExecuteResponse:
+        """Build the response envelope for an executor exception."""
+        elapsed = (datetime.utcnow() - start_time).total_seconds() * 1000
+        response = ExecuteResponse(
+            status="error",
+            tool_name=tool_name,
+            error=str(e),
+            message=f"Execution failed: {str(e)}",
+            correlation_id=correlation_id,
+            duration_ms=elapsed
+        )
+        self._log_execution(tool_name, "error", correlation_id, str(e))
+        return response
     
     def get_tools(self) -> Dict[str, ToolMetadata]:
         """Get all registered tools."""
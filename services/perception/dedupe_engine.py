@@ -17,9 +17,12 @@ Provenance:
 """
 from __future__ import annotations
 
-from collections import OrderedDict
+import hashlib
+import json
+from bisect import bisect_left, insort
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Deque, Dict, List, Optional, Tuple
 
 from .event_normalizer import PerceptionEnvelope
 
@@ -86,23 +89,55 @@ def _is_near_duplicate(
 
 # ── Engine ───────────────────────────────────────────────────────────────
 
+_GROUP_KEY = Tuple[str, str]             # (object_id, source)
+_SPATIAL_KEY = Tuple[str, str, str]      # (object_id, source, spatial_token)
+
+
+def _decision_record(d: DedupeDecision) -> str:
+    return json.dumps(
+        {
+            "decision": d.decision,
+            "reason_code": d.reason_code,
+            "dedupe_key": d.dedupe_key,
+            "event_id": d.event_id,
+            "parent_event_id": d.parent_event_id,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
 class DedupeEngine:
     """Deterministic, window-bounded perception event dedupe.
 
     Uses event-count-based windowing (not wall-clock) for determinism.
+
+    Near-duplicate candidates come from secondary indexes instead of a
+    window scan: only entries sharing (object_id, source) can match, and
+    entries that also share the spatial token are found directly. Both
+    indexes keep window order, so the first match is the same entry a
+    full scan would pick.
     """
 
-    def __init__(self, window_size: int = 100):
+    def __init__(self, window_size: int = 100, decision_log_size: int = 1000):
         """Initialize with fixed window size (event count).
 
         Args:
             window_size: max entries in dedupe window before oldest evicted.
+            decision_log_size: max recent decisions kept for audit; the
+                replay hash still covers every decision (rolling).
         """
         self._window_size = window_size
         self._window_id = "dedupe-window-0"
         self._entries: OrderedDict[str, DedupeEntry] = OrderedDict()
         self._seq = 0
-        self._decisions: List[DedupeDecision] = []
+        # Window position of each key (stable across coalesce updates)
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._by_group: Dict[_GROUP_KEY, OrderedDict[str, None]] = {}
+        self._by_spatial: Dict[_SPATIAL_KEY, List[Tuple[int, str]]] = {}
+        self._decisions: Deque[DedupeDecision] = deque(maxlen=decision_log_size)
+        self._decisions_hash = hashlib.sha256(b"").hexdigest()
         self._stats = {
             "total_evaluated": 0,
             "total_dropped": 0,
@@ -124,9 +159,70 @@ class DedupeEngine:
 
     @property
     def decisions(self) -> List[DedupeDecision]:
-        """All decisions made (for audit/replay verification)."""
+        """Most recent decisions, oldest first (bounded by decision_log_size)."""
         return list(self._decisions)
 
+    # ── Index maintenance ─────────────────────────────────────────────
+
+    def _index(self, key: str, entry: DedupeEntry) -> None:
+        group = (entry.object_id, entry.source)
+        self._by_group.setdefault(group, OrderedDict())[key] = None
+        if entry.spatial_token:
+            bucket = self._by_spatial.setdefault(group + (entry.spatial_token,), [])
+            insort(bucket, (self._order[key], key))
+
+    def _unindex_spatial(self, key: str, entry: DedupeEntry) -> None:
+        if not entry.spatial_token:
+            return
+        skey = (entry.object_id, entry.source, entry.spatial_token)
+        bucket = self._by_spatial.get(skey)
+        if not bucket:
+            return
+        pos = bisect_left(bucket, (self._order[key], key))
+        if pos < len(bucket) and bucket[pos][1] == key:
+            bucket.pop(pos)
+        if not bucket:
+            del self._by_spatial[skey]
+
+    def _unindex(self, key: str, entry: DedupeEntry) -> None:
+        self._unindex_spatial(key, entry)
+        group = (entry.object_id, entry.source)
+        members = self._by_group.get(group)
+        if members is not None:
+            members.pop(key, None)
+            if not members:
+                del self._by_group[group]
+        del self._order[key]
+
+    def _find_near_duplicate(self, envelope: PerceptionEnvelope) -> Optional[str]:
+        """Key of the first window entry that is a near-duplicate, if any."""
+        group = (envelope.object_id, envelope.source)
+        members = self._by_group.get(group)
+        if not members:
+            return None
+
+        # Earliest spatial match (same object/source/token, different content)
+        spatial_hit: Optional[str] = None
+        limit = None
+        if envelope.spatial_token:
+            for order, key in self._by_spatial.get(group + (envelope.spatial_token,), ()):
+                if self._entries[key].content_hash != envelope.content_hash:
+                    spatial_hit, limit = key, order
+                    break
+
+        # A confidence match earlier in the window wins over the spatial one
+        for key in members:
+            if limit is not None and self._order[key] >= limit:
+                break
+            if _is_near_duplicate(self._entries[key], envelope):
+                return key
+        return spatial_hit
+
+    def _record(self, decision: DedupeDecision) -> None:
+        self._decisions.append(decision)
+        rolled = self._decisions_hash + _decision_record(decision)
+        self._decisions_hash = hashlib.sha256(rolled.encode("utf-8")).hexdigest()
+
     def evaluate(self, envelope: PerceptionEnvelope) -> DedupeDecision:
         """Evaluate an envelope for deduplication.
 
@@ -147,37 +243,40 @@ class DedupeEngine:
                 parent_event_id=existing.event_id,
             )
             self._stats["total_dropped"] += 1
-            self._decisions.append(decision)
+            self._record(decision)
             return decision
 
-        # ── Near-duplicate check (scan window) ────────────────────────
-        for existing_key, existing in self._entries.items():
-            if _is_near_duplicate(existing, envelope):
-                decision = DedupeDecision(
-                    decision=DECISION_COALESCE,
-                    reason_code="near_duplicate_coalesce",
-                    dedupe_key=key,
-                    window_id=self._window_id,
+        # ── Near-duplicate check (indexed candidates) ─────────────────
+        existing_key = self._find_near_duplicate(envelope)
+        if existing_key is not None:
+            existing = self._entries[existing_key]
+            decision = DedupeDecision(
+                decision=DECISION_COALESCE,
+                reason_code="near_duplicate_coalesce",
+                dedupe_key=key,
+                window_id=self._window_id,
+                event_id=envelope.event_id,
+                parent_event_id=existing.event_id,
+                confidence_delta=abs(existing.confidence - envelope.confidence),
+            )
+            # Update entry with higher confidence version
+            if envelope.confidence > existing.confidence:
+                self._unindex_spatial(existing_key, existing)
+                self._entries[existing_key] = DedupeEntry(
                     event_id=envelope.event_id,
-                    parent_event_id=existing.event_id,
-                    confidence_delta=abs(existing.confidence - envelope.confidence),
+                    dedupe_key=existing_key,
+                    content_hash=envelope.content_hash,
+                    object_id=envelope.object_id,
+                    confidence=envelope.confidence,
+                    spatial_token=envelope.spatial_token,
+                    source=envelope.source,
+                    seq=self._seq,
                 )
-                # Update entry with higher confidence version
-                if envelope.confidence > existing.confidence:
-                    self._entries[existing_key] = DedupeEntry(
-                        event_id=envelope.event_id,
-                        dedupe_key=existing_key,
-                        content_hash=envelope.content_hash,
-                        object_id=envelope.object_id,
-                        confidence=envelope.confidence,
-                        spatial_token=envelope.spatial_token,
-                        source=envelope.source,
-                        seq=self._seq,
-                    )
-                self._seq += 1
-                self._stats["total_coalesced"] += 1
-                self._decisions.append(decision)
-                return decision
+                self._index(existing_key, self._entries[existing_key])
+            self._seq += 1
+            self._stats["total_coalesced"] += 1
+            self._record(decision)
+            return decision
 
         # ── Unique: accept ────────────────────────────────────────────
         self._seq += 1
@@ -194,9 +293,13 @@ class DedupeEngine:
 
         # Evict oldest if window full
         if len(self._entries) >= self._window_size:
-            self._entries.popitem(last=False)
+            old_key, old_entry = self._entries.popitem(last=False)
+            self._unindex(old_key, old_entry)
 
         self._entries[key] = entry
+        self._order[key] = self._next_order
+        self._next_order += 1
+        self._index(key, entry)
 
         decision = DedupeDecision(
             decision=DECISION_ACCEPT,
@@ -206,13 +309,18 @@ class DedupeEngine:
             event_id=envelope.event_id,
         )
         self._stats["total_accepted"] += 1
-        self._decisions.append(decision)
+        self._record(decision)
         return decision
 
     def clear(self) -> None:
         """Clear all state. Used for testing or session reset."""
         self._entries.clear()
+        self._order.clear()
+        self._next_order = 0
+        self._by_group.clear()
+        self._by_spatial.clear()
         self._decisions.clear()
+        self._decisions_hash = hashlib.sha256(b"").hexdigest()
         self._seq = 0
         self._stats = {
             "total_evaluated": 0,
@@ -222,18 +330,5 @@ class DedupeEngine:
         }
 
     def replay_decisions_hash(self) -> str:
-        """Deterministic hash of all decisions for replay verification."""
-        import hashlib
-        import json
-        records = [
-            {
-                "decision": d.decision,
-                "reason_code": d.reason_code,
-                "dedupe_key": d.dedupe_key,
-                "event_id": d.event_id,
-                "parent_event_id": d.parent_event_id,
-            }
-            for d in self._decisions
-        ]
-        canonical = json.dumps(records, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        """Deterministic rolling hash over every decision for replay verification."""
+        return self._decisions_hash
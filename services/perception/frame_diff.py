@@ -0,0 +1,171 @@
+"""Frame-difference stage ahead of VLM inference.
+
+Contract:
+    sig = detector.signature(raw_frame_bytes)
+    diff = detector.diff(sig)          # against the last analyzed frame
+    ... run (or skip) inference ...
+    detector.set_reference(sig)        # after a successful analysis
+
+Each signature holds a 64-bit dHash of a downscaled grayscale frame plus a
+block-wise mean-intensity grid. A frame is:
+    UNCHANGED: hash distance and every block delta under threshold
+    LOCAL:     only a bounded fraction of blocks changed -> crop box given
+    GLOBAL:    anything else (full frame should be analyzed)
+
+Requires numpy + Pillow; without them ``available`` is False and every
+frame is reported as GLOBAL so callers fall back to full inference.
+"""
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+try:
+    import numpy as np
+    from PIL import Image
+
+    FRAME_DIFF_AVAILABLE = True
+except ImportError:
+    np = None
+    Image = None
+    FRAME_DIFF_AVAILABLE = False
+
+
+CHANGE_UNCHANGED = "UNCHANGED"
+CHANGE_LOCAL = "LOCAL"
+CHANGE_GLOBAL = "GLOBAL"
+
+
+@dataclass
+class FrameSignature:
+    """Perceptual fingerprint of one frame."""
+    dhash: int
+    blocks: "np.ndarray"          # (rows, cols) mean intensity per block
+    width: int                    # source frame size in pixels
+    height: int
+
+
+@dataclass(frozen=True)
+class FrameDiff:
+    """Outcome of comparing a frame with the reference frame."""
+    change: str                                   # UNCHANGED | LOCAL | GLOBAL
+    hash_distance: int = 0
+    changed_fraction: float = 1.0
+    crop_box: Optional[Tuple[int, int, int, int]] = None  # (left, top, right, bottom) px
+
+
+class ChangeDetector:
+    """Perceptual-hash + block-mask change detector (single reference frame)."""
+
+    def __init__(
+        self,
+        hash_size: int = 8,
+        grid: Tuple[int, int] = (8, 8),
+        block_px: int = 16,
+        block_threshold: float = 10.0,
+        hash_threshold: int = 4,
+        local_max_fraction: float = 0.25,
+    ):
+        """
+        Args:
+            hash_size: dHash side length (hash_size**2 bits)
+            grid: (rows, cols) of the change mask
+            block_px: working-image pixels per block side
+            block_threshold: mean absolute intensity delta (0-255) for a changed block
+            hash_threshold: max dHash Hamming distance still considered unchanged
+            local_max_fraction: max fraction of changed blocks for a LOCAL change
+        """
+        self.hash_size = hash_size
+        self.rows, self.cols = grid
+        self.block_px = block_px
+        self.block_threshold = block_threshold
+        self.hash_threshold = hash_threshold
+        self.local_max_fraction = local_max_fraction
+        self._reference: Optional[FrameSignature] = None
+
+    @property
+    def available(self) -> bool:
+        return FRAME_DIFF_AVAILABLE
+
+    @property
+    def has_reference(self) -> bool:
+        return self._reference is not None
+
+    def signature(self, raw: bytes) -> Optional[FrameSignature]:
+        """Fingerprint an encoded frame; None if it cannot be decoded."""
+        if not FRAME_DIFF_AVAILABLE or not raw:
+            return None
+        try:
+            img = Image.open(io.BytesIO(raw))
+            width, height = img.size
+            work_size = (self.cols * self.block_px, self.rows * self.block_px)
+            # JPEG: let the decoder downscale while decoding
+            img.draft("L", work_size)
+            gray = img.convert("L")
+        except Exception:
+            return None
+
+        work = np.asarray(gray.resize(work_size, Image.BILINEAR), dtype=np.float32)
+        blocks = work.reshape(self.rows, self.block_px, self.cols, self.block_px).mean(axis=(1, 3))
+
+        small = np.asarray(
+            gray.resize((self.hash_size + 1, self.hash_size), Image.BILINEAR), dtype=np.int16,
+        )
+        bits = (small[:, 1:] > small[:, :-1]).ravel()
+        dhash = int.from_bytes(np.packbits(bits).tobytes(), "big")
+        return FrameSignature(dhash=dhash, blocks=blocks, width=width, height=height)
+
+    def diff(self, sig: Optional[FrameSignature]) -> FrameDiff:
+        """Compare *sig* with the reference frame."""
+        ref = self._reference
+        if sig is None or ref is None or (sig.width, sig.height) != (ref.width, ref.height):
+            return FrameDiff(change=CHANGE_GLOBAL)
+
+        distance = bin(sig.dhash ^ ref.dhash).count("1")
+        mask = np.abs(sig.blocks - ref.blocks) > self.block_threshold
+        fraction = float(mask.mean())
+
+        if not mask.any():
+            if distance <= self.hash_threshold:
+                return FrameDiff(change=CHANGE_UNCHANGED, hash_distance=distance, changed_fraction=0.0)
+            return FrameDiff(change=CHANGE_GLOBAL, hash_distance=distance, changed_fraction=0.0)
+
+        if fraction > self.local_max_fraction:
+            return FrameDiff(change=CHANGE_GLOBAL, hash_distance=distance, changed_fraction=fraction)
+
+        rows = np.flatnonzero(mask.any(axis=1))
+        cols = np.flatnonzero(mask.any(axis=0))
+        # One block of margin around the changed area, mapped to source pixels
+        r0, r1 = max(int(rows[0]) - 1, 0), min(int(rows[-1]) + 2, self.rows)
+        c0, c1 = max(int(cols[0]) - 1, 0), min(int(cols[-1]) + 2, self.cols)
+        box = (
+            c0 * sig.width // self.cols,
+            r0 * sig.height // self.rows,
+            c1 * sig.width // self.cols,
+            r1 * sig.height // self.rows,
+        )
+        return FrameDiff(
+            change=CHANGE_LOCAL, hash_distance=distance, changed_fraction=fraction, crop_box=box,
+        )
+
+    def set_reference(self, sig: Optional[FrameSignature]) -> None:
+        """Make *sig* the frame later frames are compared against."""
+        self._reference = sig
+
+    def reset(self) -> None:
+        """Forget the reference frame (e.g. when privacy is disabled)."""
+        self._reference = None
+
+    @staticmethod
+    def crop(raw: bytes, box: Tuple[int, int, int, int]) -> Optional[bytes]:
+        """Crop an encoded frame to *box* and re-encode it as PNG."""
+        if not FRAME_DIFF_AVAILABLE:
+            return None
+        try:
+            img = Image.open(io.BytesIO(raw))
+            out = io.BytesIO()
+            img.crop(box).save(out, format="PNG")
+            return out.getvalue()
+        except Exception:
+            return None
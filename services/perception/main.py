@@ -8,6 +8,19 @@ confirmation required on ALL actions (enforced at service layer).
 Privacy check: refuses inference when vision-capture privacy is disabled.
 Even if events arrive, no inference runs with privacy off.
 
+Frames are read straight from vision-capture's shared-memory slab when it
+is co-located (slab name comes with the privacy status), falling back to
+the HTTP frames endpoint otherwise. When the frame feed (WebSocket push
+subscription to vision-capture) is connected, frame metadata arrives as
+frames are captured and bytes are fetched by sequence number, so nothing
+polls /v1/vision/frames/latest.
+
+Privacy status is cached: vision-capture pushes changes to
+/v1/perception/privacy/notify, and the cache is re-fetched once it is
+older than its TTL. A failed re-fetch fails closed. Pushes carry the
+token sent with the subscription and can only tighten privacy; a status
+that allows capture is re-confirmed by polling every PRIVACY_POLL_TTL_S.
+
 Event bus contract:
   - vision.frame.available  (input: new frame in buffer)
   - perception.requested    (input: explicit analysis request)
@@ -19,15 +32,20 @@ Port: 7070 | Health: /healthz
 from __future__ import annotations
 
 import asyncio
+import base64
+import json
+import hmac
 import logging
+import secrets
 import time
 import uuid
+from collections import deque
 from contextlib import asynccontextmanager
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import httpx
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from pydantic import BaseModel, Field, validator
 
 import sys as _sys
@@ -35,6 +53,14 @@ from pathlib import Path as _Path
 _sys.path.insert(0, str(_Path(__file__).resolve().parent.parent / "shared"))
 from version import SONIA_VERSION, SONIA_CONTRACT
 from consent import ConsentManager, ConsentViolation
+from frame_ring import FrameRingError, SharedFrameRing
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    websockets = None
+    WEBSOCKETS_AVAILABLE = False
 
 logger = logging.getLogger("perception")
 
@@ -44,8 +70,21 @@ logger = logging.getLogger("perception")
 
 VISION_CAPTURE_URL = "http://127.0.0.1:7060"
 MODEL_ROUTER_URL = "http://127.0.0.1:7010"
+PERCEPTION_URL = "http://127.0.0.1:7070"
 MAX_GPU_BUDGET_MS = 2000
 INFERENCE_TIMEOUT_S = 10.0
+# Privacy cache TTL: long for a "capture off" status while vision-capture
+# pushes changes to us; short when not subscribed or while capture is
+# allowed (a lost push must not keep frames flowing).
+PRIVACY_PUSH_TTL_S = 30.0
+PRIVACY_POLL_TTL_S = 2.0
+PRIVACY_RESUBSCRIBE_S = 30.0
+HTTP_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0)
+FRAME_FEED_URL = "ws://127.0.0.1:7060/v1/vision/frames/subscribe"
+# Consumer-side downsampling of the frame feed (0 = every frame)
+FRAME_FEED_MAX_FPS = 2.0
+FRAME_FEED_HISTORY = 5
+FRAME_FEED_RETRY_S = (0.5, 10.0)
 
 
 class TriggerType(str, Enum):
@@ -117,6 +156,19 @@ class SceneAnalysis(BaseModel):
 # Request schemas
 # ---------------------------------------------------------------------------
 
+class PrivacyStatusPush(BaseModel):
+    """Privacy status pushed by vision-capture (see its _privacy_status)."""
+    privacy: str
+    capture_allowed: bool
+    mode: str = "off"
+    buffer_frames: int = 0
+    toggle_count: int = 0
+    zero_frame_enforced: bool = True
+    frame_slab: Optional[str] = None
+    instance_id: str
+    status_seq: int = Field(ge=0)
+
+
 class PerceptionRequest(BaseModel):
     trigger: TriggerType
     context: str = ""
@@ -155,38 +207,371 @@ state = PerceptionState()
 consent_mgr = ConsentManager()
 
 
+# ---------------------------------------------------------------------------
+# HTTP clients (one pooled client per downstream, closed in lifespan)
+# ---------------------------------------------------------------------------
+
+_vision_client: Optional[httpx.AsyncClient] = None
+_router_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_vision_client() -> httpx.AsyncClient:
+    global _vision_client
+    if _vision_client is None or _vision_client.is_closed:
+        _vision_client = httpx.AsyncClient(timeout=5.0, limits=HTTP_LIMITS)
+    return _vision_client
+
+
+def _get_router_client() -> httpx.AsyncClient:
+    global _router_client
+    if _router_client is None or _router_client.is_closed:
+        _router_client = httpx.AsyncClient(timeout=INFERENCE_TIMEOUT_S, limits=HTTP_LIMITS)
+    return _router_client
+
+
+async def close_clients() -> None:
+    """Shutdown the shared clients (call on app shutdown)."""
+    global _vision_client, _router_client
+    for client in (_vision_client, _router_client):
+        if client is not None and not client.is_closed:
+            await client.aclose()
+    _vision_client = None
+    _router_client = None
+
+
 # ---------------------------------------------------------------------------
 # Privacy check
 # ---------------------------------------------------------------------------
 
+_PRIVACY_FAIL_CLOSED = {"privacy": "disabled", "capture_allowed": False}
+
+
+def _allows_capture(status: Optional[Dict[str, Any]]) -> bool:
+    return bool(status) and status.get("privacy") == "enabled" and bool(status.get("capture_allowed"))
+
+
+class PrivacyCache:
+    """
+    Last known vision-capture privacy status.
+
+    Updated by pushes from vision-capture; re-fetched (renewing the
+    subscription) once older than the TTL. Anything unknown or stale that
+    cannot be refreshed reads as privacy disabled.
+    """
+
+    def __init__(self, callback_url: str = f"{PERCEPTION_URL}/v1/perception/privacy/notify"):
+        self.callback_url = callback_url
+        # Sent with the subscription; vision-capture echoes it on every push
+        self.token: str = secrets.token_urlsafe(32)
+        self.status: Optional[Dict[str, Any]] = None
+        self.updated_at: float = 0.0
+        self.subscribed: bool = False
+        self.instance_id: Optional[str] = None
+        self._last_subscribe_attempt: float = float("-inf")
+        self._lock = asyncio.Lock()
+        self.hits: int = 0
+        self.refreshes: int = 0
+        self.pushes: int = 0
+        self.pushes_rejected: int = 0
+
+    @property
+    def ttl_s(self) -> float:
+        if self.subscribed and not _allows_capture(self.status):
+            return PRIVACY_PUSH_TTL_S
+        return PRIVACY_POLL_TTL_S
+
+    def _fresh(self) -> bool:
+        return self.status is not None and time.monotonic() - self.updated_at < self.ttl_s
+
+    def invalidate(self) -> None:
+        self.status = None
+        self.updated_at = 0.0
+
+    def update(self, status: Dict[str, Any]) -> bool:
+        """Apply a pushed or fetched status. Out-of-order pushes are ignored."""
+        instance_id = status.get("instance_id")
+        if instance_id != self.instance_id:
+            # vision-capture restarted: its subscriber list is gone
+            self.subscribed = False
+            self.instance_id = instance_id
+        elif self.status is not None and status.get("status_seq", 0) < self.status.get("status_seq", 0):
+            return False
+        self.status = status
+        self.updated_at = time.monotonic()
+        return True
+
+    def check_token(self, token: Optional[str]) -> bool:
+        return token is not None and hmac.compare_digest(token, self.token)
+
+    def push(self, status: Dict[str, Any]) -> bool:
+        """
+        Apply a status pushed by vision-capture. A push may only tighten
+        privacy: one that would allow capture when the cache does not, or
+        that names another vision-capture instance, just invalidates the
+        cache so the next lookup re-polls.
+        """
+        if status.get("instance_id") != self.instance_id or (
+            _allows_capture(status) and not _allows_capture(self.status)
+        ):
+            self.invalidate()
+            return False
+        return self.update(status)
+
+    async def get(self) -> Dict[str, Any]:
+        if self._fresh():
+            self.hits += 1
+            return self.status
+        async with self._lock:
+            if self._fresh():
+                self.hits += 1
+                return self.status
+            try:
+                status = await self._fetch()
+            except Exception as e:
+                logger.warning(f"Could not check vision privacy: {e}")
+                self.invalidate()
+                # Fail closed: treat as privacy disabled
+                return dict(_PRIVACY_FAIL_CLOSED)
+            self.refreshes += 1
+            self.update(status)
+            return status
+
+    async def _fetch(self) -> Dict[str, Any]:
+        client = _get_vision_client()
+        now = time.monotonic()
+        # Refreshing re-subscribes: vision-capture drops a subscriber whose
+        # push failed, and re-subscribing is idempotent
+        if self.subscribed or now - self._last_subscribe_attempt >= PRIVACY_RESUBSCRIBE_S:
+            self._last_subscribe_attempt = now
+            try:
+                resp = await client.post(
+                    f"{VISION_CAPTURE_URL}/v1/vision/privacy/subscribe",
+                    json={"callback_url": self.callback_url, "token": self.token},
+                    timeout=3.0,
+                )
+                resp.raise_for_status()
+                status = resp.json()
+                self.instance_id = status.get("instance_id")
+                self.subscribed = True
+                return status
+            except Exception as e:
+                self.subscribed = False
+                logger.debug(f"Privacy subscription failed, polling instead: {e}")
+        resp = await client.get(f"{VISION_CAPTURE_URL}/v1/vision/privacy/status", timeout=3.0)
+        resp.raise_for_status()
+        return resp.json()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "subscribed": self.subscribed,
+            "ttl_s": self.ttl_s,
+            "age_s": round(time.monotonic() - self.updated_at, 2) if self.status else None,
+            "hits": self.hits,
+            "refreshes": self.refreshes,
+            "pushes": self.pushes,
+            "pushes_rejected": self.pushes_rejected,
+        }
+
+
+privacy_cache = PrivacyCache()
+
+
 async def check_vision_privacy() -> Dict[str, Any]:
-    """Check vision-capture privacy status. Returns privacy info dict."""
+    """Check vision-capture privacy status (cached). Returns privacy info dict."""
+    return await privacy_cache.get()
+
+
+_frame_ring: Optional[SharedFrameRing] = None
+
+
+def _attach_frame_ring(name: Optional[str]) -> Optional[SharedFrameRing]:
+    """Attach (or re-attach after a vision-capture restart) to the frame slab."""
+    global _frame_ring
+    if not name:
+        return None
+    if _frame_ring is not None and _frame_ring.name == name:
+        return _frame_ring
+    if _frame_ring is not None:
+        _frame_ring.close()
+        _frame_ring = None
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            resp = await client.get(f"{VISION_CAPTURE_URL}/v1/vision/privacy/status")
-            resp.raise_for_status()
-            return resp.json()
-    except Exception as e:
-        logger.warning(f"Could not check vision privacy: {e}")
-        # Fail closed: treat as privacy disabled
-        return {"privacy": "disabled", "capture_allowed": False}
+        _frame_ring = SharedFrameRing.attach(name)
+    except (FrameRingError, OSError) as e:
+        logger.debug(f"Frame slab {name!r} not attachable, using HTTP: {e}")
+        return None
+    return _frame_ring
 
 
-async def fetch_frames(n: int = 1) -> list:
-    """Fetch latest frames from vision-capture service."""
+class FrameFeed:
+    """
+    Push subscription to vision-capture frame metadata.
+
+    Keeps the last few frame notifications; a "cleared" push (privacy off,
+    mode off) empties them at once. Privacy pushes on the same socket keep
+    privacy_cache current. Reconnects resume from the last seen sequence.
+    ``on_frame`` (optional coroutine) is called for every frame notification.
+    """
+
+    def __init__(
+        self,
+        url: str = FRAME_FEED_URL,
+        max_fps: float = FRAME_FEED_MAX_FPS,
+        history: int = FRAME_FEED_HISTORY,
+    ):
+        self.url = url
+        self.max_fps = max_fps
+        self.frames: deque = deque(maxlen=history)
+        self.last_seq: int = 0
+        self.instance_id: Optional[str] = None
+        self.connected: bool = False
+        self.on_frame: Optional[Callable[[Dict[str, Any]], Awaitable[Any]]] = None
+        self.frames_received: int = 0
+        self.clears: int = 0
+        self.connects: int = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def handle(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply one pushed message. Returns the frame metadata for frame messages."""
+        kind = message.get("type")
+        if kind == "frame":
+            self.frames.append(message)
+            self.last_seq = max(self.last_seq, message.get("seq", 0))
+            self.frames_received += 1
+            return message
+        if kind == "cleared":
+            self.frames.clear()
+            self.clears += 1
+        elif kind in ("hello", "privacy"):
+            if kind == "hello" and message.get("instance_id") != self.instance_id:
+                # vision-capture restarted: sequence numbers start over
+                self.instance_id = message.get("instance_id")
+                self.frames.clear()
+                self.last_seq = 0
+            status = {k: v for k, v in message.items() if k not in ("type", "head_seq", "oldest_seq")}
+            privacy_cache.update(status)
+        return None
+
+    def latest(self, n: int = 1) -> List[Dict[str, Any]]:
+        items = list(self.frames)
+        return items[-n:]
+
+    async def _run(self) -> None:
+        delay = FRAME_FEED_RETRY_S[0]
+        while True:
+            url = f"{self.url}?max_fps={self.max_fps}&since_seq={self.last_seq}"
+            try:
+                async with websockets.connect(url, open_timeout=3.0) as ws:
+                    self.connected = True
+                    self.connects += 1
+                    delay = FRAME_FEED_RETRY_S[0]
+                    async for raw in ws:
+                        if isinstance(raw, bytes):
+                            continue
+                        frame = self.handle(json.loads(raw))
+                        if frame is not None and self.on_frame is not None:
+                            asyncio.ensure_future(self.on_frame(frame))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.debug(f"Frame feed disconnected: {e}")
+            finally:
+                self.connected = False
+                # Nothing pushed while disconnected: do not serve stale metadata
+                self.frames.clear()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, FRAME_FEED_RETRY_S[1])
+
+    def start(self) -> bool:
+        if not WEBSOCKETS_AVAILABLE:
+            return False
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return True
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._task = None
+        self.connected = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "available": WEBSOCKETS_AVAILABLE,
+            "connected": self.connected,
+            "max_fps": self.max_fps,
+            "last_seq": self.last_seq,
+            "buffered": len(self.frames),
+            "frames_received": self.frames_received,
+            "clears": self.clears,
+            "connects": self.connects,
+        }
+
+
+frame_feed = FrameFeed()
+
+
+async def fetch_frames(n: int = 1, frame_slab: Optional[str] = None) -> list:
+    """
+    Fetch latest frames from vision-capture. Reads raw bytes from the shared
+    slab when *frame_slab* is attachable; otherwise, with the frame feed
+    connected, fetches the pushed frames by sequence number; otherwise
+    falls back to polling the HTTP endpoint.
+    """
+    ring = _attach_frame_ring(frame_slab)
+    if ring is not None:
+        frames = []
+        for view in ring.latest(n):
+            raw = view.tobytes()
+            if raw is None:
+                continue  # overwritten or cleared while reading
+            frames.append({
+                "frame_id": view.frame_id,
+                "seq": view.seq,
+                "timestamp": view.timestamp,
+                "width": view.width,
+                "height": view.height,
+                "size_bytes": view.size_bytes,
+                "raw": raw,
+            })
+        return frames
+    if frame_feed.connected:
+        return await _fetch_feed_frames(frame_feed.latest(n))
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            resp = await client.get(
-                f"{VISION_CAPTURE_URL}/v1/vision/frames/latest",
-                params={"n": n},
-            )
-            resp.raise_for_status()
-            return resp.json().get("frames", [])
+        resp = await _get_vision_client().get(
+            f"{VISION_CAPTURE_URL}/v1/vision/frames/latest",
+            params={"n": n},
+        )
+        resp.raise_for_status()
+        return resp.json().get("frames", [])
     except Exception as e:
         logger.warning(f"Failed to fetch frames: {e}")
         return []
 
 
+async def _fetch_feed_frames(metas: List[Dict[str, Any]]) -> list:
+    """Fetch bytes for pushed frame metadata; frames gone meanwhile are skipped."""
+    client = _get_vision_client()
+
+    async def _one(meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            resp = await client.get(f"{VISION_CAPTURE_URL}/v1/vision/frames/{meta['seq']}/raw")
+            if resp.status_code != 200:
+                return None
+        except Exception as e:
+            logger.warning(f"Failed to fetch frame {meta['seq']}: {e}")
+            return None
+        frame = {k: v for k, v in meta.items() if k != "type"}
+        frame["raw"] = resp.content
+        return frame
+
+    results = await asyncio.gather(*(_one(m) for m in metas))
+    return [f for f in results if f is not None]
+
+
 # ---------------------------------------------------------------------------
 # VLM inference
 # ---------------------------------------------------------------------------
@@ -225,8 +610,12 @@ async def run_vlm_inference(
 
     # Add frames as base64 image references
     for frame in frames:
-        # Frame format from vision-capture: {data_b64, mime_type, ...}
-        data_b64 = frame.get("data_b64") or frame.get("data", "")
+        # Frame format from vision-capture: {data_b64 | raw, mime_type, ...}
+        raw = frame.get("raw")
+        if raw:
+            data_b64 = base64.b64encode(raw).decode("ascii")
+        else:
+            data_b64 = frame.get("data_b64") or frame.get("data", "")
         mime_type = frame.get("mime_type", "image/png")
         if data_b64:
             content_parts.append({
@@ -237,19 +626,19 @@ async def run_vlm_inference(
     messages = [{"role": "user", "content": content_parts}]
 
     try:
-        async with httpx.AsyncClient(timeout=max(max_ms / 1000, 5.0)) as client:
-            resp = await client.post(
-                f"{MODEL_ROUTER_URL}/chat",
-                json={
-                    "task_type": "vision",
-                    "messages": messages,
-                    "temperature": 0.3,
-                    "max_tokens": 1024,
-                    "policy": "cloud_allowed",
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
+        resp = await _get_router_client().post(
+            f"{MODEL_ROUTER_URL}/chat",
+            json={
+                "task_type": "vision",
+                "messages": messages,
+                "temperature": 0.3,
+                "max_tokens": 1024,
+                "policy": "cloud_allowed",
+            },
+            timeout=max(max_ms / 1000, 5.0),
+        )
+        resp.raise_for_status()
+        data = resp.json()
 
         elapsed_ms = (time.perf_counter() - start) * 1000
 
@@ -308,7 +697,23 @@ async def run_vlm_inference(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Perception pipeline starting (consent gate enabled)")
+    # Subscribe to privacy pushes up front (falls back to polling on failure)
+    await check_vision_privacy()
+    frame_feed.start()
     yield
+    await frame_feed.stop()
+    if privacy_cache.subscribed:
+        try:
+            await _get_vision_client().post(
+                f"{VISION_CAPTURE_URL}/v1/vision/privacy/unsubscribe",
+                json={"callback_url": privacy_cache.callback_url, "token": privacy_cache.token},
+                timeout=1.0,
+            )
+        except Exception:
+            pass
+    await close_clients()
+    if _frame_ring is not None:
+        _frame_ring.close()
     logger.info("Perception pipeline stopped")
 
 
@@ -347,6 +752,8 @@ async def get_status():
         "avg_inference_ms": round(state.avg_inference_ms, 1),
         "last_scene_id": state.last_scene.scene_id if state.last_scene else None,
         "events_emitted": state.events_emitted,
+        "privacy_cache": privacy_cache.to_dict(),
+        "frame_feed": frame_feed.to_dict(),
         "uptime_seconds": round(time.time() - state.started_at, 1),
     }
 
@@ -398,7 +805,7 @@ async def analyze(req: PerceptionRequest):
     correlation_id = req.correlation_id or str(uuid.uuid4())
 
     try:
-        frames = await fetch_frames(req.frame_count)
+        frames = await fetch_frames(req.frame_count, privacy.get("frame_slab"))
         if not frames:
             state.status = PerceptionStatus.IDLE
             raise HTTPException(
@@ -439,6 +846,25 @@ async def analyze(req: PerceptionRequest):
         raise HTTPException(500, f"INFERENCE_ERROR: {e}")
 
 
+# ---------------------------------------------------------------------------
+# Routes: privacy push (from vision-capture)
+# ---------------------------------------------------------------------------
+
+@app.post("/v1/perception/privacy/notify")
+async def privacy_notify(
+    status: PrivacyStatusPush,
+    x_privacy_token: Optional[str] = Header(default=None),
+):
+    """vision-capture pushes its privacy status here whenever it changes."""
+    if not privacy_cache.check_token(x_privacy_token):
+        privacy_cache.pushes_rejected += 1
+        raise HTTPException(401, "PRIVACY_PUSH_UNAUTHORIZED")
+    applied = privacy_cache.push(status.dict())
+    if applied:
+        privacy_cache.pushes += 1
+    return {"applied": applied}
+
+
 # ---------------------------------------------------------------------------
 # Routes: last scene
 # ---------------------------------------------------------------------------
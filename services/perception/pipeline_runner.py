@@ -11,22 +11,76 @@ Trigger conditions:
 
 Anti-flood:
   - Minimum interval between inferences (cooldown)
-  - Skip when perception is already processing
+  - Triggers arriving during cooldown or an in-flight run are coalesced
+    into one pending run, executed as soon as the runner is free
   - Respect privacy gate (no inference when disabled)
 
+Scheduling:
+  - Triggers are ranked by priority_router.assign_priority; inside a lane
+    explicit requests beat motion, which beats scheduled scans
+  - A user request preempts an in-flight low-priority (P2) scan
+  - The scheduled interval adapts to the observed scene-change rate and
+    is never shorter than VLM latency allows (max_duty_cycle)
+
+Change gate (when a frame_fetch_fn is supplied):
+  - Unchanged frame (dHash + block mask) -> reuse the last scene
+  - Local change -> only the changed region is cropped and analyzed
+  - Global change -> full frames analyzed
+
 Integrates with EventBus for event-driven triggers.
 """
 
 from __future__ import annotations
 
 import asyncio
+import base64
 import logging
 import time
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    from .event_normalizer import EventNormalizer, PerceptionEnvelope
+    from .frame_diff import CHANGE_LOCAL, CHANGE_UNCHANGED, ChangeDetector
+    from .priority_router import PRIORITY_NAMES, PRIORITY_P2, assign_priority
+except ImportError:
+    from event_normalizer import EventNormalizer, PerceptionEnvelope
+    from frame_diff import CHANGE_LOCAL, CHANGE_UNCHANGED, ChangeDetector
+    from priority_router import PRIORITY_NAMES, PRIORITY_P2, assign_priority
 
 logger = logging.getLogger("perception.pipeline_runner")
 
+TRIGGER_MOTION = "motion"
+TRIGGER_SCHEDULED = "scheduled"
+
+# Event type each automatic trigger is routed as; anything else is an
+# explicit request and carries a recommended action (P1 unless safety P0)
+_TRIGGER_EVENT_TYPES = {TRIGGER_MOTION: "scene_change", TRIGGER_SCHEDULED: "ambient_update"}
+# Tie-break inside a priority lane: explicit requests, motion, scheduled
+_TRIGGER_RANK = {TRIGGER_MOTION: 1, TRIGGER_SCHEDULED: 2}
+
+# Weight of the newest sample in the change-rate / latency averages
+ADAPT_ALPHA = 0.3
+
+
+def trigger_priority(trigger: str) -> int:
+    """Priority lane for a runner trigger, assigned by the priority router."""
+    explicit = trigger not in _TRIGGER_EVENT_TYPES
+    envelope = PerceptionEnvelope(
+        event_id=trigger,
+        session_id="",
+        source="vision",
+        schema_version=EventNormalizer.SCHEMA_VERSION,
+        event_type=_TRIGGER_EVENT_TYPES.get(trigger, trigger),
+        correlation_id="",
+        object_id=trigger,
+        spatial_token=None,
+        content_hash="",
+        confidence=0.0,
+        payload={"recommended_action": "analyze_scene"} if explicit else {},
+    )
+    return assign_priority(envelope)
+
 
 @dataclass
 class RunnerConfig:
@@ -41,6 +95,17 @@ class RunnerConfig:
     max_inference_ms: float = 2000.0
     # Number of frames to request per analysis
     frame_count: int = 1
+    # Skip / crop inference based on frame differences (needs frame_fetch_fn)
+    change_detection: bool = True
+    # Scale scheduled_interval_s with scene-change rate and VLM latency
+    adaptive_schedule: bool = True
+    # Adaptive interval bounds (0 = scheduled_interval_s / 4 and * 4)
+    min_scheduled_interval_s: float = 0.0
+    max_scheduled_interval_s: float = 0.0
+    # Max fraction of wall time scheduled scans may keep the VLM busy
+    max_duty_cycle: float = 0.5
+    # Let explicit requests cancel an in-flight P2 (motion/scheduled) run
+    preempt_low_priority: bool = True
 
 
 @dataclass
@@ -52,8 +117,19 @@ class RunnerStats:
     total_skipped_busy: int = 0
     total_skipped_privacy: int = 0
     total_errors: int = 0
+    total_scene_cache_hits: int = 0
+    total_local_crops: int = 0
+    total_full_frames: int = 0
+    # Triggers merged into an already pending run
+    total_coalesced: int = 0
+    # Pending runs executed once the runner was free
+    total_deferred_runs: int = 0
+    total_preempted: int = 0
     last_run_at: float = 0.0
     last_scene_id: str = ""
+    scheduled_interval_s: float = 0.0
+    scene_change_rate: float = 0.5
+    vlm_latency_ms: float = 0.0
     started_at: float = field(default_factory=time.time)
 
     def to_dict(self) -> Dict[str, Any]:
@@ -64,12 +140,46 @@ class RunnerStats:
             "total_skipped_busy": self.total_skipped_busy,
             "total_skipped_privacy": self.total_skipped_privacy,
             "total_errors": self.total_errors,
+            "total_scene_cache_hits": self.total_scene_cache_hits,
+            "total_local_crops": self.total_local_crops,
+            "total_full_frames": self.total_full_frames,
+            "total_coalesced": self.total_coalesced,
+            "total_deferred_runs": self.total_deferred_runs,
+            "total_preempted": self.total_preempted,
             "last_run_at": self.last_run_at,
             "last_scene_id": self.last_scene_id,
+            "scheduled_interval_s": round(self.scheduled_interval_s, 2),
+            "scene_change_rate": round(self.scene_change_rate, 3),
+            "vlm_latency_ms": round(self.vlm_latency_ms, 1),
             "uptime_seconds": round(time.time() - self.started_at, 1),
         }
 
 
+@dataclass
+class _Trigger:
+    """One requested analysis, possibly standing for several coalesced triggers."""
+    trigger: str
+    context: str
+    frame_count: int
+    correlation_id: str
+    priority: int
+    merged: int = 1
+    preempted: bool = False
+
+    @property
+    def rank(self) -> Tuple[int, int]:
+        return self.priority, _TRIGGER_RANK.get(self.trigger, 0)
+
+    def absorb(self, other: "_Trigger") -> "_Trigger":
+        """Coalesce two triggers: the better-ranked one wins, frame counts max out."""
+        best = other if other.rank < self.rank else self
+        return replace(
+            best,
+            frame_count=max(self.frame_count, other.frame_count),
+            merged=self.merged + other.merged,
+        )
+
+
 class PerceptionPipelineRunner:
     """
     Background runner that auto-triggers perception analysis.
@@ -89,33 +199,67 @@ class PerceptionPipelineRunner:
         analyze_fn,
         privacy_check_fn,
         config: Optional[RunnerConfig] = None,
+        frame_fetch_fn=None,
+        change_detector: Optional[ChangeDetector] = None,
     ):
         """
         Args:
-            analyze_fn: Async callable(trigger, context, frame_count, correlation_id) -> SceneAnalysis
+            analyze_fn: Async callable(trigger, context, frame_count, correlation_id) -> SceneAnalysis.
+                With frame_fetch_fn set it also receives frames=[frame dicts] to analyze.
             privacy_check_fn: Async callable() -> dict with "privacy" and "capture_allowed"
             config: Runner configuration
+            frame_fetch_fn: Optional async callable(n) -> list of frame dicts
+                ("raw" bytes or "data_b64"); enables the change gate
+            change_detector: Optional ChangeDetector (default thresholds otherwise)
         """
         self.analyze_fn = analyze_fn
         self.privacy_check_fn = privacy_check_fn
+        self.frame_fetch_fn = frame_fetch_fn
         self.config = config or RunnerConfig()
         self.stats = RunnerStats()
+        self.change_detector = change_detector or ChangeDetector()
+        self._last_scene: Any = None
+        self._last_scene_at: float = 0.0
 
         self._running = False
         self._scheduled_task: Optional[asyncio.Task] = None
         self._is_processing = False
         self._last_inference_at: float = 0.0
 
+        self._pending: Optional[_Trigger] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        self._inflight: Optional[Tuple[_Trigger, asyncio.Task]] = None
+        # Set while a preemptor owns the slot of the run it cancelled
+        self._slot_claimed = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._last_activity_at: float = 0.0
+        self._change_rate: float = 0.5
+        self._vlm_latency_s: float = 0.0
+        self.stats.scheduled_interval_s = self.scheduled_interval()
+
     @property
     def running(self) -> bool:
         return self._running
 
+    @property
+    def pending(self) -> Optional[Dict[str, Any]]:
+        """The coalesced run waiting for the runner to become free, if any."""
+        if self._pending is None:
+            return None
+        return {
+            "trigger": self._pending.trigger,
+            "priority": PRIORITY_NAMES[self._pending.priority],
+            "merged": self._pending.merged,
+        }
+
     async def start(self) -> None:
         """Start the pipeline runner."""
         if self._running:
             return
         self._running = True
         self.stats.started_at = time.time()
+        self._last_activity_at = time.monotonic()
         logger.info("Pipeline runner started (cooldown=%.1fs)", self.config.cooldown_s)
 
         # Start scheduled analysis if configured
@@ -125,12 +269,14 @@ class PerceptionPipelineRunner:
     async def stop(self) -> None:
         """Stop the pipeline runner."""
         self._running = False
-        if self._scheduled_task and not self._scheduled_task.done():
-            self._scheduled_task.cancel()
-            try:
-                await self._scheduled_task
-            except asyncio.CancelledError:
-                pass
+        self._pending = None
+        for task in (self._scheduled_task, self._drain_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
         logger.info("Pipeline runner stopped (total_runs=%d)", self.stats.total_runs)
 
     async def on_frame_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
@@ -140,7 +286,7 @@ class PerceptionPipelineRunner:
         """
         self.stats.total_triggers += 1
         return await self._try_analyze(
-            trigger="motion",
+            trigger=TRIGGER_MOTION,
             context=event.get("payload", {}).get("context", ""),
             correlation_id=event.get("correlation_id", ""),
         )
@@ -159,52 +305,226 @@ class PerceptionPipelineRunner:
             correlation_id=event.get("correlation_id", ""),
         )
 
+    def scheduled_interval(self) -> float:
+        """Current scheduled-scan interval in seconds (0 = scheduling disabled).
+
+        A busy scene (change rate 1.0) scans at a quarter of the configured
+        interval, a static one (0.0) at four times it; the result is clamped
+        to the configured bounds and stretched so scheduled scans keep the
+        VLM busy at most max_duty_cycle of the time.
+        """
+        base = self.config.scheduled_interval_s
+        if base <= 0 or not self.config.adaptive_schedule:
+            return base
+        low = self.config.min_scheduled_interval_s or base / 4
+        high = self.config.max_scheduled_interval_s or base * 4
+        interval = min(high, max(low, base * 4 ** (1 - 2 * self._change_rate)))
+        if self._vlm_latency_s > 0 and self.config.max_duty_cycle > 0:
+            interval = max(interval, self._vlm_latency_s / self.config.max_duty_cycle)
+        return interval
+
     async def _try_analyze(
         self,
-        trigger: str = "motion",
+        trigger: str = TRIGGER_MOTION,
         context: str = "",
         frame_count: int = 0,
         correlation_id: str = "",
     ) -> Dict[str, Any]:
-        """Attempt to run analysis with guard checks."""
+        """Run analysis now, or coalesce the trigger into the next run.
+
+        Returns the run's result dict when it ran inline; otherwise
+        {"ok": False, "reason": "cooldown" | "busy", "deferred": True}
+        and the trigger runs as soon as the runner is free.
+        """
         if not self._running:
             return {"ok": False, "reason": "runner_stopped"}
 
-        # Cooldown check
-        now = time.monotonic()
-        if now - self._last_inference_at < self.config.cooldown_s:
+        trig = _Trigger(
+            trigger=trigger,
+            context=context,
+            frame_count=frame_count if frame_count > 0 else self.config.frame_count,
+            correlation_id=correlation_id,
+            priority=trigger_priority(trigger),
+        )
+
+        if self._can_preempt(trig):
+            await self._preempt(trig)
+            if self._cooldown_remaining() <= 0:
+                return await self._execute(self._absorb_pending(trig))
+            self._free_slot()
+
+        if self._cooldown_remaining() > 0:
             self.stats.total_skipped_cooldown += 1
-            return {"ok": False, "reason": "cooldown"}
+            return self._defer(trig, "cooldown")
 
-        # Busy check
         if self._is_processing:
             self.stats.total_skipped_busy += 1
-            return {"ok": False, "reason": "busy"}
+            return self._defer(trig, "busy")
+
+        return await self._execute(self._absorb_pending(trig))
+
+    def _absorb_pending(self, trig: _Trigger) -> _Trigger:
+        """Fold the pending run (if any) into *trig*, which runs now."""
+        if self._pending is not None:
+            trig = trig.absorb(self._pending)
+            self._pending = None
+            self.stats.total_coalesced += 1
+        return trig
+
+    def _cooldown_remaining(self) -> float:
+        if self._last_inference_at <= 0:
+            return 0.0
+        return self._last_inference_at + self.config.cooldown_s - time.monotonic()
+
+    def _defer(self, trig: _Trigger, reason: str) -> Dict[str, Any]:
+        """Park *trig* as (or merge it into) the pending run."""
+        if self._pending is None:
+            self._pending = trig
+        else:
+            self._pending = self._pending.absorb(trig)
+            self.stats.total_coalesced += 1
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.ensure_future(self._drain_pending())
+        return {"ok": False, "reason": reason, "deferred": True}
+
+    async def _drain_pending(self) -> None:
+        """Run the pending trigger once nothing is in flight and cooldown is over."""
+        while self._running and self._pending is not None:
+            if self._is_processing:
+                await self._idle.wait()
+                continue
+            wait = self._cooldown_remaining()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            trig, self._pending = self._pending, None
+            self.stats.total_deferred_runs += 1
+            result = await self._execute(trig)
+            if not result.get("ok"):
+                logger.debug("Deferred %s run did not complete: %s", trig.trigger, result.get("reason"))
+
+    def _can_preempt(self, trig: _Trigger) -> bool:
+        if not self.config.preempt_low_priority or self._inflight is None:
+            return False
+        running = self._inflight[0]
+        return running.priority >= PRIORITY_P2 and trig.priority < running.priority
+
+    async def _preempt(self, trig: _Trigger) -> None:
+        """Cancel the in-flight low-priority run in favour of *trig*.
+
+        The runner stays busy when the cancelled run ends, so a drain woken
+        by it cannot start the pending run ahead of *trig*; the caller
+        either executes *trig* or frees the slot.
+        """
+        running, task = self._inflight
+        running.preempted = True
+        self.stats.total_preempted += 1
+        logger.info(
+            "Preempting %s run (%s) for %s (%s)",
+            running.trigger, PRIORITY_NAMES[running.priority],
+            trig.trigger, PRIORITY_NAMES[trig.priority],
+        )
+        self._slot_claimed = True
+        task.cancel()
+        try:
+            await asyncio.wait({task})
+        except BaseException:
+            self._slot_claimed = False
+            if task.done():
+                self._free_slot()
+            raise
+
+    async def _execute(self, trig: _Trigger) -> Dict[str, Any]:
+        """Run *trig* as a cancellable task; the runner is busy until it ends."""
+        self._is_processing = True
+        self._idle.clear()
+        self._last_activity_at = time.monotonic()
+        task = asyncio.ensure_future(self._analyze(trig))
+        # Registered first, so state is released before any awaiter wakes
+        task.add_done_callback(self._release)
+        self._inflight = (trig, task)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if trig.preempted and task.cancelled():
+                return {"ok": False, "reason": "preempted"}
+            raise
+
+    def _release(self, task: asyncio.Task) -> None:
+        self._inflight = None
+        if self._slot_claimed:
+            # Handed straight to the preemptor
+            self._slot_claimed = False
+            return
+        self._free_slot()
+
+    def _free_slot(self) -> None:
+        self._is_processing = False
+        self._idle.set()
 
+    async def _analyze(self, trig: _Trigger) -> Dict[str, Any]:
+        """Privacy check, change gate and inference for one (coalesced) trigger."""
         # Privacy check
         try:
             privacy = await self.privacy_check_fn()
             if privacy.get("privacy") == "disabled" or not privacy.get("capture_allowed", False):
                 self.stats.total_skipped_privacy += 1
+                self._drop_scene_cache()
                 return {"ok": False, "reason": "privacy_disabled"}
         except Exception as e:
             self.stats.total_skipped_privacy += 1
+            self._drop_scene_cache()
             return {"ok": False, "reason": f"privacy_check_failed: {e}"}
 
         # Run analysis
-        self._is_processing = True
-        self._last_inference_at = now
+        context = trig.context
         try:
-            if frame_count <= 0:
-                frame_count = self.config.frame_count
-
-            scene = await self.analyze_fn(
-                trigger=trigger,
-                context=context,
-                frame_count=frame_count,
-                correlation_id=correlation_id,
-            )
-
+            kwargs: Dict[str, Any] = {}
+            sig = None
+            if self.frame_fetch_fn is not None and self.config.change_detection and self.change_detector.available:
+                frames = await self.frame_fetch_fn(trig.frame_count)
+                if not frames:
+                    return {"ok": False, "reason": "no_frames"}
+                sig = self.change_detector.signature(_frame_bytes(frames[-1]))
+                diff = self.change_detector.diff(sig)
+                if diff.change == CHANGE_UNCHANGED and self._scene_cache_fresh():
+                    self._observe_change(0.0)
+                    self.stats.total_scene_cache_hits += 1
+                    return {"ok": True, "scene_id": self.stats.last_scene_id, "cached": True}
+                if diff.change == CHANGE_LOCAL and self._last_scene is not None:
+                    self._observe_change(0.5)
+                    cropped = self._crop_frame(frames[-1], diff.crop_box)
+                    if cropped is not None:
+                        frames = [cropped]
+                        context = _local_change_context(context, diff.crop_box, self._last_scene)
+                        self.stats.total_local_crops += 1
+                    else:
+                        self.stats.total_full_frames += 1
+                else:
+                    self._observe_change(0.0 if diff.change == CHANGE_UNCHANGED else 1.0)
+                    self.stats.total_full_frames += 1
+                kwargs["frames"] = frames
+
+            previous_inference_at = self._last_inference_at
+            started = self._last_inference_at = time.monotonic()
+            try:
+                scene = await self.analyze_fn(
+                    trigger=trig.trigger,
+                    context=context,
+                    frame_count=trig.frame_count,
+                    correlation_id=trig.correlation_id,
+                    **kwargs,
+                )
+            except asyncio.CancelledError:
+                # A cancelled inference does not hold back the next one
+                self._last_inference_at = previous_inference_at
+                raise
+            self._observe_latency(time.monotonic() - started)
+
+            if sig is not None:
+                self.change_detector.set_reference(sig)
+            self._last_scene = scene
+            self._last_scene_at = time.monotonic()
             self.stats.total_runs += 1
             self.stats.last_run_at = time.time()
             if hasattr(scene, "scene_id"):
@@ -219,22 +539,92 @@ class PerceptionPipelineRunner:
             logger.warning("Analysis failed: %s", e)
             return {"ok": False, "reason": str(e)}
 
-        finally:
-            self._is_processing = False
+    def _observe_change(self, change: float) -> None:
+        self._change_rate += ADAPT_ALPHA * (change - self._change_rate)
+        self.stats.scene_change_rate = self._change_rate
+        self.stats.scheduled_interval_s = self.scheduled_interval()
+
+    def _observe_latency(self, seconds: float) -> None:
+        if self._vlm_latency_s <= 0:
+            self._vlm_latency_s = seconds
+        else:
+            self._vlm_latency_s += ADAPT_ALPHA * (seconds - self._vlm_latency_s)
+        self.stats.vlm_latency_ms = self._vlm_latency_s * 1000
+        self.stats.scheduled_interval_s = self.scheduled_interval()
+
+    def _scene_cache_fresh(self) -> bool:
+        return (
+            self._last_scene is not None
+            and time.monotonic() - self._last_scene_at < self.config.staleness_s
+        )
+
+    def _drop_scene_cache(self) -> None:
+        """Forget the cached scene, reference frame and pending run (privacy off)."""
+        self._pending = None
+        self._last_scene = None
+        self._last_scene_at = 0.0
+        self.change_detector.reset()
+
+    def _crop_frame(self, frame: Dict[str, Any], box) -> Optional[Dict[str, Any]]:
+        raw = self.change_detector.crop(_frame_bytes(frame), box)
+        if raw is None:
+            return None
+        left, top, right, bottom = box
+        return {
+            "frame_id": frame.get("frame_id", ""),
+            "timestamp": frame.get("timestamp"),
+            "width": right - left,
+            "height": bottom - top,
+            "size_bytes": len(raw),
+            "mime_type": "image/png",
+            "crop_box": list(box),
+            "raw": raw,
+        }
 
     async def _scheduled_loop(self) -> None:
-        """Background loop for scheduled analysis."""
+        """Background loop for scheduled analysis.
+
+        The interval counts from the last run of any kind, so motion and
+        user requests push the next scheduled scan back.
+        """
         while self._running:
             try:
-                await asyncio.sleep(self.config.scheduled_interval_s)
+                wait = self.scheduled_interval() - (time.monotonic() - self._last_activity_at)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
                 if not self._running:
                     break
                 self.stats.total_triggers += 1
+                self._last_activity_at = time.monotonic()
                 await self._try_analyze(
-                    trigger="scheduled",
+                    trigger=TRIGGER_SCHEDULED,
                     context="scheduled_scan",
                 )
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.warning("Scheduled analysis error: %s", e)
+
+
+def _frame_bytes(frame: Dict[str, Any]) -> bytes:
+    """Raw encoded bytes of a frame dict from vision-capture (slab or HTTP)."""
+    raw = frame.get("raw")
+    if raw:
+        return raw
+    try:
+        return base64.b64decode(frame.get("data_b64") or "")
+    except Exception:
+        return b""
+
+
+def _local_change_context(context: str, box, last_scene: Any) -> str:
+    """Tell the VLM it is looking at a crop of a previously described scene."""
+    summary = getattr(last_scene, "summary", None)
+    if summary is None and isinstance(last_scene, dict):
+        summary = last_scene.get("summary")
+    left, top, right, bottom = box
+    note = f"Image is the changed region ({left},{top})-({right},{bottom}) of the screen."
+    if summary:
+        note += f" Previous full-scene description: {summary}"
+    return f"{context}\n\n{note}" if context else note
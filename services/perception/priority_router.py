@@ -20,7 +20,10 @@ from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
-from .event_normalizer import PerceptionEnvelope
+try:
+    from .event_normalizer import PerceptionEnvelope
+except ImportError:
+    from event_normalizer import PerceptionEnvelope
 
 
 # ── Priority Levels ──────────────────────────────────────────────────────
@@ -14,7 +14,8 @@ from app.turn_taking import (
 )
 from app.session_manager import VoiceSession, VoiceSessionManager
 from app.interruptions import handle_interrupt, InterruptResult, clear_interrupt_state
-from app.tts_client import synthesize_cancellable
+from app.tts_client import synthesize_cancellable, synthesize_streaming, SentenceChunker
+from app.tts_cache import TTSAudioCache, synthesize_cached
 from app.model_router_client import infer_cancellable, close_client as close_model_client
 from app.watchdog import run_with_timeout, StageTimeout, WatchdogResult
 from app.asr_client import transcribe_guarded
@@ -33,6 +34,10 @@ __all__ = [
     "InterruptResult",
     "clear_interrupt_state",
     "synthesize_cancellable",
+    "synthesize_streaming",
+    "SentenceChunker",
+    "TTSAudioCache",
+    "synthesize_cached",
     "infer_cancellable",
     "close_model_client",
     "run_with_timeout",
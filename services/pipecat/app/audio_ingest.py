@@ -0,0 +1,362 @@
+"""
+Pipecat — VAD-Segmented Audio Ingest
+
+Per-connection audio pipeline for the /v1/voice stream:
+    - ASR and VAD backends are created once per connection, not per frame.
+    - Incoming PCM frames are copied into a preallocated ring buffer.
+    - VAD decisions segment the stream into utterances: speech opens after
+      start_ms of voiced audio and closes after hangover_ms of silence.
+      A pre-roll keeps the onset that preceded the start decision.
+    - One final ASR call per utterance, made on end-of-speech.
+    - Optional streaming mode (partial_interval_ms > 0): while speech is
+      open, the utterance so far is re-transcribed in the background and
+      LocalAgreement-stabilized partials go to on_partial.
+
+Usage:
+    ingest = AudioIngest(create_asr(), create_vad(), session_id=sid,
+                         on_partial=send_partial)
+    for utt in await ingest.feed(pcm_bytes):
+        handle(utt.text)
+    for utt in await ingest.flush():        # control.end / disconnect
+        handle(utt.text)
+    await ingest.close()
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional
+
+from pipeline.asr import LocalAgreement, PartialTranscript
+
+logger = logging.getLogger(__name__)
+
+# End-of-speech -> transcript latencies kept for stats
+LATENCY_WINDOW = 200
+
+
+@dataclass
+class IngestConfig:
+    """Segmentation parameters (PCM s16le mono unless sample_width says otherwise)."""
+    sample_rate: int = 16000
+    sample_width: int = 2
+    start_ms: float = 90.0           # voiced audio needed to open an utterance
+    hangover_ms: float = 500.0       # trailing silence that closes it
+    preroll_ms: float = 200.0        # audio kept from before the start decision
+    min_utterance_ms: float = 250.0  # shorter utterances are discarded as noise
+    max_utterance_ms: float = 15000.0  # forced end, so the ring never overruns
+    partial_interval_ms: float = 0.0  # streaming ASR hop while speaking (0 = off)
+    partial_window_ms: float = 10000.0  # longest audio sent per partial
+
+    def bytes_for(self, ms: float) -> int:
+        n = int(ms * self.sample_rate / 1000) * self.sample_width
+        return max(n, 0)
+
+    def ms_for(self, nbytes: int) -> float:
+        return nbytes / self.sample_width / self.sample_rate * 1000
+
+
+class PCMRing:
+    """Preallocated circular byte buffer addressed by absolute stream position."""
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._buf = bytearray(capacity)
+        self.position = 0  # total bytes ever written
+
+    @property
+    def oldest(self) -> int:
+        """Oldest stream position still held."""
+        return max(0, self.position - self.capacity)
+
+    def append(self, data: bytes) -> None:
+        view = memoryview(data)
+        n = len(view)
+        if n >= self.capacity:
+            self.position += n - self.capacity
+            view = view[n - self.capacity:]
+            n = self.capacity
+        start = self.position % self.capacity
+        first = min(n, self.capacity - start)
+        self._buf[start:start + first] = view[:first]
+        if first < n:
+            self._buf[:n - first] = view[first:]
+        self.position += n
+
+    def read(self, start: int, end: Optional[int] = None) -> bytes:
+        """Bytes between two stream positions, clipped to what is still held."""
+        end = self.position if end is None else min(end, self.position)
+        start = max(start, self.oldest)
+        if end <= start:
+            return b""
+        a, b = start % self.capacity, end % self.capacity
+        if a < b or end - start < self.capacity and b == 0:
+            return bytes(self._buf[a:b or self.capacity])
+        return bytes(self._buf[a:]) + bytes(self._buf[:b])
+
+
+@dataclass
+class Utterance:
+    """One VAD-delimited stretch of speech."""
+    pcm: bytes
+    start_ms: float                  # stream time of the first byte
+    end_ms: float                    # stream time just past the last voiced frame
+    forced: bool = False             # closed by max_utterance_ms or flush
+    partial_text: str = ""           # last streaming partial before the end
+    ended_at: float = 0.0            # monotonic time of the end decision
+    text: str = ""
+    confidence: float = 0.0
+    transcript_ms: float = 0.0       # end decision -> transcript ready
+    error: str = ""
+
+    @property
+    def duration_ms(self) -> float:
+        return self.end_ms - self.start_ms
+
+
+class UtteranceSegmenter:
+    """VAD-driven start/end-of-speech state machine over a PCMRing."""
+
+    def __init__(self, config: Optional[IngestConfig] = None):
+        self.config = config or IngestConfig()
+        cfg = self.config
+        # Room for the longest utterance plus its pre-roll and one hangover
+        self.ring = PCMRing(cfg.bytes_for(cfg.max_utterance_ms + cfg.preroll_ms + cfg.hangover_ms) + 4096)
+        self.in_speech = False
+        self._voiced_ms = 0.0
+        self._silence_ms = 0.0
+        self._candidate_pos = 0
+        self._start_pos = 0
+        self._voiced_end_pos = 0
+        self.discarded = 0
+        self.forced_ends = 0
+
+    def push(self, frame: bytes, is_speech: bool) -> Optional[Utterance]:
+        """Append *frame* with its VAD decision; returns an utterance when one closes."""
+        cfg = self.config
+        before = self.ring.position
+        self.ring.append(frame)
+        frame_ms = cfg.ms_for(len(frame))
+
+        if not self.in_speech:
+            if not is_speech:
+                self._voiced_ms = 0.0
+                return None
+            if self._voiced_ms == 0.0:
+                self._candidate_pos = before
+            self._voiced_ms += frame_ms
+            if self._voiced_ms >= cfg.start_ms:
+                self.in_speech = True
+                self._silence_ms = 0.0
+                self._start_pos = max(self.ring.oldest, self._candidate_pos - cfg.bytes_for(cfg.preroll_ms))
+                self._voiced_end_pos = self.ring.position
+            return None
+
+        if is_speech:
+            self._silence_ms = 0.0
+            self._voiced_end_pos = self.ring.position
+        else:
+            self._silence_ms += frame_ms
+
+        if self._silence_ms >= cfg.hangover_ms:
+            return self._close(forced=False)
+        if cfg.ms_for(self.ring.position - self._start_pos) >= cfg.max_utterance_ms:
+            self._voiced_end_pos = self.ring.position
+            return self._close(forced=True)
+        return None
+
+    def open_pcm(self, max_ms: Optional[float] = None) -> bytes:
+        """Audio of the utterance in progress (its last *max_ms* if given)."""
+        if not self.in_speech:
+            return b""
+        start = self._start_pos
+        if max_ms is not None:
+            start = max(start, self.ring.position - self.config.bytes_for(max_ms))
+        return self.ring.read(start)
+
+    @property
+    def open_bytes(self) -> int:
+        """Length of the utterance in progress."""
+        return self.ring.position - self._start_pos if self.in_speech else 0
+
+    def flush(self) -> Optional[Utterance]:
+        """Close an open utterance at the current position (end of stream)."""
+        if not self.in_speech:
+            self._voiced_ms = 0.0
+            return None
+        return self._close(forced=True)
+
+    def _close(self, forced: bool) -> Optional[Utterance]:
+        cfg = self.config
+        end = self._voiced_end_pos if not forced else self.ring.position
+        self.in_speech = False
+        self._voiced_ms = 0.0
+        self._silence_ms = 0.0
+        if forced:
+            self.forced_ends += 1
+        # Length is measured from speech onset; pre-roll does not count
+        if cfg.ms_for(end - self._candidate_pos) < cfg.min_utterance_ms:
+            self.discarded += 1
+            return None
+        return Utterance(
+            pcm=self.ring.read(self._start_pos, end),
+            start_ms=cfg.ms_for(self._start_pos),
+            end_ms=cfg.ms_for(end),
+            forced=forced,
+            ended_at=time.monotonic(),
+        )
+
+
+@dataclass
+class IngestStats:
+    """Per-connection ingest counters."""
+    frames: int = 0
+    audio_bytes: int = 0
+    utterances: int = 0
+    asr_calls: int = 0
+    asr_errors: int = 0
+    partial_calls: int = 0
+    transcript_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def to_dict(self, config: IngestConfig) -> Dict[str, Any]:
+        audio_s = config.ms_for(self.audio_bytes) / 1000
+        latencies = sorted(self.transcript_ms)
+        return {
+            "frames": self.frames,
+            "audio_s": round(audio_s, 2),
+            "utterances": self.utterances,
+            "asr_calls": self.asr_calls,
+            "asr_errors": self.asr_errors,
+            "partial_calls": self.partial_calls,
+            "asr_calls_per_audio_s": round(self.asr_calls / audio_s, 3) if audio_s else 0.0,
+            "transcript_p50_ms": round(latencies[len(latencies) // 2], 1) if latencies else 0.0,
+            "transcript_max_ms": round(latencies[-1], 1) if latencies else 0.0,
+        }
+
+
+class AudioIngest:
+    """Drives one connection's ASR/VAD backends and turns PCM frames into transcripts.
+
+    With owns_asr=False the ASR backend is shared (VoiceBackendPool) and is
+    left open on close().
+    """
+
+    def __init__(
+        self,
+        asr,  # app.voice_backends.ASRBackend
+        vad,  # app.voice_backends.VADBackend
+        config: Optional[IngestConfig] = None,
+        session_id: str = "",
+        on_partial: Optional[Callable[[PartialTranscript], Coroutine]] = None,
+        owns_asr: bool = True,
+    ):
+        self.asr = asr
+        self.owns_asr = owns_asr
+        self.vad = vad
+        self.config = config or IngestConfig()
+        self.session_id = session_id
+        self.on_partial = on_partial
+        self.segmenter = UtteranceSegmenter(self.config)
+        self.stats = IngestStats()
+        self._agreement = LocalAgreement()
+        self._partial: Optional[PartialTranscript] = None
+        self._partial_task: Optional[asyncio.Task] = None
+        self._partial_at = 0  # open_bytes at the last partial start
+
+    @property
+    def available(self) -> bool:
+        return self.asr.available
+
+    async def feed(self, frame: bytes) -> List[Utterance]:
+        """Ingest one PCM frame; returns the utterances it completed, transcribed."""
+        self.stats.frames += 1
+        self.stats.audio_bytes += len(frame)
+        # Without a VAD the stream is one utterance, cut by max length / flush
+        is_speech = self.vad.process_frame(frame, self.config.sample_rate).is_speech if self.vad.available else True
+        was_open = self.segmenter.in_speech
+        utt = self.segmenter.push(frame, is_speech)
+        if was_open and not self.segmenter.in_speech:
+            await self._end_partials(utt)
+        elif self._partial_due():
+            self._partial_at = self.segmenter.open_bytes
+            self._partial_task = asyncio.create_task(
+                self._run_partial(self.segmenter.open_pcm(self.config.partial_window_ms))
+            )
+        return [await self._transcribe(utt)] if utt is not None else []
+
+    async def flush(self) -> List[Utterance]:
+        """Close and transcribe the utterance in progress, if any."""
+        utt = self.segmenter.flush()
+        await self._end_partials(utt)
+        return [await self._transcribe(utt)] if utt is not None else []
+
+    def _partial_due(self) -> bool:
+        cfg = self.config
+        if cfg.partial_interval_ms <= 0 or not self.segmenter.in_speech:
+            return False
+        if self._partial_task is not None and not self._partial_task.done():
+            return False  # one hypothesis in flight at a time
+        return self.segmenter.open_bytes - self._partial_at >= cfg.bytes_for(cfg.partial_interval_ms)
+
+    async def _run_partial(self, pcm: bytes) -> None:
+        windowed = self.segmenter.open_bytes > len(pcm)
+        self.stats.partial_calls += 1
+        try:
+            result = await self.asr.transcribe_partial(pcm, sample_rate=self.config.sample_rate)
+        except Exception as e:
+            logger.debug("audio_ingest: partial ASR failed  session=%s  error=%s", self.session_id, e)
+            return
+        self._partial = self._agreement.update(result.text, windowed=windowed)
+        if self.on_partial is not None:
+            await self.on_partial(self._partial)
+
+    async def _end_partials(self, utt: Optional[Utterance]) -> None:
+        """Drop the in-flight partial so it cannot land after the final."""
+        task, self._partial_task = self._partial_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if utt is not None and self._partial is not None:
+            utt.partial_text = self._partial.text
+        self._agreement.reset()
+        self._partial = None
+        self._partial_at = 0
+
+    async def _transcribe(self, utt: Utterance) -> Utterance:
+        self.stats.utterances += 1
+        self.stats.asr_calls += 1
+        try:
+            result = await self.asr.transcribe(utt.pcm, sample_rate=self.config.sample_rate)
+            utt.text = result.text
+            utt.confidence = result.confidence
+        except Exception as e:
+            self.stats.asr_errors += 1
+            utt.error = str(e)
+            logger.warning("audio_ingest: ASR failed  session=%s  error=%s", self.session_id, e)
+        utt.transcript_ms = (time.monotonic() - utt.ended_at) * 1000
+        self.stats.transcript_ms.append(utt.transcript_ms)
+        logger.debug(
+            "audio_ingest: utterance  session=%s  audio=%.0fms  forced=%s  "
+            "text_len=%d  transcript=%.0fms",
+            self.session_id, utt.duration_ms, utt.forced, len(utt.text), utt.transcript_ms,
+        )
+        return utt
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = self.stats.to_dict(self.config)
+        d["discarded"] = self.segmenter.discarded
+        d["forced_ends"] = self.segmenter.forced_ends
+        return d
+
+    async def close(self) -> None:
+        """Stop partials and release the connection's own backend clients."""
+        await self._end_partials(None)
+        if self.owns_asr:
+            await self.asr.close()
@@ -0,0 +1,434 @@
+"""
+Pipecat — Phrase-Level TTS Audio Cache
+
+Content-addressed cache for synthesized audio of recurring assistant
+phrases (confirmations, error notices, "one moment", action prompts).
+
+Key:
+    sha256(backend, voice, sample_rate, normalized text)
+
+Tiers:
+    - Memory: LRU bounded by total audio bytes.
+    - Disk:   one file per key under cache_dir, evicted oldest-access first
+              once the directory exceeds max_disk_bytes.  Disk hits are
+              promoted to memory.  File I/O runs in worker threads; usage
+              and access order are tracked in memory (scanned once at
+              startup, ordered by mtime).
+
+Only pinned keys (the prewarm allowlist) and phrases used at least
+disk_min_uses times are written to disk.  Everything else -- notably the
+individual sentences of streamed replies, which are user conversation
+content -- stays in the memory tier only.
+
+Concurrent misses for the same key share one synthesis call.
+
+Usage:
+    cache = TTSAudioCache(cache_dir=r"S:\\data\\tts_cache")
+    install_default_cache(cache)
+    await prewarm(tts, load_prewarm_phrases(), cache)
+    result = await synthesize_cached(tts, "One moment.", streaming=True)
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.voice_backends import TTSBackend, TTSResult
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_CACHE_DIR = r"S:\data\tts_cache"
+_DEFAULT_MAX_MEMORY_BYTES = 16 * 1024 * 1024
+_DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+# Text longer than this is one-off reply content, not a phrase.
+_DEFAULT_MAX_PHRASE_CHARS = 160
+_PREWARM_CONCURRENCY = 4
+# Uses (synthesis + memory hits) before an unpinned phrase is persisted.
+_DEFAULT_DISK_MIN_USES = 3
+
+# Spoken by the gateway / voice loop often enough to be worth synthesizing
+# at startup.  Override with SONIA_TTS_PREWARM_FILE (one phrase per line).
+DEFAULT_PREWARM_PHRASES: Tuple[str, ...] = (
+    "One moment.",
+    "Okay.",
+    "Done.",
+    "Sure.",
+    "Sorry, I didn't catch that.",
+    "Sorry, something went wrong.",
+    "Do you want me to go ahead?",
+    "Please confirm.",
+    "Cancelled.",
+    "I'm still working on it.",
+    "(No response generated)",
+)
+
+# Disk entry header: duration_ms as little-endian double
+_HEADER = struct.Struct("<d")
+_WS = re.compile(r"\s+")
+
+
+def normalize_phrase(text: str) -> str:
+    """Case- and whitespace-insensitive form of *text* used in cache keys."""
+    return _WS.sub(" ", text).strip().casefold()
+
+
+def backend_identity(tts) -> Tuple[str, str, int]:
+    """(backend, voice, sample_rate) for a pipeline.tts.TTS or a TTSBackend."""
+    cfg = getattr(tts, "config", None)
+    if cfg is not None and not isinstance(cfg, dict):
+        # pipeline.tts.TTSConfig
+        backend = f"{cfg.backend}:{cfg.model}"
+        if cfg.speed != 1.0:
+            backend = f"{backend}@{cfg.speed:g}"
+        return backend, cfg.voice, cfg.sample_rate
+    cfg = cfg or {}
+    return (
+        getattr(tts, "provider", type(tts).__name__),
+        cfg.get("voice", "default"),
+        int(cfg.get("sample_rate", 16000)),
+    )
+
+
+class TTSAudioCache:
+    """Two-tier (memory LRU + disk) store of synthesized phrase audio."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_memory_bytes: int = _DEFAULT_MAX_MEMORY_BYTES,
+        max_disk_bytes: int = _DEFAULT_MAX_DISK_BYTES,
+        max_phrase_chars: int = _DEFAULT_MAX_PHRASE_CHARS,
+        disk_min_uses: int = _DEFAULT_DISK_MIN_USES,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.max_phrase_chars = max_phrase_chars
+        self.disk_min_uses = disk_min_uses
+        self._memory: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        # Keys allowed on disk regardless of use count (prewarm allowlist)
+        self._pinned: set = set()
+        # key -> uses while in the memory tier (unpinned, not yet on disk)
+        self._uses: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._dir: Optional[Path] = None
+        # key -> file size, least recently used first
+        self._disk: "OrderedDict[str, int]" = OrderedDict()
+        self._disk_bytes = 0
+        if cache_dir:
+            try:
+                path = Path(cache_dir)
+                path.mkdir(parents=True, exist_ok=True)
+                self._dir = path
+                self._scan_disk()
+            except OSError as e:
+                logger.error("tts_cache: cannot use cache dir %s: %s", cache_dir, e)
+
+    @staticmethod
+    def make_key(backend: str, voice: str, text: str, sample_rate: int) -> str:
+        raw = "\x00".join((backend, voice, str(sample_rate), normalize_phrase(text)))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def cacheable(self, text: str) -> bool:
+        return 0 < len(text.strip()) <= self.max_phrase_chars
+
+    def pin(self, key: str) -> None:
+        """Allow *key* on disk as soon as it is stored."""
+        with self._lock:
+            self._pinned.add(key)
+
+    # ---- lookup / store ------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """(audio, duration_ms) for *key*, or None."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                persist = self._count_use(key)
+            on_disk = key in self._disk
+        if entry is not None:
+            if persist:
+                await asyncio.to_thread(self._write_disk, key, entry)
+            return entry
+
+        entry = await asyncio.to_thread(self._read_disk, key) if on_disk else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    async def put(self, key: str, audio: bytes, duration_ms: float = 0.0,
+                  persist: bool = False) -> None:
+        """Store *audio*; on disk only if *persist*, pinned, or reused enough."""
+        if not audio:
+            return
+        entry = (audio, float(duration_ms))
+        with self._lock:
+            self._remember(key, entry)
+            persist = persist or self._count_use(key)
+        if persist and self._dir is not None:
+            await asyncio.to_thread(self._write_disk, key, entry)
+
+    def clear(self) -> None:
+        """Drop the memory tier (disk entries are kept)."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._uses.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "max_memory_bytes": self.max_memory_bytes,
+                "disk_bytes": self._disk_bytes,
+                "max_disk_bytes": self.max_disk_bytes,
+                "disk_dir": str(self._dir) if self._dir else None,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    # ---- memory tier (caller holds the lock) ---------------------------------
+
+    def _count_use(self, key: str) -> bool:
+        """Count a use of an in-memory key; True once it should go to disk."""
+        if self._dir is None or key in self._disk:
+            return False
+        if key in self._pinned:
+            return True
+        if key not in self._memory:
+            return False
+        uses = self._uses.get(key, 0) + 1
+        if uses >= self.disk_min_uses:
+            self._uses.pop(key, None)
+            return True
+        self._uses[key] = uses
+        return False
+
+    def _remember(self, key: str, entry: Tuple[bytes, float]) -> None:
+        size = len(entry[0])
+        if size > self.max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= len(old[0])
+        self._memory[key] = entry
+        self._memory_bytes += size
+        while self._memory_bytes > self.max_memory_bytes:
+            evicted, (audio, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(audio)
+            self._uses.pop(evicted, None)
+            self.evictions += 1
+
+    # ---- disk tier (worker threads) ------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.tts"
+
+    def _scan_disk(self) -> None:
+        """Index existing entries by access time; the only directory walk."""
+        files = []
+        for p in self._dir.glob("*/*.tts"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, p.stem, st.st_size))
+        files.sort()
+        for _, key, size in files:
+            self._disk[key] = size
+        self._disk_bytes = sum(size for _, _, size in files)
+
+    def _read_disk(self, key: str) -> Optional[Tuple[bytes, float]]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)  # access order across restarts
+        except OSError:
+            with self._lock:
+                self._disk_bytes -= self._disk.pop(key, 0)
+            return None
+        with self._lock:
+            if key in self._disk:
+                self._disk.move_to_end(key)
+        if len(data) <= _HEADER.size:
+            return None
+        (duration_ms,) = _HEADER.unpack_from(data)
+        return data[_HEADER.size:], duration_ms
+
+    def _write_disk(self, key: str, entry: Tuple[bytes, float]) -> None:
+        path = self._path(key)
+        data = _HEADER.pack(entry[1]) + entry[0]
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning("tts_cache: write failed  key=%s  error=%s", key[:12], e)
+            return
+        with self._lock:
+            self._disk_bytes += len(data) - self._disk.pop(key, 0)
+            self._disk[key] = len(data)
+            over = self._disk_bytes > self.max_disk_bytes
+        if over:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until under max_disk_bytes."""
+        victims = []
+        with self._lock:
+            while self._disk_bytes > self.max_disk_bytes and self._disk:
+                key, size = self._disk.popitem(last=False)
+                self._disk_bytes -= size
+                self.evictions += 1
+                victims.append(key)
+        for key in victims:
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Process-wide default cache
+# ---------------------------------------------------------------------------
+
+_default_cache: Optional[TTSAudioCache] = None
+
+
+def install_default_cache(cache: Optional[TTSAudioCache]) -> None:
+    """Set the cache synthesize_cached uses when none is passed."""
+    global _default_cache
+    _default_cache = cache
+
+
+def default_cache() -> Optional[TTSAudioCache]:
+    return _default_cache
+
+
+def cache_dir_from_env() -> str:
+    return os.environ.get("SONIA_TTS_CACHE_DIR", _DEFAULT_CACHE_DIR)
+
+
+def load_prewarm_phrases(path: Optional[str] = None) -> List[str]:
+    """Phrases from *path* / SONIA_TTS_PREWARM_FILE, else the defaults."""
+    path = path or os.environ.get("SONIA_TTS_PREWARM_FILE", "")
+    if path:
+        try:
+            lines = Path(path).read_text(encoding="utf-8").splitlines()
+            return [ln.strip() for ln in lines if ln.strip() and not ln.startswith("#")]
+        except OSError as e:
+            logger.warning("tts_cache: cannot read prewarm file %s: %s", path, e)
+    return list(DEFAULT_PREWARM_PHRASES)
+
+
+# ---------------------------------------------------------------------------
+# Synthesis through the cache
+# ---------------------------------------------------------------------------
+
+def _split_result(result: Any) -> Tuple[bytes, float, bool]:
+    """(audio, duration_ms, ok) from a pipeline.tts dict or a TTSResult."""
+    if isinstance(result, dict):
+        ok = not result.get("error") and not result.get("timeout")
+        return result.get("audio", b"") or b"", result.get("duration_ms", 0) or 0, ok
+    return getattr(result, "audio_bytes", b"") or b"", getattr(result, "duration_ms", 0.0) or 0.0, True
+
+
+def _as_result(tts, audio: bytes, duration_ms: float) -> Any:
+    """A cache hit shaped like *tts*'s own synthesize() return value."""
+    if isinstance(tts, TTSBackend):
+        return TTSResult(audio_bytes=audio, duration_ms=duration_ms)
+    return {"audio": audio, "duration_ms": duration_ms, "streaming": False, "cached": True}
+
+
+async def synthesize_cached(tts, text: str, cache: Optional[TTSAudioCache] = None, **kwargs) -> Any:
+    """
+    ``tts.synthesize(text, **kwargs)`` through *cache* (default: the
+    installed process cache).  Returns the backend's own result shape.
+    """
+    cache = cache or _default_cache
+    if cache is None or not cache.cacheable(text):
+        return await tts.synthesize(text, **kwargs)
+
+    backend, voice, rate = backend_identity(tts)
+    key = cache.make_key(backend, kwargs.get("voice", voice), text, rate)
+    entry = await cache.get(key)
+    if entry is not None:
+        return _as_result(tts, *entry)
+
+    # Single flight: identical concurrent misses wait for the first one
+    pending = cache._inflight.get(key)
+    if pending is not None:
+        audio, duration_ms = await asyncio.shield(pending)
+        if audio:
+            return _as_result(tts, audio, duration_ms)
+        return await tts.synthesize(text, **kwargs)
+
+    fut = asyncio.get_running_loop().create_future()
+    cache._inflight[key] = fut
+    try:
+        result = await tts.synthesize(text, **kwargs)
+        audio, duration_ms, ok = _split_result(result)
+        if ok and audio:
+            await cache.put(key, audio, duration_ms)
+        fut.set_result((audio if ok else b"", duration_ms))
+        return result
+    except BaseException:
+        fut.set_result((b"", 0.0))
+        raise
+    finally:
+        cache._inflight.pop(key, None)
+
+
+async def prewarm(tts, phrases: Iterable[str], cache: Optional[TTSAudioCache] = None) -> Dict[str, int]:
+    """Synthesize every phrase not yet cached.  Returns counts."""
+    cache = cache or _default_cache
+    counts = {"phrases": 0, "cached": 0, "synthesized": 0, "failed": 0}
+    if cache is None:
+        return counts
+    backend, voice, rate = backend_identity(tts)
+    sem = asyncio.Semaphore(_PREWARM_CONCURRENCY)
+
+    async def _one(phrase: str) -> None:
+        key = cache.make_key(backend, voice, phrase, rate)
+        cache.pin(key)
+        if await cache.get(key) is not None:
+            counts["cached"] += 1
+            return
+        async with sem:
+            try:
+                result = await synthesize_cached(tts, phrase, cache)
+            except Exception as e:
+                logger.warning("tts_cache: prewarm failed  phrase=%r  error=%s", phrase, e)
+                counts["failed"] += 1
+                return
+        audio, _, ok = _split_result(result)
+        counts["synthesized" if ok and audio else "failed"] += 1
+
+    unique = {normalize_phrase(p): p for p in phrases if cache.cacheable(p)}
+    counts["phrases"] = len(unique)
+    await asyncio.gather(*(_one(p) for p in unique.values()))
+    return counts
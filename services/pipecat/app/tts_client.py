@@ -6,23 +6,47 @@ Wraps the existing pipeline.tts.TTS with:
     - Turn state transition integration (THINKING → SPEAKING on first chunk).
     - Structured result with timing metadata.
     - Clean cancellation semantics (no orphan HTTP requests).
+    - Phrase cache lookup (app.tts_cache) before calling the backend.
+
+Streaming mode (synthesize_streaming):
+    - Splits model text (a string or an async iterator of tokens) at
+      sentence / clause boundaries.
+    - Synthesizes up to *lookahead* chunks ahead of playback concurrently.
+    - Hands each chunk's audio to a callback in order as soon as it is ready.
+    - On cancel_tts_evt, drops everything not yet handed over.
 
 Usage:
     result = await synthesize_cancellable(session, text, tts, trace_id)
     if result["cancelled"]:
         # barge-in happened during synthesis
+
+    result = await synthesize_streaming(session, text, tts, websocket.send_bytes,
+                                        latency=collector)
 """
 
 import asyncio
 import logging
+import re
 import time
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, AsyncIterable, Awaitable, Callable, Deque, Dict, List, Optional, Union
 
 from app.turn_taking import TurnState, transition
 from app.session_manager import VoiceSession
+from app.tts_cache import TTSAudioCache, synthesize_cached
 
 logger = logging.getLogger(__name__)
 
+# Sentences shorter than this are merged with the next one before synthesis.
+MIN_CHUNK_CHARS: int = 24
+# Longer runs without a sentence end are split at clause punctuation.
+MAX_CHUNK_CHARS: int = 200
+# Chunks synthesized ahead of the one being played.
+DEFAULT_LOOKAHEAD: int = 2
+
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*\s+")
+_CLAUSE_END = re.compile(r"[,;:]\s+")
+
 
 async def synthesize_cancellable(
     session: VoiceSession,
@@ -30,6 +54,7 @@ async def synthesize_cancellable(
     tts,  # pipeline.tts.TTS instance
     trace_id: str = "",
     state_transition: bool = True,
+    cache: Optional[TTSAudioCache] = None,
 ) -> Dict[str, Any]:
     """
     Run TTS synthesis with cancel-event awareness.
@@ -47,6 +72,7 @@ async def synthesize_cancellable(
         tts:              Initialised TTS backend instance.
         trace_id:         Correlation ID.
         state_transition: Whether to attempt THINKING→SPEAKING transition.
+        cache:            Phrase cache (default: the installed process cache).
 
     Returns:
         Dict with keys: audio, duration_ms, cancelled, cancel_reason,
@@ -93,7 +119,7 @@ async def synthesize_cancellable(
     try:
         # Create the synthesis task
         synth_task = asyncio.create_task(
-            tts.synthesize(text, streaming=True),
+            synthesize_cached(tts, text, cache, streaming=True),
             name=f"tts_synth_{sid}",
         )
         session.register_task("tts_synth", synth_task)
@@ -163,3 +189,238 @@ async def synthesize_cancellable(
 async def _wait_for_cancel(evt: asyncio.Event) -> None:
     """Block until the cancel event is set."""
     await evt.wait()
+
+
+# ---------------------------------------------------------------------------
+# Streaming synthesis
+# ---------------------------------------------------------------------------
+
+class SentenceChunker:
+    """Incrementally cuts text into sentence / clause chunks for TTS."""
+
+    def __init__(self, min_chars: int = MIN_CHUNK_CHARS, max_chars: int = MAX_CHUNK_CHARS):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self._buf = ""
+        self._pending = ""  # complete sentences still below min_chars
+
+    def feed(self, text: str) -> List[str]:
+        """Add text; return the chunks it completed."""
+        self._buf += text
+        chunks: List[str] = []
+        while True:
+            m = _SENTENCE_END.search(self._buf)
+            if m is None:
+                break
+            self._take(self._buf[:m.end()], chunks)
+            self._buf = self._buf[m.end():]
+        while len(self._buf) > self.max_chars:
+            cut = None
+            for m in _CLAUSE_END.finditer(self._buf, 0, self.max_chars):
+                cut = m.end()
+            if cut is None:
+                cut = self._buf.rfind(" ", 0, self.max_chars) + 1 or self.max_chars
+            self._take(self._buf[:cut], chunks)
+            self._buf = self._buf[cut:]
+        return chunks
+
+    def flush(self) -> List[str]:
+        """Return whatever text remains as the last chunk."""
+        rest = (self._pending + self._buf).strip()
+        self._pending = self._buf = ""
+        return [rest] if rest else []
+
+    def _take(self, piece: str, out: List[str]) -> None:
+        self._pending += piece
+        if len(self._pending.strip()) >= self.min_chars:
+            out.append(self._pending.strip())
+            self._pending = ""
+
+
+def split_sentences(text: str, min_chars: int = MIN_CHUNK_CHARS, max_chars: int = MAX_CHUNK_CHARS) -> List[str]:
+    """Split complete text into TTS chunks."""
+    chunker = SentenceChunker(min_chars, max_chars)
+    return chunker.feed(text) + chunker.flush()
+
+
+def _audio_of(synth_result: Any) -> bytes:
+    """Audio from a pipeline.tts dict result or a voice_backends TTSResult."""
+    if isinstance(synth_result, dict):
+        return synth_result.get("audio", b"") or b""
+    return getattr(synth_result, "audio_bytes", b"") or b""
+
+
+async def synthesize_streaming(
+    session: VoiceSession,
+    text: Union[str, AsyncIterable[str]],
+    tts,  # pipeline.tts.TTS or app.voice_backends.TTSBackend
+    on_chunk: Callable[[bytes], Awaitable[Any]],
+    trace_id: str = "",
+    lookahead: int = DEFAULT_LOOKAHEAD,
+    latency=None,  # voice.latency_metrics.LatencyCollector
+    state_transition: bool = True,
+    cache: Optional[TTSAudioCache] = None,
+) -> Dict[str, Any]:
+    """
+    Synthesize *text* chunk by chunk and stream the audio through *on_chunk*.
+
+    Chunks are synthesized concurrently, at most ``lookahead + 1`` at a
+    time, and delivered in order. The time the first chunk is delivered
+    is recorded with ``latency.record_first_emit(session_id, turn_id, ...)``.
+    If ``session.cancel_tts_evt`` fires, in-flight syntheses are cancelled
+    and no further audio is delivered. Cancelling the calling task cleans
+    up the same way and then propagates CancelledError.
+
+    Args:
+        session:          VoiceSession owning this turn.
+        text:             Full text, or an async iterator of text deltas.
+        tts:              Initialised TTS backend instance.
+        on_chunk:         Coroutine called with each chunk's audio, in order.
+        trace_id:         Correlation ID.
+        lookahead:        Chunks synthesized ahead of the one being delivered.
+        latency:          Optional LatencyCollector for time-to-first-audio.
+        state_transition: Whether to attempt THINKING→SPEAKING on first audio.
+        cache:            Phrase cache (default: the installed process cache).
+
+    Returns:
+        Dict with keys: chunks, audio_bytes, first_audio_ms, cancelled,
+        cancel_reason, elapsed_ms, error.
+    """
+    t0 = time.monotonic()
+    sid = session.session_id
+
+    result: Dict[str, Any] = {
+        "chunks": 0,
+        "audio_bytes": 0,
+        "first_audio_ms": None,
+        "cancelled": False,
+        "cancel_reason": "",
+        "elapsed_ms": 0,
+        "error": None,
+    }
+
+    if session.cancel_tts_evt.is_set():
+        result["cancelled"] = True
+        result["cancel_reason"] = "cancel_tts_evt set before start"
+        return result
+
+    # Text chunks in order; None marks the end of the text
+    chunk_q: asyncio.Queue = asyncio.Queue()
+    window = asyncio.Semaphore(max(lookahead, 0) + 1)
+    in_flight: Deque[asyncio.Task] = deque()
+    ready = asyncio.Event()
+    text_done = False
+
+    async def _produce() -> None:
+        chunker = SentenceChunker()
+        if isinstance(text, str):
+            for chunk in split_sentences(text):
+                await chunk_q.put(chunk)
+        else:
+            async for delta in text:
+                for chunk in chunker.feed(delta):
+                    await chunk_q.put(chunk)
+            for chunk in chunker.flush():
+                await chunk_q.put(chunk)
+        await chunk_q.put(None)
+
+    async def _launch() -> None:
+        nonlocal text_done
+        while True:
+            chunk = await chunk_q.get()
+            if chunk is None:
+                break
+            await window.acquire()
+            in_flight.append(asyncio.create_task(
+                synthesize_cached(tts, chunk, cache), name=f"tts_chunk_{sid}",
+            ))
+            ready.set()
+        text_done = True
+        ready.set()
+
+    producer = asyncio.create_task(_produce(), name=f"tts_text_{sid}")
+    launcher = asyncio.create_task(_launch(), name=f"tts_launch_{sid}")
+    cancel_waiter = asyncio.create_task(
+        _wait_for_cancel(session.cancel_tts_evt),
+        name=f"tts_cancel_wait_{sid}",
+    )
+    session.register_task("tts_synth", launcher)
+
+    try:
+        while True:
+            if not in_flight:
+                if text_done:
+                    break
+                ready.clear()
+                waiter = asyncio.create_task(ready.wait())
+                done, _ = await asyncio.wait(
+                    {waiter, cancel_waiter, producer},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if waiter not in done:
+                    waiter.cancel()
+                if cancel_waiter in done:
+                    raise _TTSCancelled("cancel_tts_evt during synthesis")
+                if producer in done and producer.exception() is not None:
+                    raise producer.exception()
+                continue
+
+            task = in_flight[0]
+            done, _ = await asyncio.wait(
+                {task, cancel_waiter}, return_when=asyncio.FIRST_COMPLETED,
+            )
+            if cancel_waiter in done:
+                raise _TTSCancelled("cancel_tts_evt during synthesis")
+            in_flight.popleft()
+            window.release()
+            audio = _audio_of(task.result())
+            if not audio:
+                continue
+
+            if result["chunks"] == 0:
+                result["first_audio_ms"] = round((time.monotonic() - t0) * 1000, 1)
+                if latency is not None:
+                    latency.record_first_emit(sid, session.turn_id or trace_id, time.monotonic_ns())
+                if state_transition and session.turn_state == TurnState.THINKING:
+                    await transition(
+                        session, TurnState.SPEAKING,
+                        reason="tts_first_chunk", trace_id=trace_id,
+                    )
+            await on_chunk(audio)
+            result["chunks"] += 1
+            result["audio_bytes"] += len(audio)
+
+    except _TTSCancelled as e:
+        result["cancelled"] = True
+        result["cancel_reason"] = str(e)
+        logger.info(
+            "tts_client: stream cancelled  session=%s  chunks_sent=%d  "
+            "dropped=%d  elapsed=%.0fms  trace=%s",
+            sid, result["chunks"], len(in_flight),
+            (time.monotonic() - t0) * 1000, trace_id,
+        )
+    except asyncio.CancelledError:
+        logger.info(
+            "tts_client: stream externally cancelled  session=%s  chunks_sent=%d  trace=%s",
+            sid, result["chunks"], trace_id,
+        )
+        raise
+    except Exception as e:
+        result["error"] = str(e)
+        logger.error(
+            "tts_client: stream error  session=%s  error=%s  trace=%s",
+            sid, e, trace_id,
+        )
+    finally:
+        leftovers = [producer, launcher, cancel_waiter, *in_flight]
+        for t in leftovers:
+            t.cancel()
+        await asyncio.gather(*leftovers, return_exceptions=True)
+        session.unregister_task("tts_synth")
+        result["elapsed_ms"] = round((time.monotonic() - t0) * 1000, 1)
+
+    return result
+
+
+class _TTSCancelled(Exception):
+    """Internal: cancel_tts_evt fired while streaming."""
@@ -4,10 +4,12 @@ v4.4 Epic B: Concrete providers wired to pipeline/ modules.
 Stubs remain as fallback when backends are not configured.
 """
 
+import asyncio
 import logging
 import os
 import struct
 import math
+import time
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field
 
@@ -22,6 +24,7 @@ class ASRResult:
     language: str = "en"
     duration_ms: float = 0.0
     is_final: bool = True
+    error: str = ""
 
 
 @dataclass
@@ -61,11 +64,20 @@ class ASRBackend:
             return ASRResult()
         raise NotImplementedError(f"ASR provider '{self.provider}' not implemented")
 
+    async def transcribe_partial(self, audio_bytes: bytes, sample_rate: int = 16000) -> ASRResult:
+        """Hypothesis for an utterance still in progress (streaming mode)."""
+        result = await self.transcribe(audio_bytes, sample_rate=sample_rate)
+        result.is_final = False
+        return result
+
     async def transcribe_stream(self, audio_chunk: bytes) -> Optional[ASRResult]:
         if not self._configured:
             return None
         raise NotImplementedError(f"ASR streaming for '{self.provider}' not implemented")
 
+    async def close(self) -> None:
+        """Release provider clients; backends without any are a no-op."""
+
 
 class TTSBackend:
     """Abstract TTS backend interface."""
@@ -85,6 +97,9 @@ class TTSBackend:
             return TTSResult()
         raise NotImplementedError(f"TTS provider '{self.provider}' not implemented")
 
+    async def close(self) -> None:
+        """Release provider clients; backends without any are a no-op."""
+
 
 class VADBackend:
     """Abstract VAD backend interface."""
@@ -108,6 +123,13 @@ class VADBackend:
 # v4.4 Epic B: Concrete Providers
 # ============================================================================
 
+def _asr_error(result: Dict[str, Any]) -> str:
+    """Failure reported by pipeline/asr.py, which returns rather than raises."""
+    if result.get("error"):
+        return str(result["error"])
+    return "timeout" if result.get("timeout") else ""
+
+
 class OllamaASR(ASRBackend):
     """ASR provider delegating to pipeline/asr.py Ollama Whisper backend."""
 
@@ -139,8 +161,24 @@ class OllamaASR(ASRBackend):
             text=result.get("text", ""),
             confidence=result.get("confidence", 0.0),
             is_final=not result.get("partial", False),
+            error=_asr_error(result),
+        )
+
+    async def transcribe_partial(self, audio_bytes: bytes, sample_rate: int = 16000) -> ASRResult:
+        await self._ensure_asr()
+        result = await self._asr.transcribe(audio_bytes, partial=True)
+        return ASRResult(
+            text=result.get("text", ""),
+            confidence=result.get("confidence", 0.0),
+            is_final=False,
+            error=_asr_error(result),
         )
 
+    async def close(self) -> None:
+        if self._asr is not None:
+            await self._asr.shutdown()
+            self._asr = None
+
 
 class QwenASR(ASRBackend):
     """ASR provider delegating to pipeline/asr.py Qwen backend."""
@@ -173,8 +211,24 @@ class QwenASR(ASRBackend):
             text=result.get("text", ""),
             confidence=result.get("confidence", 0.0),
             is_final=not result.get("partial", False),
+            error=_asr_error(result),
+        )
+
+    async def transcribe_partial(self, audio_bytes: bytes, sample_rate: int = 16000) -> ASRResult:
+        await self._ensure_asr()
+        result = await self._asr.transcribe(audio_bytes, partial=True)
+        return ASRResult(
+            text=result.get("text", ""),
+            confidence=result.get("confidence", 0.0),
+            is_final=False,
+            error=_asr_error(result),
         )
 
+    async def close(self) -> None:
+        if self._asr is not None:
+            await self._asr.shutdown()
+            self._asr = None
+
 
 class OllamaTTS(TTSBackend):
     """TTS provider delegating to pipeline/tts.py Ollama backend."""
@@ -208,6 +262,11 @@ class OllamaTTS(TTSBackend):
             duration_ms=result.get("duration_ms", 0.0),
         )
 
+    async def close(self) -> None:
+        if self._tts is not None:
+            await self._tts.shutdown()
+            self._tts = None
+
 
 class QwenTTS(TTSBackend):
     """TTS provider delegating to pipeline/tts.py Qwen backend."""
@@ -241,6 +300,11 @@ class QwenTTS(TTSBackend):
             duration_ms=result.get("duration_ms", 0.0),
         )
 
+    async def close(self) -> None:
+        if self._tts is not None:
+            await self._tts.shutdown()
+            self._tts = None
+
 
 class EnergyVAD(VADBackend):
     """VAD provider delegating to pipeline/vad.py energy-based detection."""
@@ -304,3 +368,105 @@ def create_vad(config: Optional[Dict[str, Any]] = None) -> VADBackend:
         return EnergyVAD(cfg)
     else:
         return VADBackend(cfg)
+
+
+# ============================================================================
+# Process-wide backend pool
+# ============================================================================
+
+WARMUP_SILENCE_MS = 500
+WARMUP_PHRASE = "Ready."
+
+
+class VoiceBackendPool:
+    """ASR/TTS backends created once per process and warmed up at startup.
+
+    The backends (and the pooled HTTP clients inside them) are shared by
+    every voice connection, so a session's first utterance does not pay
+    model load and connection setup. VAD keeps per-stream state and is
+    handed out fresh per connection via new_vad().
+    """
+
+    def __init__(
+        self,
+        asr_config: Optional[Dict[str, Any]] = None,
+        tts_config: Optional[Dict[str, Any]] = None,
+        vad_config: Optional[Dict[str, Any]] = None,
+    ):
+        self.asr = create_asr(asr_config)
+        self.tts = create_tts(tts_config)
+        self._vad_config = vad_config
+        self._ready = asyncio.Event()
+        self._served = False  # a real turn has gone through the backends
+        self.warm = False
+        self.warmup_ms: Dict[str, float] = {}
+        self.warmup_errors: Dict[str, str] = {}
+
+    @property
+    def ready(self) -> bool:
+        """True once warm-up has finished (successfully or not)."""
+        return self._ready.is_set()
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def new_vad(self) -> VADBackend:
+        return create_vad(self._vad_config)
+
+    async def warm_up(self) -> bool:
+        """Issue one transcription and one synthesis so models are resident.
+
+        Failures are recorded, not raised: the service still becomes ready
+        and the first real turns are reported as cold. Returns self.warm.
+        """
+        if self.asr.available:
+            result = await self._warm("asr", self.asr.transcribe(bytes(16000 * 2 * WARMUP_SILENCE_MS // 1000)))
+            if result is not None and result.error:
+                self.warmup_errors["asr"] = result.error
+        if self.tts.available:
+            result = await self._warm("tts", self.tts.synthesize(WARMUP_PHRASE))
+            if result is not None and not result.audio_bytes:
+                self.warmup_errors["tts"] = "warm-up synthesis returned no audio"
+        self.warm = not self.warmup_errors
+        self._ready.set()
+        logger.info("voice backends ready  warm=%s  warmup_ms=%s  errors=%s",
+                    self.warm, self.warmup_ms, self.warmup_errors)
+        return self.warm
+
+    async def _warm(self, name: str, call):
+        t0 = time.monotonic()
+        result = None
+        try:
+            result = await call
+        except Exception as e:
+            self.warmup_errors[name] = str(e) or type(e).__name__
+        self.warmup_ms[name] = round((time.monotonic() - t0) * 1000, 1)
+        return result
+
+    def take_cold(self) -> bool:
+        """Whether the turn about to be served is a cold one.
+
+        Only the first turn after startup can be cold, and only when
+        warm-up did not succeed; it then warms the backends itself.
+        """
+        cold = not (self.warm or self._served)
+        self._served = True
+        return cold
+
+    async def close(self) -> None:
+        await self.asr.close()
+        await self.tts.close()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "warm": self.warm,
+            "warmup_ms": dict(self.warmup_ms),
+            "warmup_errors": dict(self.warmup_errors),
+            "asr": {"available": self.asr.available, "provider": self.asr.provider},
+            "tts": {"available": self.tts.available, "provider": self.tts.provider},
+        }
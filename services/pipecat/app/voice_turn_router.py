@@ -13,6 +13,12 @@ v2.8 additions:
   - Barge-in handling: new turn auto-cancels previous turn
   - No zombie tasks: cancelled turns leave no orphaned async tasks
 
+Speculative recall:
+  - speculate() sends a stable partial transcript to the gateway, which
+    starts memory recall for it before the user has finished speaking
+  - process_turn() reuses that recall when the final transcript matches;
+    otherwise the speculation is cancelled through the CancelRegistry
+
 Event flow per user message:
   1. User sends text via Pipecat WS
   2. VoiceTurnRouter.process_turn() calls GatewayStreamClient.send_turn()
@@ -29,7 +35,9 @@ import logging
 import time
 import uuid
 from dataclasses import dataclass, field
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+
+from voice.cancel_registry import CancelRegistry
 
 logger = logging.getLogger("pipecat.voice_turn_router")
 
@@ -66,12 +74,14 @@ class VoiceTurnRouter:
         gateway_url: str = "http://127.0.0.1:7000",
         turn_timeout: float = 30.0,
         on_partial: Optional[Callable[[str, str], Coroutine]] = None,
+        cancel_registry: Optional[CancelRegistry] = None,
     ):
         """
         Args:
             gateway_url: Base URL for the API gateway.
             turn_timeout: Max seconds to wait for a turn response.
             on_partial: Callback(session_id, partial_text) for streaming.
+            cancel_registry: Tokens for cancelled speculative recalls.
         """
         self.gateway_url = gateway_url
         self.turn_timeout = turn_timeout
@@ -87,6 +97,12 @@ class VoiceTurnRouter:
         self._active_tasks: Dict[str, asyncio.Task] = {}  # session_id -> active turn task
         self._cancelled_turns: List[str] = []  # turn_ids that were cancelled
 
+        # Speculative recall per session: session_id -> (spec_id, text)
+        self.cancel_registry = cancel_registry or CancelRegistry()
+        self._speculations: Dict[str, Tuple[str, str]] = {}
+        self._speculation_hits = 0
+        self._speculation_misses = 0
+
     @property
     def active_sessions(self) -> int:
         return len(self._clients)
@@ -139,6 +155,19 @@ class VoiceTurnRouter:
         # Register current task for cancellation
         self._active_tasks[pipecat_session_id] = asyncio.current_task()
 
+        # Use the speculative recall only if the final transcript matches it
+        spec_id = ""
+        spec = self._speculations.get(pipecat_session_id)
+        if spec is not None:
+            if (
+                _normalize(spec[1]) == _normalize(user_text)
+                and not self.cancel_registry.is_requested(pipecat_session_id, spec[0])
+            ):
+                spec_id = self._speculations.pop(pipecat_session_id)[0]
+                self._speculation_hits += 1
+            else:
+                await self.cancel_speculation(pipecat_session_id, reason="diverged")
+
         try:
             client = await self._get_or_create_client(pipecat_session_id)
 
@@ -157,6 +186,7 @@ class VoiceTurnRouter:
                     text=user_text,
                     correlation_id=correlation_id,
                     timeout=self.turn_timeout,
+                    spec_id=spec_id,
                 )
             finally:
                 client.on_partial = old_partial
@@ -182,6 +212,8 @@ class VoiceTurnRouter:
         finally:
             # v2.8: Unregister task -- no zombies
             self._active_tasks.pop(pipecat_session_id, None)
+            if spec_id:
+                self.cancel_registry.clear(pipecat_session_id, spec_id)
 
         record.latency_ms = (time.monotonic() - t0) * 1000
 
@@ -218,6 +250,55 @@ class VoiceTurnRouter:
             return pipecat_session_id
         return None
 
+    async def speculate(self, pipecat_session_id: str, text: str) -> Optional[str]:
+        """
+        Start gateway memory recall for a stable partial transcript.
+
+        A newer partial supersedes (and cancels) the previous speculation.
+        Returns the spec_id, or None if the gateway could not be reached.
+        """
+        current = self._speculations.get(pipecat_session_id)
+        if current is not None:
+            if _normalize(current[1]) == _normalize(text):
+                return current[0]
+            await self.cancel_speculation(pipecat_session_id, reason="superseded")
+
+        try:
+            client = await self._get_or_create_client(pipecat_session_id)
+        except Exception as e:
+            logger.debug("Speculation skipped session=%s: %s", pipecat_session_id, e)
+            return None
+
+        spec_id = f"spec_{uuid.uuid4().hex[:8]}"
+        if not await client.send_speculative(text, spec_id):
+            return None
+        self._speculations[pipecat_session_id] = (spec_id, text)
+        return spec_id
+
+    async def cancel_speculation(self, pipecat_session_id: str, reason: str = "diverged") -> Optional[str]:
+        """
+        Cancel the session's speculative recall, if any.
+
+        The cancel is requested in the CancelRegistry first, so a turn racing
+        with it cannot pick the speculation up; the token is consumed once
+        the gateway has been told. Returns the cancelled spec_id.
+        """
+        spec = self._speculations.pop(pipecat_session_id, None)
+        if spec is None:
+            return None
+        spec_id = spec[0]
+        self._speculation_misses += 1
+        self.cancel_registry.request(pipecat_session_id, spec_id)
+        client = self._clients.get(pipecat_session_id)
+        if client is not None and await client.cancel_speculative(spec_id):
+            self.cancel_registry.consume(pipecat_session_id, spec_id)
+        self.cancel_registry.clear(pipecat_session_id, spec_id)
+        logger.info(
+            "Cancelled speculative recall session=%s spec=%s reason=%s",
+            pipecat_session_id, spec_id, reason,
+        )
+        return spec_id
+
     @property
     def active_tasks_count(self) -> int:
         """Number of in-flight turn tasks across all sessions."""
@@ -225,6 +306,8 @@ class VoiceTurnRouter:
 
     async def close_session(self, pipecat_session_id: str) -> bool:
         """Close and cleanup a session's stream client."""
+        self._speculations.pop(pipecat_session_id, None)
+        self.cancel_registry.clear_session(pipecat_session_id)
         async with self._lock:
             client = self._clients.pop(pipecat_session_id, None)
         if client:
@@ -261,6 +344,13 @@ class VoiceTurnRouter:
             ),
         }
 
+    def speculation_stats(self) -> Dict[str, int]:
+        """Speculative recall outcomes (kept out of the frozen get_stats shape)."""
+        return {
+            "speculation_hits": self._speculation_hits,
+            "speculation_misses": self._speculation_misses,
+        }
+
     # -- Internal --
 
     async def _get_or_create_client(self, pipecat_session_id: str):
@@ -290,3 +380,7 @@ class VoiceTurnRouter:
             await client.connect()
             self._clients[pipecat_session_id] = client
             return client
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.lower().split())
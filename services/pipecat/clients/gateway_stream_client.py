@@ -5,7 +5,10 @@ WebSocket client that connects Pipecat to the API Gateway's
 /v1/stream/{session_id} for real turn pipeline round-trips.
 
 Protocol (JSON over WS):
-  Send:  {"type": "input.text", "text": "...", "correlation_id": "req_XXX"}
+  Send:  {"type": "input.text", "text": "...", "correlation_id": "req_XXX",
+          "payload": {"text": "...", "spec_id": "..."}}
+         {"type": "input.text.speculative", "payload": {"text": "...", "spec_id": "..."}}
+         {"type": "control.speculative.cancel", "payload": {"spec_id": "..."}}
   Recv:  {"type": "response.final", "payload": {"text": "..."}}
          {"type": "response.partial", "payload": {"text": "..."}}
          {"type": "error", "payload": {"message": "..."}}
@@ -206,12 +209,14 @@ class GatewayStreamClient:
         text: str,
         correlation_id: str = "",
         timeout: float = 0,
+        spec_id: str = "",
     ) -> TurnResult:
         """
         Send a text turn and wait for the final response.
 
         Returns TurnResult with assistant_text, tool_calls, latency, etc.
         Collects partial responses if on_partial callback is set.
+        *spec_id* names a speculative recall started for this same text.
         """
         if self._state != StreamState.CONNECTED:
             result = TurnResult()
@@ -241,6 +246,7 @@ class GatewayStreamClient:
             "text": text,
             "turn_id": turn_id,
             "correlation_id": correlation_id,
+            "payload": {"text": text, "spec_id": spec_id},
         }
         t0 = time.monotonic()
         try:
@@ -292,6 +298,32 @@ class GatewayStreamClient:
         result.latency_ms = (time.monotonic() - t0) * 1000
         return result
 
+    # -- Speculative recall --
+
+    async def send_speculative(self, text: str, spec_id: str) -> bool:
+        """Ask the gateway to start memory recall for a stable partial transcript."""
+        return await self._send_control({
+            "type": "input.text.speculative",
+            "payload": {"text": text, "spec_id": spec_id},
+        })
+
+    async def cancel_speculative(self, spec_id: str) -> bool:
+        """Abandon a speculative recall whose transcript diverged."""
+        return await self._send_control({
+            "type": "control.speculative.cancel",
+            "payload": {"spec_id": spec_id},
+        })
+
+    async def _send_control(self, msg: Dict[str, Any]) -> bool:
+        if self._state != StreamState.CONNECTED:
+            return False
+        try:
+            await self._ws.send(json.dumps(msg))
+            return True
+        except Exception as e:
+            logger.debug("Control send failed (%s): %s", msg["type"], e)
+            return False
+
     # -- Internal WS management --
 
     async def _do_connect(self) -> None:
@@ -3,6 +3,7 @@ Pipecat Main Service
 FastAPI application with session management and WebSocket support.
 """
 
+import asyncio
 import json
 import sys
 import uuid
@@ -34,9 +35,13 @@ from routes.ws import websocket_handler
 from clients.api_gateway_client import ApiGatewayClient, ApiGatewayClientError
 
 # Voice loop hardening modules
-from app.session_manager import VoiceSessionManager
+from app.session_manager import VoiceSession, VoiceSessionManager
 from app.telemetry import TurnTelemetryLogger
 from app.model_router_client import close_client as close_model_router_client
+from app.tts_client import synthesize_streaming
+from app import tts_cache
+from app.voice_backends import VoiceBackendPool
+from voice.latency_metrics import LatencyCollector
 
 # v2.7: Voice turn router (gateway stream pipeline)
 from app.voice_turn_router import VoiceTurnRouter, VoiceTurnRecord
@@ -51,6 +56,9 @@ api_gateway_client: Optional[ApiGatewayClient] = None
 voice_session_manager: Optional[VoiceSessionManager] = None
 turn_telemetry: Optional[TurnTelemetryLogger] = None
 voice_turn_router: Optional[VoiceTurnRouter] = None  # v2.7
+voice_backend_pool: Optional[VoiceBackendPool] = None
+# End-of-speech -> first TTS audio on /v1/voice
+voice_latency = LatencyCollector()
 
 
 def generate_correlation_id() -> str:
@@ -68,6 +76,7 @@ def log_event(event_dict: dict):
 async def _lifespan(a):
     """Startup and shutdown lifecycle for Pipecat."""
     global session_manager, api_gateway_client, voice_session_manager, turn_telemetry, voice_turn_router
+    global voice_backend_pool
 
     session_manager = SessionManager(persist_dir="S:\\data\\sessions")
     session_manager.load_persisted()
@@ -82,6 +91,16 @@ async def _lifespan(a):
         turn_timeout=30.0,
     )
 
+    # Phrase-level TTS cache, shared by synthesize_cancellable and /v1/voice
+    # (construction indexes the disk tier, so keep it off the event loop)
+    tts_cache.install_default_cache(
+        await asyncio.to_thread(tts_cache.TTSAudioCache, cache_dir=tts_cache.cache_dir_from_env())
+    )
+
+    # ASR/TTS created once and warmed in the background; /readyz waits on it
+    voice_backend_pool = VoiceBackendPool()
+    warmup_task = asyncio.create_task(_warm_voice_backends(), name="voice_backend_warmup")
+
     log_event({
         "level": "INFO",
         "service": "pipecat",
@@ -91,6 +110,9 @@ async def _lifespan(a):
 
     yield  # ── app is running ──
 
+    warmup_task.cancel()
+    await asyncio.gather(warmup_task, return_exceptions=True)
+
     if voice_turn_router:
         closed = await voice_turn_router.close_all()
         log_event({
@@ -109,6 +131,9 @@ async def _lifespan(a):
             "count": closed,
         })
 
+    if voice_backend_pool:
+        await voice_backend_pool.close()
+
     await close_model_router_client()
 
     if api_gateway_client:
@@ -122,6 +147,27 @@ async def _lifespan(a):
     })
 
 
+async def _warm_voice_backends():
+    """Warm the backend pool, then fill the TTS cache with common phrases."""
+    await voice_backend_pool.warm_up()
+    log_event({
+        "level": "INFO" if voice_backend_pool.warm else "WARNING",
+        "service": "pipecat",
+        "event": "voice_backends_ready",
+        **voice_backend_pool.to_dict(),
+    })
+    tts = voice_backend_pool.tts
+    if not tts.available:
+        return
+    counts = await tts_cache.prewarm(tts, tts_cache.load_prewarm_phrases())
+    log_event({
+        "level": "INFO",
+        "service": "pipecat",
+        "event": "tts_cache_prewarmed",
+        **counts,
+    })
+
+
 app = FastAPI(
     title="Pipecat",
     description="Session management and WebSocket real-time communication",
@@ -159,10 +205,30 @@ async def healthz():
     # v2.7: Voice turn router stats
     if voice_turn_router is not None:
         health["voice_turn_router"] = voice_turn_router.get_stats()
+        health["speculative_recall"] = voice_turn_router.speculation_stats()
+
+    cache = tts_cache.default_cache()
+    if cache is not None:
+        health["tts_cache"] = cache.stats()
+
+    if voice_backend_pool is not None:
+        health["voice_backends"] = voice_backend_pool.to_dict()
 
     return health
 
 
+@app.get("/readyz")
+async def readyz():
+    """Readiness: 503 until the voice backends have finished warming up."""
+    ready = voice_backend_pool is not None and voice_backend_pool.ready
+    body = {
+        "ready": ready,
+        "service": "pipecat",
+        "voice_backends": voice_backend_pool.to_dict() if voice_backend_pool is not None else None,
+    }
+    return JSONResponse(status_code=200 if ready else 503, content=body)
+
+
 @app.get("/version")
 async def version():
     """Version endpoint."""
@@ -208,9 +274,13 @@ async def voice_backends():
     """Status of ASR/TTS/VAD backends."""
     try:
         from app.voice_backends import create_asr, create_tts, create_vad
-        asr = create_asr()
-        tts = create_tts()
-        vad = create_vad()
+        if voice_backend_pool is not None:
+            asr, tts = voice_backend_pool.asr, voice_backend_pool.tts
+            vad = voice_backend_pool.new_vad()
+        else:
+            asr = create_asr()
+            tts = create_tts()
+            vad = create_vad()
         return {
             "ok": True,
             "service": "pipecat",
@@ -428,6 +498,133 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
     )
 
 
+# Streaming ASR hop while the user speaks, and the committed-word count at
+# which a stable partial starts speculative memory recall at the gateway.
+PARTIAL_TRANSCRIPT_INTERVAL_MS = 400.0
+SPECULATE_MIN_WORDS = 3
+# Sentence chunks synthesized ahead of the one being played
+TTS_LOOKAHEAD_CHUNKS = 2
+
+
+def _partial_transcript_sender(websocket: WebSocket, session_id: str):
+    """on_partial callback: forward partials; speculate on stable ones."""
+    async def _send(partial):
+        await websocket.send_json({
+            "type": "transcript.partial",
+            "text": partial.text,
+            "committed": partial.committed,
+            "stable": partial.stable,
+        })
+        if (
+            partial.stable
+            and voice_turn_router
+            and len(partial.committed.split()) >= SPECULATE_MIN_WORDS
+        ):
+            await voice_turn_router.speculate(session_id, partial.committed)
+    return _send
+
+
+async def _speak(websocket: WebSocket, voice_session: VoiceSession, text: str, tts, turn_id: str):
+    """Stream sentence-chunked TTS audio for one reply as binary frames."""
+    sid = voice_session.session_id
+    try:
+        result = await synthesize_streaming(
+            voice_session, text, tts, websocket.send_bytes,
+            trace_id=turn_id,
+            lookahead=TTS_LOOKAHEAD_CHUNKS,
+            latency=voice_latency,
+            state_transition=False,
+        )
+        await websocket.send_json({
+            "type": "response.audio.end",
+            "turn_id": turn_id,
+            "chunks": result["chunks"],
+            "first_audio_ms": result["first_audio_ms"],
+            "cancelled": result["cancelled"],
+        })
+    except Exception as e:
+        log_event({
+            "level": "WARN",
+            "service": "pipecat",
+            "event": "voice_stream_tts_error",
+            "session_id": sid,
+            "error": str(e),
+        })
+    finally:
+        voice_latency.finalize_turn(sid, turn_id)
+        voice_session.unregister_task("speak")
+
+
+async def _barge_in(voice_session: VoiceSession) -> None:
+    """Stop the reply still being spoken, if any, and wait for it to end."""
+    speaking = voice_session.active_tasks.get("speak")
+    if speaking is None or speaking.done():
+        return
+    voice_session.signal_cancel_tts()
+    await asyncio.gather(speaking, return_exceptions=True)
+
+
+async def _run_audio_turn(websocket: WebSocket, voice_session: VoiceSession, utt, tts):
+    """
+    Run one transcribed utterance through the gateway turn pipeline and send
+    the reply. TTS audio is streamed chunk by chunk from a background task
+    registered as "speak" on *voice_session*, so the receive loop keeps
+    reading audio and can barge in. Returns the TTS backend so the caller
+    can reuse it for the rest of the connection.
+    """
+    session_id = voice_session.session_id
+    if not utt.text:
+        if voice_turn_router:
+            await voice_turn_router.cancel_speculation(session_id, reason="empty_transcript")
+        return tts
+
+    record = await voice_turn_router.process_turn(
+        user_text=utt.text,
+        pipecat_session_id=session_id,
+        correlation_id=generate_correlation_id(),
+    )
+    if not record.ok:
+        await websocket.send_json({
+            "type": "error",
+            "message": record.error,
+        })
+        return tts
+
+    if tts is None:
+        if voice_backend_pool is not None:
+            tts = voice_backend_pool.tts
+        else:
+            from app.voice_backends import create_tts
+            tts = create_tts()
+    has_audio = tts.available and bool(record.assistant_text.strip())
+
+    await websocket.send_json({
+        "type": "response.final",
+        "text": record.assistant_text,
+        "turn_id": record.turn_id,
+        "latency_ms": round(record.latency_ms, 1),
+        "transcript_ms": round(utt.transcript_ms, 1),
+        "has_audio": has_audio,
+    })
+
+    if has_audio:
+        # Only one reply speaks at a time
+        await _barge_in(voice_session)
+        voice_session.reset_cancel_events()
+        voice_session.turn_id = record.turn_id
+        # Without a warmed pool every connection builds its own backends
+        cold = voice_backend_pool.take_cold() if voice_backend_pool is not None else True
+        if utt.ended_at:
+            voice_latency.record_turn_start(
+                session_id, record.turn_id, int(utt.ended_at * 1e9), cold=cold,
+            )
+        voice_session.register_task("speak", asyncio.create_task(
+            _speak(websocket, voice_session, record.assistant_text, tts, record.turn_id),
+            name=f"speak_{session_id}",
+        ))
+    return tts
+
+
 @app.websocket("/v1/voice/{session_id}")
 async def voice_stream_endpoint(websocket: WebSocket, session_id: str):
     """
@@ -439,11 +636,17 @@ async def voice_stream_endpoint(websocket: WebSocket, session_id: str):
       Client -> Server:
         {"type": "input.text", "text": "Hello"}
         {"type": "control.end"}
+        <binary>  raw PCM s16le 16 kHz mono; segmented by VAD, one final
+                  ASR call per utterance (see app/audio_ingest.py).
+                  Speech onset while a reply is playing stops its audio.
 
       Server -> Client:
+        {"type": "transcript.partial", "text": "...", "committed": "...", "stable": true}
         {"type": "session.ready", "gateway_session_id": "..."}
         {"type": "response.partial", "text": "..."}
         {"type": "response.final", "text": "...", "turn_id": "...", "latency_ms": ...}
+        <binary>  TTS audio, one frame per sentence chunk as it is synthesized
+        {"type": "response.audio.end", "turn_id": "...", "chunks": 3, "cancelled": false}
         {"type": "error", "message": "..."}
         {"type": "tool.call", "tool_name": "...", "status": "..."}
 
@@ -461,6 +664,15 @@ async def voice_stream_endpoint(websocket: WebSocket, session_id: str):
         "correlation_id": correlation_id,
     })
 
+    ingest = None  # app.audio_ingest.AudioIngest, created on the first audio frame
+    tts = None
+    if voice_session_manager is not None:
+        voice_session = voice_session_manager.create(
+            session_id=session_id, metadata={"route": "v1/voice"},
+        )
+    else:
+        voice_session = VoiceSession(session_id=session_id)
+
     try:
         # Notify client the stream is ready
         await websocket.send_json({
@@ -475,51 +687,30 @@ async def voice_stream_endpoint(websocket: WebSocket, session_id: str):
 
             if message.get("type") == "websocket.receive":
                 if "bytes" in message and message["bytes"]:
-                    # Binary audio frame (raw PCM bytes)
-                    pcm_bytes = message["bytes"]
-
-                    # Route through ASR if available
+                    # Binary audio frame (raw PCM bytes). ASR comes from the
+                    # process-wide pool; VAD state is per connection. ASR runs
+                    # once per VAD-delimited utterance.
                     try:
-                        from app.voice_backends import create_asr, create_vad
-                        asr = create_asr()
-                        vad = create_vad()
-
-                        if asr.available:
-                            asr_result = await asr.transcribe(pcm_bytes)
-                            if asr_result.text:
-                                # Process transcribed text through turn pipeline
-                                turn_corr = generate_correlation_id()
-                                record = await voice_turn_router.process_turn(
-                                    user_text=asr_result.text,
-                                    pipecat_session_id=session_id,
-                                    correlation_id=turn_corr,
-                                )
-
-                                if record.ok:
-                                    # Try TTS on response
-                                    from app.voice_backends import create_tts
-                                    tts = create_tts()
-                                    tts_audio = b""
-                                    if tts.available:
-                                        tts_result = await tts.synthesize(record.assistant_text)
-                                        tts_audio = tts_result.audio_bytes
-
-                                    await websocket.send_json({
-                                        "type": "response.final",
-                                        "text": record.assistant_text,
-                                        "turn_id": record.turn_id,
-                                        "latency_ms": round(record.latency_ms, 1),
-                                        "has_audio": len(tts_audio) > 0,
-                                    })
-
-                                    # Send TTS audio as binary frame
-                                    if tts_audio:
-                                        await websocket.send_bytes(tts_audio)
-                                else:
-                                    await websocket.send_json({
-                                        "type": "error",
-                                        "message": record.error,
-                                    })
+                        if ingest is None:
+                            from app.audio_ingest import AudioIngest, IngestConfig
+                            from app.voice_backends import create_asr, create_vad
+                            if voice_backend_pool is not None:
+                                asr, vad = voice_backend_pool.asr, voice_backend_pool.new_vad()
+                            else:
+                                asr, vad = create_asr(), create_vad()
+                            ingest = AudioIngest(
+                                asr, vad,
+                                config=IngestConfig(partial_interval_ms=PARTIAL_TRANSCRIPT_INTERVAL_MS),
+                                session_id=session_id,
+                                on_partial=_partial_transcript_sender(websocket, session_id),
+                                owns_asr=voice_backend_pool is None,
+                            )
+
+                        if ingest.available:
+                            for utt in await ingest.feed(message["bytes"]):
+                                tts = await _run_audio_turn(websocket, voice_session, utt, tts)
+                            if ingest.segmenter.in_speech:
+                                await _barge_in(voice_session)
                         else:
                             await websocket.send_json({
                                 "type": "error",
@@ -548,6 +739,14 @@ async def voice_stream_endpoint(websocket: WebSocket, session_id: str):
             msg_type = msg.get("type", "")
 
             if msg_type == "control.end":
+                # Transcribe the utterance still open when the client stops
+                if ingest is not None and ingest.available:
+                    for utt in await ingest.flush():
+                        tts = await _run_audio_turn(websocket, voice_session, utt, tts)
+                # Let the last reply finish playing
+                speaking = voice_session.active_tasks.get("speak")
+                if speaking is not None:
+                    await asyncio.gather(speaking, return_exceptions=True)
                 break
 
             if msg_type == "input.text":
@@ -623,6 +822,21 @@ async def voice_stream_endpoint(websocket: WebSocket, session_id: str):
             "error": str(e),
         })
     finally:
+        if ingest is not None:
+            log_event({
+                "level": "INFO",
+                "service": "pipecat",
+                "event": "voice_stream_audio_stats",
+                "session_id": session_id,
+                **ingest.to_dict(),
+            })
+            await ingest.close()
+        # Cancels a reply still speaking
+        if voice_session_manager is not None:
+            await voice_session_manager.close(session_id, reason="voice_stream_closed")
+        else:
+            for task in voice_session.active_tasks.values():
+                task.cancel()
         # Cleanup the gateway stream client for this session
         if voice_turn_router:
             await voice_turn_router.close_session(session_id)
@@ -1,15 +1,18 @@
 """Pipecat voice pipeline components."""
 
-from .vad import VAD, VADConfig
-from .asr import ASR, ASRConfig
+from .vad import VAD, VADConfig, VADState
+from .asr import ASR, ASRConfig, LocalAgreement, PartialTranscript
 from .tts import TTS, TTSConfig
 from .session_manager import SessionManager, SessionState
 
 __all__ = [
     "VAD",
     "VADConfig",
+    "VADState",
     "ASR",
     "ASRConfig",
+    "LocalAgreement",
+    "PartialTranscript",
     "TTS",
     "TTSConfig",
     "SessionManager",
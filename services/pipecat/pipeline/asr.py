@@ -3,11 +3,17 @@ Automatic Speech Recognition (ASR) Client
 
 Converts audio to text with support for streaming and partial results.
 Supports multiple ASR backends: Ollama Whisper, Qwen, OpenAI, local models.
+
+Streaming mode re-transcribes a sliding window of the utterance while the
+user is still speaking. LocalAgreement commits the word prefix that
+consecutive hypotheses agree on, so committed words never change and the
+rest of the latest hypothesis is reported as tentative.
 """
 
 import logging
 import asyncio
-from typing import Optional, AsyncIterator, Dict, Any
+from collections import deque
+from typing import Optional, AsyncIterator, Dict, Any, List
 from dataclasses import dataclass
 import httpx
 
@@ -23,9 +29,99 @@ class ASRConfig:
     base_url: str = "http://127.0.0.1:8000"  # Service endpoint
     model: str = "qwen-audio"  # Model name
     timeout: float = 30.0
+    keepalive_expiry: float = 60.0  # idle seconds a pooled connection stays open
     api_key: str = ""  # v4.4: Required for OpenAI backend
 
 
+@dataclass
+class PartialTranscript:
+    """Incremental transcript of an utterance in progress."""
+    committed: str = ""  # agreed by consecutive hypotheses; never revised
+    tentative: str = ""  # remainder of the latest hypothesis
+    revision: int = 0  # number of hypotheses seen
+    stable: bool = False  # this hypothesis extended the committed prefix
+
+    @property
+    def text(self) -> str:
+        return " ".join(p for p in (self.committed, self.tentative) if p)
+
+
+class LocalAgreement:
+    """
+    Local-agreement-n stabilization over successive hypotheses of one utterance.
+
+    A word is committed once the last *n* hypotheses agree on it and on
+    every word before it. When the transcription window has slid past the
+    start of the utterance, hypotheses are aligned to the committed text by
+    their overlap with its tail.
+    """
+
+    def __init__(self, n: int = 2):
+        if n < 2:
+            raise ValueError("local agreement needs at least 2 hypotheses")
+        self.n = n
+        self.committed: List[str] = []
+        self._hypotheses: deque = deque(maxlen=n)
+        self.revision = 0
+
+    def update(self, hypothesis: str, windowed: bool = False) -> PartialTranscript:
+        """
+        Add a hypothesis and return the resulting partial transcript.
+
+        Args:
+            hypothesis: Transcript of the current window
+            windowed: True if the window no longer starts at the utterance start
+        """
+        self.revision += 1
+        words = self._align(hypothesis.split(), windowed)
+        self._hypotheses.append(words)
+
+        stable = False
+        if len(self._hypotheses) == self.n:
+            agreed = _common_prefix(list(self._hypotheses))
+            if len(agreed) > len(self.committed) and _same_words(
+                agreed[:len(self.committed)], self.committed
+            ):
+                self.committed = agreed
+                stable = True
+
+        return PartialTranscript(
+            committed=" ".join(self.committed),
+            tentative=" ".join(words[len(self.committed):]),
+            revision=self.revision,
+            stable=stable,
+        )
+
+    def _align(self, words: List[str], windowed: bool) -> List[str]:
+        """Express *words* as a hypothesis for the whole utterance."""
+        if not windowed or not self.committed:
+            return words
+        # Longest tail of the committed text that the window starts with
+        for k in range(min(len(self.committed), len(words)), 0, -1):
+            if _same_words(self.committed[-k:], words[:k]):
+                return self.committed + words[k:]
+        # No overlap: keep what is committed, let agreement decide the rest
+        return self.committed + words
+
+    def reset(self) -> None:
+        self.committed = []
+        self._hypotheses.clear()
+        self.revision = 0
+
+
+def _same_words(a: List[str], b: List[str]) -> bool:
+    return len(a) == len(b) and all(x.lower() == y.lower() for x, y in zip(a, b))
+
+
+def _common_prefix(hypotheses: List[List[str]]) -> List[str]:
+    prefix: List[str] = []
+    for column in zip(*hypotheses):
+        if any(w.lower() != column[0].lower() for w in column[1:]):
+            break
+        prefix.append(column[-1])
+    return prefix
+
+
 class ASR:
     """Automatic Speech Recognition engine."""
 
@@ -44,7 +140,12 @@ class ASR:
     async def initialize(self) -> None:
         """Initialize ASR service."""
         try:
-            self.client = httpx.AsyncClient(timeout=self.config.timeout)
+            # Keep connections open across turns so an idle pause between
+            # utterances does not cost a new TCP/TLS handshake
+            self.client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=httpx.Limits(keepalive_expiry=self.config.keepalive_expiry),
+            )
             
             # Verify service availability
             if self.config.backend == "qwen":
@@ -82,7 +183,8 @@ class ASR:
         """
         if not self._initialized:
             logger.warning("ASR not initialized, returning empty transcript")
-            return {"text": "", "confidence": 0.0, "partial": partial}
+            return {"text": "", "confidence": 0.0, "partial": partial,
+                    "error": "ASR not initialized"}
 
         try:
             if self.config.backend == "qwen":
@@ -128,14 +230,15 @@ class ASR:
                 }
             else:
                 logger.error(f"Qwen ASR error: {response.status_code}")
-                return {"text": "", "confidence": 0.0, "partial": partial}
+                return {"text": "", "confidence": 0.0, "partial": partial,
+                        "error": f"HTTP {response.status_code}"}
 
         except asyncio.TimeoutError:
             logger.error("Qwen ASR timeout")
             return {"text": "", "confidence": 0.0, "partial": partial, "timeout": True}
         except Exception as e:
             logger.error(f"Qwen transcription failed: {e}")
-            return {"text": "", "confidence": 0.0, "partial": partial}
+            return {"text": "", "confidence": 0.0, "partial": partial, "error": str(e)}
 
     async def _transcribe_ollama(
         self,
@@ -161,11 +264,12 @@ class ASR:
                     "partial": partial,
                 }
             else:
-                return {"text": "", "confidence": 0.0, "partial": partial}
+                return {"text": "", "confidence": 0.0, "partial": partial,
+                        "error": f"HTTP {response.status_code}"}
 
         except Exception as e:
             logger.error(f"Ollama Whisper transcription failed: {e}")
-            return {"text": "", "confidence": 0.0, "partial": partial}
+            return {"text": "", "confidence": 0.0, "partial": partial, "error": str(e)}
 
     async def _transcribe_openai(
         self,
@@ -194,11 +298,39 @@ class ASR:
                     "partial": partial,
                 }
             else:
-                return {"text": "", "confidence": 0.0, "partial": partial}
+                return {"text": "", "confidence": 0.0, "partial": partial,
+                        "error": f"HTTP {response.status_code}"}
 
         except Exception as e:
             logger.error(f"OpenAI transcription failed: {e}")
-            return {"text": "", "confidence": 0.0, "partial": partial}
+            return {"text": "", "confidence": 0.0, "partial": partial, "error": str(e)}
+
+    async def transcribe_partial(
+        self,
+        audio_bytes: bytes,
+        agreement: LocalAgreement,
+        window_ms: float = 10000.0,
+    ) -> PartialTranscript:
+        """
+        Transcribe the trailing window of an utterance in progress.
+
+        Args:
+            audio_bytes: Utterance audio so far (PCM 16-bit)
+            agreement: The utterance's LocalAgreement state
+            window_ms: Longest stretch of audio sent per hypothesis
+
+        Returns:
+            PartialTranscript; also stored as the current partial
+        """
+        window_bytes = int(window_ms * self.config.sample_rate / 1000) * 2
+        windowed = len(audio_bytes) > window_bytes
+        if windowed:
+            audio_bytes = audio_bytes[-window_bytes:]
+
+        result = await self.transcribe(audio_bytes, partial=True)
+        partial = agreement.update(result.get("text", ""), windowed=windowed)
+        self.update_partial(partial.text)
+        return partial
 
     def update_partial(self, transcript: str) -> None:
         """Update partial transcript."""
@@ -4,14 +4,15 @@ Session Manager for Voice Streaming
 Manages voice session state, audio buffers, and conversation flow.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from uuid import uuid4
 
-from .vad import VAD, VADConfig
-from .asr import ASR, ASRConfig
+from .vad import VAD, VADConfig, VADState
+from .asr import ASR, ASRConfig, LocalAgreement
 from .tts import TTS, TTSConfig
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,9 @@ class SessionState:
     is_speaking_assistant: bool = False
     turn_count: int = 0
     interrupted: bool = False
+    vad_state: VADState = field(default_factory=VADState)
+    asr_agreement: LocalAgreement = field(default_factory=LocalAgreement)
+    partial_at: int = 0  # audio_buffer length at the last partial transcription
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -41,6 +45,7 @@ class SessionManager:
         vad_config: Optional[VADConfig] = None,
         asr_config: Optional[ASRConfig] = None,
         tts_config: Optional[TTSConfig] = None,
+        partial_interval_ms: float = 0.0,
     ):
         """
         Initialize session manager.
@@ -49,10 +54,13 @@ class SessionManager:
             vad_config: Voice Activity Detection config
             asr_config: Automatic Speech Recognition config
             tts_config: Text-to-Speech config
+            partial_interval_ms: Streaming ASR: re-transcribe the utterance
+                after this much new audio while the user speaks (0 = off)
         """
         self.vad = VAD(vad_config or VADConfig())
         self.asr = ASR(asr_config or ASRConfig())
         self.tts = TTS(tts_config or TTSConfig())
+        self.partial_interval_ms = partial_interval_ms
         self.sessions: Dict[str, SessionState] = {}
         self._initialized = False
 
@@ -117,7 +125,9 @@ class SessionManager:
 
         Args:
             session_id: Session identifier
-            audio_frame: Audio data (16-bit PCM)
+            audio_frame: Audio data (16-bit PCM); any bytes-like object,
+                so a memoryview into a received frame is buffered without
+                an intermediate copy
 
         Returns:
             Event dict with type, data, partial_transcript, etc.
@@ -133,38 +143,118 @@ class SessionManager:
             session.last_activity = datetime.utcnow().isoformat() + "Z"
 
             # Detect speech
-            is_speech, confidence = self.vad.process_frame(audio_frame)
-
-            event = {
-                "type": "audio_frame",
-                "session_id": session_id,
-                "is_speech": is_speech,
-                "confidence": confidence,
-            }
-
-            # Check if turn should end
-            if self.vad.should_end_turn():
-                event["type"] = "turn_complete"
-                
-                # Transcribe buffer
-                if session.audio_buffer:
-                    transcript_result = await self.asr.transcribe(
-                        bytes(session.audio_buffer)
-                    )
-                    session.transcript = transcript_result.get("text", "")
-                    event["transcript"] = session.transcript
-                    
-                    # Reset buffer and VAD
-                    session.audio_buffer.clear()
-                    self.vad.reset()
-                    session.turn_count += 1
-
-            return event
+            is_speech, confidence = self.vad.process_frame(audio_frame, session.vad_state)
+            return await self._audio_event(session, is_speech, confidence)
 
         except Exception as e:
             logger.error(f"Audio processing failed: {e}")
             return {"type": "error", "data": str(e)}
 
+    async def process_audio_batch(
+        self,
+        frames: Dict[str, bytes],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Process one audio frame for each of many sessions.
+
+        Speech detection for all sessions runs as one vectorized VAD call;
+        turn completion and transcription then run concurrently across
+        sessions.
+
+        Args:
+            frames: session_id -> audio data (16-bit PCM)
+
+        Returns:
+            session_id -> event dict, as process_audio would return
+        """
+        events: Dict[str, Dict[str, Any]] = {}
+        sessions: List[SessionState] = []
+        batch: List[bytes] = []
+        now = datetime.utcnow().isoformat() + "Z"
+        for session_id, audio_frame in frames.items():
+            session = self.get_session(session_id)
+            if not session:
+                logger.error(f"Unknown session {session_id}")
+                events[session_id] = {"type": "error", "data": "Session not found"}
+                continue
+            session.audio_buffer.extend(audio_frame)
+            session.last_activity = now
+            sessions.append(session)
+            batch.append(audio_frame)
+
+        try:
+            results = self.vad.process_batch(batch, [s.vad_state for s in sessions])
+        except Exception as e:
+            logger.error(f"Batch VAD failed: {e}")
+            for session in sessions:
+                events[session.session_id] = {"type": "error", "data": str(e)}
+            return events
+
+        outcomes = await asyncio.gather(
+            *(
+                self._audio_event(session, is_speech, confidence)
+                for session, (is_speech, confidence) in zip(sessions, results)
+            ),
+            return_exceptions=True,
+        )
+        for session, outcome in zip(sessions, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Audio processing failed: {outcome}")
+                outcome = {"type": "error", "data": str(outcome)}
+            events[session.session_id] = outcome
+        return events
+
+    async def _audio_event(
+        self,
+        session: SessionState,
+        is_speech: bool,
+        confidence: float,
+    ) -> Dict[str, Any]:
+        """Build the frame event; transcribe and reset when the turn ends."""
+        event = {
+            "type": "audio_frame",
+            "session_id": session.session_id,
+            "is_speech": is_speech,
+            "confidence": confidence,
+        }
+
+        # Check if turn should end
+        if self.vad.should_end_turn(session.vad_state):
+            event["type"] = "turn_complete"
+
+            # Transcribe buffer
+            if session.audio_buffer:
+                transcript_result = await self.asr.transcribe(
+                    bytes(session.audio_buffer)
+                )
+                session.transcript = transcript_result.get("text", "")
+                event["transcript"] = session.transcript
+
+                # Reset buffer and VAD
+                session.audio_buffer.clear()
+                self.vad.reset(session.vad_state)
+                session.asr_agreement.reset()
+                session.partial_at = 0
+                session.turn_count += 1
+
+        elif self._partial_due(session):
+            partial = await self.asr.transcribe_partial(
+                bytes(session.audio_buffer), session.asr_agreement
+            )
+            session.partial_at = len(session.audio_buffer)
+            event["partial_transcript"] = partial.text
+            event["committed_transcript"] = partial.committed
+            event["partial_stable"] = partial.stable
+
+        return event
+
+    def _partial_due(self, session: SessionState) -> bool:
+        """Streaming ASR: enough new audio since the last partial, mid-speech."""
+        if self.partial_interval_ms <= 0 or session.vad_state.speech_ms <= 0:
+            return False
+        interval = int(self.partial_interval_ms * self.asr.config.sample_rate / 1000) * 2
+        return len(session.audio_buffer) - session.partial_at >= interval
+
     async def synthesize_response(
         self,
         session_id: str,
@@ -25,6 +25,7 @@ class TTSConfig:
     voice: str = "default"  # Voice identifier
     speed: float = 1.0  # Speech speed (0.5-2.0)
     timeout: float = 30.0
+    keepalive_expiry: float = 60.0  # idle seconds a pooled connection stays open
     api_key: str = ""  # v4.4: Required for OpenAI backend
 
 
@@ -46,7 +47,12 @@ class TTS:
     async def initialize(self) -> None:
         """Initialize TTS service."""
         try:
-            self.client = httpx.AsyncClient(timeout=self.config.timeout)
+            # Keep connections open across turns so an idle pause between
+            # utterances does not cost a new TCP/TLS handshake
+            self.client = httpx.AsyncClient(
+                timeout=self.config.timeout,
+                limits=httpx.Limits(keepalive_expiry=self.config.keepalive_expiry),
+            )
             
             # Verify service availability
             if self.config.backend == "qwen":
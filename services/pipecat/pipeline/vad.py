@@ -3,15 +3,26 @@ Voice Activity Detection (VAD) Module
 
 Detects speech in audio stream with configurable sensitivity.
 Supports multiple VAD backends: Silero VAD, WebRTC VAD, simple energy-based.
+
+The VAD engine itself is stateless per stream: speech/silence counters live
+in a VADState that each session owns and passes in, so one engine can be
+shared by every session. Energy features (RMS, zero-crossing rate, spectral
+flatness) are computed with NumPy over views of the PCM bytes, and
+process_batch() evaluates many sessions' frames in one vectorized call.
 """
 
 import logging
-import math
-from typing import Optional, Tuple, List
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Added to power spectra so silent frames do not take log(0)
+_SPECTRAL_EPS = 1e-12
+
 
 @dataclass
 class VADConfig:
@@ -19,11 +30,70 @@ class VADConfig:
     sample_rate: int = 16000  # 16 kHz
     frame_size: int = 512  # 512 samples (32ms at 16kHz)
     threshold: float = 0.5  # Energy threshold (0-1)
+    max_flatness: float = 0.35  # Spectral flatness above this is noise, not speech
     min_speech_duration: int = 100  # Min ms of speech
     min_silence_duration: int = 500  # Min ms of silence to end turn
     backend: str = "energy"  # energy, silero, webrtc
 
 
+@dataclass
+class VADState:
+    """Per-session speech/silence counters."""
+    is_speech: bool = False
+    frame_count: int = 0
+    speech_ms: float = 0.0  # speech heard in the current turn
+    silence_ms: float = 0.0  # trailing silence since the last speech frame
+
+    def update(self, is_speech: bool, frame_ms: float) -> None:
+        self.frame_count += 1
+        self.is_speech = is_speech
+        if is_speech:
+            self.speech_ms += frame_ms
+            self.silence_ms = 0.0
+        elif self.speech_ms > 0:
+            self.silence_ms += frame_ms
+
+    def reset(self) -> None:
+        self.is_speech = False
+        self.frame_count = 0
+        self.speech_ms = 0.0
+        self.silence_ms = 0.0
+
+
+@dataclass
+class VADFeatures:
+    """Energy features for a batch of equal-length frames (one row per frame)."""
+    rms: np.ndarray  # normalized to 0-1
+    flatness: np.ndarray  # spectral flatness, 0 (tonal) .. 1 (white noise)
+
+
+def pcm_samples(audio_bytes: bytes) -> np.ndarray:
+    """int16 view of 16-bit little-endian PCM (no copy; a trailing odd byte is ignored)."""
+    return np.frombuffer(audio_bytes, dtype="<i2", count=len(audio_bytes) // 2)
+
+
+def frame_features(samples: np.ndarray) -> VADFeatures:
+    """
+    RMS and spectral flatness per row of *samples*.
+
+    Args:
+        samples: int16 array of shape (n_samples,) or (n_frames, n_samples)
+    """
+    frames = np.atleast_2d(samples)
+    n = frames.shape[1]
+    x = frames.astype(np.float32)
+    x *= 1.0 / 32768.0
+
+    rms = np.sqrt(np.einsum("ij,ij->i", x, x) / n)
+    np.minimum(rms, 1.0, out=rms)
+
+    power = np.abs(np.fft.rfft(x, axis=1)) ** 2
+    power += _SPECTRAL_EPS
+    flatness = np.exp(np.mean(np.log(power), axis=1)) / np.mean(power, axis=1)
+
+    return VADFeatures(rms=rms, flatness=flatness)
+
+
 class VAD:
     """Voice Activity Detection engine."""
 
@@ -35,12 +105,8 @@ class VAD:
             config: VAD configuration
         """
         self.config = config or VADConfig()
-        self.is_speech = False
-        self.speech_start_time = None
-        self.silence_start_time = None
-        self.frame_count = 0
-        self._silence_duration = 0
-        self._speech_duration = 0
+        # Used when a caller does not pass its own VADState
+        self.state = VADState()
 
     async def initialize(self) -> None:
         """Initialize VAD backend."""
@@ -75,77 +141,123 @@ class VAD:
         except ImportError:
             raise ImportError("webrtcvad not installed")
 
-    def process_frame(self, audio_bytes: bytes) -> Tuple[bool, float]:
+    def _frame_ms(self, audio_bytes: bytes) -> float:
+        return (len(audio_bytes) // 2) / self.config.sample_rate * 1000
+
+    def process_frame(
+        self,
+        audio_bytes: bytes,
+        state: Optional[VADState] = None,
+    ) -> Tuple[bool, float]:
         """
         Process audio frame for speech detection.
 
         Args:
             audio_bytes: Audio frame (typically 512 samples = 32ms at 16kHz)
+            state: The calling session's VAD state (default: the engine's own)
 
         Returns:
             (is_speech, confidence) tuple
         """
-        self.frame_count += 1
+        state = state if state is not None else self.state
 
         try:
             if self.config.backend == "silero":
-                return self._detect_silero(audio_bytes)
+                result = self._detect_silero(audio_bytes)
             elif self.config.backend == "webrtc":
-                return self._detect_webrtc(audio_bytes)
+                result = self._detect_webrtc(audio_bytes)
             else:
-                return self._detect_energy(audio_bytes)
+                result = self._detect_energy(audio_bytes)
         except Exception as e:
             logger.error(f"VAD detection failed: {e}")
-            return False, 0.0
+            result = (False, 0.0)
+
+        state.update(result[0], self._frame_ms(audio_bytes))
+        return result
+
+    def process_batch(
+        self,
+        frames: Sequence[bytes],
+        states: Sequence[VADState],
+    ) -> List[Tuple[bool, float]]:
+        """
+        Energy-detect one frame per session in vectorized calls.
+
+        Frames of equal length are stacked and evaluated together, so a
+        tick over many sessions costs a handful of NumPy calls rather than
+        one detection per session. Non-energy backends fall back to
+        per-frame processing.
+
+        Args:
+            frames: One audio frame per session
+            states: The matching sessions' VAD states
+
+        Returns:
+            (is_speech, confidence) per frame, in input order
+        """
+        if len(frames) != len(states):
+            raise ValueError("frames and states must have the same length")
+        if self.config.backend != "energy":
+            return [self.process_frame(f, s) for f, s in zip(frames, states)]
+
+        results: List[Tuple[bool, float]] = [(False, 0.0)] * len(frames)
+        by_length: Dict[int, List[int]] = defaultdict(list)
+        for i, frame in enumerate(frames):
+            by_length[len(frame) // 2].append(i)
+
+        for n, indices in by_length.items():
+            if n == 0:
+                continue
+            stacked = np.frombuffer(
+                b"".join(memoryview(frames[i])[:2 * n] for i in indices), dtype="<i2"
+            ).reshape(len(indices), n)
+            features = frame_features(stacked)
+            speech = self._is_speech(features)
+            for row, i in enumerate(indices):
+                results[i] = (bool(speech[row]), float(features.rms[row]))
+
+        for frame, state, (is_speech, _) in zip(frames, states, results):
+            state.update(is_speech, self._frame_ms(frame))
+        return results
+
+    def _is_speech(self, features: VADFeatures) -> np.ndarray:
+        return (features.rms > self.config.threshold) & (
+            features.flatness <= self.config.max_flatness
+        )
 
     def _detect_energy(self, audio_bytes: bytes) -> Tuple[bool, float]:
         """
-        Simple energy-based speech detection.
+        Energy-based speech detection.
 
-        Computes RMS energy and thresholds.
+        Speech is RMS above the threshold with a spectrum that is not flat
+        (loud broadband noise is rejected). Confidence is the normalized RMS.
         """
-        # Convert bytes to samples (16-bit PCM)
-        import struct
-        samples = struct.unpack(f"{len(audio_bytes)//2}h", audio_bytes)
-        
-        # Compute RMS energy
-        if len(samples) == 0:
+        samples = pcm_samples(audio_bytes)
+        if samples.size == 0:
             return False, 0.0
-        
-        rms = math.sqrt(sum(s**2 for s in samples) / len(samples))
-        
-        # Normalize to 0-1 (16-bit audio max is 32768)
-        normalized_rms = min(1.0, rms / 32768.0)
-        
-        # Simple threshold
-        is_speech = normalized_rms > self.config.threshold
-        
-        return is_speech, normalized_rms
+
+        features = frame_features(samples)
+        return bool(self._is_speech(features)[0]), float(features.rms[0])
 
     def _detect_silero(self, audio_bytes: bytes) -> Tuple[bool, float]:
         """Speech detection using Silero VAD."""
         try:
             import torch
-            
-            # Convert bytes to tensor
-            import struct
-            samples = struct.unpack(f"{len(audio_bytes)//2}h", audio_bytes)
-            
+
             # Normalize to [-1, 1]
-            audio_tensor = torch.tensor(
-                [s / 32768.0 for s in samples],
-                dtype=torch.float32
+            audio_tensor = torch.from_numpy(
+                pcm_samples(audio_bytes).astype(np.float32) / 32768.0
             )
-            
+
             # Get speech probability
             speech_prob = self.silero_model(
                 audio_tensor,
                 self.config.sample_rate
             ).item()
-            
+
             is_speech = speech_prob > self.config.threshold
             return is_speech, speech_prob
-            
+
         except Exception as e:
             logger.error(f"Silero detection failed: {e}")
             return False, 0.0
@@ -158,55 +270,44 @@ class VAD:
                 audio_bytes,
                 self.config.sample_rate
             )
-            
+
             # Estimate confidence based on energy
-            import struct
-            samples = struct.unpack(f"{len(audio_bytes)//2}h", audio_bytes)
-            rms = math.sqrt(sum(s**2 for s in samples) / len(samples))
-            confidence = min(1.0, rms / 32768.0)
-            
+            samples = pcm_samples(audio_bytes)
+            confidence = float(frame_features(samples).rms[0]) if samples.size else 0.0
+
             return is_speech, confidence
-            
+
         except Exception as e:
             logger.error(f"WebRTC detection failed: {e}")
             return False, 0.0
 
-    def get_speech_duration(self) -> int:
+    def get_speech_duration(self, state: Optional[VADState] = None) -> int:
         """Get current speech duration in ms."""
-        if self.is_speech and self.speech_start_time is not None:
-            frame_ms = (self.config.frame_size / self.config.sample_rate) * 1000
-            return int(self._speech_duration + (self.frame_count * frame_ms))
-        return int(self._speech_duration)
+        state = state if state is not None else self.state
+        return int(state.speech_ms)
 
-    def get_silence_duration(self) -> int:
+    def get_silence_duration(self, state: Optional[VADState] = None) -> int:
         """Get current silence duration in ms."""
-        if not self.is_speech and self.silence_start_time is not None:
-            frame_ms = (self.config.frame_size / self.config.sample_rate) * 1000
-            return int(self._silence_duration + (self.frame_count * frame_ms))
-        return int(self._silence_duration)
+        state = state if state is not None else self.state
+        return int(state.silence_ms)
 
-    def should_end_turn(self) -> bool:
+    def should_end_turn(self, state: Optional[VADState] = None) -> bool:
         """
         Determine if turn should end.
 
         True if: sufficient speech followed by sufficient silence.
         """
-        speech_dur = self.get_speech_duration()
-        silence_dur = self.get_silence_duration()
-        
+        speech_dur = self.get_speech_duration(state)
+        silence_dur = self.get_silence_duration(state)
+
         return (
             speech_dur >= self.config.min_speech_duration and
             silence_dur >= self.config.min_silence_duration
         )
 
-    def reset(self) -> None:
+    def reset(self, state: Optional[VADState] = None) -> None:
         """Reset VAD state for new turn."""
-        self.is_speech = False
-        self.speech_start_time = None
-        self.silence_start_time = None
-        self.frame_count = 0
-        self._silence_duration = 0
-        self._speech_duration = 0
+        (state if state is not None else self.state).reset()
         logger.debug("VAD state reset")
 
     async def shutdown(self) -> None:
@@ -6,6 +6,10 @@ not via external stopwatches.
 Metrics:
     warm_path_ms: t_first_emit_ns - t_detect_ns (speech detected -> first output)
 
+Turns recorded as cold (served by backends that were not warmed up yet,
+so they also paid model load and connection setup) are reported
+separately and kept out of the warm-path percentiles.
+
 Gate G18 threshold: p95 warm-path <= 1200 ms.
 """
 from __future__ import annotations
@@ -16,6 +20,15 @@ from threading import Lock
 from typing import Optional
 
 
+def _percentile(data: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of sorted, non-empty *data*."""
+    k = (pct / 100) * (len(data) - 1)
+    f = int(k)
+    c = f + 1 if f + 1 < len(data) else f
+    d = k - f
+    return data[f] + d * (data[c] - data[f])
+
+
 @dataclass
 class TurnLatency:
     """Latency record for a single turn."""
@@ -24,6 +37,7 @@ class TurnLatency:
     t_detect_ns: Optional[int] = None
     t_first_emit_ns: Optional[int] = None
     finalized: bool = False
+    cold: bool = False
 
     @property
     def warm_path_ns(self) -> Optional[int]:
@@ -55,8 +69,12 @@ class LatencyCollector:
         self._finalized: list[TurnLatency] = []
         self._max_window = max_window
 
-    def record_turn_start(self, session_id: str, turn_id: str, t_detect_ns: int) -> None:
-        """Record when voice activity confirms turn start."""
+    def record_turn_start(self, session_id: str, turn_id: str, t_detect_ns: int,
+                          cold: bool = False) -> None:
+        """Record when voice activity confirms turn start.
+
+        *cold* marks a turn served before its backends were warm.
+        """
         with self._lock:
             key = (session_id, turn_id)
             rec = self._records.get(key)
@@ -64,6 +82,7 @@ class LatencyCollector:
                 rec = TurnLatency(session_id=session_id, turn_id=turn_id)
                 self._records[key] = rec
             rec.t_detect_ns = t_detect_ns
+            rec.cold = cold
 
     def record_first_emit(self, session_id: str, turn_id: str, t_first_emit_ns: int) -> None:
         """Record when first assistant output is emitted (token/audio chunk)."""
@@ -93,6 +112,9 @@ class LatencyCollector:
     def compute_percentiles(self, window: Optional[int] = None) -> dict:
         """Compute latency percentiles over finalized turns.
 
+        Warm-path percentiles and the G18 verdict cover warm turns only;
+        cold turns are summarised under the cold_* keys.
+
         Returns:
             {
                 "count": int,
@@ -100,6 +122,9 @@ class LatencyCollector:
                 "p95_ms": float or None,
                 "p99_ms": float or None,
                 "g18_pass": bool,
+                "cold_count": int,
+                "cold_p50_ms": float or None,
+                "cold_max_ms": float or None,
             }
         """
         with self._lock:
@@ -108,10 +133,20 @@ class LatencyCollector:
         if window is not None:
             records = records[-window:]
 
-        latencies_ms = [
+        latencies_ms = sorted(
             r.warm_path_ms for r in records
-            if r.warm_path_ms is not None
-        ]
+            if r.warm_path_ms is not None and not r.cold
+        )
+        cold_ms = sorted(
+            r.warm_path_ms for r in records
+            if r.warm_path_ms is not None and r.cold
+        )
+
+        cold = {
+            "cold_count": len(cold_ms),
+            "cold_p50_ms": round(_percentile(cold_ms, 50), 2) if cold_ms else None,
+            "cold_max_ms": round(cold_ms[-1], 2) if cold_ms else None,
+        }
 
         if not latencies_ms:
             return {
@@ -120,21 +155,13 @@ class LatencyCollector:
                 "p95_ms": None,
                 "p99_ms": None,
                 "g18_pass": False,
+                **cold,
             }
 
-        latencies_ms.sort()
         n = len(latencies_ms)
-
-        def percentile(data: list[float], pct: float) -> float:
-            k = (pct / 100) * (len(data) - 1)
-            f = int(k)
-            c = f + 1 if f + 1 < len(data) else f
-            d = k - f
-            return data[f] + d * (data[c] - data[f])
-
-        p50 = percentile(latencies_ms, 50)
-        p95 = percentile(latencies_ms, 95)
-        p99 = percentile(latencies_ms, 99)
+        p50 = _percentile(latencies_ms, 50)
+        p95 = _percentile(latencies_ms, 95)
+        p99 = _percentile(latencies_ms, 99)
 
         return {
             "count": n,
@@ -142,6 +169,7 @@ class LatencyCollector:
             "p95_ms": round(p95, 2),
             "p99_ms": round(p99, 2),
             "g18_pass": p95 <= self.G18_P95_THRESHOLD_MS,
+            **cold,
         }
 
     @property
@@ -0,0 +1,222 @@
+"""Retention for finished voice turns.
+
+A terminal turn is compacted into a TurnRecord (final snapshot, its
+deterministic hash and counts) and kept in an LRU-bounded TurnArchive.
+The full event sequence and command keys can optionally be spilled to an
+append-only JSONL log so recent turns remain replayable.
+
+Spill log rotation: once the active file exceeds max_spill_bytes it is
+renamed to "<path>.1" (replacing the previous one) and a new file is
+started.  Records pointing into a rotated-away file are no longer
+replayable; their compact record stays in the archive until evicted.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from .turn_events import TurnEvent
+from .turn_state import TurnSnapshot
+
+
+@dataclass(frozen=True)
+class TurnRecord:
+    """Immutable summary of a finished turn."""
+    snapshot: TurnSnapshot
+    snapshot_hash: str
+    event_count: int
+    command_count: int
+    command_log_hash: str
+    first_ts_ns: Optional[int] = None
+    last_ts_ns: Optional[int] = None
+    spill_generation: Optional[int] = None  # None: events were not spilled
+    spill_offset: int = 0
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return (self.snapshot.session_id, self.snapshot.turn_id)
+
+    def to_dict(self) -> dict:
+        s = self.snapshot
+        return {
+            "session_id": s.session_id,
+            "turn_id": s.turn_id,
+            "correlation_id": s.correlation_id,
+            "state": s.state.value,
+            "seq": s.seq,
+            "reason": s.reason,
+            "snapshot_hash": self.snapshot_hash,
+            "event_count": self.event_count,
+            "command_count": self.command_count,
+            "command_log_hash": self.command_log_hash,
+        }
+
+
+def command_log_hash(command_keys: list[str]) -> str:
+    """Hash of the sorted executed command keys (G19 replay comparison)."""
+    canonical = "\n".join(sorted(command_keys))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def compact_turn(snapshot: TurnSnapshot, events: list[TurnEvent],
+                 command_keys: list[str],
+                 prior: Optional[TurnRecord] = None) -> TurnRecord:
+    """Build the compact record for a terminal turn (not yet spilled).
+
+    *prior* is the earlier record of a reopened turn whose events could not
+    be reloaded from the spill log: its counts and first timestamp carry
+    forward and the command log hash is chained onto its hash.
+    """
+    if prior is None:
+        return TurnRecord(
+            snapshot=snapshot,
+            snapshot_hash=snapshot.deterministic_hash(),
+            event_count=len(events),
+            command_count=len(command_keys),
+            command_log_hash=command_log_hash(command_keys),
+            first_ts_ns=events[0].ts_monotonic_ns if events else None,
+            last_ts_ns=events[-1].ts_monotonic_ns if events else None,
+        )
+    return TurnRecord(
+        snapshot=snapshot,
+        snapshot_hash=snapshot.deterministic_hash(),
+        event_count=prior.event_count + len(events),
+        command_count=prior.command_count + len(command_keys),
+        command_log_hash=command_log_hash([prior.command_log_hash, *command_keys]),
+        first_ts_ns=prior.first_ts_ns,
+        last_ts_ns=events[-1].ts_monotonic_ns if events else prior.last_ts_ns,
+    )
+
+
+class TurnArchive:
+    """LRU-bounded store of TurnRecords with optional JSONL event spill."""
+
+    def __init__(
+        self,
+        max_turns: int = 1024,
+        spill_path: Optional[str] = None,
+        max_spill_bytes: int = 64 * 1024 * 1024,
+    ) -> None:
+        self.max_turns = max_turns
+        self.max_spill_bytes = max_spill_bytes
+        self._lock = Lock()
+        self._records: OrderedDict[tuple[str, str], TurnRecord] = OrderedDict()
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._generation = 0
+        self._spill_bytes = 0
+        self.evicted = 0
+        if self._spill_path is not None:
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            if self._spill_path.exists():
+                self._rotate()
+
+    # ── store ────────────────────────────────────────────────────────────
+
+    def add(self, record: TurnRecord, events: list[TurnEvent],
+            command_keys: list[str]) -> TurnRecord:
+        """Archive *record*, spilling its events first if a log is configured.
+
+        Returns the stored record (with spill location filled in).
+        """
+        with self._lock:
+            if self._spill_path is not None:
+                record = self._spill(record, events, command_keys)
+            self._records[record.key] = record
+            self._records.move_to_end(record.key)
+            while len(self._records) > self.max_turns:
+                self._records.popitem(last=False)
+                self.evicted += 1
+        return record
+
+    def get(self, session_id: str, turn_id: str) -> Optional[TurnRecord]:
+        with self._lock:
+            record = self._records.get((session_id, turn_id))
+            if record is not None:
+                self._records.move_to_end(record.key)
+            return record
+
+    def drop_session(self, session_id: str) -> int:
+        """Forget every archived turn of *session_id*. Returns the count."""
+        with self._lock:
+            keys = [k for k in self._records if k[0] == session_id]
+            for k in keys:
+                del self._records[k]
+            return len(keys)
+
+    def session_counts(self) -> dict[str, int]:
+        with self._lock:
+            counts: dict[str, int] = {}
+            for sid, _ in self._records:
+                counts[sid] = counts.get(sid, 0) + 1
+            return counts
+
+    # ── spill log ────────────────────────────────────────────────────────
+
+    def load_spilled(self, record: TurnRecord) -> Optional[tuple[list[TurnEvent], list[str]]]:
+        """(events, command_keys) for *record* from the spill log, if still there."""
+        if record.spill_generation is None or self._spill_path is None:
+            return None
+        with self._lock:
+            if record.spill_generation == self._generation:
+                path = self._spill_path
+            elif record.spill_generation == self._generation - 1:
+                path = self._rotated_path()
+            else:
+                return None
+        try:
+            with open(path, "rb") as f:
+                f.seek(record.spill_offset)
+                entry = json.loads(f.readline())
+        except (OSError, ValueError):
+            return None
+        if (entry.get("session_id"), entry.get("turn_id")) != record.key:
+            return None
+        events = [TurnEvent(**e) for e in entry["events"]]
+        return events, list(entry["commands"])
+
+    def _spill(self, record: TurnRecord, events: list[TurnEvent],
+               command_keys: list[str]) -> TurnRecord:
+        if self._spill_bytes >= self.max_spill_bytes:
+            self._rotate()
+        line = json.dumps({
+            **record.to_dict(),
+            "events": [asdict(e) for e in events],
+            "commands": sorted(command_keys),
+        }, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+        offset = self._spill_bytes
+        with open(self._spill_path, "ab") as f:
+            f.write(line)
+        self._spill_bytes += len(line)
+        return replace(record, spill_generation=self._generation, spill_offset=offset)
+
+    def _rotated_path(self) -> Path:
+        return self._spill_path.with_name(self._spill_path.name + ".1")
+
+    def _rotate(self) -> None:
+        os.replace(self._spill_path, self._rotated_path())
+        self._generation += 1
+        self._spill_bytes = 0
+
+    # ── stats ────────────────────────────────────────────────────────────
+
+    @property
+    def count(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "archived_turns": len(self._records),
+                "max_turns": self.max_turns,
+                "evicted": self.evicted,
+                "spill_path": str(self._spill_path) if self._spill_path else None,
+                "spill_bytes": self._spill_bytes,
+                "spill_generation": self._generation,
+            }
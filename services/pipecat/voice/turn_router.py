@@ -5,22 +5,37 @@ Wires together:
     - Command dispatch with idempotency keys
     - Latency instrumentation
     - Cancel registry integration
+    - Retention: terminal turns are compacted into a TurnArchive
 
 Command idempotency key: f"{session_id}:{turn_id}:{seq}:{command.name}"
+
+Only turns still in progress keep their snapshot, event log and command
+log in memory.  Once a turn reaches a terminal state it is compacted to a
+TurnRecord; get_snapshot() keeps answering from the record, and
+get_event_log()/replay_archived() read the spill log while it still holds
+the turn.  A late event for an archived turn reopens it: the turn goes
+back through the normal reduce/record/idempotency path and is compacted
+again with the event and any commands included.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from threading import Lock
 from typing import Callable, List, Optional
 
 from .cancel_registry import CancelRegistry
 from .latency_metrics import LatencyCollector
+from .turn_archive import TurnArchive, TurnRecord, compact_turn
 from .turn_events import TurnEvent
 from .turn_reducer import Command, reduce_turn
 from .turn_state import TurnSnapshot, TurnState, make_initial_snapshot
 
 
+# Rough per-entry cost of a CommandExecutionLog key + result dict
+_APPROX_COMMAND_BYTES = 256
+
+
 class CommandExecutionLog:
     """Tracks executed commands for idempotency and audit."""
 
@@ -45,6 +60,13 @@ class CommandExecutionLog:
         with self._lock:
             return len(self._executed)
 
+    @classmethod
+    def from_keys(cls, keys: list[str]) -> "CommandExecutionLog":
+        """Rebuild a log (without results) from spilled command keys."""
+        log = cls()
+        log._executed = {k: {} for k in keys}
+        return log
+
     def command_log(self) -> list[str]:
         """Return sorted list of all executed command keys (for replay hashing)."""
         with self._lock:
@@ -60,19 +82,26 @@ class TurnRouter:
         router.ingest(event)
         router.ingest(event)
         snapshot = router.get_snapshot("session1", "turn1")
+
+    Pass a TurnArchive with spill_path to keep finished turns replayable
+    after they leave memory.
     """
 
     def __init__(
         self,
         cancel_registry: Optional[CancelRegistry] = None,
         latency_collector: Optional[LatencyCollector] = None,
+        archive: Optional[TurnArchive] = None,
     ) -> None:
         self._lock = Lock()
         self._snapshots: dict[tuple[str, str], TurnSnapshot] = {}
         self._event_logs: dict[tuple[str, str], list[TurnEvent]] = {}
         self._command_logs: dict[tuple[str, str], CommandExecutionLog] = {}
+        # Reopened turns whose events were not reloadable from the spill log
+        self._reopened: dict[tuple[str, str], TurnRecord] = {}
         self._cancel_registry = cancel_registry or CancelRegistry()
         self._latency = latency_collector or LatencyCollector()
+        self._archive = archive or TurnArchive()
 
     def start_turn(self, session_id: str, turn_id: str, correlation_id: str) -> TurnSnapshot:
         """Initialize a new turn at IDLE state."""
@@ -94,27 +123,35 @@ class TurnRouter:
 
         with self._lock:
             snapshot = self._snapshots.get(key)
-            if snapshot is None:
+            cmd_log = self._command_logs.get(key)
+        archived = None
+        if snapshot is None:
+            archived = self._archive.get(*key)
+            if archived is None:
                 raise ValueError(f"No active turn for {key}")
-            cmd_log = self._command_logs[key]
+            snapshot = archived.snapshot
 
-        # Pure reduce
+        # Pure reduce (terminal states absorb late events)
         new_snapshot, commands = reduce_turn(snapshot, event)
 
+        if archived is not None:
+            cmd_log = self._reopen(archived)
+
         # Record event
         with self._lock:
             self._snapshots[key] = new_snapshot
             self._event_logs[key].append(event)
 
-        # Latency instrumentation
-        if event.event_type == "TURN_STARTED":
-            self._latency.record_turn_start(
-                event.session_id, event.turn_id, event.ts_monotonic_ns
-            )
-        elif event.event_type in ("MODEL_FIRST_TOKEN", "TTS_STARTED"):
-            self._latency.record_first_emit(
-                event.session_id, event.turn_id, event.ts_monotonic_ns
-            )
+        # Latency instrumentation (already finalized for reopened turns)
+        if archived is None:
+            if event.event_type == "TURN_STARTED":
+                self._latency.record_turn_start(
+                    event.session_id, event.turn_id, event.ts_monotonic_ns
+                )
+            elif event.event_type in ("MODEL_FIRST_TOKEN", "TTS_STARTED"):
+                self._latency.record_first_emit(
+                    event.session_id, event.turn_id, event.ts_monotonic_ns
+                )
 
         # Cancel registry integration
         if event.event_type == "BARGE_IN_REQUESTED":
@@ -130,26 +167,127 @@ class TurnRouter:
                 cmd_log.record(idem_key, {"args": cmd.args})
                 executed_cmds.append(cmd)
 
-        # Finalize latency on terminal
+        # Finalize latency and compact on terminal
         if new_snapshot.is_terminal:
-            self._latency.finalize_turn(event.session_id, event.turn_id)
+            if archived is None:
+                self._latency.finalize_turn(event.session_id, event.turn_id)
+            self._compact(key)
 
         return new_snapshot, executed_cmds
 
+    def _compact(self, key: tuple[str, str]) -> Optional[TurnRecord]:
+        """Move a finished turn out of the live maps into the archive."""
+        with self._lock:
+            snapshot = self._snapshots.pop(key, None)
+            events = self._event_logs.pop(key, [])
+            cmd_log = self._command_logs.pop(key, None)
+            prior = self._reopened.pop(key, None)
+        if snapshot is None:
+            return None
+        self._cancel_registry.clear(*key)
+        command_keys = cmd_log.command_log() if cmd_log is not None else []
+        record = compact_turn(snapshot, events, command_keys, prior=prior)
+        return self._archive.add(record, events, command_keys)
+
+    def _reopen(self, record: TurnRecord) -> CommandExecutionLog:
+        """Put an archived turn back in the live maps for a late event.
+
+        Events and command keys are reloaded from the spill log when it
+        still holds the turn; otherwise the record is kept so compaction
+        can carry its counts forward.
+        """
+        spilled = self._archive.load_spilled(record)
+        events, command_keys = spilled if spilled is not None else ([], [])
+        cmd_log = CommandExecutionLog.from_keys(command_keys)
+        with self._lock:
+            self._snapshots[record.key] = record.snapshot
+            self._event_logs[record.key] = events
+            self._command_logs[record.key] = cmd_log
+            if spilled is None:
+                self._reopened[record.key] = record
+        return cmd_log
+
     def get_snapshot(self, session_id: str, turn_id: str) -> Optional[TurnSnapshot]:
-        """Get current snapshot for a turn."""
+        """Get current snapshot for a turn (final snapshot once archived)."""
         with self._lock:
-            return self._snapshots.get((session_id, turn_id))
+            snapshot = self._snapshots.get((session_id, turn_id))
+        if snapshot is not None:
+            return snapshot
+        record = self._archive.get(session_id, turn_id)
+        return record.snapshot if record is not None else None
+
+    def get_record(self, session_id: str, turn_id: str) -> Optional[TurnRecord]:
+        """Compact record of a finished turn, if still archived."""
+        return self._archive.get(session_id, turn_id)
 
     def get_event_log(self, session_id: str, turn_id: str) -> list[TurnEvent]:
         """Get recorded events for replay."""
         with self._lock:
-            return list(self._event_logs.get((session_id, turn_id), []))
+            events = self._event_logs.get((session_id, turn_id))
+            if events is not None:
+                return list(events)
+        spilled = self._load_spilled(session_id, turn_id)
+        return spilled[0] if spilled is not None else []
 
     def get_command_log(self, session_id: str, turn_id: str) -> CommandExecutionLog:
         """Get command execution log for a turn."""
         with self._lock:
-            return self._command_logs.get((session_id, turn_id), CommandExecutionLog())
+            cmd_log = self._command_logs.get((session_id, turn_id))
+            if cmd_log is not None:
+                return cmd_log
+        spilled = self._load_spilled(session_id, turn_id)
+        return CommandExecutionLog.from_keys(spilled[1]) if spilled is not None else CommandExecutionLog()
+
+    def _load_spilled(self, session_id: str, turn_id: str):
+        record = self._archive.get(session_id, turn_id)
+        return self._archive.load_spilled(record) if record is not None else None
+
+    def close_session(self, session_id: str) -> int:
+        """Drop live and archived state for *session_id*. Returns turns dropped."""
+        with self._lock:
+            keys = [k for k in self._snapshots if k[0] == session_id]
+            for k in keys:
+                del self._snapshots[k]
+                self._event_logs.pop(k, None)
+                self._command_logs.pop(k, None)
+                self._reopened.pop(k, None)
+        for _, turn_id in keys:
+            self._latency.finalize_turn(session_id, turn_id)
+        self._cancel_registry.clear_session(session_id)
+        return len(keys) + self._archive.drop_session(session_id)
+
+    def memory_stats(self) -> dict:
+        """Live/archived turn counts and approximate live bytes per session."""
+        sessions: dict[str, dict] = {}
+        with self._lock:
+            for key, snapshot in self._snapshots.items():
+                events = self._event_logs.get(key, [])
+                cmd_log = self._command_logs.get(key)
+                n_cmds = cmd_log.count if cmd_log is not None else 0
+                entry = sessions.setdefault(key[0], {
+                    "active_turns": 0, "events": 0, "commands": 0,
+                    "approx_bytes": 0, "archived_turns": 0,
+                })
+                entry["active_turns"] += 1
+                entry["events"] += len(events)
+                entry["commands"] += n_cmds
+                entry["approx_bytes"] += (
+                    sys.getsizeof(snapshot)
+                    + sys.getsizeof(events)
+                    + sum(sys.getsizeof(e) for e in events)
+                    + n_cmds * _APPROX_COMMAND_BYTES
+                )
+        for sid, n in self._archive.session_counts().items():
+            sessions.setdefault(sid, {
+                "active_turns": 0, "events": 0, "commands": 0,
+                "approx_bytes": 0, "archived_turns": 0,
+            })["archived_turns"] = n
+        return {
+            "active_turns": sum(s["active_turns"] for s in sessions.values()),
+            "approx_bytes": sum(s["approx_bytes"] for s in sessions.values()),
+            "archive": self._archive.stats(),
+            "sessions": sessions,
+        }
 
     def replay(self, session_id: str, turn_id: str, correlation_id: str,
                events: list[TurnEvent]) -> TurnSnapshot:
@@ -163,6 +301,23 @@ class TurnRouter:
             snapshot, _ = self.ingest(event)
         return snapshot
 
+    def replay_archived(self, session_id: str, turn_id: str) -> Optional[TurnSnapshot]:
+        """Replay a finished turn from the spill log and check it against its record.
+
+        Returns the replayed terminal snapshot, or None if the turn's events
+        are no longer available. Raises ValueError if the replay diverges.
+        """
+        record = self._archive.get(session_id, turn_id)
+        spilled = self._archive.load_spilled(record) if record is not None else None
+        if spilled is None:
+            return None
+        events, _ = spilled
+        replay = TurnRouter(latency_collector=LatencyCollector())
+        snapshot = replay.replay(session_id, turn_id, record.snapshot.correlation_id, events)
+        if snapshot is None or snapshot.deterministic_hash() != record.snapshot_hash:
+            raise ValueError(f"Replay of {(session_id, turn_id)} diverged from archived record")
+        return snapshot
+
     @property
     def latency(self) -> LatencyCollector:
         return self._latency
@@ -170,3 +325,7 @@ class TurnRouter:
     @property
     def cancel_registry(self) -> CancelRegistry:
         return self._cancel_registry
+
+    @property
+    def archive(self) -> TurnArchive:
+        return self._archive
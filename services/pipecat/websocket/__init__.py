@@ -1,5 +1,6 @@
 """WebSocket components for voice streaming."""
 
+from .framing import Codec, FrameType, decode_frame, encode_frame
 from .server import WebSocketServer
 
-__all__ = ["WebSocketServer"]
+__all__ = ["WebSocketServer", "Codec", "FrameType", "decode_frame", "encode_frame"]
@@ -0,0 +1,130 @@
+"""
+Binary Audio Framing for the Voice WebSocket
+
+Each binary WebSocket message is one frame:
+
+    offset  size  field
+    0       1     version     (FRAME_VERSION)
+    1       1     frame type  (FrameType)
+    2       1     codec       (Codec)
+    3       1     reserved
+    4       4     seq         uint32, per direction, wraps
+    8       8     timestamp   uint64, microseconds (sender clock)
+    16      ...   payload     raw PCM s16le mono, or one Opus packet
+
+All integers are little-endian. Control messages (interrupt, status,
+transcripts) stay JSON text frames.
+
+Opus support needs opuslib (libopus); it is imported on first use.
+"""
+
+import struct
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import List, Union
+
+FRAME_VERSION = 1
+HEADER = struct.Struct("<BBBxIQ")
+HEADER_SIZE = HEADER.size  # 16
+
+SAMPLE_RATE = 16000
+OPUS_FRAME_MS = 20
+OPUS_FRAME_SAMPLES = SAMPLE_RATE * OPUS_FRAME_MS // 1000
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class FrameType(IntEnum):
+    AUDIO = 1
+
+
+class Codec(IntEnum):
+    PCM = 0
+    OPUS = 1
+
+
+class FrameError(ValueError):
+    """Malformed binary frame."""
+
+
+@dataclass(frozen=True)
+class Frame:
+    """Decoded frame; payload is a view into the received message."""
+    type: FrameType
+    codec: Codec
+    seq: int
+    ts_us: int
+    payload: memoryview
+
+
+def now_us() -> int:
+    return time.monotonic_ns() // 1000
+
+
+def encode_frame(
+    payload: BytesLike,
+    seq: int,
+    ts_us: int,
+    frame_type: FrameType = FrameType.AUDIO,
+    codec: Codec = Codec.PCM,
+) -> bytes:
+    """Header + payload as one message (a single copy of the payload)."""
+    header = HEADER.pack(FRAME_VERSION, frame_type, codec, seq & 0xFFFFFFFF, ts_us)
+    return b"".join((header, payload))
+
+
+def decode_frame(data: BytesLike) -> Frame:
+    """Parse a binary frame without copying its payload."""
+    view = memoryview(data)
+    if len(view) < HEADER_SIZE:
+        raise FrameError(f"frame too short: {len(view)} bytes")
+    version, frame_type, codec, seq, ts_us = HEADER.unpack_from(view)
+    if version != FRAME_VERSION:
+        raise FrameError(f"unsupported frame version {version}")
+    try:
+        return Frame(FrameType(frame_type), Codec(codec), seq, ts_us, view[HEADER_SIZE:])
+    except ValueError as e:
+        raise FrameError(str(e)) from None
+
+
+class OpusCodec:
+    """20 ms Opus encoder/decoder pair for 16 kHz mono speech."""
+
+    def __init__(self, bitrate: int = 24000):
+        try:
+            import opuslib
+        except Exception as e:  # opuslib raises a bare Exception without libopus
+            raise ImportError(f"opuslib not available: {e}") from None
+        self._encoder = opuslib.Encoder(SAMPLE_RATE, 1, opuslib.APPLICATION_VOIP)
+        self._encoder.bitrate = bitrate
+        self._decoder = opuslib.Decoder(SAMPLE_RATE, 1)
+        self._pending = bytearray()  # PCM tail shorter than one Opus frame
+
+    def encode(self, pcm: BytesLike, final: bool = False) -> List[bytes]:
+        """PCM -> Opus packets, one per 20 ms; *final* pads and flushes the tail."""
+        frame_bytes = OPUS_FRAME_SAMPLES * 2
+        self._pending += pcm
+        if final and self._pending:
+            self._pending += bytes(-len(self._pending) % frame_bytes)
+        n = len(self._pending) // frame_bytes * frame_bytes
+        view = memoryview(self._pending)
+        packets = [
+            self._encoder.encode(bytes(view[i:i + frame_bytes]), OPUS_FRAME_SAMPLES)
+            for i in range(0, n, frame_bytes)
+        ]
+        view.release()
+        del self._pending[:n]
+        return packets
+
+    def decode(self, packet: BytesLike) -> bytes:
+        """One Opus packet -> PCM s16le."""
+        return self._decoder.decode(bytes(packet), OPUS_FRAME_SAMPLES)
+
+
+def opus_available() -> bool:
+    try:
+        import opuslib  # noqa: F401
+    except Exception:
+        return False
+    return True
@@ -2,20 +2,64 @@
 WebSocket Server for Voice Streaming
 
 Handles real-time bidirectional audio streaming with clients.
-Protocol: JSON messages with embedded audio frames.
+
+Protocol:
+    - Binary frames: 16-byte header + raw PCM or Opus (see framing.py).
+      A client that sends binary audio gets binary audio back, in the
+      codec of its last uplink frame.
+    - JSON text frames: control messages, and legacy base64 audio
+      ({"type": "audio", "data": "<base64>"}) for older clients.
 """
 
 import logging
-from typing import Set, Dict, Any
+from dataclasses import dataclass
+from typing import Set, Dict, Any, Optional
 from fastapi import WebSocket, WebSocketDisconnect
 import json
 import base64
 
 from ..pipeline.session_manager import SessionManager
+from .framing import (
+    Codec,
+    FrameError,
+    HEADER_SIZE,
+    OPUS_FRAME_MS,
+    OpusCodec,
+    decode_frame,
+    encode_frame,
+    now_us,
+    opus_available,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _Peer:
+    """Per-connection framing state and traffic counters."""
+    binary: bool = False
+    codec: Codec = Codec.PCM
+    opus: Optional[OpusCodec] = None
+    send_seq: int = 0
+    recv_seq: int = -1
+    frames_in: int = 0
+    frames_out: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    out_of_order: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "framing": "binary" if self.binary else "json",
+            "codec": self.codec.name.lower(),
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "out_of_order": self.out_of_order,
+        }
+
+
 class WebSocketServer:
     """WebSocket server for voice streaming."""
 
@@ -28,6 +72,7 @@ class WebSocketServer:
         """
         self.session_manager = session_manager
         self.connections: Dict[str, Set[WebSocket]] = {}  # session_id -> connections
+        self._peers: Dict[WebSocket, _Peer] = {}
 
     async def connect(
         self,
@@ -48,13 +93,16 @@ class WebSocketServer:
                 self.connections[session_id] = set()
             
             self.connections[session_id].add(websocket)
+            self._peers[websocket] = _Peer()
             logger.info(f"WebSocket connected: {session_id}")
             
             # Send connection confirmation
+            codecs = ["pcm", "opus"] if opus_available() else ["pcm"]
             await websocket.send_json({
                 "type": "connected",
                 "session_id": session_id,
                 "message": "Connected to Pipecat voice service",
+                "audio": {"framing": ["binary", "json"], "header_bytes": HEADER_SIZE, "codecs": codecs},
             })
             
         except Exception as e:
@@ -70,6 +118,7 @@ class WebSocketServer:
             websocket: WebSocket connection
         """
         try:
+            self._peers.pop(websocket, None)
             if session_id in self.connections:
                 self.connections[session_id].discard(websocket)
                 
@@ -85,7 +134,7 @@ class WebSocketServer:
         self,
         session_id: str,
         websocket: WebSocket,
-    ) -> bytes:
+    ):
         """
         Receive audio frame from client.
 
@@ -94,11 +143,24 @@ class WebSocketServer:
             websocket: WebSocket connection
 
         Returns:
-            Audio bytes
+            PCM audio as a bytes-like object; for binary PCM frames this is
+            a memoryview into the received message (no copy).
+
+        Raises:
+            WebSocketDisconnect: when the client goes away
         """
         try:
-            message = await websocket.receive_json()
-            
+            raw = await websocket.receive()
+            if raw.get("type") == "websocket.disconnect":
+                raise WebSocketDisconnect(raw.get("code", 1000))
+            if raw.get("bytes") is not None:
+                return self._receive_frame(websocket, raw["bytes"])
+
+            message = json.loads(raw.get("text") or "")
+            peer = self._peers.get(websocket)
+            if peer is not None:
+                peer.bytes_in += len(raw.get("text") or "")
+
             if message.get("type") == "audio":
                 # Audio is base64-encoded in JSON
                 audio_base64 = message.get("data", "")
@@ -113,6 +175,8 @@ class WebSocketServer:
                 logger.warning(f"Unknown message type: {message.get('type')}")
                 return b""
                 
+        except WebSocketDisconnect:
+            raise
         except json.JSONDecodeError:
             logger.error("Invalid JSON in WebSocket message")
             return b""
@@ -120,6 +184,49 @@ class WebSocketServer:
             logger.error(f"Receive error: {e}")
             return b""
 
+    def _receive_frame(self, websocket: WebSocket, data: bytes):
+        """Binary frame -> PCM (a view into *data* unless Opus-decoded)."""
+        peer = self._peers.setdefault(websocket, _Peer())
+        try:
+            frame = decode_frame(data)
+        except FrameError as e:
+            logger.warning(f"Dropping malformed audio frame: {e}")
+            return b""
+
+        peer.binary = True
+        peer.frames_in += 1
+        peer.bytes_in += len(data)
+        if peer.recv_seq >= 0 and (frame.seq - peer.recv_seq) & 0xFFFFFFFF > 0x7FFFFFFF:
+            peer.out_of_order += 1
+        peer.recv_seq = frame.seq
+
+        if frame.codec == Codec.OPUS:
+            if peer.opus is None:
+                try:
+                    peer.opus = OpusCodec()
+                except ImportError as e:
+                    logger.warning(f"Opus frame received but {e}")
+                    return b""
+            peer.codec = Codec.OPUS
+            return peer.opus.decode(frame.payload)
+
+        peer.codec = Codec.PCM
+        return frame.payload
+
+    def get_stats(self, session_id: str) -> Dict[str, Any]:
+        """Traffic counters for every connection of a session."""
+        peers = [
+            self._peers[ws].to_dict()
+            for ws in self.connections.get(session_id, ())
+            if ws in self._peers
+        ]
+        return {
+            "session_id": session_id,
+            "connections": peers,
+            "bytes_in": sum(p["bytes_in"] for p in peers),
+            "bytes_out": sum(p["bytes_out"] for p in peers),
+        }
+
     async def send_event(
         self,
         session_id: str,
@@ -160,6 +267,19 @@ class WebSocketServer:
             audio_bytes: Audio data
         """
         try:
+            legacy = []
+            for websocket in list(self.connections.get(session_id, ())):
+                peer = self._peers.get(websocket)
+                if peer is None or not peer.binary:
+                    legacy.append(websocket)
+                    continue
+                try:
+                    await self._send_frames(websocket, peer, audio_bytes)
+                except Exception as e:
+                    logger.error(f"Send error: {e}")
+            if not legacy:
+                return
+
             # Base64 encode audio
             audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
             
@@ -170,11 +290,35 @@ class WebSocketServer:
                 "timestamp": datetime.utcnow().isoformat() + "Z",
             }
             
-            await self.send_event(session_id, event)
+            text = json.dumps(event)
+            for websocket in legacy:
+                try:
+                    await websocket.send_text(text)
+                except Exception as e:
+                    logger.error(f"Send error: {e}")
+                    continue
+                peer = self._peers.get(websocket)
+                if peer is not None:
+                    peer.frames_out += 1
+                    peer.bytes_out += len(text)
             
         except Exception as e:
             logger.error(f"Audio send error: {e}")
 
+    async def _send_frames(self, websocket: WebSocket, peer: _Peer, audio_bytes: bytes) -> None:
+        """Send PCM to a binary-framing client, Opus-encoded if it uses Opus."""
+        if peer.codec == Codec.OPUS and peer.opus is not None:
+            payloads = peer.opus.encode(audio_bytes, final=True)
+        else:
+            payloads = [audio_bytes]
+        ts = now_us()
+        for i, payload in enumerate(payloads):
+            frame = encode_frame(payload, peer.send_seq, ts + i * OPUS_FRAME_MS * 1000, codec=peer.codec)
+            await websocket.send_bytes(frame)
+            peer.send_seq = (peer.send_seq + 1) & 0xFFFFFFFF
+            peer.frames_out += 1
+            peer.bytes_out += len(frame)
+
     async def send_transcript(
         self,
         session_id: str,
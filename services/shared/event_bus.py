@@ -4,8 +4,10 @@ Event Bus -- v2.7-m2
 In-process async event bus for inter-service communication.
 Dispatches EventEnvelopes to registered handlers with:
 
-  - Topic-based routing (subscribe by EventType pattern)
+  - Topic-based routing (subscribe by EventType pattern, cached per topic)
   - Async handler execution with timeout
+  - Optional queued delivery: per-subscriber bounded queue + worker task
+    with a drop-oldest / drop-newest / block overflow policy
   - Dead letter queue for failed deliveries
   - Correlation ID propagation
   - Bounded event history for diagnostics
@@ -17,6 +19,11 @@ Usage:
     bus.subscribe("perception.*", on_any_perception)
     await bus.publish(EventEnvelope(type="vision.frame.available", ...))
 
+Queued delivery (slow subscribers do not hold up the publisher or each other):
+    bus.subscribe("vision.frame.*", on_frame, delivery=DELIVERY_QUEUED,
+                  queue_size=8, overflow=OVERFLOW_DROP_OLDEST)
+    bus.publish_nowait({"type": "vision.frame.available", ...})  # hot producers
+
 HTTP bridge (for cross-process dispatch):
     bridge = HttpEventBridge(bus)
     bridge.register_target("perception", "http://127.0.0.1:7070/v1/perception/events")
@@ -35,6 +42,18 @@ from typing import Any, Callable, Coroutine, Dict, List, Optional, Set
 
 logger = logging.getLogger("sonia.event_bus")
 
+# Delivery modes
+DELIVERY_DIRECT = "direct"    # publish() awaits the handler inline
+DELIVERY_QUEUED = "queued"    # handler runs in the subscription's own worker
+
+# Overflow policies for queued subscriptions
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_DROP_NEWEST = "drop_newest"
+OVERFLOW_BLOCK = "block"      # publish() waits for room; publish_nowait() drops
+
+_DELIVERY_MODES = (DELIVERY_DIRECT, DELIVERY_QUEUED)
+_OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_DROP_NEWEST, OVERFLOW_BLOCK)
+
 
 @dataclass
 class EventRecord:
@@ -71,11 +90,17 @@ class EventBus:
       - "vision.*" matches "vision.frame.available", "vision.privacy.changed"
       - "perception.completed" matches exactly
       - "*" matches everything
+
+    Direct subscriptions (the default) are awaited one after another inside
+    publish(). Queued subscriptions get a bounded queue drained by their own
+    worker task, so publish() only enqueues and returns.
     """
 
     HANDLER_TIMEOUT_S = 10.0
     MAX_HISTORY = 500
     MAX_DEAD_LETTERS = 100
+    DEFAULT_QUEUE_SIZE = 100
+    MAX_MATCH_CACHE = 1024
 
     def __init__(self, name: str = "default"):
         self.name = name
@@ -85,70 +110,280 @@ class EventBus:
         self._total_published: int = 0
         self._total_delivered: int = 0
         self._total_failed: int = 0
+        self._total_dropped: int = 0
         self._started_at: float = time.time()
+        # event_type -> matching subscriptions; rebuilt lazily after
+        # subscribe/unsubscribe so each topic is glob-matched once
+        self._match_cache: Dict[str, List[_Subscription]] = {}
+        # Direct handlers scheduled by publish_nowait()
+        self._pending: Set[asyncio.Task] = set()
 
     def subscribe(
         self,
         pattern: str,
         handler: Handler,
         name: str = "",
+        delivery: str = DELIVERY_DIRECT,
+        queue_size: Optional[int] = None,
+        overflow: str = OVERFLOW_DROP_OLDEST,
     ) -> str:
-        """Subscribe a handler to events matching pattern. Returns subscription ID."""
+        """
+        Subscribe a handler to events matching pattern. Returns subscription ID.
+
+        Args:
+            pattern: glob over event types
+            handler: async callable receiving the event dict
+            name: label used in logs, dead letters and stats
+            delivery: DELIVERY_DIRECT or DELIVERY_QUEUED
+            queue_size: queued mode only; defaults to DEFAULT_QUEUE_SIZE
+            overflow: queued mode only; what to do when the queue is full
+        """
+        if delivery not in _DELIVERY_MODES:
+            raise ValueError(f"Unknown delivery mode: {delivery}")
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
         sub_id = f"sub_{uuid.uuid4().hex[:8]}"
         sub = _Subscription(
             id=sub_id,
             pattern=pattern,
             handler=handler,
             name=name or handler.__name__,
+            delivery=delivery,
+            queue_size=max(1, queue_size or self.DEFAULT_QUEUE_SIZE),
+            overflow=overflow,
         )
         self._subscriptions.append(sub)
-        logger.info("Subscribed %s to '%s' (id=%s)", sub.name, pattern, sub_id)
+        self._match_cache.clear()
+        logger.info(
+            "Subscribed %s to '%s' (id=%s, %s)", sub.name, pattern, sub_id, delivery,
+        )
         return sub_id
 
     def unsubscribe(self, sub_id: str) -> bool:
-        """Remove a subscription by ID."""
-        before = len(self._subscriptions)
+        """Remove a subscription by ID. A queued subscription's worker is cancelled."""
+        removed = [s for s in self._subscriptions if s.id == sub_id]
+        if not removed:
+            return False
         self._subscriptions = [s for s in self._subscriptions if s.id != sub_id]
-        return len(self._subscriptions) < before
+        self._match_cache.clear()
+        for sub in removed:
+            sub.stop()
+        return True
+
+    def _matching(self, event_type: str) -> List[_Subscription]:
+        matching = self._match_cache.get(event_type)
+        if matching is None:
+            matching = [s for s in self._subscriptions if s.matches(event_type)]
+            if len(self._match_cache) >= self.MAX_MATCH_CACHE:
+                self._match_cache.clear()
+            self._match_cache[event_type] = matching
+        return matching
 
     async def publish(self, event: Dict[str, Any]) -> int:
         """
         Publish an event to all matching subscribers.
-        Returns number of handlers that received the event.
+
+        Direct subscribers are awaited in turn; queued subscribers only have
+        the event enqueued (waiting for room under OVERFLOW_BLOCK).
+        Returns number of handlers that received (or queued) the event.
         """
         event_type = event.get("type", "")
         event_id = event.get("id", str(uuid.uuid4()))
-        source = event.get("source", "")
         correlation_id = event.get("correlation_id", "")
 
         self._total_published += 1
         t0 = time.monotonic()
 
-        # Find matching subscriptions
-        matching = [s for s in self._subscriptions if s.matches(event_type)]
-
         delivered = 0
         failed = 0
 
-        for sub in matching:
-            try:
-                await asyncio.wait_for(
-                    sub.handler(event),
-                    timeout=self.HANDLER_TIMEOUT_S,
-                )
+        for sub in self._matching(event_type):
+            if not sub.active:
+                continue
+            if sub.delivery == DELIVERY_QUEUED:
+                if await self._enqueue(sub, event, block=True):
+                    delivered += 1
+                continue
+            if await self._deliver(sub, event, event_id, event_type, correlation_id):
                 delivered += 1
-                self._total_delivered += 1
-            except asyncio.TimeoutError:
-                failed += 1
-                self._total_failed += 1
-                self._record_dead_letter(event_id, event_type, sub.name, "timeout", correlation_id)
-                logger.warning("Handler %s timed out for %s", sub.name, event_type)
-            except Exception as e:
+            else:
                 failed += 1
-                self._total_failed += 1
-                self._record_dead_letter(event_id, event_type, sub.name, str(e), correlation_id)
-                logger.warning("Handler %s failed for %s: %s", sub.name, event_type, e)
 
+        self._record_history(event, event_id, delivered, failed, t0)
+        return delivered
+
+    def publish_nowait(self, event: Dict[str, Any]) -> int:
+        """
+        Publish without awaiting any handler. Must run on the event loop.
+
+        Queued subscribers get the event enqueued under their overflow policy
+        (OVERFLOW_BLOCK drops instead of waiting). Direct subscribers are
+        scheduled as tasks, so their relative order is not guaranteed.
+        Returns number of subscribers the event was handed to.
+        """
+        event_type = event.get("type", "")
+        event_id = event.get("id", str(uuid.uuid4()))
+        correlation_id = event.get("correlation_id", "")
+
+        self._total_published += 1
+        t0 = time.monotonic()
+
+        accepted = 0
+        for sub in self._matching(event_type):
+            if not sub.active:
+                continue
+            if sub.delivery == DELIVERY_QUEUED:
+                if self._enqueue_nowait(sub, event):
+                    accepted += 1
+                continue
+            task = asyncio.get_running_loop().create_task(
+                self._deliver(sub, event, event_id, event_type, correlation_id),
+            )
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+            accepted += 1
+
+        self._record_history(event, event_id, accepted, 0, t0)
+        return accepted
+
+    async def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued event and scheduled handler has run.
+
+        Subscriptions stopped by close() or unsubscribe() are not waited on,
+        so draining a closed bus returns True at once. Returns False if
+        *timeout* expired first.
+        """
+        def _queued() -> List[_Subscription]:
+            return [s for s in self._subscriptions if s.active and s.queue is not None]
+
+        async def _wait() -> None:
+            while True:
+                waits = [s.queue.join() for s in _queued()]
+                pending = list(self._pending)
+                if not waits and not pending:
+                    return
+                await asyncio.gather(*waits, *pending, return_exceptions=True)
+                if not self._pending and all(s.queue.qsize() == 0 for s in _queued()):
+                    return
+
+        try:
+            await asyncio.wait_for(_wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self) -> None:
+        """Cancel all queued-delivery workers; undelivered events are discarded."""
+        tasks = []
+        for sub in self._subscriptions:
+            if sub.worker is not None:
+                tasks.append(sub.worker)
+            sub.stop()
+        tasks.extend(self._pending)
+        for task in self._pending:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _deliver(
+        self,
+        sub: _Subscription,
+        event: Dict[str, Any],
+        event_id: str,
+        event_type: str,
+        correlation_id: str,
+    ) -> bool:
+        """Run one handler with the timeout; failures go to the dead letter queue."""
+        try:
+            await asyncio.wait_for(
+                sub.handler(event),
+                timeout=self.HANDLER_TIMEOUT_S,
+            )
+            sub.delivered += 1
+            self._total_delivered += 1
+            return True
+        except asyncio.TimeoutError:
+            sub.failed += 1
+            self._total_failed += 1
+            self._record_dead_letter(event_id, event_type, sub.name, "timeout", correlation_id)
+            logger.warning("Handler %s timed out for %s", sub.name, event_type)
+        except Exception as e:
+            sub.failed += 1
+            self._total_failed += 1
+            self._record_dead_letter(event_id, event_type, sub.name, str(e), correlation_id)
+            logger.warning("Handler %s failed for %s: %s", sub.name, event_type, e)
+        return False
+
+    # ------------------------------------------------------------------
+    # Queued delivery
+    # ------------------------------------------------------------------
+
+    def _ensure_worker(self, sub: _Subscription) -> asyncio.Queue:
+        if sub.queue is None:
+            sub.queue = asyncio.Queue(maxsize=sub.queue_size)
+        if sub.worker is None or sub.worker.done():
+            sub.worker = asyncio.get_running_loop().create_task(
+                self._worker(sub), name=f"event_bus:{self.name}:{sub.name}",
+            )
+        return sub.queue
+
+    async def _enqueue(self, sub: _Subscription, event: Dict[str, Any], block: bool) -> bool:
+        queue = self._ensure_worker(sub)
+        if block and sub.overflow == OVERFLOW_BLOCK:
+            await queue.put((event, time.monotonic()))
+            sub.enqueued += 1
+            return True
+        return self._enqueue_nowait(sub, event)
+
+    def _enqueue_nowait(self, sub: _Subscription, event: Dict[str, Any]) -> bool:
+        queue = self._ensure_worker(sub)
+        if queue.full():
+            if sub.overflow != OVERFLOW_DROP_OLDEST:
+                self._drop(sub)
+                return False
+            queue.get_nowait()
+            queue.task_done()
+            self._drop(sub)
+        queue.put_nowait((event, time.monotonic()))
+        sub.enqueued += 1
+        return True
+
+    def _drop(self, sub: _Subscription) -> None:
+        sub.dropped += 1
+        self._total_dropped += 1
+        if sub.dropped == 1 or sub.dropped % 100 == 0:
+            logger.warning(
+                "Subscriber %s queue full (%d), %d events dropped",
+                sub.name, sub.queue_size, sub.dropped,
+            )
+
+    async def _worker(self, sub: _Subscription) -> None:
+        queue = sub.queue
+        while True:
+            event, enqueued_at = await queue.get()
+            try:
+                lag_ms = (time.monotonic() - enqueued_at) * 1000
+                sub.last_lag_ms = lag_ms
+                sub.max_lag_ms = max(sub.max_lag_ms, lag_ms)
+                await self._deliver(
+                    sub, event,
+                    event.get("id", ""), event.get("type", ""),
+                    event.get("correlation_id", ""),
+                )
+            finally:
+                queue.task_done()
+
+    def _record_history(
+        self,
+        event: Dict[str, Any],
+        event_id: str,
+        delivered: int,
+        failed: int,
+        t0: float,
+    ) -> None:
+        event_type = event.get("type", "")
+        source = event.get("source", "")
+        correlation_id = event.get("correlation_id", "")
         elapsed = (time.monotonic() - t0) * 1000
 
         # Record history
@@ -171,19 +406,19 @@ class EventBus:
             event_type, delivered, failed, elapsed,
         )
 
-        return delivered
-
     def get_stats(self) -> Dict[str, Any]:
-        """Return bus statistics."""
+        """Return bus statistics, including per-subscriber queue depth, lag and drops."""
         return {
             "name": self.name,
             "subscriptions": len(self._subscriptions),
             "total_published": self._total_published,
             "total_delivered": self._total_delivered,
             "total_failed": self._total_failed,
+            "total_dropped": self._total_dropped,
             "dead_letters": len(self._dead_letters),
             "history_size": len(self._history),
             "uptime_seconds": round(time.time() - self._started_at, 1),
+            "subscribers": {s.id: s.to_dict() for s in self._subscriptions},
         }
 
     def get_dead_letters(self, limit: int = 20) -> List[Dict[str, Any]]:
@@ -222,10 +457,48 @@ class _Subscription:
     pattern: str
     handler: Handler
     name: str
+    delivery: str = DELIVERY_DIRECT
+    queue_size: int = EventBus.DEFAULT_QUEUE_SIZE
+    overflow: str = OVERFLOW_DROP_OLDEST
+    queue: Optional[asyncio.Queue] = None
+    worker: Optional[asyncio.Task] = None
+    enqueued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    dropped: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+    active: bool = True
 
     def matches(self, event_type: str) -> bool:
         return fnmatch.fnmatch(event_type, self.pattern)
 
+    def stop(self) -> None:
+        self.active = False
+        if self.worker is not None and not self.worker.done():
+            self.worker.cancel()
+        self.worker = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {
+            "name": self.name,
+            "pattern": self.pattern,
+            "delivery": self.delivery,
+            "delivered": self.delivered,
+            "failed": self.failed,
+        }
+        if self.delivery == DELIVERY_QUEUED:
+            out.update({
+                "queue_size": self.queue_size,
+                "queue_depth": self.queue.qsize() if self.queue is not None else 0,
+                "overflow": self.overflow,
+                "enqueued": self.enqueued,
+                "dropped": self.dropped,
+                "lag_ms": round(self.last_lag_ms, 1),
+                "max_lag_ms": round(self.max_lag_ms, 1),
+            })
+        return out
+
 
 # ---------------------------------------------------------------------------
 # HTTP Event Bridge (cross-process dispatch)
@@ -0,0 +1,287 @@
+"""Shared-memory frame slab for SONIA vision.
+
+Fixed-slot ring of raw frame bytes in one preallocated shared-memory
+block. vision-capture owns and writes the slab; co-located readers
+(perception) attach by name and read frames by sequence number or slot
+index without HTTP or base64.
+
+Layout:
+  [ring header 64B][slot 0: header 64B | data slot_size B][slot 1 ...]
+
+Each slot header carries the sequence number of the frame it holds.
+Writers zero the slot sequence before touching the data and publish the
+new sequence last, so a reader that sees the same sequence before and
+after reading has an untorn frame (seqlock).
+"""
+
+import mmap
+import struct
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - platforms without shm support
+    shared_memory = None
+
+_MAGIC = b"SONIAFR1"
+# magic, slot_count, slot_size, head_seq, base_seq
+_RING_HDR = struct.Struct("<8sIIQQ")
+# seq, timestamp, width, height, size_bytes, frame_id
+_SLOT_HDR = struct.Struct("<QdIII16s")
+_SEQ = struct.Struct("<Q")
+_HDR_BYTES = 64
+_SLOT_HDR_BYTES = 64
+_HEAD_SEQ_OFFSET = 16
+_BASE_SEQ_OFFSET = 24
+
+
+class FrameRingError(Exception):
+    """Raised on slab layout mismatches or oversized frames."""
+
+
+@dataclass
+class FrameView:
+    """A frame in the slab. ``data`` is a zero-copy view into shared memory.
+
+    The view stays valid only until the writer laps the ring; call
+    ``is_valid()`` after consuming ``data`` or use ``tobytes()``.
+    """
+    seq: int
+    slot: int
+    frame_id: str
+    timestamp: float
+    width: int
+    height: int
+    size_bytes: int
+    data: memoryview
+    _ring: "SharedFrameRing"
+
+    def is_valid(self) -> bool:
+        return self._ring._slot_seq(self.slot) == self.seq
+
+    def tobytes(self) -> Optional[bytes]:
+        """Copy the frame out; None if it was overwritten or cleared meanwhile."""
+        raw = bytes(self.data)
+        return raw if self.is_valid() else None
+
+
+class SharedFrameRing:
+    """
+    Single-writer, multi-reader ring of raw frames in shared memory.
+
+    Create with ``create=True`` in the owning process; other processes use
+    ``SharedFrameRing.attach(name)``. When shared memory is unavailable the
+    owner falls back to an anonymous mmap (same API, in-process only).
+    """
+
+    def __init__(
+        self,
+        slot_count: int,
+        slot_size: int,
+        name: Optional[str] = None,
+        create: bool = True,
+    ):
+        self._lock = threading.Lock()
+        self._shm = None
+        self._mmap = None
+        self._owner = create
+        if create:
+            self.slot_count = slot_count
+            self.slot_size = slot_size
+            size = _HDR_BYTES + slot_count * (_SLOT_HDR_BYTES + slot_size)
+            self._shm = _create_shm(name, size)
+            if self._shm is not None:
+                self._buf = self._shm.buf
+            else:
+                self._mmap = mmap.mmap(-1, size)
+                self._buf = memoryview(self._mmap)
+            _RING_HDR.pack_into(self._buf, 0, _MAGIC, slot_count, slot_size, 0, 0)
+        else:
+            if shared_memory is None or not name:
+                raise FrameRingError("shared memory is not available")
+            self._shm = _attach_shm(name)
+            self._buf = self._shm.buf
+            magic, self.slot_count, self.slot_size, _, _ = _RING_HDR.unpack_from(self._buf, 0)
+            if magic != _MAGIC:
+                self.close()
+                raise FrameRingError(f"unexpected frame slab layout in {name!r}")
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Attach read-side to an existing slab created by another process."""
+        return cls(0, 0, name=name, create=False)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Shared-memory name, or None for the in-process mmap fallback."""
+        return self._shm.name if self._shm is not None else None
+
+    @property
+    def head_seq(self) -> int:
+        """Sequence number of the newest frame (0 when nothing was written)."""
+        return _SEQ.unpack_from(self._buf, _HEAD_SEQ_OFFSET)[0]
+
+    @property
+    def base_seq(self) -> int:
+        """Frames at or below this sequence were cleared."""
+        return _SEQ.unpack_from(self._buf, _BASE_SEQ_OFFSET)[0]
+
+    def slot_for(self, seq: int) -> int:
+        return (seq - 1) % self.slot_count
+
+    def _slot_offset(self, slot: int) -> int:
+        return _HDR_BYTES + slot * (_SLOT_HDR_BYTES + self.slot_size)
+
+    def _slot_seq(self, slot: int) -> int:
+        return _SEQ.unpack_from(self._buf, self._slot_offset(slot))[0]
+
+    # ------------------------------------------------------------------
+    # Write side (owner only)
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        data: bytes,
+        width: int,
+        height: int,
+        timestamp: float,
+        frame_id: Optional[str] = None,
+    ) -> Tuple[int, int]:
+        """Copy *data* into the next slot. Returns (seq, slot)."""
+        size = len(data)
+        if size > self.slot_size:
+            raise FrameRingError(f"frame of {size} bytes exceeds slot size {self.slot_size}")
+        fid = uuid.UUID(frame_id) if frame_id else uuid.uuid4()
+        with self._lock:
+            seq = self.head_seq + 1
+            slot = self.slot_for(seq)
+            off = self._slot_offset(slot)
+            _SEQ.pack_into(self._buf, off, 0)
+            start = off + _SLOT_HDR_BYTES
+            self._buf[start:start + size] = data
+            _SLOT_HDR.pack_into(self._buf, off, 0, timestamp, width, height, size, fid.bytes)
+            _SEQ.pack_into(self._buf, off, seq)
+            _SEQ.pack_into(self._buf, _HEAD_SEQ_OFFSET, seq)
+        return seq, slot
+
+    def clear(self) -> None:
+        """Zero every used slot so no frame bytes survive in the slab."""
+        with self._lock:
+            for slot in range(self.slot_count):
+                off = self._slot_offset(slot)
+                seq, _, _, _, size, _ = _SLOT_HDR.unpack_from(self._buf, off)
+                if seq == 0 and size == 0:
+                    continue
+                _SEQ.pack_into(self._buf, off, 0)
+                start = off + _SLOT_HDR_BYTES
+                self._buf[start:start + size] = bytes(size)
+                self._buf[off:off + _SLOT_HDR_BYTES] = bytes(_SLOT_HDR_BYTES)
+            _SEQ.pack_into(self._buf, _BASE_SEQ_OFFSET, self.head_seq)
+
+    # ------------------------------------------------------------------
+    # Read side
+    # ------------------------------------------------------------------
+
+    def read(self, seq: int) -> Optional[FrameView]:
+        """Frame with sequence *seq*, or None if it was overwritten or cleared."""
+        if seq <= 0 or seq <= self.base_seq:
+            return None
+        view = self.read_slot(self.slot_for(seq))
+        if view is None or view.seq != seq:
+            return None
+        return view
+
+    def read_slot(self, slot: int) -> Optional[FrameView]:
+        """Whatever frame currently occupies *slot*, or None if empty."""
+        if not 0 <= slot < self.slot_count:
+            raise IndexError(f"slot {slot} out of range (0..{self.slot_count - 1})")
+        off = self._slot_offset(slot)
+        seq, ts, width, height, size, fid = _SLOT_HDR.unpack_from(self._buf, off)
+        if seq == 0:
+            return None
+        start = off + _SLOT_HDR_BYTES
+        view = FrameView(
+            seq=seq,
+            slot=slot,
+            frame_id=str(uuid.UUID(bytes=fid)),
+            timestamp=ts,
+            width=width,
+            height=height,
+            size_bytes=size,
+            data=self._buf[start:start + size],
+            _ring=self,
+        )
+        # Header must not have changed underneath us
+        return view if view.is_valid() else None
+
+    def latest(self, n: int = 1) -> List[FrameView]:
+        """Up to *n* newest frames, oldest first."""
+        head = self.head_seq
+        lowest = max(self.base_seq + 1, head - min(n, self.slot_count) + 1, 1)
+        frames = []
+        for seq in range(lowest, head + 1):
+            view = self.read(seq)
+            if view is not None:
+                frames.append(view)
+        return frames
+
+    def close(self) -> None:
+        """Release this handle; the owner also unlinks the shared block."""
+        if self._mmap is not None:
+            self._buf.release()
+        self._buf = None
+        if self._shm is not None:
+            try:
+                self._shm.close()
+            except BufferError:
+                # Outstanding FrameViews still reference the block
+                pass
+            if self._owner:
+                try:
+                    self._shm.unlink()
+                except FileNotFoundError:
+                    pass
+            self._shm = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
+
+
+def _create_shm(name: Optional[str], size: int):
+    if shared_memory is None:
+        return None
+    try:
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    except FileExistsError:
+        # Stale block left by a crashed writer: replace it
+        stale = _attach_shm(name)
+        stale.close()
+        try:
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        return shared_memory.SharedMemory(name=name, create=True, size=size)
+    except OSError:
+        return None
+
+
+def _attach_shm(name: str):
+    try:
+        return shared_memory.SharedMemory(name=name, create=False, track=False)
+    except TypeError:
+        pass
+    # Python < 3.13: keep the resource tracker from registering (and later
+    # unlinking) the owner's block when this reader exits.
+    from multiprocessing import resource_tracker
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name, create=False)
+    finally:
+        resource_tracker.register = register
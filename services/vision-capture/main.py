@@ -8,13 +8,31 @@ Zero-frame invariant: when privacy is disabled, the buffer is cleared,
 writes are rejected (403), reads return empty/forbidden, and no stale
 data can leak through any endpoint.
 
+Frames are held as raw bytes in a preallocated shared-memory slab
+(see shared/frame_ring.py). Binary ingest (raw POST body or WebSocket)
+avoids base64 entirely; co-located readers attach to the slab named in
+/v1/vision/privacy/status and read frames by sequence number.
+
+Privacy subscribers (POST /v1/vision/privacy/subscribe) are pushed the
+privacy status whenever privacy or capture mode changes. Callbacks must be
+loopback or listed in SONIA_PRIVACY_CALLBACK_URLS; each push carries the
+subscriber's token, and a subscriber whose push fails is dropped.
+
+Frame subscribers (WebSocket /v1/vision/frames/subscribe) are pushed frame
+metadata as frames arrive, downsampled to their requested max_fps, and
+fetch bytes on demand ({"op": "get", "seq": N} on the socket, GET
+/v1/vision/frames/{seq}/raw, or the shared slab). Clearing the buffer
+(privacy off, mode off, DELETE) pushes a "cleared" message at once.
+
 Port: 7060 | Health: /healthz
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
+import os
 import time
 import uuid
 from collections import deque
@@ -22,14 +40,18 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
+from urllib.parse import urlsplit
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+import httpx
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import Response
+from pydantic import BaseModel, Field
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "shared"))
 from version import SONIA_VERSION, SONIA_CONTRACT
+from frame_ring import SharedFrameRing
 
 logger = logging.getLogger("vision-capture")
 
@@ -43,6 +65,16 @@ ACTIVE_FPS = 10.0
 AMBIENT_RESOLUTION = (320, 240)
 ACTIVE_RESOLUTION = (640, 480)
 MAX_FRAME_BYTES = 1 * 1024 * 1024
+PRIVACY_NOTIFY_TIMEOUT_S = 2.0
+MAX_PRIVACY_SUBSCRIBERS = 8
+# Non-loopback callback URLs accepted for privacy pushes (comma-separated)
+PRIVACY_CALLBACK_URLS = frozenset(
+    u.strip() for u in os.environ.get("SONIA_PRIVACY_CALLBACK_URLS", "").split(",") if u.strip()
+)
+_LOOPBACK_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+FRAME_SUBSCRIBER_QUEUE = 32
+# Shared-memory slab name; unset -> a unique name published via privacy status
+FRAME_SLAB_NAME = os.environ.get("SONIA_VISION_FRAME_SLAB") or None
 
 
 class CaptureMode(str, Enum):
@@ -66,27 +98,88 @@ class Frame:
     timestamp: float
     width: int
     height: int
-    data_b64: str
     size_bytes: int
     mode: CaptureMode
+    seq: int
+    slot: int
 
 
 class RingBuffer:
-    def __init__(self, maxlen: int = RING_BUFFER_MAX_FRAMES):
+    """
+    Frame metadata ring backed by a fixed-slot shared-memory byte slab.
+
+    The slab (maxlen x MAX_FRAME_BYTES) is allocated by open(), called at
+    service startup (or on the first write), and unlinked by close().
+    """
+
+    def __init__(self, maxlen: int = RING_BUFFER_MAX_FRAMES, slab_name: Optional[str] = FRAME_SLAB_NAME):
         self._buf: deque[Frame] = deque(maxlen=maxlen)
+        self._slab_name = slab_name
+        self._slab: Optional[SharedFrameRing] = None
+
+    def open(self) -> SharedFrameRing:
+        if self._slab is None:
+            self._slab = SharedFrameRing(
+                slot_count=self._buf.maxlen, slot_size=MAX_FRAME_BYTES, name=self._slab_name
+            )
+        return self._slab
 
-    def push(self, frame: Frame) -> None:
+    @property
+    def slab_name(self) -> Optional[str]:
+        return self._slab.name if self._slab is not None else None
+
+    def push(self, raw: bytes, width: int, height: int, timestamp: float, mode: CaptureMode) -> Frame:
+        frame_id = str(uuid.uuid4())
+        seq, slot = self.open().write(raw, width, height, timestamp, frame_id)
+        frame = Frame(
+            frame_id=frame_id,
+            timestamp=timestamp,
+            width=width,
+            height=height,
+            size_bytes=len(raw),
+            mode=mode,
+            seq=seq,
+            slot=slot,
+        )
         self._buf.append(frame)
+        return frame
 
     def latest(self, n: int = 1) -> list[Frame]:
         items = list(self._buf)
         return items[-n:] if n <= len(items) else items
 
+    def since(self, seq: int) -> list[Frame]:
+        """Buffered frames with a sequence number above *seq*, oldest first."""
+        return [f for f in self._buf if f.seq > seq]
+
+    def get(self, seq: int) -> Optional[Frame]:
+        for f in reversed(self._buf):
+            if f.seq == seq:
+                return f
+            if f.seq < seq:
+                break
+        return None
+
+    def data(self, frame: Frame) -> Optional[bytes]:
+        """Raw bytes for *frame*; None once its slot was reused or cleared."""
+        if self._slab is None:
+            return None
+        view = self._slab.read(frame.seq)
+        return view.tobytes() if view is not None else None
+
     def clear(self) -> int:
         count = len(self._buf)
         self._buf.clear()
+        if self._slab is not None:
+            self._slab.clear()
         return count
 
+    def close(self) -> None:
+        self._buf.clear()
+        if self._slab is not None:
+            self._slab.close()
+            self._slab = None
+
     def __len__(self) -> int:
         return len(self._buf)
 
@@ -97,6 +190,73 @@ class RingBuffer:
         return self._buf[-1].timestamp - self._buf[0].timestamp
 
 
+def _frame_meta(f: Frame) -> dict:
+    return {
+        "frame_id": f.frame_id,
+        "seq": f.seq,
+        "timestamp": f.timestamp,
+        "width": f.width,
+        "height": f.height,
+        "size_bytes": f.size_bytes,
+        "mode": f.mode.value,
+    }
+
+
+class FrameSubscriber:
+    """
+    One push subscription. Frame notifications sit in a bounded deque (the
+    oldest is dropped when the consumer lags); control messages are never
+    dropped, and a "cleared" message discards any queued frame notifications.
+    """
+
+    def __init__(self, max_fps: float = 0.0, queue_size: int = FRAME_SUBSCRIBER_QUEUE):
+        self.max_fps = max_fps
+        self._frames: deque[dict] = deque(maxlen=max(1, queue_size))
+        self._control: deque[dict] = deque()
+        self._wake = asyncio.Event()
+        self._last_ts: float = 0.0
+        self.sent: int = 0
+        self.skipped_fps: int = 0
+        self.dropped: int = 0
+
+    def offer(self, frame: Frame) -> bool:
+        """Queue a frame notification unless max_fps says to skip it."""
+        if self.max_fps > 0 and self._last_ts and frame.timestamp - self._last_ts < 1.0 / self.max_fps:
+            self.skipped_fps += 1
+            return False
+        self._last_ts = frame.timestamp
+        if len(self._frames) == self._frames.maxlen:
+            self.dropped += 1
+        self._frames.append({"type": "frame", **_frame_meta(frame)})
+        self._wake.set()
+        return True
+
+    def push(self, message: dict) -> None:
+        if message.get("type") == "cleared":
+            self._frames.clear()
+            self._last_ts = 0.0
+        self._control.append(message)
+        self._wake.set()
+
+    async def next_batch(self) -> list[dict]:
+        """Wait for messages; control messages come before frames."""
+        await self._wake.wait()
+        self._wake.clear()
+        batch = list(self._control) + list(self._frames)
+        self._control.clear()
+        self._frames.clear()
+        return batch
+
+    def to_dict(self) -> dict:
+        return {
+            "max_fps": self.max_fps,
+            "queued": len(self._frames),
+            "sent": self.sent,
+            "skipped_fps": self.skipped_fps,
+            "dropped": self.dropped,
+        }
+
+
 # ---------------------------------------------------------------------------
 # Service state
 # ---------------------------------------------------------------------------
@@ -116,6 +276,11 @@ class VisionCaptureState:
         self.privacy_toggle_count: int = 0
         self.mode_toggle_count: int = 0
         self.started_at: float = time.time()
+        # Privacy push subscriptions (callback URL -> token); status_seq orders pushes
+        self.instance_id: str = str(uuid.uuid4())
+        self.privacy_subscribers: dict[str, str] = {}
+        self.privacy_status_seq: int = 0
+        self.frame_subscribers: set[FrameSubscriber] = set()
 
     @property
     def capture_allowed(self) -> bool:
@@ -136,14 +301,41 @@ class VisionCaptureState:
         return AMBIENT_RESOLUTION
 
     def enforce_privacy_off(self) -> int:
-        cleared = self.buffer.clear()
+        cleared = self.clear_frames("privacy_disabled")
         self.mode = CaptureMode.OFF
         self.last_frame_time = 0.0
         return cleared
 
+    def clear_frames(self, reason: str) -> int:
+        """Clear the buffer and tell frame subscribers immediately."""
+        cleared = self.buffer.clear()
+        self.broadcast({"type": "cleared", "reason": reason, "buffer_frames": 0})
+        return cleared
+
+    def publish_frame(self, frame: Frame) -> None:
+        for sub in self.frame_subscribers:
+            sub.offer(frame)
+
+    def broadcast(self, message: dict) -> None:
+        for sub in self.frame_subscribers:
+            sub.push(message)
 
+
+# Replaced by a fresh state (with its frame slab open) for each app lifespan
 state = VisionCaptureState()
 
+_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_http() -> httpx.AsyncClient:
+    global _http
+    if _http is None or _http.is_closed:
+        _http = httpx.AsyncClient(
+            timeout=PRIVACY_NOTIFY_TIMEOUT_S,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        )
+    return _http
+
 
 # ---------------------------------------------------------------------------
 # Lifecycle
@@ -151,10 +343,18 @@ state = VisionCaptureState()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global state
     logger.info("Vision capture starting (privacy=DISABLED, mode=OFF)")
+    state.buffer.close()
+    state = VisionCaptureState()
+    state.buffer.open()
     state.enforce_privacy_off()
     yield
     state.enforce_privacy_off()
+    # Unlinks the shared-memory slab
+    state.buffer.close()
+    if _http is not None and not _http.is_closed:
+        await _http.aclose()
     logger.info("Vision capture stopped, buffer cleared")
 
 
@@ -173,6 +373,11 @@ class ModeChangeRequest(BaseModel):
     mode: CaptureMode
 
 
+class PrivacySubscribeRequest(BaseModel):
+    callback_url: str
+    token: str = Field(min_length=16, max_length=256)
+
+
 class IngestFrameRequest(BaseModel):
     data_b64: str
     width: int = 640
@@ -206,8 +411,7 @@ async def health_alias():
 # Routes: privacy control
 # ---------------------------------------------------------------------------
 
-@app.get("/v1/vision/privacy/status")
-async def get_privacy_status():
+def _privacy_status() -> dict:
     return {
         "privacy": state.privacy.value,
         "capture_allowed": state.capture_allowed,
@@ -215,14 +419,84 @@ async def get_privacy_status():
         "buffer_frames": len(state.buffer),
         "toggle_count": state.privacy_toggle_count,
         "zero_frame_enforced": state.privacy == PrivacyState.DISABLED,
+        # Co-located readers attach here; withheld while privacy is off
+        "frame_slab": state.buffer.slab_name if state.privacy == PrivacyState.ENABLED else None,
+        "instance_id": state.instance_id,
+        "status_seq": state.privacy_status_seq,
     }
 
 
+def _callback_allowed(url: str) -> bool:
+    """Privacy pushes only go to loopback or explicitly configured services."""
+    if url in PRIVACY_CALLBACK_URLS:
+        return True
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    return parts.scheme in ("http", "https") and parts.hostname in _LOOPBACK_HOSTS
+
+
+async def _push_privacy_status(status: dict) -> None:
+    """
+    Push to every subscriber. A subscriber whose push fails is dropped, so
+    it stays on its short poll TTL until it re-subscribes.
+    """
+    client = _get_http()
+
+    async def _send(url: str, token: str) -> None:
+        try:
+            resp = await client.post(url, json=status, headers={"X-Privacy-Token": token})
+            resp.raise_for_status()
+        except Exception as e:
+            logger.warning(f"Privacy push to {url} failed, dropping subscriber: {e}")
+            if state.privacy_subscribers.get(url) == token:
+                del state.privacy_subscribers[url]
+
+    await asyncio.gather(*(_send(url, token) for url, token in list(state.privacy_subscribers.items())))
+
+
+def _privacy_changed() -> None:
+    """Bump the status sequence and notify subscribers in the background."""
+    state.privacy_status_seq += 1
+    if state.frame_subscribers:
+        state.broadcast({"type": "privacy", **_privacy_status()})
+    if state.privacy_subscribers:
+        asyncio.get_running_loop().create_task(_push_privacy_status(_privacy_status()))
+
+
+@app.get("/v1/vision/privacy/status")
+async def get_privacy_status():
+    return _privacy_status()
+
+
+@app.post("/v1/vision/privacy/subscribe")
+async def subscribe_privacy(req: PrivacySubscribeRequest):
+    """Register (or renew) a callback for privacy pushes. Returns the current status."""
+    if not _callback_allowed(req.callback_url):
+        raise HTTPException(400, "PRIVACY_CALLBACK_NOT_ALLOWED")
+    if (
+        req.callback_url not in state.privacy_subscribers
+        and len(state.privacy_subscribers) >= MAX_PRIVACY_SUBSCRIBERS
+    ):
+        raise HTTPException(429, "PRIVACY_SUBSCRIBERS_FULL")
+    state.privacy_subscribers[req.callback_url] = req.token
+    return _privacy_status()
+
+
+@app.post("/v1/vision/privacy/unsubscribe")
+async def unsubscribe_privacy(req: PrivacySubscribeRequest):
+    if state.privacy_subscribers.get(req.callback_url) == req.token:
+        del state.privacy_subscribers[req.callback_url]
+    return {"subscribers": len(state.privacy_subscribers)}
+
+
 @app.post("/v1/vision/privacy/enable")
 async def enable_privacy():
     old = state.privacy
     state.privacy = PrivacyState.ENABLED
     state.privacy_toggle_count += 1
+    _privacy_changed()
     logger.info("Privacy ENABLED")
     return {"old": old.value, "new": state.privacy.value, "mode": state.mode.value}
 
@@ -233,6 +507,7 @@ async def disable_privacy():
     state.privacy = PrivacyState.DISABLED
     state.privacy_toggle_count += 1
     cleared = state.enforce_privacy_off()
+    _privacy_changed()
     logger.info(f"Privacy DISABLED -> cleared {cleared} frames, mode OFF")
     return {
         "old": old.value,
@@ -261,7 +536,9 @@ async def set_mode_explicit(req: ModeChangeRequest):
     state.mode = req.mode
     state.mode_toggle_count += 1
     if req.mode == CaptureMode.OFF:
-        state.buffer.clear()
+        state.clear_frames("mode_off")
+    if old != state.mode:
+        _privacy_changed()
     return {"old": old.value, "new": state.mode.value}
 
 
@@ -289,8 +566,8 @@ async def buffer_stats():
 # Routes: frame ingestion
 # ---------------------------------------------------------------------------
 
-@app.post("/v1/vision/frames")
-async def ingest_frame(req: IngestFrameRequest):
+def _check_ingest_allowed() -> None:
+    """Privacy and mode gates, applied before any frame bytes are touched."""
     # Privacy hard gate (first check, always)
     if state.privacy == PrivacyState.DISABLED:
         state.frames_rejected += 1
@@ -302,43 +579,85 @@ async def ingest_frame(req: IngestFrameRequest):
         state.frames_rejected_mode += 1
         raise HTTPException(400, "CAPTURE_OFF: activate ambient or active mode first")
 
-    try:
-        raw = base64.b64decode(req.data_b64)
-    except Exception:
-        state.frames_rejected += 1
-        raise HTTPException(400, "INVALID_BASE64: could not decode frame data")
+
+def _accept_frame(raw: bytes, width: int, height: int, timestamp: Optional[float]) -> dict:
+    """Gate and store one raw frame. Raises HTTPException on rejection."""
+    _check_ingest_allowed()
 
     if len(raw) > MAX_FRAME_BYTES:
         state.frames_rejected += 1
         state.frames_rejected_size += 1
         raise HTTPException(413, f"FRAME_TOO_LARGE: {len(raw)} bytes (max {MAX_FRAME_BYTES})")
 
-    now = req.timestamp or time.time()
+    now = timestamp or time.time()
     min_interval = 1.0 / state.target_fps if state.target_fps > 0 else 0
     if min_interval > 0 and state.last_frame_time and (now - state.last_frame_time) < min_interval * 0.8:
         state.frames_rejected += 1
         state.frames_rejected_rate += 1
         raise HTTPException(429, "RATE_LIMITED: frames arriving too fast")
 
-    frame = Frame(
-        frame_id=str(uuid.uuid4()),
-        timestamp=now,
-        width=req.width,
-        height=req.height,
-        data_b64=req.data_b64,
-        size_bytes=len(raw),
-        mode=state.mode,
-    )
-    state.buffer.push(frame)
+    frame = state.buffer.push(raw, width, height, now, state.mode)
     state.frames_captured += 1
     state.last_frame_time = now
+    state.publish_frame(frame)
     return {
         "frame_id": frame.frame_id,
+        "seq": frame.seq,
         "buffer_frames": len(state.buffer),
         "buffer_duration_seconds": round(state.buffer.duration_seconds, 2),
     }
 
 
+@app.post("/v1/vision/frames")
+async def ingest_frame(req: IngestFrameRequest):
+    _check_ingest_allowed()
+    try:
+        raw = base64.b64decode(req.data_b64)
+    except Exception:
+        state.frames_rejected += 1
+        raise HTTPException(400, "INVALID_BASE64: could not decode frame data")
+    return _accept_frame(raw, req.width, req.height, req.timestamp)
+
+
+@app.post("/v1/vision/frames/raw")
+async def ingest_frame_raw(
+    request: Request,
+    width: int = 640,
+    height: int = 480,
+    timestamp: Optional[float] = None,
+):
+    """Binary ingest: the request body is the encoded frame (no base64)."""
+    _check_ingest_allowed()
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > MAX_FRAME_BYTES:
+        state.frames_rejected += 1
+        state.frames_rejected_size += 1
+        raise HTTPException(413, f"FRAME_TOO_LARGE: {declared} bytes (max {MAX_FRAME_BYTES})")
+    raw = await request.body()
+    return _accept_frame(raw, width, height, timestamp)
+
+
+@app.websocket("/v1/vision/frames/ws")
+async def ingest_frames_ws(ws: WebSocket, width: int = 640, height: int = 480):
+    """
+    Binary ingest stream: each binary message is one frame. Every frame is
+    acknowledged with the same JSON body as POST /v1/vision/frames, or
+    {"error", "status"} when it is rejected.
+    """
+    await ws.accept()
+    try:
+        while True:
+            raw = await ws.receive_bytes()
+            try:
+                ack = _accept_frame(raw, width, height, None)
+            except HTTPException as e:
+                await ws.send_json({"error": e.detail, "status": e.status_code})
+                continue
+            await ws.send_json(ack)
+    except WebSocketDisconnect:
+        pass
+
+
 # ---------------------------------------------------------------------------
 # Routes: frame retrieval (zero-frame on privacy off)
 # ---------------------------------------------------------------------------
@@ -350,22 +669,24 @@ async def get_latest_frames(n: int = 1):
         return {"count": 0, "frames": [], "privacy": "disabled"}
     if state.mode == CaptureMode.OFF:
         return {"count": 0, "frames": [], "mode": "off"}
-    frames = state.buffer.latest(n)
-    return {
-        "count": len(frames),
-        "frames": [
+    frames = []
+    for f in state.buffer.latest(n):
+        raw = state.buffer.data(f)
+        if raw is None:
+            continue
+        frames.append(
             {
                 "frame_id": f.frame_id,
+                "seq": f.seq,
                 "timestamp": f.timestamp,
                 "width": f.width,
                 "height": f.height,
                 "size_bytes": f.size_bytes,
                 "mode": f.mode.value,
-                "data_b64": f.data_b64,
+                "data_b64": base64.b64encode(raw).decode("ascii"),
             }
-            for f in frames
-        ],
-    }
+        )
+    return {"count": len(frames), "frames": frames}
 
 
 @app.get("/v1/vision/frame/latest")
@@ -377,20 +698,145 @@ async def get_single_latest():
     if not frames:
         raise HTTPException(404, "NO_FRAMES: buffer is empty")
     f = frames[0]
+    raw = state.buffer.data(f)
+    if raw is None:
+        raise HTTPException(404, "NO_FRAMES: buffer is empty")
     return {
         "frame_id": f.frame_id,
+        "seq": f.seq,
         "timestamp": f.timestamp,
         "width": f.width,
         "height": f.height,
         "size_bytes": f.size_bytes,
         "mode": f.mode.value,
-        "data_b64": f.data_b64,
+        "data_b64": base64.b64encode(raw).decode("ascii"),
     }
 
 
+@app.get("/v1/vision/frame/latest/raw")
+async def get_single_latest_raw():
+    """Latest frame as raw bytes; metadata travels in X-Frame-* headers."""
+    if state.privacy == PrivacyState.DISABLED:
+        raise HTTPException(403, "PRIVACY_DISABLED: cannot read frames")
+    frames = state.buffer.latest(1)
+    raw = state.buffer.data(frames[0]) if frames else None
+    if raw is None:
+        raise HTTPException(404, "NO_FRAMES: buffer is empty")
+    f = frames[0]
+    return Response(
+        content=raw,
+        media_type="application/octet-stream",
+        headers={
+            "X-Frame-Id": f.frame_id,
+            "X-Frame-Seq": str(f.seq),
+            "X-Frame-Timestamp": repr(f.timestamp),
+            "X-Frame-Width": str(f.width),
+            "X-Frame-Height": str(f.height),
+            "X-Frame-Mode": f.mode.value,
+        },
+    )
+
+
+@app.get("/v1/vision/frames/{seq}/raw")
+async def get_frame_raw(seq: int):
+    """Bytes of one frame by sequence number (fetch-on-demand for subscribers)."""
+    if state.privacy == PrivacyState.DISABLED:
+        raise HTTPException(403, "PRIVACY_DISABLED: cannot read frames")
+    f = state.buffer.get(seq)
+    raw = state.buffer.data(f) if f is not None else None
+    if raw is None:
+        raise HTTPException(404, f"FRAME_GONE: frame {seq} is no longer buffered")
+    return Response(
+        content=raw,
+        media_type="application/octet-stream",
+        headers={
+            "X-Frame-Id": f.frame_id,
+            "X-Frame-Seq": str(f.seq),
+            "X-Frame-Timestamp": repr(f.timestamp),
+            "X-Frame-Width": str(f.width),
+            "X-Frame-Height": str(f.height),
+            "X-Frame-Mode": f.mode.value,
+        },
+    )
+
+
+@app.websocket("/v1/vision/frames/subscribe")
+async def subscribe_frames(
+    ws: WebSocket,
+    max_fps: float = 0.0,
+    since_seq: int = 0,
+    queue_size: int = FRAME_SUBSCRIBER_QUEUE,
+):
+    """
+    Push subscription for frame metadata.
+
+    Server -> client (JSON):
+      {"type": "hello", "head_seq", "oldest_seq", "privacy", "mode", "frame_slab", ...}
+      {"type": "frame", "seq", "frame_id", "timestamp", "width", "height", ...}
+      {"type": "cleared", "reason", "buffer_frames": 0}
+      {"type": "privacy", ...privacy status...}
+      {"type": "data", "seq", "found"} -- followed by one binary message if found
+    Client -> server (JSON):
+      {"op": "get", "seq": N}       request frame bytes
+      {"op": "set_fps", "max_fps"}  change downsampling
+
+    since_seq > 0 replays buffered frames newer than that sequence first.
+    """
+    await ws.accept()
+    sub = FrameSubscriber(max_fps=max_fps, queue_size=queue_size)
+    frames = state.buffer.latest(RING_BUFFER_MAX_FRAMES)
+    await ws.send_json({
+        "type": "hello",
+        "head_seq": frames[-1].seq if frames else 0,
+        "oldest_seq": frames[0].seq if frames else 0,
+        **_privacy_status(),
+    })
+    if since_seq > 0 and state.privacy == PrivacyState.ENABLED:
+        for f in state.buffer.since(since_seq):
+            sub.offer(f)
+    state.frame_subscribers.add(sub)
+
+    async def _send() -> None:
+        while True:
+            for message in await sub.next_batch():
+                if message["type"] != "_get":
+                    await ws.send_json(message)
+                    if message["type"] == "frame":
+                        sub.sent += 1
+                    continue
+                seq = message["seq"]
+                f = state.buffer.get(seq) if state.privacy == PrivacyState.ENABLED else None
+                raw = state.buffer.data(f) if f is not None else None
+                await ws.send_json({"type": "data", "seq": seq, "found": raw is not None})
+                if raw is not None:
+                    await ws.send_bytes(raw)
+
+    async def _receive() -> None:
+        while True:
+            msg = await ws.receive_json()
+            op = msg.get("op")
+            if op == "get":
+                sub.push({"type": "_get", "seq": int(msg.get("seq", 0))})
+            elif op == "set_fps":
+                sub.max_fps = float(msg.get("max_fps", 0.0))
+
+    sender = asyncio.ensure_future(_send())
+    receiver = asyncio.ensure_future(_receive())
+    try:
+        done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            exc = task.exception()
+            if exc is not None and not isinstance(exc, WebSocketDisconnect):
+                logger.warning(f"Frame subscriber closed: {exc}")
+    finally:
+        state.frame_subscribers.discard(sub)
+        sender.cancel()
+        receiver.cancel()
+
+
 @app.delete("/v1/vision/buffer")
 async def clear_buffer():
-    count = state.buffer.clear()
+    count = state.clear_frames("buffer_cleared")
     return {"cleared_frames": count}
 
 
@@ -416,6 +862,7 @@ async def get_status():
         "target_resolution": list(state.target_resolution),
         "privacy_toggle_count": state.privacy_toggle_count,
         "mode_toggle_count": state.mode_toggle_count,
+        "frame_subscribers": [sub.to_dict() for sub in state.frame_subscribers],
         "uptime_seconds": round(time.time() - state.started_at, 1),
     }
 
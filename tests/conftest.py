@@ -0,0 +1,44 @@
+"""
+Suite-wide test configuration.
+
+Event loop hygiene:
+  Both ``asyncio.run`` and the pytest-asyncio runner (asyncio_mode = auto)
+  leave the main thread without a current event loop when they finish.
+  Older suites still drive coroutines through
+  ``asyncio.get_event_loop().run_until_complete``, so every test starts
+  with a current loop: a shared fallback loop is installed whenever the
+  previous test left none (or left a closed one).
+"""
+
+import asyncio
+import warnings
+
+import pytest
+
+_fallback_loop = None
+
+
+def _current_loop():
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            return asyncio.get_event_loop_policy().get_event_loop()
+    except RuntimeError:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def _current_event_loop():
+    """Install the fallback loop if the previous test left no usable loop."""
+    global _fallback_loop
+    loop = _current_loop()
+    if loop is None or loop.is_closed():
+        if _fallback_loop is None or _fallback_loop.is_closed():
+            _fallback_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_fallback_loop)
+    yield
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if _fallback_loop is not None and not _fallback_loop.is_closed():
+        _fallback_loop.close()
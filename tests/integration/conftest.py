@@ -64,6 +64,16 @@ def _repo_path(*parts: str) -> str:
     return os.path.join(_REPO_ROOT, *parts)
 
 
+# pipecat's voice package (VoiceTurnRouter imports voice.cancel_registry)
+if "voice" not in sys.modules and os.path.isfile(_repo_path("services", "pipecat", "voice", "__init__.py")):
+    _voice_spec = importlib.util.spec_from_file_location(
+        "voice",
+        _repo_path("services", "pipecat", "voice", "__init__.py"),
+        submodule_search_locations=[_repo_path("services", "pipecat", "voice")],
+    )
+    sys.modules["voice"] = importlib.util.module_from_spec(_voice_spec)
+    _voice_spec.loader.exec_module(sys.modules["voice"])
+
 # VoiceTurnRouter + VoiceTurnRecord
 _vtr_mod = _load_module(
     "pipecat_voice_turn_router",
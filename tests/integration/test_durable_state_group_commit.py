@@ -0,0 +1,104 @@
+"""
+DurableStateStore -- single-writer group commits
+
+Tests:
+  1. Concurrent writes share commits and are all visible once awaited
+  2. A failing op is isolated to its savepoint (neighbours still commit)
+  3. Session touches are coalesced and written lazily
+  4. Reads return native objects; close() commits outstanding writes
+"""
+
+import asyncio
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+GATEWAY_DIR = Path(__file__).resolve().parents[2] / "services" / "api-gateway"
+if str(GATEWAY_DIR) not in sys.path:
+    sys.path.insert(0, str(GATEWAY_DIR))
+
+from durable_state import DurableStateStore
+
+
+def _session(sid, turn_count=0):
+    return {
+        "session_id": sid, "user_id": "u1", "conversation_id": "c1",
+        "created_at": "2026-01-01T00:00:00+00:00",
+        "expires_at": "2099-01-01T00:00:00+00:00",
+        "last_activity": "2026-01-01T00:00:00+00:00",
+        "turn_count": turn_count, "metadata": {"k": "v"},
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = DurableStateStore(
+        db_path=str(tmp_path / "state.db"),
+        commit_batch_size=64, commit_interval_ms=5.0, touch_interval_s=60.0,
+    )
+    yield s
+    s.close()
+
+
+class TestGroupCommit:
+
+    async def test_concurrent_writes_share_commits(self, store):
+        await asyncio.gather(*(
+            store.enqueue_outbox(f"turn_memory:t{i}", {"i": i}) for i in range(200)
+        ))
+        pending = await store.get_pending_outbox(limit=500)
+        assert len(pending) == 200
+        assert isinstance(pending[0]["payload"], dict)
+        stats = store.get_stats()
+        assert stats["ops_committed"] == 200
+        assert stats["commits"] < 200
+        assert stats["max_group_size"] > 1
+
+    async def test_failing_op_does_not_poison_group(self, store):
+        await asyncio.gather(
+            store.persist_session(_session("ses_ok_1")),
+            store.persist_session({"user_id": "missing-session-id"}),
+            store.persist_session(_session("ses_ok_2")),
+        )
+        sessions = await store.load_active_sessions()
+        assert sorted(s["session_id"] for s in sessions) == ["ses_ok_1", "ses_ok_2"]
+        assert sessions[0]["metadata"] == {"k": "v"}
+        assert store.get_stats()["ops_failed"] == 1
+
+    async def test_touches_are_lazy_and_coalesced(self, store, tmp_path):
+        def turn_count():
+            conn = sqlite3.connect(str(tmp_path / "state.db"))
+            try:
+                return conn.execute(
+                    "SELECT turn_count FROM sessions WHERE session_id = 'ses_t'"
+                ).fetchone()[0]
+            finally:
+                conn.close()
+
+        await store.persist_session(_session("ses_t"))
+        for n in range(1, 6):
+            store.touch_session("ses_t", f"2026-01-01T00:00:0{n}+00:00", n)
+        assert turn_count() == 0
+        assert store.get_stats()["pending_touches"] == 1
+
+        await store.flush()
+        assert turn_count() == 5
+        assert store.get_stats()["touches_written"] == 1
+
+    async def test_close_commits_outstanding_writes(self, tmp_path):
+        path = str(tmp_path / "state.db")
+        store1 = DurableStateStore(db_path=path, touch_interval_s=60.0)
+        await store1.persist_idempotency_key("idem_1", "act_1", {"ok": True})
+        await store1.persist_session(_session("ses_c"))
+        store1.touch_session("ses_c", "2026-01-01T00:00:09+00:00", 7)
+        store1.close()
+
+        store2 = DurableStateStore(db_path=path)
+        entry = await store2.get_idempotency_key("idem_1")
+        assert entry["result_json"] == {"ok": True}
+        assert (await store2.get_idempotency_key("missing")) is None
+        sessions = await store2.load_active_sessions()
+        assert sessions[0]["turn_count"] == 7
+        store2.close()
@@ -98,7 +98,7 @@ class TestVLMInference:
                 captured["payload"] = json
                 return FakeResponse()
 
-        with patch("perception_main.httpx.AsyncClient", return_value=FakeClient()):
+        with patch("perception_main._get_router_client", return_value=FakeClient()):
             result = await run_vlm_inference([fake_frame], "test context", 2000)
 
         assert captured["url"] == f"{MODEL_ROUTER_URL}/chat"
@@ -123,7 +123,7 @@ class TestVLMInference:
             async def post(self, *a, **kw):
                 raise _httpx.ReadTimeout("timeout")
 
-        with patch("perception_main.httpx.AsyncClient", return_value=TimeoutClient()):
+        with patch("perception_main._get_router_client", return_value=TimeoutClient()):
             run_vlm_inference = _load_perception_main().run_vlm_inference
             result = await run_vlm_inference([], "", 1000)
 
@@ -145,7 +145,7 @@ class TestVLMInference:
             async def __aexit__(self, *a): pass
             async def post(self, *a, **kw): return ErrorResponse()
 
-        with patch("perception_main.httpx.AsyncClient", return_value=FakeClient()):
+        with patch("perception_main._get_router_client", return_value=FakeClient()):
             run_vlm_inference = _load_perception_main().run_vlm_inference
             result = await run_vlm_inference([], "", 2000)
 
@@ -169,7 +169,7 @@ class TestVLMInference:
                 assert all(p["type"] == "text" for p in content)
                 return OkResponse()
 
-        with patch("perception_main.httpx.AsyncClient", return_value=FakeClient()):
+        with patch("perception_main._get_router_client", return_value=FakeClient()):
             run_vlm_inference = _load_perception_main().run_vlm_inference
             result = await run_vlm_inference([], "", 2000)
 
@@ -194,7 +194,7 @@ class TestVLMInference:
                 captured["payload"] = json
                 return OkResponse()
 
-        with patch("perception_main.httpx.AsyncClient", return_value=FakeClient()):
+        with patch("perception_main._get_router_client", return_value=FakeClient()):
             run_vlm_inference = _load_perception_main().run_vlm_inference
             await run_vlm_inference([], "user is cooking dinner", 2000)
 
@@ -22,7 +22,7 @@ Tests (20):
   PerceptionPipelineRunner (9):
     12. Runner starts and stops cleanly
     13. Cooldown blocks rapid triggers
-    14. Busy check blocks concurrent analysis
+    14. Busy trigger is deferred into the next run
     15. Privacy disabled blocks analysis
     16. Successful analysis updates stats
     17. Runner config defaults
@@ -300,7 +300,12 @@ class TestPerceptionPipelineRunner:
         r2 = await runner.on_frame_event({"type": "test"})
         assert r2["ok"] is False
         assert r2["reason"] == "busy"
+        assert r2["deferred"] is True
         await task
+        # Deferred trigger runs once the first analysis finishes
+        await asyncio.sleep(0.6)
+        assert runner.stats.total_deferred_runs == 1
+        assert runner.stats.total_runs == 2
         await runner.stop()
 
     @pytest.mark.asyncio
@@ -0,0 +1,157 @@
+"""Pytest suite for model-router request scheduler (admission control)."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+
+MODEL_ROUTER_DIR = Path(__file__).resolve().parents[2] / "services" / "model-router"
+if str(MODEL_ROUTER_DIR) not in sys.path:
+    sys.path.insert(0, str(MODEL_ROUTER_DIR))
+
+from app.profiles import ProfileName, ReasonCode
+from app.request_scheduler import RequestScheduler, SchedulerRejected, is_local_backend
+
+
+BACKEND = "ollama/qwen2.5:7b"
+
+
+def test_rs1_local_backend_detection():
+    assert is_local_backend("ollama/qwen2.5:7b")
+    assert is_local_backend("vllm/qwen")
+    assert is_local_backend("bare-model")
+    assert not is_local_backend("anthropic/claude-sonnet-4-6")
+
+
+async def test_rs2_max_inflight_enforced():
+    sched = RequestScheduler()
+    sched.configure_backend(BACKEND, max_inflight=2, max_queue=10)
+    active = 0
+    peak = 0
+
+    async def job(i):
+        nonlocal active, peak
+        async with sched.slot(BACKEND, session_id=f"s{i}"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(job(i) for i in range(6)))
+
+    stats = sched.to_dict()["backends"][BACKEND]
+    assert peak == 2
+    assert stats["admitted"] == 6
+    assert stats["inflight"] == 0
+    assert stats["queue_depth"] == 0
+
+
+async def test_rs3_priority_order_voice_before_summarisation():
+    sched = RequestScheduler()
+    sched.configure_backend(BACKEND, max_inflight=1, max_queue=10)
+    order = []
+    await sched.acquire(BACKEND, ProfileName.CHAT_LOW_LATENCY, "holder")
+
+    async def job(profile, tag):
+        await sched.acquire(BACKEND, profile, tag)
+        order.append(tag)
+        sched.release(BACKEND)
+
+    tasks = [
+        asyncio.create_task(job(ProfileName.MEMORY_OPS, "summary")),
+        asyncio.create_task(job(ProfileName.VISION_ANALYSIS, "vision")),
+        asyncio.create_task(job(ProfileName.CHAT_LOW_LATENCY, "voice")),
+    ]
+    await asyncio.sleep(0)
+    sched.release(BACKEND)
+    await asyncio.gather(*tasks)
+    assert order == ["voice", "vision", "summary"]
+
+
+async def test_rs4_round_robin_across_sessions():
+    sched = RequestScheduler()
+    sched.configure_backend(BACKEND, max_inflight=1, max_queue=10)
+    order = []
+    await sched.acquire(BACKEND, ProfileName.CHAT_LOW_LATENCY, "holder")
+
+    async def job(session):
+        await sched.acquire(BACKEND, ProfileName.CHAT_LOW_LATENCY, session)
+        order.append(session)
+        sched.release(BACKEND)
+
+    tasks = [asyncio.create_task(job(s)) for s in ["a", "a", "a", "b", "c"]]
+    await asyncio.sleep(0)
+    sched.release(BACKEND)
+    await asyncio.gather(*tasks)
+    assert order == ["a", "b", "c", "a", "a"]
+
+
+async def test_rs5_queue_full_rejected():
+    sched = RequestScheduler()
+    sched.configure_backend(BACKEND, max_inflight=1, max_queue=1)
+    await sched.acquire(BACKEND)
+    waiter = asyncio.create_task(sched.acquire(BACKEND, session_id="w"))
+    await asyncio.sleep(0)
+    with pytest.raises(SchedulerRejected) as exc:
+        await sched.acquire(BACKEND, session_id="x")
+    sched.release(BACKEND)
+    await waiter
+    sched.release(BACKEND)
+
+    rej, stats = exc.value, sched.to_dict()["backends"][BACKEND]
+    assert rej.reason_code == ReasonCode.QUEUE_FULL
+    assert stats["rejected_full"] == 1
+    assert stats["inflight"] == 0
+
+
+async def test_rs6_queue_deadline_rejects_and_frees_queue():
+    sched = RequestScheduler()
+    sched.configure_backend(BACKEND, max_inflight=1, max_queue=4)
+    await sched.acquire(BACKEND)
+    with pytest.raises(SchedulerRejected) as exc:
+        await sched.acquire(BACKEND, ProfileName.CHAT_LOW_LATENCY, "s", deadline_ms=20)
+    during = sched.to_dict()["backends"][BACKEND]
+    sched.release(BACKEND)
+    after = sched.to_dict()["backends"][BACKEND]
+
+    rej = exc.value
+    assert rej.reason_code == ReasonCode.QUEUE_DEADLINE_EXCEEDED
+    assert rej.waited_ms >= 15
+    assert during["queue_depth"] == 0
+    assert during["rejected_deadline"] == 1
+    assert after["inflight"] == 0
+
+
+async def test_rs7_early_rejection_from_observed_service_time():
+    sched = RequestScheduler()
+    sched.configure_backend(BACKEND, max_inflight=1, max_queue=4)
+    await sched.acquire(BACKEND)
+    sched.release(BACKEND, service_ms=5000)
+    await sched.acquire(BACKEND)
+    with pytest.raises(SchedulerRejected) as exc:
+        await sched.acquire(BACKEND, ProfileName.CHAT_LOW_LATENCY, "s")
+
+    rej, stats = exc.value, sched.to_dict()["backends"][BACKEND]
+    assert rej.reason_code == ReasonCode.QUEUE_DEADLINE_EXCEEDED
+    assert rej.waited_ms == 0.0
+    assert stats["rejected_early"] == 1
+
+
+async def test_rs8_check_slo_uses_latency_budget_shape():
+    sched = RequestScheduler()
+    sched.configure_backend(BACKEND, max_inflight=1, max_queue=4)
+    await sched.acquire(BACKEND)
+    waiter = asyncio.create_task(sched.acquire(BACKEND, session_id="w"))
+    await asyncio.sleep(0.05)
+    sched.release(BACKEND)
+    await waiter
+    sched.release(BACKEND)
+    violations = sched.check_slo(max_wait_p95_ms=10.0)
+    assert len(violations) == 1
+    v = violations[0]
+    assert v["stage"] == "model_queue"
+    assert v["metric"] == "p95"
+    assert v["backend"] == BACKEND
+    assert v["actual"] > v["threshold"]
@@ -0,0 +1,87 @@
+"""Pytest suite for model-router batched route audit logger."""
+
+import json
+import queue
+import sys
+from pathlib import Path
+
+
+MODEL_ROUTER_DIR = Path(__file__).resolve().parents[2] / "services" / "model-router"
+if str(MODEL_ROUTER_DIR) not in sys.path:
+    sys.path.insert(0, str(MODEL_ROUTER_DIR))
+
+from app.route_audit import AuditRecord, RouteAuditLogger
+
+
+def _record(i: int) -> AuditRecord:
+    return AuditRecord(
+        trace_id=f"t{i}",
+        turn_id=f"turn{i}",
+        requested_profile="chat_low_latency",
+        selected_backend="ollama/x",
+        fallback_chain=[],
+        reason_code="OK",
+    )
+
+
+def test_ra1_batched_records_reach_disk(tmp_path):
+    path = tmp_path / "routes.jsonl"
+    audit = RouteAuditLogger(path=str(path), flush_interval_s=0.01)
+    for i in range(50):
+        audit.log_record(_record(i))
+    assert audit.flush()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(ln)["trace_id"] for ln in lines] == [f"t{i}" for i in range(50)]
+    assert audit.record_count == 50
+    audit.close()
+
+
+def test_ra2_read_recent_from_ring(tmp_path):
+    audit = RouteAuditLogger(path=str(tmp_path / "routes.jsonl"), flush_interval_s=0.01)
+    for i in range(30):
+        audit.log_record(_record(i))
+    recent = audit.read_recent(5)
+    assert [r["trace_id"] for r in recent] == ["t25", "t26", "t27", "t28", "t29"]
+    audit.close()
+
+
+def test_ra3_read_recent_tail_after_restart(tmp_path):
+    path = tmp_path / "routes.jsonl"
+    first = RouteAuditLogger(path=str(path), flush_interval_s=0.01)
+    for i in range(500):
+        first.log_record(_record(i))
+    first.close()
+
+    second = RouteAuditLogger(path=str(path), flush_interval_s=0.01)
+    recent = second.read_recent(3)
+    assert [r["trace_id"] for r in recent] == ["t497", "t498", "t499"]
+    second.close()
+
+
+def test_ra4_queue_full_drops_are_counted(tmp_path):
+    audit = RouteAuditLogger(path=str(tmp_path / "routes.jsonl"), flush_interval_s=0.01)
+    # Detach the writer by swapping in a saturated queue.
+    writer_queue, audit._queue = audit._queue, queue.Queue(maxsize=1)
+    audit.log_record(_record(0))
+    audit.log_record(_record(1))
+    audit.log_record(_record(2))
+    assert audit.dropped_count == 2
+    assert audit.to_dict()["records_dropped"] == 2
+    assert audit.to_dict()["queue_depth"] == 1
+    audit._queue = writer_queue
+    audit.close()
+    assert not audit._writer.is_alive()
+
+
+def test_ra5_size_rotation(tmp_path):
+    path = tmp_path / "routes.jsonl"
+    audit = RouteAuditLogger(
+        path=str(path), flush_interval_s=0.0, batch_size=1, max_bytes=1000, backup_count=2,
+    )
+    for i in range(40):
+        audit.log_record(_record(i))
+    audit.close()
+    assert path.with_name("routes.jsonl.1").exists()
+    assert path.stat().st_size <= 1000
+    assert audit.to_dict()["rotations"] >= 1
+    assert not path.with_name("routes.jsonl.3").exists()
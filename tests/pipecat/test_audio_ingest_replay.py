@@ -0,0 +1,191 @@
+"""
+Tests for app.audio_ingest — VAD-Segmented Audio Ingest
+
+Replays recorded (seeded, synthetic) PCM through the per-connection ingest
+with the real EnergyVAD and a fake ASR, and reports ASR calls per second of
+audio and end-of-speech -> transcript latency.
+
+Verifies:
+    A1. PCMRing wraps and reads back by absolute stream position.
+    A2. Each spoken utterance produces exactly one ASR call.
+    A3. Pre-roll keeps the onset; hangover keeps short pauses inside one utterance.
+    A4. Short noise bursts are discarded without an ASR call.
+    A5. max_utterance_ms forces an end on continuous speech.
+    A6. flush() transcribes the utterance still open at end of stream.
+    A7. ASR errors are counted and do not break the stream.
+    A8. Replay benchmark: ASR calls per audio second vs the per-frame path.
+"""
+
+import asyncio
+import math
+import os
+import random
+import sys
+
+for _m in list(sys.modules):
+    if _m == "app" or _m.startswith("app."):
+        sys.modules.pop(_m, None)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "pipecat"))
+
+from app.audio_ingest import AudioIngest, IngestConfig, PCMRing
+from app.voice_backends import ASRBackend, ASRResult, EnergyVAD
+
+RATE = 16000
+FRAME_MS = 20
+FRAME_SAMPLES = RATE * FRAME_MS // 1000
+
+
+class FakeASR(ASRBackend):
+    """Records every call; returns a numbered transcript per utterance."""
+
+    def __init__(self, delay_s: float = 0.0, fail: bool = False):
+        super().__init__({"provider": "fake"})
+        self.calls = []
+        self.delay_s = delay_s
+        self.fail = fail
+
+    async def transcribe(self, audio_bytes: bytes, sample_rate: int = 16000) -> ASRResult:
+        self.calls.append(len(audio_bytes))
+        if self.delay_s:
+            await asyncio.sleep(self.delay_s)
+        if self.fail:
+            raise RuntimeError("asr down")
+        return ASRResult(text=f"utt{len(self.calls)}", confidence=0.9)
+
+
+def _frames(segments, seed=7):
+    """[(kind, ms)] -> 20 ms s16le frames; kind is 'speech' or 'silence'."""
+    rng = random.Random(seed)
+    out = []
+    t = 0
+    for kind, ms in segments:
+        for _ in range(ms // FRAME_MS):
+            samples = []
+            for _ in range(FRAME_SAMPLES):
+                if kind == "speech":
+                    v = 30000 * math.sin(2 * math.pi * 220 * t / RATE) + rng.uniform(-500, 500)
+                else:
+                    v = rng.uniform(-300, 300)
+                samples.append(int(max(-32768, min(32767, v))))
+                t += 1
+            out.append(b"".join(s.to_bytes(2, "little", signed=True) for s in samples))
+    return out
+
+
+def _recording():
+    """~10 s: three utterances, one with a short pause inside, and a noise click."""
+    return _frames([
+        ("silence", 600), ("speech", 1200), ("silence", 800),
+        ("speech", 700), ("silence", 200), ("speech", 600), ("silence", 900),
+        ("speech", 60), ("silence", 1000),
+        ("speech", 2000), ("silence", 1400),
+    ])
+
+
+async def _replay(ingest, frames):
+    utts = []
+    for f in frames:
+        utts.extend(await ingest.feed(f))
+    utts.extend(await ingest.flush())
+    return utts
+
+
+def test_a1_ring_wraps():
+    """A1: PCMRing wraps and reads back by absolute stream position."""
+    ring = PCMRing(10)
+    ring.append(b"abcdef")
+    ring.append(b"ghijkl")
+    assert ring.position == 12
+    assert ring.oldest == 2
+    assert ring.read(0) == b"cdefghijkl"
+    assert ring.read(4, 9) == b"efghi"
+    ring.append(b"0123456789ABC")
+    assert ring.read(ring.oldest) == b"3456789ABC"
+
+
+async def test_a2_one_asr_call_per_utterance():
+    """A2: Each spoken utterance produces exactly one ASR call."""
+    asr = FakeASR()
+    ingest = AudioIngest(asr, EnergyVAD())
+    utts = await _replay(ingest, _recording())
+    assert len(asr.calls) == 3
+    assert [u.text for u in utts] == ["utt1", "utt2", "utt3"]
+    assert not any(u.forced for u in utts)
+
+
+async def test_a3_preroll_and_hangover():
+    """A3: Pre-roll keeps the onset; hangover keeps short pauses inside one utterance."""
+    cfg = IngestConfig()
+    ingest = AudioIngest(FakeASR(), EnergyVAD(), cfg)
+    utts = await _replay(ingest, _recording())
+    first, second = utts[0], utts[1]
+    # Speech started at 600 ms; pre-roll reaches back before it
+    assert first.start_ms < 600
+    assert first.start_ms >= 600 - cfg.preroll_ms
+    # End is the last voiced frame, not the end of the hangover
+    assert abs(first.end_ms - 1800) <= FRAME_MS
+    # 700 + 200 pause + 600 stays one utterance
+    assert second.duration_ms >= 1500
+
+
+async def test_a4_noise_burst_discarded():
+    """A4: Short noise bursts are discarded without an ASR call."""
+    asr = FakeASR()
+    ingest = AudioIngest(asr, EnergyVAD(), IngestConfig(start_ms=40, min_utterance_ms=250))
+    await _replay(ingest, _frames([("silence", 200), ("speech", 60), ("silence", 800)]))
+    assert asr.calls == []
+    assert ingest.segmenter.discarded == 1
+
+
+async def test_a5_forced_end_on_max_length():
+    """A5: max_utterance_ms forces an end on continuous speech."""
+    asr = FakeASR()
+    cfg = IngestConfig(max_utterance_ms=1000)
+    ingest = AudioIngest(asr, EnergyVAD(), cfg)
+    utts = await _replay(ingest, _frames([("speech", 3000)]))
+    assert len(utts) >= 2
+    assert utts[0].forced
+    assert all(len(u.pcm) <= cfg.bytes_for(1000 + cfg.preroll_ms) for u in utts)
+
+
+async def test_a6_flush_open_utterance():
+    """A6: flush() transcribes the utterance still open at end of stream."""
+    asr = FakeASR()
+    ingest = AudioIngest(asr, EnergyVAD())
+    utts = await _replay(ingest, _frames([("silence", 200), ("speech", 800)]))
+    assert len(utts) == 1
+    assert utts[0].forced
+    assert len(asr.calls) == 1
+
+
+async def test_a7_asr_error_counted():
+    """A7: ASR errors are counted and do not break the stream."""
+    ingest = AudioIngest(FakeASR(fail=True), EnergyVAD())
+    utts = await _replay(ingest, _recording())
+    assert len(utts) == 3
+    assert all(u.error == "asr down" and u.text == "" for u in utts)
+    assert ingest.to_dict()["asr_errors"] == 3
+
+
+async def test_a8_replay_benchmark():
+    """A8: Replay benchmark: ASR calls per audio second vs the per-frame path."""
+    frames = _recording()
+    asr = FakeASR(delay_s=0.01)
+    ingest = AudioIngest(asr, EnergyVAD())
+    await _replay(ingest, frames)
+    stats = ingest.to_dict()
+
+    # The previous endpoint called ASR once per binary frame
+    per_frame_calls_per_s = len(frames) / stats["audio_s"]
+    print(
+        f"\n  audio={stats['audio_s']}s  frames={stats['frames']}  "
+        f"asr_calls={stats['asr_calls']}  "
+        f"calls/s={stats['asr_calls_per_audio_s']} (per-frame: {per_frame_calls_per_s:.1f})  "
+        f"eos->transcript p50={stats['transcript_p50_ms']}ms max={stats['transcript_max_ms']}ms"
+    )
+    assert stats["asr_calls"] == 3
+    assert stats["asr_calls_per_audio_s"] < 0.5
+    assert stats["asr_calls_per_audio_s"] * 100 < per_frame_calls_per_s
+    # Latency is the ASR call itself, not the hangover or the rest of the stream
+    assert 10 <= stats["transcript_p50_ms"] < 200
@@ -0,0 +1,245 @@
+"""
+Tests for streaming ASR — partial transcripts and speculative turn start
+
+Verifies:
+    S1. LocalAgreement commits a prefix only once two hypotheses agree on it.
+    S2. Committed words are never revised by later hypotheses.
+    S3. Windowed hypotheses are aligned to the committed tail.
+    S4. ASR.transcribe_partial sends only the trailing window.
+    S5. AudioIngest streams partials while speaking; the final is one call.
+    S6. pipeline.SessionManager emits partial transcripts in streaming mode.
+    S7. Matching final transcript reuses the speculative recall.
+    S8. Diverging final transcript cancels the speculation via CancelRegistry.
+    S9. A newer stable partial supersedes the previous speculation.
+"""
+
+import asyncio
+import os
+import sys
+import types
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pytest
+
+for _m in list(sys.modules):
+    if _m == "app" or _m.startswith("app.") or _m == "pipeline" or _m.startswith("pipeline."):
+        sys.modules.pop(_m, None)
+
+PIPECAT_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "services", "pipecat")
+sys.path.insert(0, PIPECAT_DIR)
+
+from pipeline.asr import ASR, LocalAgreement
+from pipeline.session_manager import SessionManager
+from app.audio_ingest import AudioIngest, IngestConfig
+from app.voice_backends import ASRBackend, ASRResult, EnergyVAD
+from app.voice_turn_router import VoiceTurnRouter
+
+RATE = 16000
+_rng = np.random.default_rng(3)
+
+
+def _speech(ms):
+    t = np.arange(RATE * ms // 1000)
+    return (30000 * np.sin(2 * np.pi * 220 * t / RATE)).astype("<i2").tobytes()
+
+
+def _silence(ms):
+    return _rng.uniform(-300, 300, RATE * ms // 1000).astype("<i2").tobytes()
+
+
+def _frames(pcm, frame_ms=20):
+    step = RATE * frame_ms // 1000 * 2
+    return [pcm[i:i + step] for i in range(0, len(pcm), step)]
+
+
+def test_s1_commit_on_agreement():
+    """S1: LocalAgreement commits a prefix only once two hypotheses agree on it."""
+    la = LocalAgreement()
+    p = la.update("turn on")
+    assert p.committed == "" and p.tentative == "turn on" and not p.stable
+    p = la.update("turn on the")
+    assert p.committed == "turn on" and p.tentative == "the" and p.stable
+    p = la.update("turn on the lights")
+    assert p.committed == "turn on the" and p.text == "turn on the lights"
+
+
+def test_s2_committed_never_revised():
+    """S2: Committed words are never revised by later hypotheses."""
+    la = LocalAgreement()
+    la.update("set a timer")
+    la.update("set a timer for")
+    p = la.update("set the timer for")
+    assert p.committed == "set a timer"
+    p = la.update("set the timer for ten")
+    assert p.committed == "set a timer"
+    assert not p.stable
+
+
+def test_s3_windowed_alignment():
+    """S3: Windowed hypotheses are aligned to the committed tail."""
+    la = LocalAgreement()
+    la.update("please read me the")
+    la.update("please read me the news")
+    p = la.update("the news from", windowed=True)
+    assert p.committed == "please read me the news"
+    assert p.tentative == "from"
+    p = la.update("news from today", windowed=True)
+    assert p.committed == "please read me the news from"
+
+
+async def test_s4_transcribe_partial_window():
+    """S4: ASR.transcribe_partial sends only the trailing window."""
+    asr = ASR()
+    asr._initialized = True
+    sent = []
+
+    async def fake(audio, partial=False):
+        sent.append((len(audio), partial))
+        return {"text": "hello there", "confidence": 0.9, "partial": partial}
+
+    asr.transcribe = fake
+    la = LocalAgreement()
+    await asr.transcribe_partial(_speech(3000), la, window_ms=1000)
+    partial = await asr.transcribe_partial(_speech(3000), la, window_ms=1000)
+    assert sent == [(RATE * 2, True), (RATE * 2, True)]
+    assert partial.committed == "hello there"
+    assert asr.get_partial() == "hello there"
+
+
+class ScriptedASR(ASRBackend):
+    """Partials grow one word per call; the final is the full sentence."""
+
+    WORDS = "what is the weather like today".split()
+
+    def __init__(self):
+        super().__init__({"provider": "fake"})
+        self.partial_calls = 0
+        self.final_calls = 0
+
+    async def transcribe(self, audio_bytes, sample_rate=16000):
+        self.final_calls += 1
+        return ASRResult(text=" ".join(self.WORDS), confidence=0.9)
+
+    async def transcribe_partial(self, audio_bytes, sample_rate=16000):
+        self.partial_calls += 1
+        await asyncio.sleep(0)
+        return ASRResult(text=" ".join(self.WORDS[:self.partial_calls + 1]), is_final=False)
+
+
+async def test_s5_ingest_streams_partials():
+    """S5: AudioIngest streams partials while speaking; the final is one call."""
+    asr = ScriptedASR()
+    partials = []
+
+    async def on_partial(p):
+        partials.append(p)
+
+    ingest = AudioIngest(asr, EnergyVAD(), IngestConfig(partial_interval_ms=200), on_partial=on_partial)
+    utts = []
+    for f in _frames(_silence(300) + _speech(2000) + _silence(800)):
+        utts.extend(await ingest.feed(f))
+        await asyncio.sleep(0)
+    assert len(utts) == 1
+    assert asr.final_calls == 1
+    assert asr.partial_calls >= 3
+    assert ingest.to_dict()["partial_calls"] == asr.partial_calls
+    assert any(p.stable for p in partials)
+    committed = [p.committed for p in partials]
+    assert committed == sorted(committed, key=len)
+    assert utts[0].partial_text
+    assert utts[0].text == "what is the weather like today"
+
+
+async def test_s6_session_manager_partials():
+    """S6: pipeline.SessionManager emits partial transcripts in streaming mode."""
+    sm = SessionManager(partial_interval_ms=200)
+    sm.asr._initialized = True
+    sm.asr.transcribe = AsyncMock(return_value={"text": "good morning", "confidence": 0.9})
+    sid = sm.create_session("u1")
+    events = [await sm.process_audio(sid, f) for f in _frames(_speech(1000), frame_ms=32)]
+    partial_events = [e for e in events if "partial_transcript" in e]
+    assert len(partial_events) >= 3
+    assert partial_events[0]["committed_transcript"] == ""
+    assert partial_events[-1]["committed_transcript"] == "good morning"
+
+
+class FakeStreamClient:
+    def __init__(self):
+        self.state = SimpleNamespace(value="connected")
+        self.on_partial = None
+        self.speculative = []
+        self.cancelled = []
+        self.turns = []
+
+    async def send_speculative(self, text, spec_id):
+        self.speculative.append((text, spec_id))
+        return True
+
+    async def cancel_speculative(self, spec_id):
+        self.cancelled.append(spec_id)
+        return True
+
+    async def send_turn(self, text, correlation_id="", timeout=0, spec_id=""):
+        self.turns.append((text, spec_id))
+        return SimpleNamespace(ok=True, assistant_text="ok", tool_calls=[], latency_ms=1.0, error="")
+
+
+@pytest.fixture
+def pipecat_clients(monkeypatch):
+    """Resolve "clients" to pipecat's package: api-gateway has a regular package of the same name."""
+    for name in [m for m in sys.modules if m.split(".")[0] == "clients"]:
+        monkeypatch.delitem(sys.modules, name)
+    package = types.ModuleType("clients")
+    package.__path__ = [os.path.join(PIPECAT_DIR, "clients")]
+    monkeypatch.setitem(sys.modules, "clients", package)
+    yield
+    for name in [m for m in sys.modules if m.split(".")[0] == "clients"]:
+        del sys.modules[name]
+
+
+def _router():
+    router = VoiceTurnRouter()
+    client = FakeStreamClient()
+    router._clients["s1"] = client
+    return router, client
+
+
+async def test_s7_speculation_hit(pipecat_clients):
+    """S7: Matching final transcript reuses the speculative recall."""
+    router, client = _router()
+
+    spec_id = await router.speculate("s1", "what is the weather")
+    record = await router.process_turn("What is the  weather", "s1")
+    assert record.ok
+    assert client.turns == [("What is the  weather", spec_id)]
+    assert client.cancelled == []
+    assert router.speculation_stats()["speculation_hits"] == 1
+    assert router.cancel_registry.active_count == 0
+
+
+async def test_s8_speculation_diverged(pipecat_clients):
+    """S8: Diverging final transcript cancels the speculation via CancelRegistry."""
+    router, client = _router()
+
+    spec_id = await router.speculate("s1", "turn off the")
+    await router.process_turn("turn off the kitchen lights", "s1")
+    assert client.cancelled == [spec_id]
+    assert client.turns == [("turn off the kitchen lights", "")]
+    assert router.speculation_stats()["speculation_misses"] == 1
+    assert not router.cancel_registry.is_requested("s1", spec_id)
+    assert router.cancel_registry.active_count == 0
+
+
+async def test_s9_speculation_superseded(pipecat_clients):
+    """S9: A newer stable partial supersedes the previous speculation."""
+    router, client = _router()
+
+    first = await router.speculate("s1", "play some")
+    again = await router.speculate("s1", "play  some")
+    second = await router.speculate("s1", "play some jazz")
+    assert again == first
+    assert second != first
+    assert client.cancelled == [first]
+    assert [s for _, s in client.speculative] == [first, second]
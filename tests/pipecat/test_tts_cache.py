@@ -0,0 +1,215 @@
+"""
+Tests for app.tts_cache — Phrase-Level TTS Audio Cache
+
+Verifies:
+    C1. Keys ignore case/whitespace but separate backend, voice and sample rate.
+    C2. Memory tier evicts least recently used entries by total bytes.
+    C3. Disk tier survives a new cache instance and evicts by size.
+    C4. Hits come back in the backend's own result shape; failures are not cached.
+    C5. Concurrent misses for one phrase share a single synthesis call.
+    C6. prewarm synthesizes each missing phrase once.
+    C7. synthesize_cancellable and synthesize_streaming use the installed cache.
+    C8. Only prewarm phrases and repeated phrases reach the disk tier.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+for _m in list(sys.modules):
+    if _m == "app" or _m.startswith("app."):
+        sys.modules.pop(_m, None)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "pipecat"))
+
+from app import tts_cache
+from app.session_manager import VoiceSession
+from app.tts_cache import TTSAudioCache, prewarm, synthesize_cached
+from app.tts_client import synthesize_cancellable, synthesize_streaming
+from app.voice_backends import TTSBackend, TTSResult
+
+
+class FakeTTS:
+    """pipeline.tts.TTS-shaped backend counting synthesize calls."""
+
+    def __init__(self, delay_s: float = 0.0, fail: bool = False):
+        from pipeline.tts import TTSConfig
+        self.config = TTSConfig(backend="fake")
+        self.calls = []
+        self.delay_s = delay_s
+        self.fail = fail
+
+    async def synthesize(self, text, streaming=True):
+        self.calls.append(text)
+        if self.delay_s:
+            await asyncio.sleep(self.delay_s)
+        if self.fail:
+            return {"audio": b"", "duration_ms": 0, "streaming": False, "error": "tts down"}
+        return {"audio": text.encode() * 10, "duration_ms": 100 * len(text), "streaming": False}
+
+
+class FakeBackend(TTSBackend):
+    def __init__(self):
+        super().__init__({"provider": "fake"})
+        self.calls = 0
+
+    async def synthesize(self, text, voice="default"):
+        self.calls += 1
+        return TTSResult(audio_bytes=b"pcm" + text.encode(), duration_ms=42.0)
+
+
+@pytest.fixture(autouse=True)
+def _no_default_cache():
+    tts_cache.install_default_cache(None)
+    yield
+    tts_cache.install_default_cache(None)
+
+
+def test_c1_keys():
+    """C1: Keys ignore case/whitespace but separate backend, voice and sample rate."""
+    key = TTSAudioCache.make_key
+    base = key("qwen", "default", "One moment.", 16000)
+    assert key("qwen", "default", "  one   MOMENT. ", 16000) == base
+    assert key("ollama", "default", "One moment.", 16000) != base
+    assert key("qwen", "alto", "One moment.", 16000) != base
+    assert key("qwen", "default", "One moment.", 24000) != base
+    assert key("qwen", "default", "One moment", 16000) != base
+
+
+async def test_c2_memory_lru_by_bytes():
+    """C2: Memory tier evicts least recently used entries by total bytes."""
+    cache = TTSAudioCache(max_memory_bytes=300)
+    await cache.put("a", b"x" * 100)
+    await cache.put("b", b"x" * 100)
+    await cache.put("c", b"x" * 100)
+    assert await cache.get("a") is not None  # a is now most recent
+    await cache.put("d", b"x" * 100)
+    assert await cache.get("b") is None
+    assert await cache.get("a") and await cache.get("c") and await cache.get("d")
+    await cache.put("huge", b"x" * 1000)  # larger than the tier: not kept
+    assert await cache.get("huge") is None
+    stats = cache.stats()
+    assert stats["memory_bytes"] == 300 and stats["evictions"] == 1
+
+
+async def test_c3_disk_tier(tmp_path):
+    """C3: Disk tier survives a new cache instance and evicts by size."""
+    first = TTSAudioCache(cache_dir=str(tmp_path))
+    await first.put("k1", b"audio-1", 250.0, persist=True)
+    second = TTSAudioCache(cache_dir=str(tmp_path))
+    assert await second.get("k1") == (b"audio-1", 250.0)
+    assert second.stats()["disk_hits"] == 1
+    assert await second.get("k1") is not None
+    assert second.stats()["disk_hits"] == 1  # promoted to memory
+
+    small = TTSAudioCache(cache_dir=str(tmp_path / "small"), max_disk_bytes=100)
+    for i in range(5):
+        await small.put(f"k{i}", bytes(40), persist=True)
+    small.clear()
+    assert await small.get("k3") is not None  # k3 is now most recent
+    await small.put("k5", bytes(40), persist=True)
+    assert small.stats()["disk_bytes"] <= 100
+    assert list(small._disk) == ["k3", "k5"]
+    assert await small.get("k4") is None
+    assert await small.get("k3") is not None
+
+    # A restart re-indexes the surviving files once, oldest access first
+    for i, key in enumerate(("k5", "k3")):
+        os.utime(small._path(key), (i, i))
+    reopened = TTSAudioCache(cache_dir=str(tmp_path / "small"), max_disk_bytes=100)
+    assert list(reopened._disk) == ["k5", "k3"]
+    assert reopened.stats()["disk_bytes"] == small.stats()["disk_bytes"]
+
+
+async def test_c4_result_shapes():
+    """C4: Hits come back in the backend's own result shape; failures are not cached."""
+    cache = TTSAudioCache()
+
+    tts = FakeTTS()
+    first = await synthesize_cached(tts, "Done.", cache, streaming=True)
+    hit = await synthesize_cached(tts, "done.", cache, streaming=True)
+    backend = FakeBackend()
+    await synthesize_cached(backend, "Done.", cache)
+    backend_hit = await synthesize_cached(backend, "Done.", cache)
+    failing = FakeTTS(fail=True)
+    failing.config.backend = "failing"
+    await synthesize_cached(failing, "Done.", cache)
+    await synthesize_cached(failing, "Done.", cache)
+
+    assert tts.calls == ["Done."]
+    assert hit["audio"] == first["audio"] and hit["cached"]
+    assert hit["duration_ms"] == first["duration_ms"]
+    assert backend.calls == 1
+    assert isinstance(backend_hit, TTSResult) and backend_hit.duration_ms == 42.0
+    assert len(failing.calls) == 2
+
+
+async def test_c5_single_flight():
+    """C5: Concurrent misses for one phrase share a single synthesis call."""
+    cache = TTSAudioCache()
+    tts = FakeTTS(delay_s=0.02)
+
+    results = await asyncio.gather(*(synthesize_cached(tts, "One moment.", cache) for _ in range(5)))
+    assert tts.calls == ["One moment."]
+    assert len({r["audio"] for r in results}) == 1
+    assert cache._inflight == {}
+
+
+async def test_c6_prewarm(tmp_path):
+    """C6: prewarm synthesizes each missing phrase once."""
+    phrases_file = tmp_path / "phrases.txt"
+    phrases_file.write_text("# common\nOne moment.\nDone.\none moment.\n\nOkay.\n" + "x" * 500 + "\n")
+    phrases = tts_cache.load_prewarm_phrases(str(phrases_file))
+    cache = TTSAudioCache()
+    tts = FakeTTS()
+
+    counts = await prewarm(tts, phrases, cache)
+    assert len(phrases) == 5
+    assert counts["phrases"] == 3 and counts["synthesized"] == 3
+    assert sorted(tts.calls) == ["Done.", "Okay.", "one moment."]
+    again = await prewarm(tts, phrases, cache)
+    assert again["cached"] == 3 and len(tts.calls) == 3
+
+
+async def test_c7_tts_client_uses_default_cache():
+    """C7: synthesize_cancellable and synthesize_streaming use the installed cache."""
+    cache = TTSAudioCache()
+    tts_cache.install_default_cache(cache)
+    tts = FakeTTS()
+    await prewarm(tts, ["Sure.", "Sorry, something went wrong."])
+    assert len(tts.calls) == 2
+
+    result = await synthesize_cancellable(VoiceSession(session_id="s1"), "sure.", tts)
+    assert result["audio"] == b"Sure." * 10
+
+    sent = []
+
+    async def on_chunk(audio):
+        sent.append(audio)
+
+    text = "Sorry, something went wrong. Let me try that again in a different way."
+    await synthesize_streaming(VoiceSession(session_id="s2"), text, tts, on_chunk)
+    assert len(tts.calls) == 3
+    assert tts.calls[-1] == "Let me try that again in a different way."
+    assert sent[0] == b"Sorry, something went wrong." * 10
+    assert cache.stats()["hits"] >= 2
+
+
+async def test_c8_disk_holds_only_pinned_and_repeated_phrases(tmp_path):
+    """C8: Only prewarm phrases and repeated phrases reach the disk tier."""
+    cache = TTSAudioCache(cache_dir=str(tmp_path), disk_min_uses=3)
+    tts = FakeTTS()
+    await prewarm(tts, ["One moment."], cache)
+    await synthesize_cached(tts, "My bank PIN is in the drawer.", cache)
+    await synthesize_cached(tts, "Okay.", cache)
+    await synthesize_cached(tts, "okay.", cache)
+    key = TTSAudioCache.make_key
+    backend, voice, rate = tts_cache.backend_identity(tts)
+    assert set(cache._disk) == {key(backend, voice, "One moment.", rate)}
+
+    await synthesize_cached(tts, "Okay.", cache)
+    assert key(backend, voice, "Okay.", rate) in cache._disk
+    assert key(backend, voice, "My bank PIN is in the drawer.", rate) not in cache._disk
+    assert len(list(tmp_path.glob("*/*.tts"))) == 2
@@ -0,0 +1,219 @@
+"""
+Tests for app.tts_client.synthesize_streaming — Sentence-Chunked Streaming TTS
+
+Verifies:
+    T1. split_sentences cuts at sentence ends and merges short sentences.
+    T2. Long runs without a sentence end are split at clause punctuation.
+    T3. SentenceChunker emits chunks from streamed token deltas.
+    T4. Chunks are delivered in order even when synthesis finishes out of order.
+    T5. Synthesis runs at most lookahead + 1 chunks at a time.
+    T6. cancel_tts_evt stops delivery within one chunk and cancels the rest.
+    T6c. External cancellation cleans up, then propagates CancelledError.
+    T7. Time-to-first-audio is recorded with LatencyCollector.record_first_emit.
+    T8. Time-to-first-audio: streaming vs whole-reply synthesis.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+for _m in list(sys.modules):
+    if _m == "app" or _m.startswith("app.") or _m == "voice" or _m.startswith("voice."):
+        sys.modules.pop(_m, None)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "pipecat"))
+
+from app.session_manager import VoiceSession
+from app.tts_client import SentenceChunker, split_sentences, synthesize_streaming
+from app.turn_taking import TurnState
+from voice.latency_metrics import LatencyCollector
+
+REPLY = (
+    "The forecast for today is mostly sunny. "
+    "Expect a high of twenty two degrees this afternoon. "
+    "Light winds will pick up after sunset. "
+    "Tomorrow looks cooler with a chance of rain."
+)
+
+
+class FakeTTS:
+    """Synthesis time proportional to text length; tracks concurrency."""
+
+    def __init__(self, ms_per_char: float = 0.2, delays=None):
+        self.ms_per_char = ms_per_char
+        self.delays = delays or {}
+        self.started = []
+        self.cancelled = []
+        self.active = 0
+        self.max_active = 0
+
+    async def synthesize(self, text):
+        self.started.append(text)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            delay = self.delays.get(len(self.started) - 1, len(text) * self.ms_per_char)
+            await asyncio.sleep(delay / 1000)
+            return {"audio": text.encode(), "duration_ms": len(text) * 50}
+        except asyncio.CancelledError:
+            self.cancelled.append(text)
+            raise
+        finally:
+            self.active -= 1
+
+
+async def _stream(session, text, tts, **kwargs):
+    sent = []
+
+    async def on_chunk(audio):
+        sent.append((time.monotonic(), audio))
+
+    return await synthesize_streaming(session, text, tts, on_chunk, **kwargs), sent
+
+
+def test_t1_split_sentences():
+    """T1: split_sentences cuts at sentence ends and merges short sentences."""
+    chunks = split_sentences("Hi. OK! " + REPLY)
+    assert chunks[0] == "Hi. OK! The forecast for today is mostly sunny."
+    assert chunks[-1] == "Tomorrow looks cooler with a chance of rain."
+    assert len(chunks) == 4
+    assert " ".join(chunks) == ("Hi. OK! " + REPLY)
+    assert split_sentences("   ") == []
+
+
+def test_t2_clause_split():
+    """T2: Long runs without a sentence end are split at clause punctuation."""
+    text = "first we check the calendar, then we look at the weather, and finally we book the table"
+    chunks = split_sentences(text, max_chars=40)
+    assert chunks == [
+        "first we check the calendar,",
+        "then we look at the weather,",
+        "and finally we book the table",
+    ]
+
+
+def test_t3_chunker_streamed_tokens():
+    """T3: SentenceChunker emits chunks from streamed token deltas."""
+    chunker = SentenceChunker()
+    out = []
+    for token in REPLY.replace(" ", " \x00").split("\x00"):
+        out.extend(chunker.feed(token))
+    out.extend(chunker.flush())
+    assert out == split_sentences(REPLY)
+
+
+async def test_t3b_async_token_stream():
+    """T3: synthesize_streaming accepts an async iterator of text deltas."""
+    async def tokens():
+        for word in REPLY.split(" "):
+            await asyncio.sleep(0)
+            yield word + " "
+
+    tts = FakeTTS()
+    session = VoiceSession(session_id="s1")
+    sent = []
+
+    async def on_chunk(audio):
+        sent.append(audio.decode())
+
+    result = await synthesize_streaming(session, tokens(), tts, on_chunk)
+    assert result["chunks"] == 4
+    assert sent == split_sentences(REPLY)
+
+
+async def test_t4_ordered_delivery():
+    """T4: Chunks are delivered in order even when synthesis finishes out of order."""
+    tts = FakeTTS(delays={0: 60, 1: 5, 2: 5})
+    result, sent = await _stream(VoiceSession(session_id="s1"), REPLY, tts)
+    assert result["chunks"] == 4 and not result["cancelled"]
+    assert [a.decode() for _, a in sent] == split_sentences(REPLY)
+    assert result["audio_bytes"] == sum(len(a) for _, a in sent)
+
+
+async def test_t5_bounded_lookahead():
+    """T5: Synthesis runs at most lookahead + 1 chunks at a time."""
+    text = " ".join(f"This is sentence number {i} of the reply." for i in range(10))
+    tts = FakeTTS()
+    result, _ = await _stream(VoiceSession(session_id="s1"), text, tts, lookahead=1)
+    assert result["chunks"] == 10
+    assert tts.max_active == 2
+
+
+async def test_t6_cancel_within_one_chunk():
+    """T6: cancel_tts_evt stops delivery within one chunk and cancels the rest."""
+    session = VoiceSession(session_id="s1")
+    tts = FakeTTS(ms_per_char=1.0)
+    sent = []
+
+    async def on_chunk(audio):
+        sent.append(audio)
+        if len(sent) == 1:
+            session.signal_cancel_tts()
+
+    result = await synthesize_streaming(session, REPLY, tts, on_chunk)
+    await asyncio.sleep(0.01)
+    assert result["cancelled"]
+    assert result["chunks"] == 1 and len(sent) == 1
+    assert tts.active == 0
+    assert len(tts.cancelled) >= 1
+    assert "tts_synth" not in session.active_tasks
+
+
+async def test_t6b_cancel_before_start():
+    """T6: A cancel set before the call sends nothing."""
+    session = VoiceSession(session_id="s1")
+    session.signal_cancel_tts()
+    tts = FakeTTS()
+    result, sent = await _stream(session, REPLY, tts)
+    assert result["cancelled"] and sent == [] and tts.started == []
+
+
+async def test_t6c_external_cancel_propagates():
+    """T6c: External cancellation cleans up, then propagates CancelledError."""
+    tts = FakeTTS(ms_per_char=5)
+    session = VoiceSession(session_id="s1")
+
+    async def on_chunk(audio):
+        pass
+
+    task = asyncio.ensure_future(synthesize_streaming(session, REPLY, tts, on_chunk))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    else:
+        raise AssertionError("CancelledError was swallowed")
+    assert tts.active == 0 and tts.cancelled
+    assert "tts_synth" not in session.active_tasks
+
+
+async def test_t7_first_emit_recorded():
+    """T7: Time-to-first-audio is recorded with LatencyCollector.record_first_emit."""
+    session = VoiceSession(session_id="s1", turn_id="turn_1")
+    session.turn_state = TurnState.THINKING
+    collector = LatencyCollector()
+    t_detect = time.monotonic_ns()
+    collector.record_turn_start("s1", "turn_1", t_detect)
+    result, sent = await _stream(session, REPLY, FakeTTS(), latency=collector)
+    rec = collector.finalize_turn("s1", "turn_1")
+    assert rec.t_first_emit_ns is not None
+    assert rec.warm_path_ms >= result["first_audio_ms"] > 0
+    assert len(sent) == 4
+    assert session.turn_state == TurnState.SPEAKING
+
+
+async def test_t8_ttfa_vs_whole_reply():
+    """T8: Time-to-first-audio: streaming vs whole-reply synthesis."""
+    tts = FakeTTS(ms_per_char=0.5)
+
+    t0 = time.monotonic()
+    await tts.synthesize(REPLY)
+    whole_ms = (time.monotonic() - t0) * 1000
+
+    result, _ = await _stream(VoiceSession(session_id="s1"), REPLY, tts)
+    print(f"\n  chars={len(REPLY)}  whole-reply={whole_ms:.1f}ms  first-chunk={result['first_audio_ms']}ms")
+    assert result["first_audio_ms"] < whole_ms / 2
+
@@ -0,0 +1,179 @@
+"""
+Tests for pipeline.vad — Per-Session VAD State and Vectorized Detection
+
+Verifies:
+    V1. pcm_samples is a view over the PCM bytes, not a copy.
+    V2. Features separate tonal speech, loud white noise and silence.
+    V3. Loud white noise is not detected as speech.
+    V4. Interleaved sessions keep independent speech/silence counters.
+    V5. A turn ends only for the session that spoke then went silent.
+    V6. process_batch matches per-frame processing, including state updates.
+    V7. process_batch handles mixed frame lengths and empty frames.
+    V7c. Batch turn completions transcribe concurrently across sessions.
+    V8. Batch timing: one vectorized call vs per-session calls.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+
+for _m in list(sys.modules):
+    if _m == "app" or _m.startswith("app.") or _m == "pipeline" or _m.startswith("pipeline."):
+        sys.modules.pop(_m, None)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "pipecat"))
+
+from pipeline.vad import VAD, VADState, frame_features, pcm_samples
+from pipeline.session_manager import SessionManager
+
+RATE = 16000
+FRAME = 512  # 32 ms
+_rng = np.random.default_rng(42)
+
+
+def _speech(n=FRAME, phase=0):
+    t = np.arange(phase, phase + n)
+    x = 30000 * np.sin(2 * np.pi * 220 * t / RATE) + _rng.uniform(-500, 500, n)
+    return x.astype("<i2").tobytes()
+
+
+def _silence(n=FRAME):
+    return _rng.uniform(-300, 300, n).astype("<i2").tobytes()
+
+
+def _white(n=FRAME):
+    return _rng.uniform(-32767, 32767, n).astype("<i2").tobytes()
+
+
+def test_v1_samples_are_a_view():
+    """V1: pcm_samples is a view over the PCM bytes, not a copy."""
+    raw = _speech()
+    samples = pcm_samples(raw)
+    assert not samples.flags.owndata
+    assert samples.size == FRAME
+    assert pcm_samples(raw + b"\x01").size == FRAME
+
+
+def test_v2_features():
+    """V2: Features separate tonal speech, loud white noise and silence."""
+    speech = frame_features(pcm_samples(_speech()))
+    white = frame_features(pcm_samples(_white()))
+    quiet = frame_features(pcm_samples(_silence()))
+    assert speech.rms[0] > 0.5 and white.rms[0] > 0.5 and quiet.rms[0] < 0.05
+    assert speech.flatness[0] < 0.05 < 0.3 < white.flatness[0]
+
+
+def test_v3_white_noise_rejected():
+    """V3: Loud white noise is not detected as speech."""
+    vad = VAD()
+    assert vad.process_frame(_speech())[0] is True
+    is_speech, confidence = vad.process_frame(_white())
+    assert is_speech is False
+    assert confidence > 0.5
+
+
+def test_v4_interleaved_sessions_isolated():
+    """V4: Interleaved sessions keep independent speech/silence counters."""
+    vad = VAD()
+    a, b = VADState(), VADState()
+    for _ in range(10):
+        vad.process_frame(_speech(), a)
+        vad.process_frame(_silence(), b)
+    assert a.speech_ms == 320 and a.silence_ms == 0
+    assert b.speech_ms == 0 and b.silence_ms == 0
+    assert a.frame_count == b.frame_count == 10
+    assert vad.state.frame_count == 0
+
+
+async def test_v5_turn_end_per_session():
+    """V5: A turn ends only for the session that spoke then went silent."""
+    sm = SessionManager()
+    sm.asr.transcribe = AsyncMock(return_value={"text": "hello"})
+    a, b = sm.create_session("u1"), sm.create_session("u2")
+    events_a, events_b = [], []
+    for i in range(40):
+        events_a.append(await sm.process_audio(a, _speech() if i < 10 else _silence()))
+        events_b.append(await sm.process_audio(b, _speech()))
+
+    done_a = [e for e in events_a if e["type"] == "turn_complete"]
+    assert len(done_a) == 1 and done_a[0]["transcript"] == "hello"
+    assert all(e["type"] == "audio_frame" for e in events_b)
+    assert sm.get_session(a).turn_count == 1
+    assert sm.get_session(b).vad_state.speech_ms == 40 * 32
+    assert sm.asr.transcribe.await_count == 1
+
+
+def test_v6_batch_matches_per_frame():
+    """V6: process_batch matches per-frame processing, including state updates."""
+    vad = VAD()
+    frames = [_speech(), _silence(), _white(), _speech(phase=37), _silence()] * 20
+    single = [VADState() for _ in frames]
+    batched = [VADState() for _ in frames]
+    expected = [vad.process_frame(f, s) for f, s in zip(frames, single)]
+    got = vad.process_batch(frames, batched)
+    assert [r[0] for r in got] == [r[0] for r in expected]
+    assert np.allclose([r[1] for r in got], [r[1] for r in expected], atol=1e-6)
+    assert single == batched
+
+
+def test_v7_batch_mixed_lengths():
+    """V7: process_batch handles mixed frame lengths and empty frames."""
+    vad = VAD()
+    frames = [_speech(320), _speech(512), b"", _silence(320), _speech(512)[:-1]]
+    states = [VADState() for _ in frames]
+    got = vad.process_batch(frames, states)
+    assert [r[0] for r in got] == [True, True, False, False, True]
+    assert got[2] == (False, 0.0)
+    assert states[0].speech_ms == 20 and states[1].speech_ms == 32
+
+
+async def test_v7b_session_manager_batch():
+    """V7: SessionManager.process_audio_batch reports unknown sessions per entry."""
+    sm = SessionManager()
+    sm.asr.transcribe = AsyncMock(return_value={"text": ""})
+    a = sm.create_session("u1")
+    events = await sm.process_audio_batch({a: _speech(), "missing": _speech()})
+    assert events[a]["is_speech"] is True
+    assert events["missing"]["type"] == "error"
+
+
+async def test_v7c_batch_transcribes_concurrently():
+    """V7c: Batch turn completions transcribe concurrently across sessions."""
+    sm = SessionManager()
+
+    async def slow_transcribe(audio):
+        await asyncio.sleep(0.1)
+        return {"text": "hi"}
+
+    sm.asr.transcribe = slow_transcribe
+    sm.vad.should_end_turn = lambda state=None: True
+    ids = [sm.create_session(f"u{i}") for i in range(4)]
+
+    t0 = time.perf_counter()
+    events = await sm.process_audio_batch({sid: _speech() for sid in ids})
+    elapsed = time.perf_counter() - t0
+    assert all(events[sid]["transcript"] == "hi" for sid in ids)
+    assert elapsed < 0.3
+
+
+def test_v8_batch_timing():
+    """V8: Batch timing: one vectorized call vs per-session calls."""
+    vad = VAD()
+    frames = [_speech(phase=i) if i % 2 else _silence() for i in range(500)]
+    states = [VADState() for _ in frames]
+
+    t0 = time.perf_counter()
+    for f, s in zip(frames, states):
+        vad.process_frame(f, s)
+    per_frame_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    vad.process_batch(frames, states)
+    batch_ms = (time.perf_counter() - t0) * 1000
+
+    print(f"\n  sessions=500  per-frame={per_frame_ms:.1f}ms  batch={batch_ms:.1f}ms")
+    assert batch_ms < per_frame_ms
@@ -0,0 +1,155 @@
+"""
+Tests for app.voice_backends.VoiceBackendPool — Shared, Pre-Warmed Backends
+
+Verifies:
+    P1. warm_up issues one transcription and one synthesis, then reports ready.
+    P2. Readiness is only signalled once warm-up has finished.
+    P3. A failed warm-up is recorded; the first real turn is then cold.
+    P4. Connections share the pool's ASR; closing a connection leaves it open.
+    P5. An ASR error result (returned, not raised) fails warm-up.
+"""
+
+import asyncio
+import os
+import sys
+
+for _m in list(sys.modules):
+    if _m == "app" or _m.startswith("app."):
+        sys.modules.pop(_m, None)
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "pipecat"))
+
+from app.audio_ingest import AudioIngest
+from app.voice_backends import (
+    ASRBackend,
+    ASRResult,
+    EnergyVAD,
+    OllamaASR,
+    TTSBackend,
+    TTSResult,
+    VoiceBackendPool,
+    WARMUP_PHRASE,
+)
+
+
+class FakeASR(ASRBackend):
+    def __init__(self, delay_s: float = 0.0, fail: bool = False, error: str = ""):
+        super().__init__({"provider": "fake"})
+        self.calls = []
+        self.delay_s = delay_s
+        self.fail = fail
+        self.error = error
+        self.closed = False
+
+    async def transcribe(self, audio_bytes, sample_rate=16000):
+        self.calls.append(len(audio_bytes))
+        if self.delay_s:
+            await asyncio.sleep(self.delay_s)
+        if self.fail:
+            raise ConnectionError("asr down")
+        return ASRResult(text="", error=self.error)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeTTS(TTSBackend):
+    def __init__(self, audio: bytes = b"pcm"):
+        super().__init__({"provider": "fake"})
+        self.calls = []
+        self.audio = audio
+        self.closed = False
+
+    async def synthesize(self, text, voice="default"):
+        self.calls.append(text)
+        return TTSResult(audio_bytes=self.audio)
+
+    async def close(self):
+        self.closed = True
+
+
+def _pool(asr=None, tts=None):
+    pool = VoiceBackendPool(vad_config={"provider": "energy"})
+    pool.asr = asr or FakeASR()
+    pool.tts = tts or FakeTTS()
+    return pool
+
+
+async def test_p1_warm_up_calls_each_backend_once():
+    """P1: warm_up issues one transcription and one synthesis, then reports ready."""
+    pool = _pool()
+    assert not pool.ready
+    assert await pool.warm_up() is True
+    assert pool.asr.calls == [16000]  # 500 ms of 16 kHz s16le silence
+    assert pool.tts.calls == [WARMUP_PHRASE]
+    assert pool.ready and pool.warm
+    assert set(pool.warmup_ms) == {"asr", "tts"}
+    assert pool.take_cold() is False
+    d = pool.to_dict()
+    assert d["ready"] and d["warm"] and d["warmup_errors"] == {}
+
+
+async def test_p2_ready_only_after_warm_up():
+    """P2: Readiness is only signalled once warm-up has finished."""
+    pool = _pool(asr=FakeASR(delay_s=0.05))
+
+    task = asyncio.create_task(pool.warm_up())
+    early = await pool.wait_ready(timeout=0.01)
+    mid = pool.ready
+    late = await pool.wait_ready(timeout=1.0)
+    await task
+    assert (early, mid, late) == (False, False, True)
+
+
+async def test_p3_failed_warm_up_marks_first_turn_cold():
+    """P3: A failed warm-up is recorded; the first real turn is then cold."""
+    pool = _pool(asr=FakeASR(fail=True), tts=FakeTTS(audio=b""))
+    assert await pool.warm_up() is False
+    assert pool.ready and not pool.warm
+    assert pool.warmup_errors == {
+        "asr": "asr down",
+        "tts": "warm-up synthesis returned no audio",
+    }
+    assert pool.take_cold() is True
+    assert pool.take_cold() is False
+
+
+async def test_p4_connections_share_pool_asr():
+    """P4: Connections share the pool's ASR; closing a connection leaves it open."""
+    pool = _pool()
+    vads = [pool.new_vad(), pool.new_vad()]
+    assert all(isinstance(v, EnergyVAD) for v in vads) and vads[0] is not vads[1]
+
+    for vad in vads:
+        ingest = AudioIngest(pool.asr, vad, session_id="s", owns_asr=False)
+        await ingest.close()
+    shut_after_sessions = pool.asr.closed
+    await pool.close()
+    assert shut_after_sessions is False
+    assert pool.asr.closed and pool.tts.closed
+
+
+class _PipelineASR:
+    """Stands in for pipeline/asr.py ASR, which reports failures in the result."""
+
+    def __init__(self, result):
+        self.result = result
+
+    async def transcribe(self, audio_bytes, partial=False):
+        return dict(self.result, partial=partial)
+
+
+async def test_p5_asr_error_result_fails_warm_up():
+    """P5: An ASR error result (returned, not raised) fails warm-up."""
+    pool = _pool(asr=FakeASR(error="HTTP 503"))
+    assert await pool.warm_up() is False
+    assert pool.warmup_errors == {"asr": "HTTP 503"}
+    assert pool.take_cold() is True
+
+    asr = OllamaASR()
+    asr._asr = _PipelineASR({"text": "", "confidence": 0.0, "error": "connection refused"})
+    assert (await asr.transcribe(b"\x00\x00")).error == "connection refused"
+    asr._asr = _PipelineASR({"text": "", "confidence": 0.0, "timeout": True})
+    assert (await asr.transcribe_partial(b"\x00\x00")).error == "timeout"
+    asr._asr = _PipelineASR({"text": "hi", "confidence": 0.9})
+    assert (await asr.transcribe(b"\x00\x00")).error == ""
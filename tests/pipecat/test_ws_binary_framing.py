@@ -0,0 +1,234 @@
+"""
+Tests for pipecat websocket binary audio framing
+
+Verifies:
+    W1. Frame header round-trips; the decoded payload is a view, not a copy.
+    W2. Malformed frames are rejected with FrameError.
+    W3. Binary PCM lands in the session buffer straight from the frame view.
+    W4. Binary clients get binary audio back; JSON clients keep base64 JSON.
+    W5. Client disconnect propagates as WebSocketDisconnect.
+    W6. Opus uplink/downlink round-trip (needs opuslib + libopus).
+    W7. Loopback benchmark: bytes and per-frame CPU, binary vs base64 JSON.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from fastapi import WebSocketDisconnect
+
+from services.pipecat.pipeline.session_manager import SessionManager
+from services.pipecat.websocket.framing import (
+    HEADER_SIZE,
+    Codec,
+    FrameError,
+    OpusCodec,
+    decode_frame,
+    encode_frame,
+    opus_available,
+)
+from services.pipecat.websocket.server import WebSocketServer
+
+RATE = 16000
+FRAME_BYTES = RATE * 20 // 1000 * 2  # 20 ms s16le
+
+
+def _pcm(n_bytes=FRAME_BYTES, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.integers(-8000, 8000, n_bytes // 2, dtype="<i2").tobytes()
+
+
+class LoopbackWebSocket:
+    """In-memory WebSocket: scripted inbound messages, counted outbound bytes."""
+
+    def __init__(self, inbound=()):
+        self.inbound = list(inbound)
+        self.sent = []
+        self.wire_bytes_out = 0
+
+    async def accept(self):
+        pass
+
+    async def receive(self):
+        if not self.inbound:
+            return {"type": "websocket.disconnect", "code": 1000}
+        msg = self.inbound.pop(0)
+        if isinstance(msg, (bytes, bytearray)):
+            return {"type": "websocket.receive", "bytes": msg}
+        return {"type": "websocket.receive", "text": msg}
+
+    async def send_json(self, data):
+        await self.send_text(json.dumps(data))
+
+    async def send_text(self, text):
+        self.sent.append(text)
+        self.wire_bytes_out += len(text)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+        self.wire_bytes_out += len(data)
+
+
+def _server():
+    sm = SessionManager()
+    return WebSocketServer(sm), sm
+
+
+def test_w1_header_roundtrip():
+    """W1: Frame header round-trips; the decoded payload is a view, not a copy."""
+    pcm = _pcm()
+    data = encode_frame(pcm, seq=7, ts_us=123456789)
+    assert len(data) == HEADER_SIZE + len(pcm) == 16 + 640
+    frame = decode_frame(data)
+    assert (frame.seq, frame.ts_us, frame.codec) == (7, 123456789, Codec.PCM)
+    assert frame.payload == pcm
+    assert frame.payload.obj is data
+    assert decode_frame(encode_frame(b"", seq=2**32 + 5, ts_us=0)).seq == 5
+
+
+def test_w2_malformed_frames():
+    """W2: Malformed frames are rejected with FrameError."""
+    good = bytearray(encode_frame(_pcm(), 1, 1))
+    with pytest.raises(FrameError):
+        decode_frame(good[:10])
+    bad_version = bytearray(good)
+    bad_version[0] = 9
+    with pytest.raises(FrameError):
+        decode_frame(bad_version)
+    bad_codec = bytearray(good)
+    bad_codec[2] = 7
+    with pytest.raises(FrameError):
+        decode_frame(bad_codec)
+
+
+async def test_w3_zero_copy_into_session_buffer():
+    """W3: Binary PCM lands in the session buffer straight from the frame view."""
+    server, sm = _server()
+    sid = sm.create_session("u1")
+    frames = [encode_frame(_pcm(seed=i), i, i * 20000) for i in range(3)]
+    ws = LoopbackWebSocket(frames)
+
+    await server.connect(sid, ws)
+    got = []
+    for _ in frames:
+        audio = await server.receive_audio(sid, ws)
+        assert isinstance(audio, memoryview)
+        got.append(audio)
+        await sm.process_audio(sid, audio)
+    assert got[0].obj is frames[0]
+    assert bytes(sm.get_session(sid).audio_buffer) == b"".join(_pcm(seed=i) for i in range(3))
+    stats = server.get_stats(sid)
+    assert stats["connections"][0]["framing"] == "binary"
+    assert stats["connections"][0]["frames_in"] == 3
+
+
+async def test_w4_downlink_per_client_framing():
+    """W4: Binary clients get binary audio back; JSON clients keep base64 JSON."""
+    server, sm = _server()
+    sid = sm.create_session("u1")
+    binary = LoopbackWebSocket([encode_frame(_pcm(), 0, 0)])
+    legacy = LoopbackWebSocket([json.dumps({"type": "audio", "data": base64.b64encode(_pcm()).decode()})])
+    reply = _pcm(FRAME_BYTES * 5, seed=9)
+
+    await server.connect(sid, binary)
+    await server.connect(sid, legacy)
+    assert await server.receive_audio(sid, binary) == _pcm()
+    assert await server.receive_audio(sid, legacy) == _pcm()
+    await server.send_audio(sid, reply)
+    await server.send_audio(sid, reply)
+    frames = [decode_frame(m) for m in binary.sent if isinstance(m, bytes)]
+    assert [f.seq for f in frames] == [0, 1]
+    assert frames[0].payload == reply
+    events = [json.loads(m) for m in legacy.sent[1:]]
+    assert [e["type"] for e in events] == ["audio", "audio"]
+    assert base64.b64decode(events[0]["data"]) == reply
+
+
+async def test_w5_disconnect_propagates():
+    """W5: Client disconnect propagates as WebSocketDisconnect."""
+    server, sm = _server()
+    sid = sm.create_session("u1")
+    ws = LoopbackWebSocket()
+
+    await server.connect(sid, ws)
+    with pytest.raises(WebSocketDisconnect):
+        await server.receive_audio(sid, ws)
+
+
+@pytest.mark.skipif(not opus_available(), reason="opuslib/libopus not installed")
+async def test_w6_opus_roundtrip():
+    """W6: Opus uplink/downlink round-trip (needs opuslib + libopus)."""
+    client = OpusCodec()
+    t = np.arange(RATE) / RATE
+    pcm = (8000 * np.sin(2 * np.pi * 220 * t)).astype("<i2").tobytes()
+    packets = client.encode(pcm, final=True)
+    assert len(packets) == 50
+    server, sm = _server()
+    sid = sm.create_session("u1")
+    ws = LoopbackWebSocket([encode_frame(p, i, 0, codec=Codec.OPUS) for i, p in enumerate(packets)])
+
+    await server.connect(sid, ws)
+    decoded = [await server.receive_audio(sid, ws) for _ in packets]
+    await server.send_audio(sid, pcm)
+    assert sum(len(d) for d in decoded) == len(pcm)
+    down = [decode_frame(m) for m in ws.sent if isinstance(m, bytes)]
+    assert all(f.codec == Codec.OPUS for f in down)
+    assert sum(len(f.payload) for f in down) < len(pcm) / 5
+
+
+async def test_w7_loopback_benchmark():
+    """W7: Loopback benchmark: bytes and per-frame CPU, binary vs base64 JSON."""
+    clients, frames_per_client = 100, 50
+    pcm = _pcm()
+
+    def legacy_msgs():
+        return [json.dumps({"type": "audio", "data": base64.b64encode(pcm).decode()})
+                for _ in range(frames_per_client)]
+
+    def binary_msgs():
+        return [encode_frame(pcm, i, i * 20000) for i in range(frames_per_client)]
+
+    async def run(make_msgs):
+        server, sm = _server()
+        sockets = []
+        for c in range(clients):
+            ws = LoopbackWebSocket(make_msgs())
+            sockets.append((f"s{c}", ws))
+            await server.connect(f"s{c}", ws)
+        wire_in = sum(len(m) for _, ws in sockets for m in ws.inbound)
+        for _, ws in sockets:
+            ws.sent.clear()
+            ws.wire_bytes_out = 0
+
+        async def client(sid, ws):
+            for _ in range(frames_per_client):
+                audio = await server.receive_audio(sid, ws)
+                await server.send_audio(sid, audio)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(client(sid, ws) for sid, ws in sockets))
+        elapsed = time.perf_counter() - t0
+        wire_out = sum(ws.wire_bytes_out for _, ws in sockets)
+        return wire_in, wire_out, elapsed
+
+    legacy_in, legacy_out, legacy_s = await run(legacy_msgs)
+    binary_in, binary_out, binary_s = await run(binary_msgs)
+    n = clients * frames_per_client
+    print(
+        f"\n  clients={clients}  frames={n}"
+        f"\n  json+b64: in={legacy_in // clients}B/session out={legacy_out // clients}B/session "
+        f"cpu={legacy_s / n * 1e6:.1f}us/frame"
+        f"\n  binary:   in={binary_in // clients}B/session out={binary_out // clients}B/session "
+        f"cpu={binary_s / n * 1e6:.1f}us/frame"
+    )
+    assert binary_in < legacy_in * 0.8
+    assert binary_out < legacy_out * 0.8
+    assert binary_s < legacy_s
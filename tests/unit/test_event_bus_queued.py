@@ -0,0 +1,175 @@
+"""Unit tests for event_bus queued delivery -- per-subscriber queues, overflow, stats."""
+import asyncio
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "shared"))
+
+import pytest
+
+from event_bus import (
+    DELIVERY_QUEUED, OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, EventBus,
+)
+
+
+class TestQueuedDelivery:
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_does_not_block_others(self):
+        bus = EventBus()
+        gate = asyncio.Event()
+        fast, slow = [], []
+
+        async def on_fast(event):
+            fast.append(event["id"])
+
+        async def on_slow(event):
+            await gate.wait()
+            slow.append(event["id"])
+
+        bus.subscribe("vision.*", on_fast, delivery=DELIVERY_QUEUED)
+        bus.subscribe("vision.*", on_slow, delivery=DELIVERY_QUEUED)
+        for i in range(3):
+            assert await bus.publish({"type": "vision.frame.available", "id": str(i)}) == 2
+        await asyncio.sleep(0.01)
+        assert fast == ["0", "1", "2"]
+        assert slow == []
+
+        gate.set()
+        assert await bus.drain(timeout=1.0)
+        assert slow == ["0", "1", "2"]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_keeps_newest(self):
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event["id"])
+
+        sub_id = bus.subscribe(
+            "frame", handler, delivery=DELIVERY_QUEUED, queue_size=2, overflow=OVERFLOW_DROP_OLDEST,
+        )
+        for i in range(5):
+            bus.publish_nowait({"type": "frame", "id": str(i)})
+        stats = bus.get_stats()["subscribers"][sub_id]
+        assert stats["queue_depth"] == 2
+        assert stats["dropped"] == 3
+
+        await bus.drain(timeout=1.0)
+        assert seen == ["3", "4"]
+        assert bus.get_stats()["total_dropped"] == 3
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_drop_newest_and_block_nowait(self):
+        bus = EventBus()
+        got = {"newest": [], "block": []}
+
+        async def newest(event):
+            got["newest"].append(event["id"])
+
+        async def block(event):
+            got["block"].append(event["id"])
+
+        bus.subscribe("t", newest, delivery=DELIVERY_QUEUED, queue_size=1, overflow=OVERFLOW_DROP_NEWEST)
+        bus.subscribe("t", block, delivery=DELIVERY_QUEUED, queue_size=1, overflow=OVERFLOW_BLOCK)
+        accepted = [bus.publish_nowait({"type": "t", "id": str(i)}) for i in range(3)]
+        assert accepted == [2, 0, 0]
+        await bus.drain(timeout=1.0)
+        assert got == {"newest": ["0"], "block": ["0"]}
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_applies_backpressure(self):
+        bus = EventBus()
+        gate = asyncio.Event()
+        seen = []
+
+        async def handler(event):
+            await gate.wait()
+            seen.append(event["id"])
+
+        bus.subscribe("t", handler, delivery=DELIVERY_QUEUED, queue_size=1, overflow=OVERFLOW_BLOCK)
+        await bus.publish({"type": "t", "id": "0"})
+        await bus.publish({"type": "t", "id": "1"})
+        blocked = asyncio.ensure_future(bus.publish({"type": "t", "id": "2"}))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        gate.set()
+        assert await blocked == 1
+        await bus.drain(timeout=1.0)
+        assert seen == ["0", "1", "2"]
+        assert bus.get_stats()["total_dropped"] == 0
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_queued_failures_reach_dead_letters_and_lag_is_reported(self):
+        bus = EventBus()
+        bus.HANDLER_TIMEOUT_S = 0.05
+
+        async def bad(event):
+            if event["id"] == "boom":
+                raise ValueError("boom")
+            await asyncio.sleep(0.02)
+
+        sub_id = bus.subscribe("t", bad, delivery=DELIVERY_QUEUED)
+        for eid in ("a", "b", "boom"):
+            bus.publish_nowait({"type": "t", "id": eid})
+        await bus.drain(timeout=1.0)
+
+        stats = bus.get_stats()["subscribers"][sub_id]
+        assert stats["delivered"] == 2 and stats["failed"] == 1
+        assert stats["max_lag_ms"] >= 20
+        assert bus.get_dead_letters()[0]["error"] == "boom"
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_match_cache_follows_subscriptions(self):
+        bus = EventBus()
+        seen = []
+
+        async def handler(event):
+            seen.append(event["type"])
+
+        bus.subscribe("vision.*", handler)
+        await bus.publish({"type": "vision.frame.available"})
+        assert "vision.frame.available" in bus._match_cache
+
+        queued = bus.subscribe("vision.frame.*", handler, delivery=DELIVERY_QUEUED)
+        assert bus._match_cache == {}
+        assert await bus.publish({"type": "vision.frame.available"}) == 2
+        await bus.drain(timeout=1.0)
+
+        assert bus.unsubscribe(queued)
+        assert await bus.publish({"type": "vision.frame.available"}) == 1
+        assert len(seen) == 4
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_drain_after_close_returns_at_once(self):
+        bus = EventBus()
+        gate = asyncio.Event()
+
+        async def stuck(event):
+            await gate.wait()
+
+        bus.subscribe("t", stuck, delivery=DELIVERY_QUEUED)
+        for i in range(3):
+            bus.publish_nowait({"type": "t", "id": str(i)})
+        await asyncio.sleep(0.01)
+        await bus.close()
+
+        t0 = asyncio.get_running_loop().time()
+        assert await bus.drain(timeout=1.0)
+        assert asyncio.get_running_loop().time() - t0 < 0.5
+
+    def test_rejects_unknown_policy(self):
+        bus = EventBus()
+
+        async def handler(event):
+            pass
+
+        with pytest.raises(ValueError):
+            bus.subscribe("t", handler, delivery="fanout")
+        with pytest.raises(ValueError):
+            bus.subscribe("t", handler, overflow="spill")
@@ -0,0 +1,61 @@
+"""Unit tests for frame_ring -- shared-memory frame slab (write, seq reads, clear)."""
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "shared"))
+
+import pytest
+
+from frame_ring import FrameRingError, SharedFrameRing
+
+
+@pytest.fixture
+def ring():
+    r = SharedFrameRing(slot_count=4, slot_size=64)
+    yield r
+    r.close()
+
+
+class TestSharedFrameRing:
+    def test_write_then_read_by_seq(self, ring):
+        seq, slot = ring.write(b"frame-1", 10, 20, 1.5)
+        assert (seq, slot) == (1, 0)
+        view = ring.read(seq)
+        assert bytes(view.data) == b"frame-1"
+        assert (view.width, view.height, view.timestamp) == (10, 20, 1.5)
+        assert ring.read_slot(slot).frame_id == view.frame_id
+
+    def test_lapped_frames_are_gone(self, ring):
+        for i in range(6):
+            ring.write(bytes([i]) * 3, 1, 1, float(i))
+        assert ring.head_seq == 6
+        assert ring.read(2) is None
+        assert [v.seq for v in ring.latest(10)] == [3, 4, 5, 6]
+
+    def test_view_invalidated_when_slot_reused(self, ring):
+        view = ring.read(ring.write(b"old", 1, 1, 0.0)[0])
+        for _ in range(4):
+            ring.write(b"new", 1, 1, 0.0)
+        assert not view.is_valid()
+        assert view.tobytes() is None
+
+    def test_clear_zeroes_slab(self, ring):
+        seq, slot = ring.write(b"secret", 1, 1, 0.0)
+        ring.clear()
+        assert ring.read(seq) is None
+        assert ring.latest(4) == []
+        start = ring._slot_offset(slot)
+        assert bytes(ring._buf[start:start + 128]) == bytes(128)
+
+    def test_oversized_frame_rejected(self, ring):
+        with pytest.raises(FrameRingError):
+            ring.write(b"x" * 65, 1, 1, 0.0)
+
+    def test_reader_attaches_by_name(self, ring):
+        if ring.name is None:
+            pytest.skip("shared memory unavailable")
+        ring.write(b"shared", 1, 1, 0.0)
+        reader = SharedFrameRing.attach(ring.name)
+        try:
+            assert (reader.slot_count, reader.slot_size) == (4, 64)
+            assert reader.latest(1)[0].tobytes() == b"shared"
+        finally:
+            reader.close()
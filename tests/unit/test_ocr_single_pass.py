@@ -0,0 +1,141 @@
+"""Unit tests for ocr -- single-pass full analysis, result cache, tiled Tesseract."""
+import io
+import os, sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "api-gateway"))
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+import ocr
+from ocr import OCREngine, OCRProvider, OCRResultCache
+
+
+def _data(words):
+    """image_to_data DICT for (text, conf, left, top, block, par, line) words."""
+    keys = ("text", "conf", "left", "top", "width", "height", "block_num", "par_num", "line_num")
+    data = {k: [] for k in keys}
+    for text, conf, left, top, block, par, line in words:
+        for k, v in zip(keys, (text, conf, left, top, 30, 10, block, par, line)):
+            data[k].append(v)
+    return data
+
+
+class _FakeTesseract:
+    class Output:
+        DICT = "dict"
+
+    def __init__(self, words):
+        self.words = words
+        self.data_calls = 0
+        self.string_calls = 0
+
+    def image_to_data(self, img, lang=None, output_type=None):
+        self.data_calls += 1
+        return _data(self.words)
+
+    def image_to_string(self, img, lang=None):
+        self.string_calls += 1
+        return ""
+
+
+def _png(width=64, height=32, fill=255):
+    buf = io.BytesIO()
+    Image.new("L", (width, height), color=fill).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def tess(monkeypatch):
+    fake = _FakeTesseract([
+        ("Hello", 96, 10, 5, 1, 1, 1),
+        ("world", 91, 50, 5, 1, 1, 1),
+        ("", -1, 0, 0, 1, 1, 1),
+        ("Next", 88, 10, 25, 1, 1, 2),
+        ("Para", 0, 10, 45, 1, 2, 1),
+    ])
+    monkeypatch.setattr(ocr, "pytesseract", fake, raising=False)
+    monkeypatch.setattr(ocr, "Image", Image, raising=False)
+    monkeypatch.setattr(ocr, "PYTESSERACT_AVAILABLE", True)
+    return fake
+
+
+class TestSinglePass:
+    async def test_text_and_boxes_from_one_pass(self, tess):
+        engine = OCREngine(cache=OCRResultCache())
+        result = await engine.full_analysis(_png(), language="eng")
+        assert tess.data_calls == 1 and tess.string_calls == 0
+        assert result.text == "Hello world\nNext\n\nPara"
+        # conf 0 words count towards text but not boxes
+        assert [b.text for b in result.boxes] == ["Hello", "world", "Next"]
+        assert result.boxes[0].bbox == (10, 5, 30, 10)
+        assert result.confidence == pytest.approx((0.96 + 0.91 + 0.88) / 3)
+
+    async def test_identical_image_served_from_cache(self, tess):
+        cache = OCRResultCache(max_entries=2)
+        engine = OCREngine(cache=cache)
+        first = await engine.full_analysis(_png(), language="eng")
+        again = await engine.full_analysis(_png(), language="eng")
+        assert tess.data_calls == 1
+        assert again.text == first.text and again.boxes == first.boxes
+        again.boxes.clear()
+        assert len((await engine.full_analysis(_png(), language="eng")).boxes) == 3
+
+        await engine.full_analysis(_png(), language="deu")
+        await engine.full_analysis(_png(fill=0), language="eng")
+        assert tess.data_calls == 3
+        assert cache.stats() == {"entries": 2, "max_entries": 2, "hits": 2, "misses": 3}
+
+    async def test_use_cache_false_bypasses_cache(self, tess):
+        engine = OCREngine(cache=OCRResultCache())
+        await engine.full_analysis(_png(), use_cache=False)
+        await engine.full_analysis(_png(), use_cache=False)
+        assert tess.data_calls == 2
+        assert engine.cache.stats()["entries"] == 0
+
+
+class TestTiledTesseract:
+    async def test_bands_keep_each_word_once(self, monkeypatch):
+        # Pixel value encodes the source row so the fake knows where each crop starts
+        img = Image.new("L", (40, 250))
+        img.putdata([y for y in range(250) for _ in range(40)])
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+
+        rows = {"top": 50, "edge": 110, "low": 190, "bottom": 230}
+
+        def tile_data(png_bytes, lang):
+            crop = Image.open(io.BytesIO(png_bytes))
+            crop_top = crop.getpixel((0, 0))
+            words = [
+                (name, 90, 0, y - crop_top, 1, 1, line)
+                for line, (name, y) in enumerate(rows.items(), start=1)
+                if crop_top <= y < crop_top + crop.height
+            ]
+            return _data(words)
+
+        pool = ThreadPoolExecutor(max_workers=3)
+        monkeypatch.setattr(ocr, "pytesseract", _FakeTesseract([]), raising=False)
+        monkeypatch.setattr(ocr, "Image", Image, raising=False)
+        monkeypatch.setattr(ocr, "PYTESSERACT_AVAILABLE", True)
+        monkeypatch.setattr(ocr, "_get_tile_pool", lambda workers: pool)
+        monkeypatch.setattr(ocr, "_tesseract_tile_data", tile_data)
+
+        engine = OCREngine(cache=OCRResultCache(), tile_height=100)
+        engine.providers[OCRProvider.TESSERACT].tile_overlap = 20
+        result = await engine.full_analysis(buf.getvalue())
+        pool.shutdown()
+
+        assert [b.text for b in result.boxes] == ["top", "edge", "low", "bottom"]
+        assert [b.bbox[1] for b in result.boxes] == [50, 110, 190, 230]
+        assert result.text == "top\n\nedge\nlow\n\nbottom"
+
+    def test_shutdown_tile_pool_stops_and_resets_pool(self):
+        pool = ocr._get_tile_pool(1)
+        assert ocr._get_tile_pool(1) is pool
+        ocr.shutdown_tile_pool()
+        assert ocr._tile_pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(int)
+        ocr.shutdown_tile_pool()  # no pool: no-op
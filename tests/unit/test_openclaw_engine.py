@@ -0,0 +1,342 @@
+"""
+OpenClaw Execution Engine Tests
+Async dispatch, per-tool limits, kill-on-timeout, streamed shell output
+and a mixed-load benchmark.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+SERVICES_DIR = Path(__file__).resolve().parents[2] / "services"
+if str(SERVICES_DIR) not in sys.path:
+    sys.path.insert(0, str(SERVICES_DIR))
+
+from openclaw.engine import ExecutionEngine
+from openclaw.executors.shell_exec import OutputRing, ShellExecutor
+from openclaw.policy import SecurityTier
+from openclaw.registry import ToolExecutor, ToolRegistry
+from openclaw.schemas import ExecuteRequest
+
+TOOL_DELAY_S = 0.05
+
+
+# ============================================================================
+# Stub executors
+# ============================================================================
+
+class BlockingStub(ToolExecutor):
+    """Blocking executor (like file/desktop tools): sleeps in the calling thread."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    def execute(self, tool_name, args, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        time.sleep(TOOL_DELAY_S)
+        self.running -= 1
+        return {"success": True, "result": {"tool": tool_name}, "error": None}
+
+
+class AsyncStub(ToolExecutor):
+    """Native async executor (like shell.run / web.fetch)."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    def execute(self, tool_name, args, **kwargs):
+        time.sleep(TOOL_DELAY_S)
+        return {"success": True, "result": {"tool": tool_name}, "error": None}
+
+    async def execute_async(self, tool_name, args, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(TOOL_DELAY_S)
+        self.running -= 1
+        return {"success": True, "result": {"tool": tool_name}, "error": None}
+
+
+def _registry(engine=None):
+    registry = ToolRegistry(engine=engine or ExecutionEngine())
+    stubs = {
+        "stub.shell": AsyncStub(),
+        "stub.web": AsyncStub(),
+        "stub.file": BlockingStub(),
+        "stub.desktop": BlockingStub(),
+    }
+    for name, executor in stubs.items():
+        registry.register_tool(
+            name=name,
+            display_name=name,
+            description="stub",
+            tier=SecurityTier.TIER_0_READONLY.value,
+            requires_sandboxing=False,
+            default_timeout_ms=5000,
+            executor=executor,
+        )
+    return registry, stubs
+
+
+def _mixed_requests(n_per_tool=10):
+    return [
+        ExecuteRequest(tool_name=name, args={}, correlation_id=f"{name}-{i}")
+        for i in range(n_per_tool)
+        for name in ("stub.shell", "stub.web", "stub.file", "stub.desktop")
+    ]
+
+
+# ============================================================================
+# Engine Tests
+# ============================================================================
+
+class TestExecutionEngine:
+    """Unit tests for ExecutionEngine and ToolRegistry.execute_async."""
+
+    async def test_execute_async_matches_sync_envelope(self):
+        """execute_async returns the same envelope as execute."""
+        registry, _ = _registry()
+        request = ExecuteRequest(tool_name="stub.file", args={}, correlation_id="c1")
+        sync = registry.execute(request)
+        async_ = await registry.execute_async(request)
+        assert async_.status == sync.status == "executed"
+        assert async_.result == sync.result
+        assert async_.correlation_id == "c1"
+        missing = await registry.execute_async(ExecuteRequest(tool_name="nope.tool"))
+        assert missing.status == "not_implemented"
+
+    async def test_blocking_executor_does_not_stall_event_loop(self):
+        """Blocking executors run on the thread pool; the loop keeps ticking."""
+        registry, _ = _registry()
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        beat = asyncio.create_task(heartbeat())
+        await asyncio.gather(*(
+            registry.execute_async(ExecuteRequest(tool_name="stub.file")) for _ in range(4)
+        ))
+        beat.cancel()
+        assert ticks >= 5
+        assert registry.engine.offloaded == 4
+
+    async def test_per_tool_concurrency_limit(self):
+        """No more than the tool's limit runs at once; other tools are unaffected."""
+        engine = ExecutionEngine(tool_limits={"stub.shell": 2, "stub.desktop": 1})
+        registry, stubs = _registry(engine)
+        await asyncio.gather(*(registry.execute_async(r) for r in _mixed_requests(6)))
+        assert stubs["stub.shell"].peak == 2
+        assert stubs["stub.desktop"].peak == 1
+        assert stubs["stub.web"].peak > 2
+        stats = engine.get_stats()
+        assert stats["completed"] == 24
+        assert stats["running"] == {} and stats["waiting"] == {}
+
+    def test_desktop_input_tools_share_a_slot(self):
+        """Keyboard, mouse and window focus share the desktop.input limit."""
+        engine = ExecutionEngine()
+        keys = {engine.limit_key(t) for t in ("keyboard.type", "mouse.click", "window.focus")}
+        assert keys == {"desktop.input"}
+        assert engine.tool_limits["desktop.input"] == 1
+        assert engine.limit_key("shell.run") == "shell.run"
+
+    async def test_executor_exception_becomes_error_envelope(self):
+        """An exception raised on the thread pool is reported as status=error."""
+        class Boom(ToolExecutor):
+            def execute(self, tool_name, args, **kwargs):
+                raise RuntimeError("boom")
+
+        registry, _ = _registry()
+        registry.register_tool("stub.boom", "Boom", "stub", SecurityTier.TIER_0_READONLY.value,
+                               False, 5000, Boom())
+        response = await registry.execute_async(ExecuteRequest(tool_name="stub.boom"))
+        assert response.status == "error"
+        assert response.error == "boom"
+
+    async def test_mixed_load_benchmark(self):
+        """Throughput of parallel mixed tool calls: sequential sync vs engine."""
+        requests = _mixed_requests(10)
+
+        registry, _ = _registry()
+        t0 = time.perf_counter()
+        for r in requests:
+            registry.execute(r)
+        sequential_s = time.perf_counter() - t0
+
+        registry, _ = _registry()
+        t0 = time.perf_counter()
+        responses = await asyncio.gather(*(registry.execute_async(r) for r in requests))
+        engine_s = time.perf_counter() - t0
+        assert all(r.status == "executed" for r in responses)
+        n = len(requests)
+        print(
+            f"\n  calls={n} (4 tools, {TOOL_DELAY_S * 1000:.0f} ms each)"
+            f"\n  sequential: {sequential_s:.2f}s  {n / sequential_s:.0f} calls/s"
+            f"\n  engine:     {engine_s:.2f}s  {n / engine_s:.0f} calls/s"
+        )
+        assert engine_s < sequential_s / 4
+
+
+# ============================================================================
+# Async Shell Tests
+# ============================================================================
+
+class PosixShellExecutor(ShellExecutor):
+    """ShellExecutor on /bin/sh so the async path can run off Windows."""
+    SHELL = ("sh", "-c")
+
+
+@pytest.mark.skipif(os.name == "nt", reason="uses /bin/sh")
+class TestShellExecuteAsync:
+    """Unit tests for ShellExecutor.execute_async."""
+
+    async def test_execute_async_captures_output(self):
+        """Output and return code come back in the execute() result shape."""
+        shell = PosixShellExecutor()
+        success, result, error = await shell.execute_async(
+            'python -c "import sys; print(42); sys.exit(3)"')
+        assert success is True and error is None
+        assert result["return_code"] == 3
+        assert result["stdout"].strip() == "42"
+        assert result["success"] is False
+
+    async def test_execute_async_policy_denied(self):
+        """Allowlist is enforced before anything is spawned."""
+        success, _, error = await PosixShellExecutor().execute_async("Remove-Item x")
+        assert success is False
+        assert "not in allowlist" in error
+
+    async def test_timeout_kills_process_tree(self, tmp_path):
+        """On timeout the command and the processes it started are killed."""
+        pid_file = tmp_path / "child.pid"
+        script = (
+            "import os, subprocess, sys, time;"
+            "c = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']);"
+            f"open(r'{pid_file}', 'w').write(str(c.pid));"
+            "time.sleep(30)"
+        )
+        shell = PosixShellExecutor()
+        t0 = time.monotonic()
+        success, _, error = await shell.execute_async(f'python -c "{script}"', timeout_ms=1500)
+        assert success is False
+        assert "timed out" in error
+        assert time.monotonic() - t0 < 5
+        child = int(pid_file.read_text())
+        await asyncio.sleep(0.1)
+        assert not _alive(child)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="uses /bin/sh")
+class TestShellExecuteStream:
+    """Unit tests for ShellExecutor.execute_stream and /execute/stream."""
+
+    async def test_output_arrives_before_exit(self):
+        """Lines are forwarded while the command is still running."""
+        script = "import time;print('first', flush=True);time.sleep(1);print('second')"
+        shell = PosixShellExecutor()
+        t0 = time.monotonic()
+        seen = []
+        async for event in shell.execute_stream(f'python -c "{script}"'):
+            seen.append((time.monotonic() - t0, event))
+        outputs = [(t, e["text"]) for t, e in seen if e["type"] == "output"]
+        assert outputs[0][1] == "first\n"
+        assert outputs[0][0] < 0.8
+        final = seen[-1][1]
+        assert final["type"] == "result" and final["success"] is True
+        assert final["result"]["stdout"] == "first\nsecond\n"
+        assert final["result"]["stdout_truncated"] is False
+
+    async def test_large_output_keeps_tail(self):
+        """Output beyond MAX_OUTPUT_CHARS is streamed in full; the result keeps the tail."""
+        shell = PosixShellExecutor()
+        shell.MAX_OUTPUT_CHARS = 1000
+        script = "import sys;[print(i) for i in range(20000)];print('err', file=sys.stderr)"
+        streamed = {"stdout": 0, "stderr": 0}
+        final = None
+        async for event in shell.execute_stream(f'python -c "{script}"'):
+            if event["type"] == "output":
+                streamed[event["stream"]] += len(event["text"])
+            else:
+                final = event
+        result = final["result"]
+        assert streamed["stdout"] == result["stdout_chars"] > 100000
+        assert result["stdout_truncated"] is True
+        assert len(result["stdout"]) == 1000
+        assert result["stdout"].endswith("19998\n19999\n")
+        assert result["stderr"] == "err\n"
+
+    def test_output_ring(self):
+        ring = OutputRing(10)
+        for chunk in ("abc\n", "defgh\n", "ij\n"):
+            ring.append(chunk)
+        assert ring.getvalue() == "\ndefgh\nij\n"
+        assert ring.total_chars == 13 and ring.truncated
+        ring.append("x" * 50)
+        assert ring.getvalue() == "x" * 10
+
+    async def test_cancel_kills_process(self):
+        """Setting the cancel event stops the command and reports it."""
+        shell = PosixShellExecutor()
+        script = "import time;print('started', flush=True);time.sleep(30)"
+        cancel = asyncio.Event()
+        events = []
+        t0 = time.monotonic()
+        async for event in shell.execute_stream(f'python -c "{script}"', timeout_ms=20000,
+                                                cancel=cancel):
+            events.append(event)
+            if event["type"] == "output":
+                cancel.set()
+        assert time.monotonic() - t0 < 5
+        assert events[-1] == {"type": "result", "success": False, "result": {},
+                              "error": "Command cancelled"}
+
+    def test_stream_endpoint_ndjson(self):
+        """POST /execute/stream relays output lines and ends with the final envelope."""
+        import json
+        from fastapi.testclient import TestClient
+        from openclaw import main
+
+        with TestClient(main.app) as client:
+            main.registry = ToolRegistry()
+            main.registry.executors["shell.run"].shell = PosixShellExecutor()
+            with client.stream("POST", "/execute/stream", json={
+                "tool_name": "shell.run",
+                "args": {"command": "python -c \"print('a');print('b')\""},
+                "correlation_id": "c-stream",
+            }) as response:
+                assert response.headers["content-type"].startswith("application/x-ndjson")
+                events = [json.loads(line) for line in response.iter_lines() if line]
+            assert client.post("/execute/nope/cancel").status_code == 404
+
+        assert events[0]["type"] == "started"
+        assert events[0]["execution_id"] == response.headers["x-execution-id"]
+        text = "".join(e["text"] for e in events if e["type"] == "output")
+        assert text == "a\nb\n"
+        final = events[-1]["response"]
+        assert final["status"] == "executed"
+        assert final["correlation_id"] == "c-stream"
+        assert final["result"]["stdout"] == "a\nb\n"
+        assert main.active_streams == {}
+
+
+def _alive(pid):
+    """Running (not dead, not an unreaped zombie)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except OSError:
+        return True
@@ -0,0 +1,114 @@
+"""Pytest suite for batched outbox delivery (gateway) and memory-engine batch store."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GATEWAY_DIR = REPO_ROOT / "services" / "api-gateway"
+MEMORY_ENGINE_DIR = REPO_ROOT / "services" / "memory-engine"
+if str(GATEWAY_DIR) not in sys.path:
+    sys.path.insert(0, str(GATEWAY_DIR))
+
+
+def _load_memory_db():
+    spec = importlib.util.spec_from_file_location("_memory_engine_db", MEMORY_ENGINE_DIR / "db.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class _BatchMemory:
+    def __init__(self, batch_status=None, fail_batch=False):
+        self.batch_calls = []
+        self.single_calls = 0
+        self.batch_status = batch_status
+        self.fail_batch = fail_batch
+
+    async def store_batch(self, items, correlation_id=None):
+        from clients.memory_client import MemoryClientError
+        self.batch_calls.append(items)
+        if self.fail_batch:
+            raise MemoryClientError("UNAVAILABLE", "down", {"status_code": 503})
+        if self.batch_status is not None:
+            raise MemoryClientError("STORE_FAILED", "nope", {"status_code": self.batch_status})
+        return {"status": "stored", "ids": [f"mem_{i}" for i in range(len(items))]}
+
+    async def store(self, content, memory_type, metadata, correlation_id):
+        self.single_calls += 1
+        return {"status": "stored"}
+
+
+@pytest.fixture
+def outbox_store(tmp_path):
+    import memory_policy
+    from durable_state import DurableStateStore
+    store = DurableStateStore(db_path=str(tmp_path / "gw" / "state.db"))
+    memory_policy.set_memory_policy_state_store(store)
+    yield store
+    memory_policy.set_memory_policy_state_store(None)
+    store.close()
+
+
+async def _enqueue(store, n):
+    for i in range(n):
+        await store.enqueue_outbox(f"turn_memory:t{i}", {
+            "content": f"c{i}", "memory_type": "turn_raw",
+            "metadata": {"turn_id": f"t{i}"}, "correlation_id": f"cid{i}",
+        })
+
+
+async def test_ob1_flush_uses_single_batch_and_set_based_marks(outbox_store):
+    import memory_policy
+    await _enqueue(outbox_store, 30)
+    mem = _BatchMemory()
+    result = await memory_policy.flush_outbox(mem, limit=100)
+    assert result == {"flushed": 30, "failed": 0, "skipped": 0}
+    assert len(mem.batch_calls) == 1
+    assert mem.single_calls == 0
+    assert [it["content"] for it in mem.batch_calls[0]][:3] == ["c0", "c1", "c2"]
+    assert await outbox_store.get_pending_outbox(limit=100) == []
+
+
+async def test_ob2_batch_failure_increments_attempts_for_all(outbox_store):
+    import memory_policy
+    await _enqueue(outbox_store, 5)
+    result = await memory_policy.flush_outbox(_BatchMemory(fail_batch=True))
+    assert result["failed"] == 5
+    pending = await outbox_store.get_pending_outbox(limit=100)
+    assert len(pending) == 5
+    assert all(p["attempts"] == 1 for p in pending)
+
+
+async def test_ob3_falls_back_to_single_store_when_endpoint_missing(outbox_store):
+    import memory_policy
+    await _enqueue(outbox_store, 4)
+    mem = _BatchMemory(batch_status=404)
+    result = await memory_policy.flush_outbox(mem)
+    assert result["flushed"] == 4
+    assert len(mem.batch_calls) == 1
+    assert mem.single_calls == 4
+
+
+def test_ob4_memory_engine_store_many_is_one_transaction(tmp_path):
+    db_mod = _load_memory_db()
+    db = db_mod.MemoryDatabase(db_path=str(tmp_path / "memory.db"))
+    ids = db.store_many([
+        {"type": "turn_raw", "content": f"row {i}", "metadata": {"i": i}} for i in range(50)
+    ])
+    assert len(ids) == len(set(ids)) == 50
+    assert db.get(ids[7])["content"] == "row 7"
+    with db.connection() as conn:
+        audits = conn.execute(
+            "SELECT COUNT(*) FROM audit_log WHERE operation = 'CREATE'"
+        ).fetchone()[0]
+    assert audits == 50
+
+    with pytest.raises(Exception):
+        db.store_many([{"type": "fact", "content": "ok"}, {"type": "fact", "content": None}])
+    assert db.count() == 50
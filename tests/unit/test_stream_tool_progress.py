@@ -0,0 +1,195 @@
+"""Pytest suite for streamed tool execution: OpenclawClient.execute_stream and
+the tool.call.progress relay / control.cancel handling in routes/stream.py."""
+
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+
+GATEWAY_DIR = Path(__file__).resolve().parents[2] / "services" / "api-gateway"
+if str(GATEWAY_DIR) not in sys.path:
+    sys.path.insert(0, str(GATEWAY_DIR))
+
+
+@pytest.fixture(autouse=True)
+def _gateway_tool_policy(monkeypatch):
+    """Pin the gateway's own tool_policy (other suites register look-alikes)."""
+    spec = importlib.util.spec_from_file_location("tool_policy", GATEWAY_DIR / "tool_policy.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    monkeypatch.setitem(sys.modules, "tool_policy", mod)
+
+
+@pytest.fixture(autouse=True)
+def _gateway_imports(monkeypatch):
+    """Resolve clients/routes/session_manager to the gateway's modules (pipecat has look-alikes)."""
+    monkeypatch.syspath_prepend(str(GATEWAY_DIR))
+    for name in list(sys.modules):
+        if name.split(".")[0] not in ("clients", "routes", "session_manager"):
+            continue
+        path = getattr(sys.modules[name], "__file__", None) or ""
+        if not Path(path).resolve().is_relative_to(GATEWAY_DIR):
+            monkeypatch.delitem(sys.modules, name)
+
+
+def _ndjson(*events):
+    return "".join(json.dumps(e) + "\n" for e in events).encode()
+
+
+def _client(handler):
+    from clients.openclaw_client import OpenclawClient
+    client = OpenclawClient()
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+async def _collect(agen):
+    return [event async for event in agen]
+
+
+FINAL = {"type": "final", "response": {"status": "executed", "result": {"stdout": "a\n"}}}
+
+
+async def test_sp1_execute_stream_yields_ndjson_events():
+    seen = []
+
+    def handler(request):
+        seen.append(request.url.path)
+        body = _ndjson(
+            {"type": "started", "execution_id": "exec_1"},
+            {"type": "output", "stream": "stdout", "text": "a\n"},
+            FINAL,
+        )
+        return httpx.Response(200, content=body, headers={"content-type": "application/x-ndjson"})
+
+    events = await _collect(_client(handler).execute_stream("shell.run", {"command": "x"}))
+    assert seen == ["/execute/stream"]
+    assert [e["type"] for e in events] == ["started", "output", "final"]
+    assert events[-1]["response"]["status"] == "executed"
+
+
+async def test_sp2_falls_back_to_execute_without_stream_endpoint():
+    def handler(request):
+        if request.url.path == "/execute/stream":
+            return httpx.Response(404)
+        return httpx.Response(200, json=FINAL["response"])
+
+    events = await _collect(_client(handler).execute_stream("file.read", {"path": "x"}))
+    assert events == [FINAL]
+
+
+async def test_sp3_truncated_stream_raises():
+    from clients.openclaw_client import OpenclawClientError
+
+    def handler(request):
+        return httpx.Response(200, content=_ndjson({"type": "started", "execution_id": "e"}))
+
+    with pytest.raises(OpenclawClientError) as exc:
+        await _collect(_client(handler).execute_stream("shell.run", {"command": "x"}))
+    assert exc.value.code == "STREAM_INCOMPLETE"
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.inbound = asyncio.Queue()
+        self.sent = []
+
+    async def receive_json(self):
+        return await self.inbound.get()
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+class _FakeOpenclaw:
+    """Streams one output line, then waits until cancelled or released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.cancelled = []
+
+    async def execute_stream(self, tool_name, args, timeout_ms, correlation_id):
+        yield {"type": "started", "execution_id": "exec_1"}
+        yield {"type": "output", "stream": "stdout", "text": "working\n"}
+        await self.release.wait()
+        status = "error" if self.cancelled else "executed"
+        yield {"type": "final", "response": {"status": status, "result": {"stdout": "working\n"}}}
+
+    async def cancel(self, execution_id, correlation_id=None):
+        self.cancelled.append(execution_id)
+        self.release.set()
+        return True
+
+
+async def _run_tool(script):
+    from routes.stream import _Inbox, _stream_tool_call
+
+    ws = _FakeWebSocket()
+    oc = _FakeOpenclaw()
+    inbox = _Inbox(ws)
+    call = asyncio.create_task(_stream_tool_call(
+        ws, inbox, oc, session_id="s1", turn_id="t1",
+        tool_name="file.read", tool_args={}, correlation_id="cid",
+    ))
+    await script(ws, oc)
+    result = await asyncio.wait_for(call, timeout=2)
+    inbox.close()
+    return ws, oc, inbox, result
+
+
+async def test_sp4_progress_relayed_and_other_messages_deferred():
+    async def script(ws, oc):
+        await asyncio.sleep(0.05)
+        await ws.inbound.put({"type": "control.ping"})
+        await asyncio.sleep(0.05)
+        oc.release.set()
+
+    ws, oc, inbox, (response, cancelled) = await _run_tool(script)
+    progress = [e for e in ws.sent if e["type"] == "tool.call.progress"]
+    assert progress[0]["payload"] == {"tool_name": "file.read", "stream": "stdout", "text": "working\n"}
+    assert response["status"] == "executed" and cancelled is False
+    assert list(inbox.deferred) == [{"type": "control.ping"}]
+
+
+async def test_sp5_control_cancel_stops_running_tool():
+    async def script(ws, oc):
+        await asyncio.sleep(0.05)
+        await ws.inbound.put({"type": "control.cancel"})
+
+    ws, oc, inbox, (response, cancelled) = await _run_tool(script)
+    assert oc.cancelled == ["exec_1"]
+    assert cancelled is True
+    assert response["status"] == "error"
+    acks = [e for e in ws.sent if e["type"] == "ack"]
+    assert acks[0]["payload"] == {"cancelled": True, "tool_name": "file.read"}
+    assert not inbox.deferred
+
+
+async def test_sp6_approved_tool_relays_progress_and_cancels():
+    from routes import stream as stream_route
+
+    ws, oc = _FakeWebSocket(), _FakeOpenclaw()
+    stream_route._session_sockets["s1"] = {ws}
+    try:
+        call = asyncio.create_task(stream_route.run_approved_tool(
+            oc, session_id="s1", turn_id="t1",
+            tool_name="shell.run", tool_args={"command": "x"}, correlation_id="cid",
+        ))
+        await asyncio.sleep(0.05)
+        assert stream_route._approved_runs == {"s1": {"exec_1"}}
+        assert await stream_route._cancel_approved_runs(oc, "s1") == 1
+        response = await asyncio.wait_for(call, timeout=2)
+    finally:
+        stream_route._session_sockets.pop("s1", None)
+
+    assert oc.cancelled == ["exec_1"]
+    assert response["status"] == "error"
+    assert [e["type"] for e in ws.sent] == ["tool.call.progress", "tool.call.result"]
+    assert ws.sent[0]["payload"] == {"tool_name": "shell.run", "stream": "stdout", "text": "working\n"}
+    assert stream_route._approved_runs == {}
@@ -0,0 +1,180 @@
+"""Pytest suite for the gateway turn executor and concurrent memory write-back."""
+
+import asyncio
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+
+GATEWAY_DIR = Path(__file__).resolve().parents[2] / "services" / "api-gateway"
+if str(GATEWAY_DIR) not in sys.path:
+    sys.path.insert(0, str(GATEWAY_DIR))
+
+
+@pytest.fixture(autouse=True)
+def _gateway_tool_policy(monkeypatch):
+    """Pin the gateway's own tool_policy (other suites register look-alikes)."""
+    spec = importlib.util.spec_from_file_location("tool_policy", GATEWAY_DIR / "tool_policy.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    monkeypatch.setitem(sys.modules, "tool_policy", mod)
+
+
+ALLOW = frozenset({"shell.run", "file.read", "file.write", "browser.open"})
+
+
+class _FakeOpenclaw:
+    def __init__(self, delay_s=0.05, fail=()):
+        self.delay_s = delay_s
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.started = []
+
+    async def execute(self, tool_name, args, timeout_ms, correlation_id):
+        self.started.append(args.get("tag"))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay_s)
+            if args.get("tag") in self.fail:
+                from clients.openclaw_client import OpenclawClientError
+                raise OpenclawClientError("EXEC_FAILED", "boom")
+            return {"status": "executed", "result": {"tag": args.get("tag")}}
+        finally:
+            self.active -= 1
+
+
+def _call(name, tag):
+    return {"tool_name": name, "args": {"tag": tag}}
+
+
+def test_te1_plan_groups_reads_between_write_barriers():
+    from turn_executor import plan_tool_groups
+    calls = [
+        _call("file.read", "r1"), _call("file.read", "r2"),
+        _call("file.write", "w1"),
+        _call("file.read", "r3"),
+        _call("shell.run", "s1"), _call("shell.run", "s2"),
+    ]
+    assert plan_tool_groups(calls) == [[0, 1], [2], [3], [4], [5]]
+
+
+async def test_te2_reads_run_concurrently_and_keep_input_order():
+    from turn_executor import execute_tool_calls
+    oc = _FakeOpenclaw(delay_s=0.05)
+    calls = [_call("file.read", f"r{i}") for i in range(4)]
+    t0 = time.monotonic()
+    stage = await execute_tool_calls(oc, calls, ALLOW, "cid", max_parallel=4)
+    elapsed = time.monotonic() - t0
+    assert oc.peak == 4
+    assert elapsed < 0.15
+    assert [r["tag"] for r in stage.results] == ["r0", "r1", "r2", "r3"]
+    assert stage.executed == 4
+    assert len(stage.call_ms) == 4
+
+
+async def test_te3_parallelism_bounded():
+    from turn_executor import execute_tool_calls
+    oc = _FakeOpenclaw(delay_s=0.01)
+    calls = [_call("file.read", f"r{i}") for i in range(6)]
+    await execute_tool_calls(oc, calls, ALLOW, "cid", max_parallel=2)
+    assert oc.peak == 2
+
+
+async def test_te4_writes_are_serial_barriers():
+    from turn_executor import execute_tool_calls
+    oc = _FakeOpenclaw(delay_s=0.01)
+    calls = [_call("file.read", "r1"), _call("file.write", "w1"), _call("file.read", "r2")]
+    await execute_tool_calls(oc, calls, ALLOW, "cid")
+    assert oc.peak == 1
+    assert oc.started == ["r1", "w1", "r2"]
+
+
+async def test_te5_rejections_and_errors_recorded_in_place():
+    from turn_executor import execute_tool_calls
+    oc = _FakeOpenclaw(delay_s=0.0, fail={"r2"})
+    calls = [_call("file.read", "r1"), _call("evil.tool", "x"), _call("file.read", "r2")]
+    stage = await execute_tool_calls(oc, calls, ALLOW, "cid")
+    assert [r.status for r in stage.records] == ["executed", "rejected_not_in_allowlist", "error"]
+    assert stage.executed == 1
+    assert "x" not in oc.started
+
+
+class _FakeMemory:
+    def __init__(self, delay_s=0.05):
+        self.delay_s = delay_s
+        self.active = 0
+        self.peak = 0
+        self.stored = []
+
+    async def store(self, content, memory_type, metadata, correlation_id):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(self.delay_s)
+        self.active -= 1
+        self.stored.append(memory_type)
+        return {"status": "stored"}
+
+
+async def test_te6_memory_write_back_is_concurrent():
+    import memory_policy
+    mem = _FakeMemory()
+    memory_policy.set_memory_policy_state_store(None)
+    result = await memory_policy.write_turn_memories(
+        memory_client=mem, turn_id="t1", session_id="s1", user_id="u",
+        conversation_id="c", input_text="hi", assistant_text="hello",
+        tool_events=[{"tool": "a"}, {"tool": "b"}],
+    )
+    assert result["written"] is True
+    assert result["items_written"] == 4
+    assert mem.peak == 4
+    assert sorted(mem.stored) == ["tool_event", "tool_event", "turn_raw", "turn_summary"]
+
+
+class _FakeBatchMemory(_FakeMemory):
+    def __init__(self, batch_status=None):
+        super().__init__()
+        self.batch_status = batch_status
+        self.batches = []
+
+    async def store_batch(self, items, correlation_id=None):
+        if self.batch_status is not None:
+            from clients.memory_client import MemoryClientError
+            raise MemoryClientError(
+                "HTTP_ERROR", "unsupported", {"status_code": self.batch_status},
+            )
+        self.batches.append([it["memory_type"] for it in items])
+        return {"status": "stored", "ids": [f"m{i}" for i in range(len(items))], "count": len(items)}
+
+
+async def test_te7_memory_write_back_uses_one_batch_request():
+    import memory_policy
+    mem = _FakeBatchMemory()
+    memory_policy.set_memory_policy_state_store(None)
+    result = await memory_policy.write_turn_memories(
+        memory_client=mem, turn_id="t1", session_id="s1", user_id="u",
+        conversation_id="c", input_text="hi", assistant_text="hello",
+        tool_events=[{"tool": "a"}],
+    )
+    assert result["written"] is True
+    assert result["items_written"] == 3
+    assert mem.batches == [["turn_raw", "turn_summary", "tool_event"]]
+    assert mem.stored == []
+
+
+async def test_te8_memory_write_back_falls_back_without_batch_endpoint():
+    import memory_policy
+    mem = _FakeBatchMemory(batch_status=405)
+    memory_policy.set_memory_policy_state_store(None)
+    result = await memory_policy.write_turn_memories(
+        memory_client=mem, turn_id="t1", session_id="s1", user_id="u",
+        conversation_id="c", input_text="hi", assistant_text="hello",
+    )
+    assert result["items_written"] == 2
+    assert sorted(mem.stored) == ["turn_raw", "turn_summary"]
@@ -0,0 +1,150 @@
+"""Unit tests for ui_detection -- vectorized ElementClassifier vs the per-region loop."""
+import io
+import os, sys
+import random
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "api-gateway"))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+from ui_detection import ElementClassifier, ElementType
+
+
+def _reference_classify(image_bytes, detections, ocr_results=None):
+    """The pre-vectorization classify(): crop + gradients + OCR scan per region."""
+    img = Image.open(io.BytesIO(image_bytes))
+    out = []
+    for bbox, conf in detections:
+        x, y, w, h = bbox
+        region_array = np.array(img.crop((x, y, x + w, y + h)))
+        aspect_ratio = w / h if h > 0 else 1.0
+
+        has_text = False
+        texts = []
+        if ocr_results:
+            for box_info in ocr_results.get("boxes", []):
+                bx, by, bw, bh = box_info.get("bbox", (0, 0, 0, 0))
+                if x < bx + bw and x + w > bx and y < by + bh and y + h > by:
+                    has_text = "boxes" in ocr_results
+                    if box_info.get("text", ""):
+                        texts.append(box_info["text"])
+
+        color_variance = np.var(region_array)
+        try:
+            gray = np.mean(region_array, axis=2) if region_array.ndim == 3 else region_array
+            gx = np.gradient(gray, axis=0)
+            gy = np.gradient(gray, axis=1)
+            magnitude = np.sqrt(gx ** 2 + gy ** 2)
+            edges = magnitude > np.mean(magnitude)
+        except Exception:
+            edges = np.array([])
+        edge_density = np.sum(edges) / edges.size if edges.size > 0 else 0
+
+        is_square = 0.7 < aspect_ratio < 1.3
+        is_tall = aspect_ratio < 0.5
+        is_wide = aspect_ratio > 2.0
+        if is_square and edge_density > 0.1:
+            kind = ElementType.BUTTON
+        elif is_wide and has_text:
+            kind = ElementType.INPUT if color_variance < 50 else ElementType.TEXT
+        elif is_tall and edge_density > 0.15:
+            kind = ElementType.DROPDOWN
+        elif has_text:
+            kind = ElementType.LINK if "click" in str(ocr_results).lower() else ElementType.TEXT
+        elif edge_density > 0.2:
+            kind = ElementType.IMAGE
+        else:
+            kind = ElementType.UNKNOWN
+        out.append((kind, bbox, conf, " ".join(texts) if texts else None))
+    return out
+
+
+def _screenshot(mode, seed, size=(480, 320), shapes=60):
+    rng = random.Random(seed)
+    img = Image.new("RGB", size, color=(240, 240, 240))
+    draw = ImageDraw.Draw(img)
+    for _ in range(shapes):
+        x, y = rng.randrange(size[0]), rng.randrange(size[1])
+        box = (x, y, x + rng.randrange(4, 120), y + rng.randrange(4, 60))
+        fill = tuple(rng.randrange(256) for _ in range(3))
+        if rng.random() < 0.5:
+            draw.rectangle(box, fill=fill)
+        else:
+            draw.rectangle(box, outline=fill, width=rng.randrange(1, 4))
+    buf = io.BytesIO()
+    img.convert(mode).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _detections(seed, n, size=(480, 320)):
+    rng = random.Random(seed)
+    dets = [((-10, -5, 40, 30), 0.9), ((size[0] - 20, size[1] - 10, 50, 40), 0.8),
+            ((5, 5, 0, 10), 0.7), ((7, 7, 1, 1), 0.6), ((30, 40, 60, 1), 0.5)]
+    for _ in range(n):
+        w, h = rng.randrange(2, 200), rng.randrange(2, 120)
+        dets.append(((rng.randrange(-20, size[0]), rng.randrange(-20, size[1]), w, h),
+                     round(rng.random(), 3)))
+    return dets
+
+
+def _ocr(seed, n, size=(480, 320), click=False):
+    rng = random.Random(seed)
+    boxes = []
+    for i in range(n):
+        text = rng.choice(["File", "Edit", "", "Save", "Cancel", "OK"])
+        boxes.append({"text": text, "confidence": 0.9, "bbox": (
+            rng.randrange(size[0]), rng.randrange(size[1]), rng.randrange(0, 90), rng.randrange(0, 25))})
+    boxes.append({"text": "wide", "confidence": 0.5, "bbox": (0, 150, 480, 12)})
+    if click:
+        boxes.append({"text": "Click here", "confidence": 0.9, "bbox": (200, 200, 60, 15)})
+    return {"boxes": boxes}
+
+
+def _actual(elements):
+    return [(e.element_type, e.bbox, e.confidence, e.text_content) for e in elements]
+
+
+class TestVectorizedClassifier:
+
+    @pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "P"])
+    @pytest.mark.parametrize("click", [False, True])
+    async def test_matches_per_region_loop(self, mode, click):
+        image = _screenshot(mode, seed=7)
+        dets = _detections(seed=11, n=150)
+        ocr = _ocr(seed=13, n=80, click=click)
+        expected = _reference_classify(image, dets, ocr)
+        actual = _actual(await ElementClassifier().classify(image, dets, ocr))
+        assert actual == expected
+        assert len({kind for kind, *_ in expected}) >= 4
+
+    @pytest.mark.parametrize("ocr", [None, {}, {"other": 1}, {"boxes": []}])
+    async def test_matches_without_usable_ocr(self, ocr):
+        image = _screenshot("RGB", seed=3)
+        dets = _detections(seed=5, n=40)
+        expected = _reference_classify(image, dets, ocr)
+        assert _actual(await ElementClassifier().classify(image, dets, ocr)) == expected
+
+    async def test_negative_size_region_rejected(self):
+        with pytest.raises(RuntimeError):
+            await ElementClassifier().classify(_screenshot("RGB", 1), [((10, 10, -5, 5), 0.9)])
+
+    async def test_dense_screenshot_benchmark(self):
+        size = (1280, 800)
+        image = _screenshot("RGB", seed=21, size=size, shapes=300)
+        dets = _detections(seed=22, n=600, size=size)
+        ocr = _ocr(seed=23, n=500, size=size, click=True)
+
+        start = time.perf_counter()
+        expected = _reference_classify(image, dets, ocr)
+        reference_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = _actual(await ElementClassifier().classify(image, dets, ocr))
+        vectorized_s = time.perf_counter() - start
+
+        assert actual == expected
+        assert vectorized_s < reference_s
@@ -0,0 +1,157 @@
+"""Unit tests for vision -- bounded, input-ordered VisionClient batch analysis.
+
+The benchmark at the bottom runs the real Ollama code path against a local
+stub server and reports throughput per concurrency level.
+"""
+import asyncio
+import io
+import json
+import os, sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "services", "api-gateway"))
+
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from vision import VisionClient
+
+
+def _png(color, size=(64, 48)):
+    buf = io.BytesIO()
+    Image.new("RGB", size, color=color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class _ScriptedClient(VisionClient):
+    """analyze_image replaced by a scripted coroutine; tracks concurrency."""
+
+    def __init__(self, script, **kw):
+        super().__init__(**kw)
+        self.script = script
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def analyze_image(self, image_bytes, prompt, model=None, max_tokens=1024, temperature=0.7):
+        self.calls.append((image_bytes, prompt))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay, outcome = self.script[prompt]
+            await asyncio.sleep(delay)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        finally:
+            self.in_flight -= 1
+
+
+class TestAnalyzeBatch:
+    async def test_results_follow_input_order(self):
+        script = {f"p{i}": (0.05 - i * 0.01, f"r{i}") for i in range(5)}
+        client = _ScriptedClient(script)
+        images = [(_png((i * 40, 0, 0)), f"p{i}") for i in range(5)]
+        assert await client.batch_analyze(images, concurrency=5) == [f"r{i}" for i in range(5)]
+
+    async def test_concurrency_is_bounded(self):
+        script = {f"p{i}": (0.01, "ok") for i in range(12)}
+        client = _ScriptedClient(script, batch_concurrency=3)
+        await client.analyze_batch([(_png((i, i, i)), f"p{i}") for i in range(12)])
+        assert len(client.calls) == 12
+        assert client.max_in_flight == 3
+
+    async def test_per_item_errors_and_timeouts(self):
+        script = {
+            "fast": (0.0, "fine"),
+            "slow": (1.0, "never"),
+            "bad": (0.0, RuntimeError("backend 500")),
+        }
+        client = _ScriptedClient(script)
+        items = await client.analyze_batch(
+            [(_png((1, 1, 1)), "fast"), (_png((2, 2, 2)), "slow"), (_png((3, 3, 3)), "bad")],
+            item_timeout=0.05,
+        )
+        assert [i.index for i in items] == [0, 1, 2]
+        assert items[0].ok and items[0].result == "fine"
+        assert not items[1].ok and items[1].error.startswith("timeout")
+        assert not items[2].ok and items[2].error == "backend 500"
+        legacy = await client.batch_analyze([(_png((3, 3, 3)), "bad")])
+        assert legacy == ["Error: backend 500"]
+
+    async def test_identical_images_sent_once(self):
+        client = _ScriptedClient({"describe": (0.0, "same"), "other": (0.0, "diff")})
+        img = _png((10, 20, 30))
+        items = await client.analyze_batch([(img, "describe"), (img, "describe"), (img, "other")])
+        assert [i.result for i in items] == ["same", "same", "diff"]
+        assert [i.deduplicated for i in items] == [False, True, False]
+        assert len(client.calls) == 2
+
+    async def test_large_images_resized_and_compressed(self):
+        client = _ScriptedClient({"p": (0.0, "ok")})
+        big = _png((200, 100, 50), size=(3000, 2000))
+        await client.analyze_batch([(big, "p")], max_width=800, max_height=600)
+        sent = client.calls[0][0]
+        assert len(sent) < len(big)
+        with Image.open(io.BytesIO(sent)) as img:
+            assert img.format == "JPEG" and img.size == (800, 533)
+
+        await client.analyze_batch([(b"not an image", "p")])
+        assert client.calls[-1][0] == b"not an image"
+
+
+class _StubOllama(BaseHTTPRequestHandler):
+    delay_s = 0.05
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(cls.delay_s)
+        with cls.lock:
+            cls.in_flight -= 1
+        payload = json.dumps({"response": body["prompt"]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllama)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestBatchBenchmark:
+    async def test_throughput_scales_with_concurrency(self, stub_server):
+        pytest.importorskip("aiohttp")
+        images = [(_png((i, 2 * i, 3 * i)), f"item {i}") for i in range(16)]
+        throughput = {}
+        for concurrency in (1, 4, 8):
+            _StubOllama.max_in_flight = 0
+            client = VisionClient(base_url=stub_server)
+            start = time.perf_counter()
+            results = await client.batch_analyze(images, concurrency=concurrency)
+            throughput[concurrency] = len(images) / (time.perf_counter() - start)
+            assert results == [prompt for _, prompt in images]
+            assert _StubOllama.max_in_flight <= concurrency
+        print("\nvision batch throughput (items/s):",
+              {c: round(t, 1) for c, t in throughput.items()})
+        assert throughput[4] > 2 * throughput[1]
+        assert throughput[8] > throughput[4]
@@ -0,0 +1,132 @@
+"""Indexed DedupeEngine replay benchmark.
+
+Replays a recorded (seeded) perception stream through the indexed engine
+and through a reference copy of the original full-window scan, and
+requires identical decisions.
+
+Tests:
+    1. Same decisions as the linear scan across window sizes
+    2. Decision log is bounded while the replay hash covers every decision
+    3. Indexed evaluation touches only same-object candidates (timing sanity)
+"""
+import random
+import time
+from collections import OrderedDict
+
+import pytest
+
+from services.perception.event_normalizer import EventNormalizer
+from services.perception.dedupe_engine import (
+    DedupeEngine, DedupeEntry, DECISION_ACCEPT, DECISION_COALESCE, DECISION_DROP,
+    _is_near_duplicate,
+)
+
+normalizer = EventNormalizer()
+
+
+class _LinearScanEngine:
+    """Reference: the pre-index evaluate() (full window scan per event)."""
+
+    def __init__(self, window_size):
+        self.window_size = window_size
+        self.entries = OrderedDict()
+        self.seq = 0
+
+    def evaluate(self, env):
+        key = env.dedupe_key
+        if key in self.entries:
+            return (DECISION_DROP, key, env.event_id, self.entries[key].event_id, 0.0)
+        for existing_key, existing in self.entries.items():
+            if _is_near_duplicate(existing, env):
+                delta = abs(existing.confidence - env.confidence)
+                if env.confidence > existing.confidence:
+                    self.entries[existing_key] = DedupeEntry(
+                        event_id=env.event_id, dedupe_key=existing_key,
+                        content_hash=env.content_hash, object_id=env.object_id,
+                        confidence=env.confidence, spatial_token=env.spatial_token,
+                        source=env.source, seq=self.seq,
+                    )
+                self.seq += 1
+                return (DECISION_COALESCE, key, env.event_id, existing.event_id, delta)
+        self.seq += 1
+        if len(self.entries) >= self.window_size:
+            self.entries.popitem(last=False)
+        self.entries[key] = DedupeEntry(
+            event_id=env.event_id, dedupe_key=key, content_hash=env.content_hash,
+            object_id=env.object_id, confidence=env.confidence,
+            spatial_token=env.spatial_token, source=env.source, seq=self.seq,
+        )
+        return (DECISION_ACCEPT, key, env.event_id, None, 0.0)
+
+
+def _recorded_stream(n, seed=1337, objects=40):
+    rng = random.Random(seed)
+    stream = []
+    for i in range(n):
+        source = rng.choice(["vision", "vision", "audio", "fusion"])
+        obj = f"obj-{rng.randrange(objects)}"
+        raw = {
+            "event_id": f"evt-{i}",
+            "session_id": "replay",
+            "source": source,
+            "event_type": "entity_detection",
+            "object_id": obj,
+            "summary": f"{obj} variant {rng.randrange(6)}",
+            "confidence": round(rng.uniform(0.4, 1.0), 2),
+            "timestamp": 1000.0 + i,
+        }
+        if source == "vision":
+            raw["bounding_box"] = {
+                "x": rng.choice([0, 60, 120]), "y": rng.choice([0, 60]), "w": 100, "h": 100,
+            }
+        stream.append(normalizer.normalize(raw))
+    return stream
+
+
+def _decisions(engine, stream):
+    out = []
+    for env in stream:
+        d = engine.evaluate(env)
+        out.append((d.decision, d.dedupe_key, d.event_id, d.parent_event_id, d.confidence_delta))
+    return out
+
+
+class TestDedupeIndexReplay:
+
+    @pytest.mark.parametrize("window_size", [5, 50, 500])
+    def test_matches_linear_scan(self, window_size):
+        stream = _recorded_stream(3000)
+        reference = _LinearScanEngine(window_size)
+        expected = [reference.evaluate(env) for env in stream]
+        actual = _decisions(DedupeEngine(window_size=window_size), stream)
+        assert actual == expected
+        assert {d[0] for d in expected} == {DECISION_ACCEPT, DECISION_COALESCE, DECISION_DROP}
+
+    def test_decision_log_bounded_hash_complete(self):
+        stream = _recorded_stream(500)
+        small = DedupeEngine(window_size=50, decision_log_size=10)
+        large = DedupeEngine(window_size=50, decision_log_size=10_000)
+        _decisions(small, stream)
+        _decisions(large, stream)
+        assert len(small.decisions) == 10
+        assert small.decisions == large.decisions[-10:]
+        assert small.replay_decisions_hash() == large.replay_decisions_hash()
+
+        truncated = DedupeEngine(window_size=50)
+        _decisions(truncated, stream[:-1])
+        assert truncated.replay_decisions_hash() != large.replay_decisions_hash()
+
+    def test_large_window_replay_benchmark(self):
+        stream = _recorded_stream(4000, objects=2000)
+
+        reference = _LinearScanEngine(4000)
+        start = time.perf_counter()
+        expected = [reference.evaluate(env) for env in stream]
+        linear_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = _decisions(DedupeEngine(window_size=4000), stream)
+        indexed_s = time.perf_counter() - start
+
+        assert actual == expected
+        assert indexed_s < linear_s
@@ -49,4 +49,5 @@ _load_voice("turn_state")
 _load_voice("turn_reducer")
 _load_voice("cancel_registry")
 _load_voice("latency_metrics")
+_load_voice("turn_archive")
 _load_voice("turn_router")
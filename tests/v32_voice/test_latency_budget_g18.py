@@ -115,3 +115,21 @@ class TestLatencyBudgetG18:
         collector.finalize_turn(SID, "t1")
         assert collector.pending_count == 0
         assert collector.finalized_count == 1
+
+    def test_latency_collector_reports_cold_turns_separately(self):
+        """Cold turns (backends not warm) stay out of the warm-path percentiles."""
+        collector = LatencyCollector()
+        collector.record_turn_start(SID, "cold-1", 0, cold=True)
+        collector.record_first_emit(SID, "cold-1", 4000 * MS)
+        collector.finalize_turn(SID, "cold-1")
+        for i in range(10):
+            collector.record_turn_start(SID, f"t{i}", 0)
+            collector.record_first_emit(SID, f"t{i}", (300 + i) * MS)
+            collector.finalize_turn(SID, f"t{i}")
+
+        result = collector.compute_percentiles()
+        assert result["count"] == 10
+        assert result["p99_ms"] < 310
+        assert result["g18_pass"] is True
+        assert result["cold_count"] == 1
+        assert result["cold_p50_ms"] == result["cold_max_ms"] == 4000.0
@@ -0,0 +1,149 @@
+"""Turn retention tests.
+
+Terminal turns leave the router's live maps and are compacted into an
+LRU-bounded TurnArchive; with a spill log, recent turns stay replayable.
+"""
+import tracemalloc
+
+import pytest
+
+from services.pipecat.voice.turn_archive import TurnArchive
+from services.pipecat.voice.turn_events import TurnEvent
+from services.pipecat.voice.turn_router import TurnRouter
+from services.pipecat.voice.turn_state import TurnState
+
+# ── Helpers ──────────────────────────────────────────────────────────────
+
+CID = "corr-retention"
+
+COMPLETION = [
+    "TURN_STARTED", "ASR_PARTIAL", "ASR_FINAL", "MODEL_FIRST_TOKEN",
+    "TTS_STARTED", "TTS_CHUNK", "MODEL_STREAM_ENDED", "TTS_ENDED",
+]
+
+
+def _evt(event_type, seq, sid, tid):
+    return TurnEvent(
+        event_type=event_type,
+        session_id=sid,
+        turn_id=tid,
+        seq=seq,
+        ts_monotonic_ns=seq * 1_000_000,
+        correlation_id=CID,
+        payload={"text": "hello"} if event_type == "ASR_FINAL" else None,
+    )
+
+
+def _run_turn(router, sid, tid, types=COMPLETION):
+    router.start_turn(sid, tid, CID)
+    snapshot = None
+    for i, t in enumerate(types, start=1):
+        snapshot, _ = router.ingest(_evt(t, i, sid, tid))
+    return snapshot
+
+
+# ── Tests ────────────────────────────────────────────────────────────────
+
+class TestTurnRetention:
+
+    def test_terminal_turn_leaves_live_maps(self):
+        router = TurnRouter()
+        final = _run_turn(router, "s1", "t1")
+        stats = router.memory_stats()
+        assert stats["active_turns"] == 0
+        assert stats["sessions"]["s1"]["archived_turns"] == 1
+        assert router.get_snapshot("s1", "t1") == final
+        record = router.get_record("s1", "t1")
+        assert record.snapshot_hash == final.deterministic_hash()
+        assert record.event_count == len(COMPLETION)
+        assert record.command_count > 0
+
+    def test_in_progress_turn_is_observable(self):
+        router = TurnRouter()
+        _run_turn(router, "s1", "t1", COMPLETION[:4])
+        stats = router.memory_stats()
+        assert stats["active_turns"] == 1
+        assert stats["sessions"]["s1"]["events"] == 4
+        assert stats["sessions"]["s1"]["approx_bytes"] > 0
+
+    def test_late_event_absorbed_after_compaction(self):
+        router = TurnRouter()
+        _run_turn(router, "s1", "t1")
+        snapshot, cmds = router.ingest(_evt("TTS_CHUNK", 20, "s1", "t1"))
+        assert snapshot.state == TurnState.COMPLETED
+        assert any(c.name == "EmitDiagnostic" for c in cmds)
+        with pytest.raises(ValueError):
+            router.ingest(_evt("TTS_CHUNK", 1, "s1", "t1"))
+
+    def test_late_event_recorded_and_not_reemitted(self):
+        router = TurnRouter()
+        _run_turn(router, "s1", "t1")
+        router.ingest(_evt("TTS_CHUNK", 20, "s1", "t1"))
+        record = router.get_record("s1", "t1")
+        assert record.snapshot.seq == 20
+        assert record.event_count == len(COMPLETION) + 1
+        assert router.memory_stats()["active_turns"] == 0
+        # A duplicate late event is rejected like any stale seq
+        with pytest.raises(ValueError):
+            router.ingest(_evt("TTS_CHUNK", 20, "s1", "t1"))
+        assert router.get_record("s1", "t1").command_count == record.command_count
+
+    def test_late_event_spilled_and_replayable(self, tmp_path):
+        router = TurnRouter(archive=TurnArchive(spill_path=str(tmp_path / "turns.jsonl")))
+        _run_turn(router, "s1", "t1")
+        final, _ = router.ingest(_evt("TTS_CHUNK", 20, "s1", "t1"))
+        events = router.get_event_log("s1", "t1")
+        assert [e.event_type for e in events] == COMPLETION + ["TTS_CHUNK"]
+        assert router.get_command_log("s1", "t1").count == router.get_record("s1", "t1").command_count
+        assert router.replay_archived("s1", "t1").deterministic_hash() == final.deterministic_hash()
+
+    def test_archive_is_lru_bounded(self):
+        router = TurnRouter(archive=TurnArchive(max_turns=10))
+        for i in range(25):
+            _run_turn(router, "s1", f"t{i}")
+        assert router.archive.count == 10
+        assert router.archive.evicted == 15
+        assert router.get_snapshot("s1", "t0") is None
+        assert router.get_snapshot("s1", "t24").state == TurnState.COMPLETED
+
+    def test_spilled_turn_replays(self, tmp_path):
+        router = TurnRouter(archive=TurnArchive(spill_path=str(tmp_path / "turns.jsonl")))
+        final = _run_turn(router, "s1", "t1")
+        events = router.get_event_log("s1", "t1")
+        assert [e.event_type for e in events] == COMPLETION
+        assert events[2].payload == {"text": "hello"}
+        assert router.get_command_log("s1", "t1").count == router.get_record("s1", "t1").command_count
+        replayed = router.replay_archived("s1", "t1")
+        assert replayed.deterministic_hash() == final.deterministic_hash()
+
+    def test_spill_rotation(self, tmp_path):
+        archive = TurnArchive(spill_path=str(tmp_path / "turns.jsonl"), max_spill_bytes=2000)
+        router = TurnRouter(archive=archive)
+        for i in range(12):
+            _run_turn(router, "s1", f"t{i}")
+        assert archive.stats()["spill_generation"] >= 2
+        assert router.replay_archived("s1", "t11") is not None
+        assert router.replay_archived("s1", "t0") is None
+        assert router.get_snapshot("s1", "t0") is not None
+
+    def test_close_session(self):
+        router = TurnRouter()
+        _run_turn(router, "s1", "t1")
+        _run_turn(router, "s1", "t2", COMPLETION[:3])
+        _run_turn(router, "s2", "t1")
+        assert router.close_session("s1") == 2
+        assert router.memory_stats()["sessions"].keys() == {"s2"}
+
+    def test_memory_flat_over_many_turns(self):
+        tracemalloc.start()
+        router = TurnRouter(archive=TurnArchive(max_turns=50))
+        # Warm-up fills the archive and the latency window
+        for i in range(1500):
+            _run_turn(router, "s1", f"warm{i}")
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(2000):
+            _run_turn(router, "s1", f"t{i}")
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # 2000 turns retained in full would take megabytes
+        assert after - before < 200_000
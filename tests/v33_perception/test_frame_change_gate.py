@@ -0,0 +1,157 @@
+"""Frame-difference gate ahead of VLM inference.
+
+Tests:
+    1. Unchanged frame reuses the cached scene (no inference)
+    2. Local change sends only the cropped region
+    3. Privacy off drops the cached scene and reference frame
+    4. dHash/block mask classify unchanged, local and global changes
+"""
+import io
+
+import pytest
+
+from services.perception.frame_diff import (
+    CHANGE_GLOBAL, CHANGE_LOCAL, CHANGE_UNCHANGED, ChangeDetector, FrameDiff,
+)
+from services.perception.pipeline_runner import PerceptionPipelineRunner, RunnerConfig
+
+
+class _Scene:
+    def __init__(self, scene_id):
+        self.scene_id = scene_id
+        self.summary = f"summary of {scene_id}"
+
+
+class _ScriptedDetector:
+    """Stands in for ChangeDetector: returns a scripted diff per frame."""
+    available = True
+
+    def __init__(self, diffs):
+        self._diffs = list(diffs)
+        self.references = []
+
+    def signature(self, raw):
+        return raw
+
+    def diff(self, sig):
+        return self._diffs.pop(0)
+
+    def set_reference(self, sig):
+        self.references.append(sig)
+
+    def reset(self):
+        self.references.append(None)
+
+    @staticmethod
+    def crop(raw, box):
+        return b"crop:" + raw
+
+
+def _runner(diffs, privacy=True):
+    calls = []
+
+    async def analyze_fn(trigger, context, frame_count, correlation_id, frames=None):
+        calls.append({"context": context, "frames": frames})
+        return _Scene(f"scene_{len(calls)}")
+
+    async def privacy_fn():
+        return {"privacy": "enabled" if privacy else "disabled", "capture_allowed": privacy}
+
+    async def fetch_fn(n):
+        return [{"frame_id": "f1", "raw": b"frame"}]
+
+    runner = PerceptionPipelineRunner(
+        analyze_fn=analyze_fn,
+        privacy_check_fn=privacy_fn,
+        config=RunnerConfig(cooldown_s=0.0, staleness_s=60.0),
+        frame_fetch_fn=fetch_fn,
+        change_detector=_ScriptedDetector(diffs),
+    )
+    return runner, calls
+
+
+async def _drive(runner, n):
+    await runner.start()
+    results = [await runner.on_frame_event({"type": "test"}) for _ in range(n)]
+    await runner.stop()
+    return results
+
+
+class TestRunnerChangeGate:
+
+    async def test_unchanged_frame_reuses_scene(self):
+        runner, calls = _runner([
+            FrameDiff(change=CHANGE_GLOBAL),
+            FrameDiff(change=CHANGE_UNCHANGED, changed_fraction=0.0),
+        ])
+        r1, r2 = await _drive(runner, 2)
+        assert len(calls) == 1
+        assert r2 == {"ok": True, "scene_id": r1["scene_id"], "cached": True}
+        assert runner.stats.total_scene_cache_hits == 1
+        assert runner.stats.total_full_frames == 1
+        assert runner.stats.to_dict()["total_scene_cache_hits"] == 1
+
+    async def test_local_change_sends_crop(self):
+        runner, calls = _runner([
+            FrameDiff(change=CHANGE_GLOBAL),
+            FrameDiff(change=CHANGE_LOCAL, changed_fraction=0.1, crop_box=(10, 20, 50, 60)),
+        ])
+        await _drive(runner, 2)
+        assert len(calls) == 2
+        crop = calls[1]["frames"][0]
+        assert crop["raw"] == b"crop:frame"
+        assert crop["crop_box"] == [10, 20, 50, 60]
+        assert (crop["width"], crop["height"]) == (40, 40)
+        assert "summary of scene_1" in calls[1]["context"]
+        assert runner.stats.total_local_crops == 1
+
+    async def test_privacy_off_drops_cache(self):
+        runner, calls = _runner([], privacy=False)
+        runner._last_scene = _Scene("old")
+        r = (await _drive(runner, 1))[0]
+        assert r["reason"] == "privacy_disabled"
+        assert runner._last_scene is None
+        assert runner.change_detector.references == [None]
+
+
+class TestChangeDetector:
+
+    @pytest.fixture(autouse=True)
+    def _deps(self):
+        pytest.importorskip("numpy")
+        pytest.importorskip("PIL")
+
+    @staticmethod
+    def _png(draw=None):
+        from PIL import Image, ImageDraw
+        img = Image.new("L", (320, 240), color=40)
+        d = ImageDraw.Draw(img)
+        d.rectangle((20, 20, 140, 100), fill=200)
+        if draw:
+            draw(d)
+        out = io.BytesIO()
+        img.save(out, format="PNG")
+        return out.getvalue()
+
+    def test_identical_frame_unchanged(self):
+        det = ChangeDetector()
+        det.set_reference(det.signature(self._png()))
+        assert det.diff(det.signature(self._png())).change == CHANGE_UNCHANGED
+
+    def test_small_patch_is_local(self):
+        det = ChangeDetector()
+        det.set_reference(det.signature(self._png()))
+        diff = det.diff(det.signature(self._png(lambda d: d.rectangle((250, 180, 300, 220), fill=255))))
+        assert diff.change == CHANGE_LOCAL
+        left, top, right, bottom = diff.crop_box
+        assert left <= 250 and top <= 180 and right >= 300 and bottom >= 220
+
+    def test_whole_frame_change_is_global(self):
+        det = ChangeDetector()
+        det.set_reference(det.signature(self._png()))
+        diff = det.diff(det.signature(self._png(lambda d: d.rectangle((0, 0, 320, 240), fill=230))))
+        assert diff.change == CHANGE_GLOBAL
+
+    def test_no_reference_is_global(self):
+        det = ChangeDetector()
+        assert det.diff(det.signature(self._png())).change == CHANGE_GLOBAL
@@ -0,0 +1,169 @@
+"""Push-based frame subscription (vision-capture -> perception).
+
+Tests:
+    1. Subscriber gets frame metadata on ingest and bytes on demand
+    2. max_fps downsamples notifications on the consumer's behalf
+    3. since_seq replays buffered frames newer than the resume point
+    4. Privacy off pushes "cleared" at once; per-seq bytes are gone
+    5. Perception FrameFeed tracks frames, clears and restarts
+    6. Perception fetches pushed frames by seq instead of polling latest
+    7. The frame slab lives for the app lifespan, not the module import
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+SERVICES = Path(__file__).resolve().parents[2] / "services"
+
+
+def _load(name, path):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[name] = mod
+        spec.loader.exec_module(mod)
+    return sys.modules[name]
+
+
+@pytest.fixture(scope="module")
+def app_client():
+    # One lifespan per module: each lifespan allocates and unlinks a frame slab
+    mod = _load("vision_capture_frame_sub", SERVICES / "vision-capture" / "main.py")
+    with TestClient(mod.app) as c:
+        yield c
+
+
+@pytest.fixture
+def client(app_client):
+    app_client.post("/v1/vision/privacy/enable")
+    app_client.post("/v1/vision/mode/set", json={"mode": "active"})
+    yield app_client
+    app_client.post("/v1/vision/privacy/disable")
+
+
+def _ingest(client, data, ts):
+    resp = client.post("/v1/vision/frames/raw", params={"timestamp": ts}, content=data)
+    assert resp.status_code == 200, resp.text
+    return resp.json()["seq"]
+
+
+class TestVisionCaptureSubscription:
+
+    def test_metadata_push_and_bytes_on_demand(self, client):
+        with client.websocket_connect("/v1/vision/frames/subscribe") as ws:
+            hello = ws.receive_json()
+            assert hello["type"] == "hello" and hello["privacy"] == "enabled"
+            seq = _ingest(client, b"frame-bytes", 1000.0)
+
+            frame = ws.receive_json()
+            assert frame["type"] == "frame" and frame["seq"] == seq
+            assert "data_b64" not in frame and frame["size_bytes"] == 11
+
+            ws.send_json({"op": "get", "seq": seq})
+            assert ws.receive_json() == {"type": "data", "seq": seq, "found": True}
+            assert ws.receive_bytes() == b"frame-bytes"
+
+    def test_max_fps_downsampling(self, client):
+        with client.websocket_connect("/v1/vision/frames/subscribe?max_fps=2") as ws:
+            ws.receive_json()
+            seqs = [_ingest(client, bytes([i]), 2000.0 + i * 0.1) for i in range(11)]
+            received = [ws.receive_json()["seq"] for _ in range(3)]
+            assert received == [seqs[0], seqs[5], seqs[10]]
+
+    def test_resume_from_sequence(self, client):
+        seqs = [_ingest(client, bytes([i]), 3000.0 + i) for i in range(3)]
+        with client.websocket_connect(f"/v1/vision/frames/subscribe?since_seq={seqs[0]}") as ws:
+            hello = ws.receive_json()
+            assert hello["head_seq"] == seqs[-1]
+            assert [ws.receive_json()["seq"] for _ in range(2)] == seqs[1:]
+
+    def test_privacy_off_pushes_cleared(self, client):
+        seq = _ingest(client, b"secret", 4000.0)
+        assert client.get(f"/v1/vision/frames/{seq}/raw").content == b"secret"
+        with client.websocket_connect("/v1/vision/frames/subscribe") as ws:
+            ws.receive_json()
+            client.post("/v1/vision/privacy/disable")
+            cleared = ws.receive_json()
+            assert cleared == {"type": "cleared", "reason": "privacy_disabled", "buffer_frames": 0}
+            privacy = ws.receive_json()
+            assert privacy["type"] == "privacy" and privacy["frame_slab"] is None
+            ws.send_json({"op": "get", "seq": seq})
+            assert ws.receive_json() == {"type": "data", "seq": seq, "found": False}
+        assert client.get(f"/v1/vision/frames/{seq}/raw").status_code == 403
+
+
+@pytest.fixture
+def pm(monkeypatch):
+    mod = _load("perception_main_frame_sub", SERVICES / "perception" / "main.py")
+    monkeypatch.setattr(mod, "privacy_cache", mod.PrivacyCache())
+    monkeypatch.setattr(mod, "frame_feed", mod.FrameFeed())
+    return mod
+
+
+def _hello(instance="vc-1", seq=1):
+    return {"type": "hello", "head_seq": 0, "oldest_seq": 0, "privacy": "enabled",
+            "capture_allowed": True, "instance_id": instance, "status_seq": seq}
+
+
+class TestPerceptionFrameFeed:
+
+    def test_feed_tracks_frames_clears_and_restarts(self, pm):
+        feed = pm.frame_feed
+        feed.handle(_hello())
+        assert pm.privacy_cache.status["capture_allowed"] is True
+        for seq in (1, 2, 3):
+            feed.handle({"type": "frame", "seq": seq})
+        assert [f["seq"] for f in feed.latest(2)] == [2, 3] and feed.last_seq == 3
+
+        feed.handle({"type": "cleared", "reason": "privacy_disabled", "buffer_frames": 0})
+        assert feed.latest(5) == [] and feed.last_seq == 3
+
+        feed.handle({"type": "frame", "seq": 4})
+        feed.handle(_hello(instance="vc-2"))
+        assert feed.latest(5) == [] and feed.last_seq == 0
+
+    async def test_fetch_uses_pushed_seqs(self, pm, monkeypatch):
+        class _Resp:
+            def __init__(self, status, content=b""):
+                self.status_code, self.content = status, content
+
+        class _Client:
+            def __init__(self):
+                self.urls = []
+
+            async def get(self, url, **kw):
+                self.urls.append(url)
+                return _Resp(404) if url.endswith("/7/raw") else _Resp(200, b"px" + url[-5:-4].encode())
+
+        http = _Client()
+        monkeypatch.setattr(pm, "_get_vision_client", lambda: http)
+        pm.frame_feed.connected = True
+        for seq in (7, 8, 9):
+            pm.frame_feed.handle({"type": "frame", "seq": seq, "width": 4, "height": 4})
+
+        frames = await pm.fetch_frames(3)
+        assert [f["seq"] for f in frames] == [8, 9]
+        assert frames[0]["raw"] == b"px8" and "type" not in frames[0]
+        assert not any("frames/latest" in u for u in http.urls)
+
+
+class TestVisionCaptureSlabLifetime:
+
+    def test_slab_allocated_by_lifespan_and_unlinked_on_shutdown(self):
+        mod = _load("vision_capture_slab_lifetime", SERVICES / "vision-capture" / "main.py")
+        assert mod.state.buffer.slab_name is None
+        with TestClient(mod.app) as client:
+            name = mod.state.buffer.slab_name
+            assert name is not None
+            client.post("/v1/vision/privacy/enable")
+            assert client.get("/v1/vision/privacy/status").json()["frame_slab"] == name
+        assert mod.state.buffer.slab_name is None
+        with pytest.raises(FileNotFoundError):
+            mod.SharedFrameRing.attach(name)
@@ -0,0 +1,198 @@
+"""Perception privacy cache (pushed + TTL-bounded, fail-closed).
+
+Tests:
+    1. First lookup subscribes and later lookups hit the cache
+    2. Pushed changes apply immediately; out-of-order pushes are ignored
+    3. Stale entry that cannot be refreshed fails closed
+    4. vision-capture restart (new instance_id) drops the subscription
+    5. "Capture allowed" is re-polled after the poll TTL even when subscribed
+    6. Pushes need the subscription token and can only tighten privacy
+    7. vision-capture restricts callbacks, caps subscribers, drops failed pushes
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+SERVICES = Path(__file__).resolve().parents[2] / "services"
+PERCEPTION_MAIN = SERVICES / "perception" / "main.py"
+
+
+def _load(name="perception_main_privacy_cache", path=PERCEPTION_MAIN):
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[name] = mod
+        spec.loader.exec_module(mod)
+    return sys.modules[name]
+
+
+class _Resp:
+    def __init__(self, body, status_code=200):
+        self._body = body
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return dict(self._body)
+
+
+class _VisionClient:
+    def __init__(self, status, fail=False):
+        self.status = status
+        self.fail = fail
+        self.calls = []
+
+    async def post(self, url, json=None, **kw):
+        self.calls.append(("POST", url))
+        if self.fail:
+            raise ConnectionError("vision-capture down")
+        return _Resp(self.status)
+
+    async def get(self, url, **kw):
+        self.calls.append(("GET", url))
+        if self.fail:
+            raise ConnectionError("vision-capture down")
+        return _Resp(self.status)
+
+
+@pytest.fixture
+def pm(monkeypatch):
+    mod = _load()
+    cache = mod.PrivacyCache(callback_url="http://perception/notify")
+    monkeypatch.setattr(mod, "privacy_cache", cache)
+    return mod
+
+
+def _status(privacy="enabled", seq=1, instance="vc-1"):
+    return {
+        "privacy": privacy, "capture_allowed": privacy == "enabled",
+        "instance_id": instance, "status_seq": seq,
+    }
+
+
+class TestPrivacyCache:
+
+    async def test_subscribes_then_serves_from_cache(self, pm, monkeypatch):
+        client = _VisionClient(_status())
+        monkeypatch.setattr(pm, "_get_vision_client", lambda: client)
+
+        results = [await pm.check_vision_privacy() for _ in range(3)]
+        assert all(r["privacy"] == "enabled" for r in results)
+        assert client.calls == [("POST", f"{pm.VISION_CAPTURE_URL}/v1/vision/privacy/subscribe")]
+        assert pm.privacy_cache.subscribed is True
+        assert pm.privacy_cache.hits == 2
+
+    async def test_push_applies_in_order(self, pm):
+        cache = pm.privacy_cache
+        assert cache.update(_status(seq=2))
+        assert cache.update(_status("disabled", seq=3))
+        assert not cache.update(_status("enabled", seq=2))
+        assert (await pm.check_vision_privacy())["privacy"] == "disabled"
+
+    async def test_stale_entry_fails_closed(self, pm, monkeypatch):
+        monkeypatch.setattr(pm, "_get_vision_client", lambda: _VisionClient({}, fail=True))
+        pm.privacy_cache.update(_status())
+        pm.privacy_cache.updated_at -= pm.PRIVACY_PUSH_TTL_S + 1
+        result = await pm.check_vision_privacy()
+        assert result == {"privacy": "disabled", "capture_allowed": False}
+        assert pm.privacy_cache.status is None
+
+    def test_new_instance_drops_subscription(self, pm):
+        cache = pm.privacy_cache
+        cache.update(_status(instance="vc-1"))
+        cache.subscribed = True
+        assert cache.update(_status(seq=1, instance="vc-2"))
+        assert cache.subscribed is False
+        assert cache.ttl_s == pm.PRIVACY_POLL_TTL_S
+
+    async def test_capture_allowed_is_repolled_while_subscribed(self, pm, monkeypatch):
+        client = _VisionClient(_status())
+        monkeypatch.setattr(pm, "_get_vision_client", lambda: client)
+        cache = pm.privacy_cache
+        await pm.check_vision_privacy()
+        assert cache.subscribed and cache.ttl_s == pm.PRIVACY_POLL_TTL_S
+
+        cache.updated_at -= pm.PRIVACY_POLL_TTL_S + 0.1
+        client.status = _status("disabled", seq=2)
+        assert (await pm.check_vision_privacy())["privacy"] == "disabled"
+        # Refresh renews the subscription; "off" may then be cached longer
+        assert [c[0] for c in client.calls] == ["POST", "POST"]
+        assert cache.ttl_s == pm.PRIVACY_PUSH_TTL_S
+
+    def test_push_requires_token_and_only_tightens(self, pm):
+        cache = pm.privacy_cache
+        cache.update(_status("disabled", seq=1))
+        http = TestClient(pm.app)
+        push = _status("enabled", seq=2)
+        push["mode"] = "active"
+
+        assert http.post("/v1/perception/privacy/notify", json=push).status_code == 401
+        assert http.post("/v1/perception/privacy/notify", json=push,
+                         headers={"X-Privacy-Token": "wrong"}).status_code == 401
+        assert http.post("/v1/perception/privacy/notify", json={"privacy": "enabled"},
+                         headers={"X-Privacy-Token": cache.token}).status_code == 422
+        assert cache.status["privacy"] == "disabled"
+
+        # Authenticated, but enabling must be confirmed by a re-poll
+        resp = http.post("/v1/perception/privacy/notify", json=push,
+                         headers={"X-Privacy-Token": cache.token})
+        assert resp.json() == {"applied": False}
+        assert cache.status is None
+
+        cache.update(_status("enabled", seq=3))
+        resp = http.post("/v1/perception/privacy/notify", json=_status("disabled", seq=4),
+                         headers={"X-Privacy-Token": cache.token})
+        assert resp.json() == {"applied": True}
+        assert cache.status["privacy"] == "disabled"
+        assert (cache.pushes, cache.pushes_rejected) == (1, 2)
+
+        # Another instance_id cannot reset the cache through a push
+        assert not cache.push(_status("disabled", seq=1, instance="vc-evil"))
+        assert cache.instance_id == "vc-1"
+
+
+class _PushClient:
+    def __init__(self, fail_urls):
+        self.fail_urls = set(fail_urls)
+        self.sent = []
+
+    async def post(self, url, json=None, headers=None):
+        self.sent.append((url, headers["X-Privacy-Token"]))
+        return _Resp({}, 503 if url in self.fail_urls else 200)
+
+
+class TestVisionCapturePrivacySubscribers:
+
+    async def test_callbacks_restricted_capped_and_dropped_on_failure(self, monkeypatch):
+        vc = _load("vision_capture_privacy_push", SERVICES / "vision-capture" / "main.py")
+        token = "t" * 32
+        with TestClient(vc.app) as http:
+            def subscribe(url):
+                return http.post("/v1/vision/privacy/subscribe", json={"callback_url": url, "token": token})
+
+            assert subscribe("http://169.254.169.254/latest/meta-data").status_code == 400
+            assert subscribe("file:///etc/passwd").status_code == 400
+            for port in range(vc.MAX_PRIVACY_SUBSCRIBERS):
+                assert subscribe(f"http://127.0.0.1:{9000 + port}/notify").status_code == 200
+            assert subscribe("http://localhost:9999/notify").status_code == 429
+            # Renewing an existing subscription is not capped
+            assert subscribe("http://127.0.0.1:9000/notify").status_code == 200
+
+            client = _PushClient(fail_urls={"http://127.0.0.1:9001/notify"})
+            monkeypatch.setattr(vc, "_get_http", lambda: client)
+            await vc._push_privacy_status(vc._privacy_status())
+            assert len(client.sent) == vc.MAX_PRIVACY_SUBSCRIBERS
+            assert all(t == token for _, t in client.sent)
+            subscribers = vc.state.privacy_subscribers
+            assert "http://127.0.0.1:9001/notify" not in subscribers
+            assert len(subscribers) == vc.MAX_PRIVACY_SUBSCRIBERS - 1
@@ -0,0 +1,199 @@
+"""Priority-aware adaptive scheduling in the perception pipeline runner.
+
+Tests:
+    1. Triggers map to router lanes; coalescing keeps the best-ranked trigger
+    2. Triggers arriving while busy coalesce into one deferred run
+    3. Cooldown defers the trigger instead of dropping it
+    4. A user request preempts an in-flight scheduled scan
+    5. Motion does not preempt a scan in the same lane
+       (a preemptor runs before the pending low-priority run)
+    6. Privacy off drops the pending run
+    7. Scheduled interval follows scene-change rate and VLM latency
+"""
+import asyncio
+
+from services.perception.pipeline_runner import (
+    PerceptionPipelineRunner, RunnerConfig, _Trigger, trigger_priority,
+)
+from services.perception.priority_router import PRIORITY_P0, PRIORITY_P1, PRIORITY_P2
+
+
+class _Scene:
+    def __init__(self, scene_id):
+        self.scene_id = scene_id
+
+
+def _runner(gates=None, privacy=None, **config):
+    """Runner whose analysis blocks on gates[trigger] (an asyncio.Event) if present."""
+    calls = []
+    gates = gates or {}
+    privacy = privacy if privacy is not None else {"on": True}
+
+    async def analyze_fn(trigger, context, frame_count, correlation_id):
+        calls.append((trigger, frame_count))
+        if trigger in gates:
+            await gates[trigger].wait()
+        return _Scene(f"scene_{len(calls)}")
+
+    async def privacy_fn():
+        on = privacy["on"]
+        return {"privacy": "enabled" if on else "disabled", "capture_allowed": on}
+
+    config.setdefault("cooldown_s", 0.0)
+    runner = PerceptionPipelineRunner(
+        analyze_fn=analyze_fn, privacy_check_fn=privacy_fn, config=RunnerConfig(**config),
+    )
+    return runner, calls
+
+
+def _request(trigger="user_command", frame_count=1):
+    return {"payload": {"trigger": trigger, "frame_count": frame_count}}
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestTriggerRanking:
+
+    def test_lanes_and_coalescing(self):
+        assert trigger_priority("safety_alert") == PRIORITY_P0
+        assert trigger_priority("user_command") == PRIORITY_P1
+        assert trigger_priority("motion") == PRIORITY_P2
+        assert trigger_priority("scheduled") == PRIORITY_P2
+
+        def make(trigger, frames=1):
+            return _Trigger(trigger, trigger, frames, "", trigger_priority(trigger))
+
+        merged = make("scheduled", 3).absorb(make("motion"))
+        assert (merged.trigger, merged.frame_count, merged.merged) == ("motion", 3, 2)
+        merged = merged.absorb(make("user_command"))
+        assert (merged.trigger, merged.context, merged.merged) == ("user_command", "user_command", 3)
+
+
+class TestScheduling:
+
+    async def test_busy_triggers_coalesce(self):
+        gate = asyncio.Event()
+        runner, calls = _runner(gates={"motion": gate})
+        await runner.start()
+        first = asyncio.ensure_future(runner.on_frame_event({}))
+        await _settle()
+
+        assert await runner.on_perception_request(_request("scheduled", 2)) == {
+            "ok": False, "reason": "busy", "deferred": True,
+        }
+        await runner.on_frame_event({})
+        await runner.on_perception_request(_request("scheduled"))
+        assert runner.pending == {"trigger": "motion", "priority": "P2_INFO", "merged": 3}
+
+        gate.set()
+        assert (await first)["ok"] is True
+        await _settle()
+        assert calls == [("motion", 1), ("motion", 2)]
+        assert runner.pending is None
+        assert runner.stats.total_coalesced == 2
+        assert runner.stats.total_deferred_runs == 1
+        await runner.stop()
+
+    async def test_cooldown_defers_instead_of_dropping(self):
+        runner, calls = _runner(cooldown_s=0.05)
+        await runner.start()
+        assert (await runner.on_frame_event({}))["ok"] is True
+        r = await runner.on_frame_event({})
+        assert r == {"ok": False, "reason": "cooldown", "deferred": True}
+        assert len(calls) == 1
+
+        await asyncio.sleep(0.1)
+        assert len(calls) == 2
+        assert runner.stats.total_skipped_cooldown == 1
+        assert runner.stats.total_runs == 2
+        await runner.stop()
+
+    async def test_user_request_preempts_scheduled_scan(self):
+        runner, calls = _runner(gates={"scheduled": asyncio.Event()})
+        await runner.start()
+        scan = asyncio.ensure_future(runner.on_perception_request(_request("scheduled")))
+        await _settle()
+
+        user = await runner.on_perception_request(_request("user_command"))
+        assert user == {"ok": True, "scene_id": "scene_2"}
+        assert await scan == {"ok": False, "reason": "preempted"}
+        assert [t for t, _ in calls] == ["scheduled", "user_command"]
+        assert runner.stats.total_preempted == 1
+        assert runner.stats.total_runs == 1
+        await runner.stop()
+
+    async def test_preemptor_runs_before_pending_scan(self):
+        gate = asyncio.Event()
+        runner, calls = _runner(gates={"scheduled": gate, "motion": gate})
+        await runner.start()
+        scan = asyncio.ensure_future(runner.on_perception_request(_request("scheduled")))
+        await _settle()
+        assert (await runner.on_frame_event({}))["reason"] == "busy"
+
+        user = await runner.on_perception_request(_request("user_command"))
+        assert user["ok"] is True
+        assert await scan == {"ok": False, "reason": "preempted"}
+        assert [t for t, _ in calls] == ["scheduled", "user_command"]
+        assert runner.pending is None
+        await runner.stop()
+
+    async def test_motion_does_not_preempt_same_lane(self):
+        gate = asyncio.Event()
+        runner, calls = _runner(gates={"scheduled": gate}, preempt_low_priority=True)
+        await runner.start()
+        scan = asyncio.ensure_future(runner.on_perception_request(_request("scheduled")))
+        await _settle()
+
+        assert (await runner.on_frame_event({}))["reason"] == "busy"
+        gate.set()
+        assert (await scan)["ok"] is True
+        await _settle()
+        assert [t for t, _ in calls] == ["scheduled", "motion"]
+        assert runner.stats.total_preempted == 0
+        await runner.stop()
+
+    async def test_privacy_off_drops_pending(self):
+        gate = asyncio.Event()
+        privacy = {"on": True}
+        runner, calls = _runner(gates={"motion": gate}, privacy=privacy)
+        await runner.start()
+        first = asyncio.ensure_future(runner.on_frame_event({}))
+        await _settle()
+        await runner.on_frame_event({})
+        await runner.on_frame_event({})
+
+        privacy["on"] = False
+        gate.set()
+        await first
+        await _settle()
+        assert len(calls) == 1
+        assert runner.pending is None
+        assert runner.stats.total_skipped_privacy == 1
+        await runner.stop()
+
+
+class TestAdaptiveInterval:
+
+    def test_interval_tracks_change_rate_and_latency(self):
+        runner, _ = _runner(scheduled_interval_s=8.0)
+        assert runner.scheduled_interval() == 8.0
+
+        for _ in range(30):
+            runner._observe_change(1.0)
+        assert 2.0 <= runner.scheduled_interval() < 2.1
+
+        for _ in range(30):
+            runner._observe_change(0.0)
+        assert 31.0 < runner.scheduled_interval() <= 32.0
+
+        runner._observe_latency(20.0)
+        assert runner.scheduled_interval() == 40.0
+        assert runner.stats.to_dict()["scheduled_interval_s"] == 40.0
+
+        fixed, _ = _runner(scheduled_interval_s=8.0, adaptive_schedule=False)
+        fixed._observe_change(1.0)
+        fixed._observe_latency(60.0)
+        assert fixed.scheduled_interval() == 8.0